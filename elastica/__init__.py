@@ -12,6 +12,7 @@ from elastica.rigidbody.rigid_body import RigidBodyBase
 from elastica.rigidbody.cylinder import Cylinder
 from elastica.rigidbody.sphere import Sphere
 from elastica.surface.plane import Plane
+from elastica.surface.mesh_surface import MeshSurface
 from elastica.boundary_conditions import (
     ConstraintBase,
     FreeBC,
@@ -52,8 +53,15 @@ from elastica.contact_forces import (
     RodPlaneContact,
     RodPlaneContactWithAnisotropicFriction,
     CylinderPlaneContact,
+    RodMeshSurfaceContact,
+)
+from elastica.contact_records import ContactRecords
+from elastica.callback_functions import (
+    CallBackBaseClass,
+    ContactRecordsCallBack,
+    ExportCallBack,
+    MyCallBack,
 )
-from elastica.callback_functions import CallBackBaseClass, ExportCallBack, MyCallBack
 from elastica.dissipation import (
     DamperBase,
     AnalyticalLinearDamper,
@@ -84,10 +92,14 @@ from elastica.timestepper import (
     integrate,
     PositionVerlet,
     PEFRL,
+    SemiImplicitPositionVerlet,
     RungeKutta4,
     EulerForward,
     extend_stepper_interface,
+    compile_step_plan,
+    integrate_adaptive,
 )
 from elastica.memory_block.memory_block_rigid_body import MemoryBlockRigidBody
 from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
 from elastica.restart import save_state, load_state
+from elastica.ensemble import Ensemble
@@ -0,0 +1,246 @@
+__doc__ = """ Registry of interchangeable kernel implementations (backends) """
+import os
+from importlib.util import find_spec
+from types import FunctionType
+from typing import Callable, Dict, MutableMapping, Sequence
+
+import numpy as np
+
+# Environment variable used to select the kernel backend of the process.
+# The selection happens once, when the kernel modules are first imported.
+KERNEL_BACKEND_ENV = "ELASTICA_KERNEL_BACKEND"
+DEFAULT_KERNEL_BACKEND = "numpy"
+# Backends compiling the "reference" kernels just-in-time.
+JIT_KERNEL_BACKENDS = ("numba",)
+KNOWN_KERNEL_BACKENDS = ("numpy", "reference") + JIT_KERNEL_BACKENDS
+
+# Environment variable pointing JIT backends to an on-disk cache of compiled
+# kernels, so that repeated runs skip the compilation.
+KERNEL_CACHE_DIR_ENV = "ELASTICA_KERNEL_CACHE_DIR"
+
+# module name -> backend name -> kernel name -> kernel
+_kernel_registry: Dict[str, Dict[str, Dict[str, Callable]]] = {}
+
+
+def register_kernels(module_name: str, backend: str, kernels: Dict[str, Callable]):
+    """
+    Register a set of kernels implementing `backend` for the kernel module
+    `module_name`.
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the module providing the kernels, i.e. `elastica._linalg`.
+    backend : str
+        Name of the backend, i.e. "numpy" or "reference".
+    kernels : dict
+        Mapping from the kernel name (as it is imported by the rest of the
+        package) to its implementation.
+
+    Notes
+    -----
+    "reference" kernels are written with explicit loops over plain arrays, so
+    that JIT backends can compile them as they are.
+    """
+    _kernel_registry.setdefault(module_name, {})[backend] = dict(kernels)
+
+
+def available_backends(module_name: str):
+    """
+    Returns the names of the backends available for `module_name`.
+    """
+    backends = tuple(_kernel_registry.get(module_name, {}).keys())
+    if "reference" in backends and find_spec("numba") is not None:
+        backends += tuple(
+            backend for backend in JIT_KERNEL_BACKENDS if backend not in backends
+        )
+    return backends
+
+
+def selected_backend() -> str:
+    """
+    Returns the name of the kernel backend selected for this process.
+    """
+    backend = os.environ.get(KERNEL_BACKEND_ENV, DEFAULT_KERNEL_BACKEND)
+    if backend not in KNOWN_KERNEL_BACKENDS:
+        raise ValueError(
+            "Unknown kernel backend '{0}' given in {1}. Known backends are {2}.".format(
+                backend, KERNEL_BACKEND_ENV, KNOWN_KERNEL_BACKENDS
+            )
+        )
+    return backend
+
+
+def get_kernels(module_name: str, backend: str = None) -> Dict[str, Callable]:
+    """
+    Returns the kernels of `module_name` implemented by `backend`.
+
+    Parameters
+    ----------
+    module_name : str
+    backend : str
+        Name of the backend. If not given, the backend selected for this process
+        is used.
+
+    Returns
+    -------
+    kernels : dict
+        Mapping from kernel name to kernel.
+    """
+    if backend is None:
+        backend = selected_backend()
+
+    module_backends = _kernel_registry.get(module_name, {})
+    if backend in JIT_KERNEL_BACKENDS and backend not in module_backends:
+        if "reference" in module_backends:
+            register_kernels(module_name, backend, _jit_compile_kernels(module_name))
+
+    if backend not in module_backends:
+        raise ValueError(
+            "Kernel backend '{0}' is not available for {1}. "
+            "Available backends are {2}.".format(
+                backend, module_name, available_backends(module_name)
+            )
+        )
+    return module_backends[backend]
+
+
+def bind_kernels(module_globals: MutableMapping, backend: str = None) -> None:
+    """
+    Binds the kernels of the selected backend into the namespace of the kernel
+    module, so that `from elastica._linalg import _batch_matvec` imports the
+    selected implementation.
+
+    Parameters
+    ----------
+    module_globals : dict
+        `globals()` of the kernel module.
+    backend : str
+        Name of the backend. If not given, the backend selected for this process
+        is used. If the module does not provide the backend, the kernels defined
+        in the module are kept.
+    """
+    module_name = module_globals["__name__"]
+    if backend is None:
+        backend = selected_backend()
+    module_backends = _kernel_registry.get(module_name, {})
+    if backend in module_backends or (
+        backend in JIT_KERNEL_BACKENDS and "reference" in module_backends
+    ):
+        module_globals.update(get_kernels(module_name, backend))
+
+
+def _jit_compile_kernels(module_name: str) -> Dict[str, Callable]:
+    """
+    Wraps the "reference" kernels of `module_name` with numba. Compilation itself
+    is lazy and happens on the first call for each signature, compiled functions
+    are cached on disk.
+
+    Kernels calling other kernels see the compiled version of those, whichever
+    backend is bound in the module namespace.
+    """
+    try:
+        import numba
+    except ImportError as error:
+        raise ImportError(
+            "The numba kernel backend requires numba. "
+            "Install it with `pip install numba`, or unset {0}.".format(
+                KERNEL_BACKEND_ENV
+            )
+        ) from error
+
+    cache_dir = os.environ.get(KERNEL_CACHE_DIR_ENV)
+    if cache_dir:
+        numba.config.CACHE_DIR = cache_dir
+
+    reference_kernels = _kernel_registry[module_name]["reference"]
+    # numba resolves global names when a kernel is first compiled, so the
+    # namespace can be completed after the dispatchers are created.
+    jit_globals = dict(next(iter(reference_kernels.values())).__globals__)
+
+    # Aliases of the same kernel share one dispatcher, and are compiled once.
+    dispatchers = {}
+    compiled_kernels = {}
+    for name, kernel in reference_kernels.items():
+        if id(kernel) not in dispatchers:
+            dispatchers[id(kernel)] = numba.njit(cache=True, nogil=True)(
+                FunctionType(
+                    kernel.__code__,
+                    jit_globals,
+                    kernel.__name__,
+                    kernel.__defaults__,
+                    kernel.__closure__,
+                )
+            )
+        compiled_kernels[name] = dispatchers[id(kernel)]
+
+    jit_globals.update(compiled_kernels)
+    for name, value in jit_globals.items():
+        if name in compiled_kernels:
+            continue
+        for owner_name, owner_backends in list(_kernel_registry.items()):
+            if owner_name == module_name or "reference" not in owner_backends:
+                continue
+            if any(kernels.get(name) is value for kernels in owner_backends.values()):
+                jit_globals[name] = get_kernels(owner_name, "numba")[name]
+                break
+    return compiled_kernels
+
+
+def precompile_kernels(memory_blocks: Sequence) -> None:
+    """
+    Runs the time-stepping kernels once on each memory block, so that JIT
+    backends compile every signature used by the hot path before the first
+    time step. It does nothing for the other backends.
+
+    Compiled kernels are specialized on the exact type and memory layout of
+    their arguments, so kernels are run on the memory blocks themselves and the
+    state of the blocks is restored afterwards.
+
+    Parameters
+    ----------
+    memory_blocks : Sequence
+        Memory blocks of the simulator, as constructed by `finalize`, or chunks
+        of memory blocks.
+    """
+    if selected_backend() not in JIT_KERNEL_BACKENDS:
+        return
+
+    from elastica.rod.data_structures import (
+        overload_operator_kinematic_numba,
+        overload_operator_dynamic_numba,
+    )
+
+    for memory_block in memory_blocks:
+        saved_state = {
+            name: value.copy()
+            for name, value in vars(memory_block).items()
+            if isinstance(value, np.ndarray)
+        }
+
+        memory_block.update_internal_forces_and_torques(0.0)
+        overload_operator_kinematic_numba(
+            memory_block.n_nodes,
+            np.float64(0.0),
+            memory_block.kinematic_states.position_collection,
+            memory_block.kinematic_states.director_collection,
+            memory_block.velocity_collection,
+            memory_block.omega_collection,
+            memory_block.kinematic_states.vector_scratch_in_nodes,
+            memory_block.kinematic_states.vector_scratch_in_elements,
+            memory_block.kinematic_states.matrix_scratch_in_elements,
+            memory_block.kinematic_states.position_residual,
+        )
+        if hasattr(memory_block, "dynamic_states"):
+            overload_operator_dynamic_numba(
+                memory_block.dynamic_states.rate_collection,
+                memory_block.dynamic_rates(0.0, np.float64(0.0)),
+            )
+        else:
+            # Chunks of memory blocks are only updated by the dynamic update of
+            # their block, but compute their own accelerations.
+            memory_block.update_accelerations(0.0)
+        memory_block.reset_external_forces_and_torques(0.0)
+
+        for name, value in saved_state.items():
+            np.copyto(vars(memory_block)[name], value)
@@ -1,10 +1,11 @@
 __doc__ = """ Quadrature and difference kernels """
 import numpy as np
-from numpy import zeros, empty
+from numpy import empty
 from elastica.reset_functions_for_block_structure._reset_ghost_vector_or_scalar import (
     _reset_vector_ghost,
 )
 import functools
+from elastica._backends import register_kernels, bind_kernels
 
 
 @functools.lru_cache(maxsize=2)
@@ -15,7 +16,7 @@ def _get_zero_array(dim, ndim):
         return np.zeros((dim, 1))
 
 
-def _trapezoidal(array_collection):
+def _trapezoidal(array_collection, out=None):
     """
     Simple trapezoidal quadrature rule with zero at end-points, in a dimension agnostic way
 
@@ -23,6 +24,8 @@ def _trapezoidal(array_collection):
     ----------
     array_collection : numpy.ndarray
         2D (dim, blocksize) array containing data with 'float' type.
+    out : numpy.ndarray, optional
+        2D (dim, blocksize+1) array the result is written into.
 
     Returns
     -------
@@ -36,7 +39,9 @@ def _trapezoidal(array_collection):
     This version: 781 ns ± 18.3 ns per loop
     """
     blocksize = array_collection.shape[1]
-    temp_collection = empty((3, blocksize + 1))
+    temp_collection = (
+        empty((3, blocksize + 1), dtype=array_collection.dtype) if out is None else out
+    )
 
     temp_collection[0, 0] = 0.5 * array_collection[0, 0]
     temp_collection[1, 0] = 0.5 * array_collection[1, 0]
@@ -60,7 +65,7 @@ def _trapezoidal(array_collection):
     return temp_collection
 
 
-def _trapezoidal_for_block_structure(array_collection, ghost_idx):
+def _trapezoidal_for_block_structure(array_collection, ghost_idx, out=None):
     """
     Simple trapezoidal quadrature rule with zero at end-points, in a dimension agnostic way. This form
     specifically for the block structure implementation and there is a reset function call, to reset
@@ -72,6 +77,8 @@ def _trapezoidal_for_block_structure(array_collection, ghost_idx):
         2D (dim, blocksize) array containing data with 'float' type.
     ghost_idx : numpy.ndarray
         1D (n_ghost) array containing data with 'int' type.
+    out : numpy.ndarray, optional
+        2D (dim, blocksize+1) array the result is written into.
 
     Returns
     -------
@@ -92,7 +99,11 @@ def _trapezoidal_for_block_structure(array_collection, ghost_idx):
     _reset_vector_ghost(array_collection, ghost_idx)
 
     blocksize = array_collection.shape[1]
-    temp_collection = np.empty((3, blocksize + 1))
+    temp_collection = (
+        np.empty((3, blocksize + 1), dtype=array_collection.dtype)
+        if out is None
+        else out
+    )
 
     temp_collection[0, 0] = 0.5 * array_collection[0, 0]
     temp_collection[1, 0] = 0.5 * array_collection[1, 0]
@@ -111,7 +122,7 @@ def _trapezoidal_for_block_structure(array_collection, ghost_idx):
     return temp_collection
 
 
-def _two_point_difference(array_collection):
+def _two_point_difference(array_collection, out=None):
     """
     This function does differentiation.
 
@@ -119,6 +130,8 @@ def _two_point_difference(array_collection):
     ----------
     array_collection : numpy.ndarray
         2D (dim, blocksize) array containing data with 'float' type.
+    out : numpy.ndarray, optional
+        2D (dim, blocksize+1) array the result is written into.
 
     Returns
     -------
@@ -133,7 +146,9 @@ def _two_point_difference(array_collection):
     This version: 952 ns ± 91.1 ns per loop
     """
     blocksize = array_collection.shape[1]
-    temp_collection = empty((3, blocksize + 1))
+    temp_collection = (
+        empty((3, blocksize + 1), dtype=array_collection.dtype) if out is None else out
+    )
 
     temp_collection[0, 0] = array_collection[0, 0]
     temp_collection[1, 0] = array_collection[1, 0]
@@ -151,7 +166,7 @@ def _two_point_difference(array_collection):
     return temp_collection
 
 
-def _two_point_difference_for_block_structure(array_collection, ghost_idx):
+def _two_point_difference_for_block_structure(array_collection, ghost_idx, out=None):
     """
     This function does the differentiation, for Cosserat rod model equations. This form
     specifically for the block structure implementation and there is a reset function call, to
@@ -163,6 +178,8 @@ def _two_point_difference_for_block_structure(array_collection, ghost_idx):
         2D (dim, blocksize) array containing data with 'float' type.
     ghost_idx : numpy.ndarray
         1D (n_ghost) array containing data with 'int' type.
+    out : numpy.ndarray, optional
+        2D (dim, blocksize+1) array the result is written into.
 
     Returns
     -------
@@ -184,7 +201,11 @@ def _two_point_difference_for_block_structure(array_collection, ghost_idx):
     _reset_vector_ghost(array_collection, ghost_idx)
 
     blocksize = array_collection.shape[1]
-    temp_collection = np.empty((3, blocksize + 1))
+    temp_collection = (
+        np.empty((3, blocksize + 1), dtype=array_collection.dtype)
+        if out is None
+        else out
+    )
 
     temp_collection[0, 0] = array_collection[0, 0]
     temp_collection[1, 0] = array_collection[1, 0]
@@ -201,7 +222,92 @@ def _two_point_difference_for_block_structure(array_collection, ghost_idx):
     return temp_collection
 
 
-def _difference(vector):
+def _masked_trapezoidal_for_block_structure(array_collection, mask, out=None):
+    """
+    Simple trapezoidal quadrature rule with zero at end-points, for the block structure
+    implementation. Ghosts are given by a mask precomputed on the memory block, instead
+    of their indices, so that ghosts are zeroed while the quadrature is computed.
+
+    Parameters
+    ----------
+    array_collection : numpy.ndarray
+        2D (dim, blocksize) array containing data with 'float' type. It is multiplied
+        by `mask` in place.
+    mask : numpy.ndarray
+        1D (blocksize) array containing data with 'float' type, 0.0 on ghosts and 1.0
+        elsewhere.
+    out : numpy.ndarray, optional
+        2D (dim, blocksize+1) array the result is written into.
+
+    Returns
+    -------
+    result: numpy.ndarray
+        2D (dim, blocksize+1) array containing data with 'float' type.
+
+    """
+    blocksize = array_collection.shape[1]
+    temp_collection = (
+        np.empty((3, blocksize + 1), dtype=array_collection.dtype)
+        if out is None
+        else out
+    )
+
+    for i in range(3):
+        previous = 0.0
+        for k in range(blocksize):
+            current = array_collection[i, k] * mask[k]
+            array_collection[i, k] = current
+            temp_collection[i, k] = 0.5 * (current + previous)
+            previous = current
+        temp_collection[i, blocksize] = 0.5 * previous
+
+    return temp_collection
+
+
+def _masked_two_point_difference_for_block_structure(array_collection, mask, out=None):
+    """
+    This function does the differentiation, for Cosserat rod model equations, for the
+    block structure implementation. Ghosts are given by a mask precomputed on the memory
+    block, instead of their indices, so that ghosts are zeroed while the difference is
+    computed.
+
+    Parameters
+    ----------
+    array_collection : numpy.ndarray
+        2D (dim, blocksize) array containing data with 'float' type. It is multiplied
+        by `mask` in place.
+    mask : numpy.ndarray
+        1D (blocksize) array containing data with 'float' type, 0.0 on ghosts and 1.0
+        elsewhere.
+    out : numpy.ndarray, optional
+        2D (dim, blocksize+1) array the result is written into.
+
+    Returns
+    -------
+    result: numpy.ndarray
+        2D (dim, blocksize+1) array containing data with 'float' type.
+
+    """
+    blocksize = array_collection.shape[1]
+    temp_collection = (
+        np.empty((3, blocksize + 1), dtype=array_collection.dtype)
+        if out is None
+        else out
+    )
+
+    for i in range(3):
+        previous = 0.0
+        for k in range(blocksize):
+            current = array_collection[i, k] * mask[k]
+            array_collection[i, k] = current
+            temp_collection[i, k] = current - previous
+            previous = current
+        temp_collection[i, blocksize] = -previous
+
+    return temp_collection
+
+
+def _difference(vector, out=None):
     """
     This function computes difference between elements of a batch vector.
 
@@ -209,6 +315,8 @@ def _difference(vector):
     ----------
     vector: numpy.ndarray
         2D (dim, blocksize) array containing data with 'float' type.
+    out : numpy.ndarray, optional
+        2D (dim, blocksize-1) array the result is written into.
 
     Returns
     -------
@@ -222,16 +330,16 @@ def _difference(vector):
     This version: 840 ns ± 14.5 ns per loop
     """
     blocksize = vector.shape[1] - 1
-    output_vector = zeros((3, blocksize))
+    output_vector = empty((3, blocksize), dtype=vector.dtype) if out is None else out
 
     for i in range(3):
         for k in range(blocksize):
-            output_vector[i, k] += vector[i, k + 1] - vector[i, k]
+            output_vector[i, k] = vector[i, k + 1] - vector[i, k]
 
     return output_vector
 
 
-def _average(vector):
+def _average(vector, out=None):
     """
     This function computes the average between elements of a vector.
 
@@ -239,6 +347,8 @@ def _average(vector):
     ----------
     vector : numpy.ndarray
         1D (blocksize) array containing data with 'float' type.
+    out : numpy.ndarray, optional
+        1D (blocksize-1) array the result is written into.
 
     Returns
     -------
@@ -252,7 +362,7 @@ def _average(vector):
     This version: 713 ns ± 3.69 ns per loop
     """
     blocksize = vector.shape[0] - 1
-    output_vector = empty((blocksize))
+    output_vector = empty((blocksize), dtype=vector.dtype) if out is None else out
 
     for k in range(blocksize):
         output_vector[k] = 0.5 * (vector[k + 1] + vector[k])
@@ -318,9 +428,132 @@ def _isnan_check(array):
     return np.isnan(array).any()
 
 
+"""
+Array-at-once versions of the kernels above, see their documentation.
+"""
+
+
+def _trapezoidal_numpy(array_collection, out=None):
+    dim, blocksize = array_collection.shape
+    temp_collection = (
+        np.empty((dim, blocksize + 1), dtype=array_collection.dtype)
+        if out is None
+        else out
+    )
+
+    np.add(
+        array_collection[:, 1:], array_collection[:, :-1], out=temp_collection[:, 1:-1]
+    )
+    temp_collection[:, 0] = array_collection[:, 0]
+    temp_collection[:, -1] = array_collection[:, -1]
+    temp_collection *= 0.5
+
+    return temp_collection
+
+
+def _trapezoidal_for_block_structure_numpy(array_collection, ghost_idx, out=None):
+    array_collection[:, ghost_idx] = 0.0
+    return _trapezoidal_numpy(array_collection, out)
+
+
+def _masked_trapezoidal_for_block_structure_numpy(array_collection, mask, out=None):
+    np.multiply(array_collection, mask, out=array_collection)
+    return _trapezoidal_numpy(array_collection, out)
+
+
+def _two_point_difference_numpy(array_collection, out=None):
+    dim, blocksize = array_collection.shape
+    temp_collection = (
+        np.empty((dim, blocksize + 1), dtype=array_collection.dtype)
+        if out is None
+        else out
+    )
+
+    np.subtract(
+        array_collection[:, 1:], array_collection[:, :-1], out=temp_collection[:, 1:-1]
+    )
+    temp_collection[:, 0] = array_collection[:, 0]
+    np.negative(array_collection[:, -1], out=temp_collection[:, -1])
+
+    return temp_collection
+
+
+def _two_point_difference_for_block_structure_numpy(
+    array_collection, ghost_idx, out=None
+):
+    array_collection[:, ghost_idx] = 0.0
+    return _two_point_difference_numpy(array_collection, out)
+
+
+def _masked_two_point_difference_for_block_structure_numpy(
+    array_collection, mask, out=None
+):
+    np.multiply(array_collection, mask, out=array_collection)
+    return _two_point_difference_numpy(array_collection, out)
+
+
+def _difference_numpy(vector, out=None):
+    return np.subtract(vector[:, 1:], vector[:, :-1], out=out)
+
+
+def _average_numpy(vector, out=None):
+    output_vector = np.add(vector[1:], vector[:-1], out=out)
+    output_vector *= 0.5
+    return output_vector
+
+
+def _clip_array_numpy(input_array, vmin, vmax):
+    return np.clip(input_array, vmin, vmax, out=input_array)
+
+
 position_difference_kernel = _difference
 position_average = _average
 quadrature_kernel = _trapezoidal
 difference_kernel = _two_point_difference
 quadrature_kernel_for_block_structure = _trapezoidal_for_block_structure
 difference_kernel_for_block_structure = _two_point_difference_for_block_structure
+
+
+register_kernels(
+    __name__,
+    "numpy",
+    {
+        "_trapezoidal": _trapezoidal_numpy,
+        "_trapezoidal_for_block_structure": _trapezoidal_for_block_structure_numpy,
+        "_masked_trapezoidal_for_block_structure": _masked_trapezoidal_for_block_structure_numpy,
+        "_two_point_difference": _two_point_difference_numpy,
+        "_two_point_difference_for_block_structure": _two_point_difference_for_block_structure_numpy,
+        "_masked_two_point_difference_for_block_structure": _masked_two_point_difference_for_block_structure_numpy,
+        "_difference": _difference_numpy,
+        "_average": _average_numpy,
+        "_clip_array": _clip_array_numpy,
+        "position_difference_kernel": _difference_numpy,
+        "position_average": _average_numpy,
+        "quadrature_kernel": _trapezoidal_numpy,
+        "difference_kernel": _two_point_difference_numpy,
+        "quadrature_kernel_for_block_structure": _trapezoidal_for_block_structure_numpy,
+        "difference_kernel_for_block_structure": _two_point_difference_for_block_structure_numpy,
+    },
+)
+register_kernels(
+    __name__,
+    "reference",
+    {
+        "_trapezoidal": _trapezoidal,
+        "_trapezoidal_for_block_structure": _trapezoidal_for_block_structure,
+        "_two_point_difference": _two_point_difference,
+        "_two_point_difference_for_block_structure": _two_point_difference_for_block_structure,
+        "_masked_trapezoidal_for_block_structure": _masked_trapezoidal_for_block_structure,
+        "_masked_two_point_difference_for_block_structure": _masked_two_point_difference_for_block_structure,
+        "_difference": _difference,
+        "_average": _average,
+        "_clip_array": _clip_array,
+        "position_difference_kernel": position_difference_kernel,
+        "position_average": position_average,
+        "quadrature_kernel": quadrature_kernel,
+        "difference_kernel": difference_kernel,
+        "quadrature_kernel_for_block_structure": quadrature_kernel_for_block_structure,
+        "difference_kernel_for_block_structure": difference_kernel_for_block_structure,
+    },
+)
+bind_kernels(globals())
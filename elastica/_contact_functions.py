@@ -2,10 +2,19 @@ __doc__ = """ Numba implementation module containing contact force calculation f
 
 from elastica.contact_utils import (
     _dot_product,
+    _dot_product_batch,
     _norm,
     _find_min_dist,
+    _find_min_dist_batch,
+    _find_closest_point_on_triangle,
+    _find_closest_point_on_triangle_batch,
+    _record_contact,
+    _record_contacts,
+    _aabbs_not_intersecting,
+    _find_self_contact_candidates,
     _find_slipping_elements,
     _node_to_element_mass_or_force,
+    _node_to_element_mass_or_force_in_block,
     _elements_to_nodes_inplace,
     _node_to_element_position,
     _node_to_element_velocity,
@@ -23,6 +32,7 @@ from elastica._linalg import (
     _batch_vec_oneD_vec_cross,
 )
 import numpy as np
+from elastica._backends import register_kernels, bind_kernels
 
 
 def _calculate_contact_forces_rod_cylinder(
@@ -44,6 +54,7 @@ def _calculate_contact_forces_rod_cylinder(
     contact_nu,
     velocity_damping_coefficient,
     friction_coefficient,
+    records=None,
 ) -> None:
     # We already pass in only the first n_elem x
     n_points = x_collection_rod.shape[1]
@@ -91,6 +102,8 @@ def _calculate_contact_forces_rod_cylinder(
 
         # magnitude* direction
         net_contact_force = 0.5 * mask * (contact_damping_force + contact_force)
+        if records is not None:
+            _record_contact(records, i, 0, gamma, 2.0 * _norm(net_contact_force))
 
         # Compute friction
         slip_interpenetration_velocity = (
@@ -168,15 +181,72 @@ def _calculate_contact_forces_rod_rod(
     external_forces_rod_two,
     contact_k,
     contact_nu,
+    records=None,
 ) -> None:
     # We already pass in only the first n_elem x
     n_points_rod_one = x_collection_rod_one.shape[1]
     n_points_rod_two = x_collection_rod_two.shape[1]
+
+    # Every element of rod one is a candidate for every element of rod two
+    candidate_offsets = np.arange(n_points_rod_one + 1) * n_points_rod_two
+    candidate_indices = (
+        np.arange(n_points_rod_one * n_points_rod_two) % n_points_rod_two
+    )
+
+    _calculate_contact_forces_rod_rod_candidates(
+        x_collection_rod_one,
+        radius_rod_one,
+        length_rod_one,
+        tangent_rod_one,
+        velocity_rod_one,
+        internal_forces_rod_one,
+        external_forces_rod_one,
+        x_collection_rod_two,
+        radius_rod_two,
+        length_rod_two,
+        tangent_rod_two,
+        velocity_rod_two,
+        internal_forces_rod_two,
+        external_forces_rod_two,
+        candidate_offsets,
+        candidate_indices,
+        contact_k,
+        contact_nu,
+        records,
+    )
+
+
+def _calculate_contact_forces_rod_rod_candidates(
+    x_collection_rod_one,
+    radius_rod_one,
+    length_rod_one,
+    tangent_rod_one,
+    velocity_rod_one,
+    internal_forces_rod_one,
+    external_forces_rod_one,
+    x_collection_rod_two,
+    radius_rod_two,
+    length_rod_two,
+    tangent_rod_two,
+    velocity_rod_two,
+    internal_forces_rod_two,
+    external_forces_rod_two,
+    candidate_offsets,
+    candidate_indices,
+    contact_k,
+    contact_nu,
+    records=None,
+) -> None:
+    # Narrowphase between element i of rod one and its candidate elements j of
+    # rod two, candidate_indices[candidate_offsets[i]:candidate_offsets[i + 1]]
+    n_points_rod_one = x_collection_rod_one.shape[1]
+    n_points_rod_two = x_collection_rod_two.shape[1]
     edge_collection_rod_one = _batch_product_k_ik_to_ik(length_rod_one, tangent_rod_one)
     edge_collection_rod_two = _batch_product_k_ik_to_ik(length_rod_two, tangent_rod_two)
 
     for i in range(n_points_rod_one):
-        for j in range(n_points_rod_two):
+        for candidate in range(candidate_offsets[i], candidate_offsets[i + 1]):
+            j = candidate_indices[candidate]
             radii_sum = radius_rod_one[i] + radius_rod_two[j]
             length_sum = length_rod_one[i] + length_rod_two[j]
             # Element-wise bounding box
@@ -244,6 +314,8 @@ def _calculate_contact_forces_rod_rod(
             net_contact_force = (
                 normal_force + 0.5 * mask * (contact_damping_force + contact_force)
             ) * distance_vector
+            if records is not None:
+                _record_contact(records, i, j, gamma, 2.0 * _norm(net_contact_force))
 
             # Add it to the rods at the end of the day
             if i == 0:
@@ -276,14 +348,52 @@ def _calculate_contact_forces_self_rod(
     external_forces_rod,
     contact_k,
     contact_nu,
+    records=None,
 ) -> None:
-    # We already pass in only the first n_elem x
+    # Only element pairs close enough to touch reach the narrowphase
+    candidate_offsets, candidate_indices = _find_self_contact_candidates(
+        x_collection_rod, radius_rod, length_rod, 0.0
+    )
+    _calculate_contact_forces_self_rod_candidates(
+        x_collection_rod,
+        radius_rod,
+        length_rod,
+        tangent_rod,
+        velocity_rod,
+        external_forces_rod,
+        candidate_offsets,
+        candidate_indices,
+        contact_k,
+        contact_nu,
+        records,
+    )
+
+
+def _calculate_contact_forces_self_rod_candidates(
+    x_collection_rod,
+    radius_rod,
+    length_rod,
+    tangent_rod,
+    velocity_rod,
+    external_forces_rod,
+    candidate_offsets,
+    candidate_indices,
+    contact_k,
+    contact_nu,
+    records=None,
+) -> None:
+    # Narrowphase between element i and its candidate elements j,
+    # candidate_indices[candidate_offsets[i]:candidate_offsets[i + 1]].
+    # Candidates may include neighbours of i, which are skipped here.
     n_points_rod = x_collection_rod.shape[1]
     edge_collection_rod_one = _batch_product_k_ik_to_ik(length_rod, tangent_rod)
 
     for i in range(n_points_rod):
         skip = int(1 + np.ceil(0.8 * np.pi * radius_rod[i] / length_rod[i]))
-        for j in range(i - skip, -1, -1):
+        for candidate in range(candidate_offsets[i], candidate_offsets[i + 1]):
+            j = candidate_indices[candidate]
+            if j > i - skip:
+                continue
             radii_sum = radius_rod[i] + radius_rod[j]
             length_sum = length_rod[i] + length_rod[j]
             # Element-wise bounding box
@@ -331,6 +441,8 @@ def _calculate_contact_forces_self_rod(
             net_contact_force = (
                 0.5 * mask * (contact_damping_force + contact_force)
             ) * distance_vector
+            if records is not None:
+                _record_contact(records, i, j, gamma, 2.0 * _norm(net_contact_force))
 
             # Add it to the rods at the end of the day
             # if i == 0:
@@ -373,6 +485,7 @@ def _calculate_contact_forces_rod_sphere(
     contact_nu,
     velocity_damping_coefficient,
     friction_coefficient,
+    records=None,
 ) -> None:
     # We already pass in only the first n_elem x
     n_points = x_collection_rod.shape[1]
@@ -419,6 +532,8 @@ def _calculate_contact_forces_rod_sphere(
 
         # magnitude* direction
         net_contact_force = 0.5 * mask * (contact_damping_force + contact_force)
+        if records is not None:
+            _record_contact(records, i, 0, gamma, 2.0 * _norm(net_contact_force))
 
         # Compute friction
         slip_interpenetration_velocity = (
@@ -479,6 +594,75 @@ def _calculate_contact_forces_rod_sphere(
     )
 
 
+def _calculate_contact_forces_rod_rigid_bodies(
+    x_collection_rod,
+    radius_rod,
+    lengths_rod,
+    tangents_rod,
+    internal_forces_rod,
+    external_forces_rod,
+    velocity_rod,
+    x_body_center,
+    x_body_tip,
+    edge_body,
+    half_extent_body,
+    radius_body,
+    length_body,
+    external_forces_body,
+    external_torques_body,
+    director_body,
+    velocity_body,
+    contact_k,
+    contact_nu,
+    velocity_damping_coefficient,
+    friction_coefficient,
+) -> None:
+    """
+    Contact of a rod with consecutive rigid bodies of a memory block. Each body
+    is the capsule of radius `radius_body` around the segment from `x_body_tip`
+    along `edge_body`, inside the box of half extent `half_extent_body` around
+    its center. Bodies whose box does not intersect the box of the rod are
+    skipped, the others are in contact with the rod as in
+    `_calculate_contact_forces_rod_cylinder`, one after the other.
+    """
+    aabb_rod = np.empty((3, 2))
+    aabb_body = np.empty((3, 2))
+    max_possible_dimension = np.max(radius_rod) + np.max(lengths_rod)
+    for i in range(3):
+        aabb_rod[i, 0] = np.min(x_collection_rod[i]) - max_possible_dimension
+        aabb_rod[i, 1] = np.max(x_collection_rod[i]) + max_possible_dimension
+
+    element_position = 0.5 * (x_collection_rod[..., 1:] + x_collection_rod[..., :-1])
+    edge_collection_rod = lengths_rod * tangents_rod
+    for b in range(x_body_center.shape[1]):
+        for i in range(3):
+            aabb_body[i, 0] = x_body_center[i, b] - half_extent_body[i, b]
+            aabb_body[i, 1] = x_body_center[i, b] + half_extent_body[i, b]
+        if _aabbs_not_intersecting(aabb_body, aabb_rod):
+            continue
+
+        _calculate_contact_forces_rod_cylinder(
+            element_position,
+            edge_collection_rod,
+            x_body_center[:, b],
+            x_body_tip[:, b],
+            edge_body[:, b],
+            radius_rod + radius_body[b],
+            lengths_rod + length_body[b],
+            internal_forces_rod,
+            external_forces_rod,
+            external_forces_body[:, b : b + 1],
+            external_torques_body[:, b : b + 1],
+            director_body[:, :, b],
+            velocity_rod,
+            velocity_body[:, b : b + 1],
+            contact_k,
+            contact_nu,
+            velocity_damping_coefficient,
+            friction_coefficient,
+        )
+
+
 def _calculate_contact_forces_rod_plane(
     plane_origin,
     plane_normal,
@@ -491,6 +675,7 @@ def _calculate_contact_forces_rod_plane(
     velocity_collection,
     internal_forces,
     external_forces,
+    records=None,
 ):
     """
     This function computes the plane force response on the element, in the
@@ -557,6 +742,16 @@ def _calculate_contact_forces_rod_plane(
     plane_response_force[..., no_contact_point_idx] = 0.0
     plane_response_force_total[..., no_contact_point_idx] = 0.0
 
+    if records is not None:
+        contact_point_idx = np.where((distance_from_plane - radius) <= surface_tol)[0]
+        _record_contacts(
+            records,
+            contact_point_idx,
+            np.zeros_like(contact_point_idx),
+            radius[contact_point_idx] - distance_from_plane[contact_point_idx],
+            _batch_norm(plane_response_force_total)[contact_point_idx],
+        )
+
     # Update the external forces
     _elements_to_nodes_inplace(plane_response_force_total, external_forces)
 
@@ -587,6 +782,7 @@ def _calculate_contact_forces_rod_plane_with_anisotropic_friction(
     external_forces,
     internal_torques,
     external_torques,
+    records=None,
 ):
     (
         plane_response_force_mag,
@@ -603,6 +799,7 @@ def _calculate_contact_forces_rod_plane_with_anisotropic_friction(
         velocity_collection,
         internal_forces,
         external_forces,
+        records,
     )
 
     # First compute component of rod tangent in plane. Because friction forces acts in plane not out of plane. Thus
@@ -837,3 +1034,1134 @@ def _calculate_contact_forces_cylinder_plane(
     external_forces += plane_response_force_total
 
     return (_batch_norm(plane_response_force), no_contact_point_idx)
+
+
+def _calculate_contact_forces_rod_mesh_surface(
+    faces,
+    face_normals,
+    candidate_offsets,
+    candidate_indices,
+    surface_tol,
+    k,
+    nu,
+    radius,
+    mass,
+    position_collection,
+    velocity_collection,
+    internal_forces,
+    external_forces,
+    records=None,
+):
+    """
+    This function computes the contact forces between the elements of a rod and
+    the triangles of a mesh surface, as `_calculate_contact_forces_rod_plane`
+    does for a plane. Each element is in contact with the closest of its
+    candidate triangles: from the closest point of the triangle if the element
+    is above the face, along the face normal if it is below. Elements
+    whose center is farther than their radius plus `surface_tol` from all
+    candidate triangles are not in contact, on either side of the surface.
+
+    Parameters
+    ----------
+    faces: numpy.ndarray
+        3D (dim, 3, n_faces) array containing the vertices of the triangles.
+    face_normals: numpy.ndarray
+        2D (dim, n_faces) array containing the unit normals of the triangles.
+    candidate_offsets: numpy.ndarray
+        1D (n_elems + 1) array. The candidate triangles of element i are
+        candidate_indices[candidate_offsets[i]:candidate_offsets[i + 1]].
+    candidate_indices: numpy.ndarray
+        1D array containing the indices of the candidate triangles.
+    records: tuple or None
+        Buffers of a `ContactRecords`, the pairs in contact are appended to.
+    """
+    n_elems = radius.shape[0]
+    nodal_total_forces = _batch_vector_sum(internal_forces, external_forces)
+    element_total_forces = _node_to_element_mass_or_force(nodal_total_forces)
+    element_position = _node_to_element_position(position_collection)
+    element_velocity = _node_to_element_velocity(mass, velocity_collection)
+
+    contact_forces = np.zeros((3, n_elems))
+    for i in range(n_elems):
+        point = element_position[:, i]
+
+        # Closest candidate triangle, the first one among equally close ones
+        nearest_face = -1
+        nearest_distance = np.inf
+        nearest_point = np.zeros(3)
+        for candidate in range(candidate_offsets[i], candidate_offsets[i + 1]):
+            face = candidate_indices[candidate]
+            closest_point = _find_closest_point_on_triangle(
+                point, faces[:, 0, face], faces[:, 1, face], faces[:, 2, face]
+            )
+            distance = _norm(point - closest_point)
+            if distance < nearest_distance:
+                nearest_face = face
+                nearest_distance = distance
+                nearest_point = closest_point
+        # Check if the rod element is in contact with the surface, farther
+        # triangles tell nothing about the side the element is on
+        if nearest_face < 0 or nearest_distance - radius[i] > surface_tol:
+            continue
+
+        # Contact normal, the face normal for elements below the face
+        distance_vector = point - nearest_point
+        normal = face_normals[:, nearest_face]
+        distance_from_surface = _dot_product(distance_vector, normal)
+        if distance_from_surface >= 0.0 and nearest_distance > 0.0:
+            normal = distance_vector / nearest_distance
+            distance_from_surface = nearest_distance
+
+        # Response to the total force pushing the element towards the surface
+        force_component_along_normal_direction = _dot_product(
+            element_total_forces[:, i], normal
+        )
+        surface_response_force = (
+            -min(force_component_along_normal_direction, 0.0) * normal
+        )
+
+        # Elastic force response due to penetration
+        penetration = min(distance_from_surface - radius[i], 0.0)
+        elastic_force = -k * (normal * penetration)
+
+        # Damping force response due to velocity towards the surface
+        damping_force = -nu * (normal * _dot_product(element_velocity[:, i], normal))
+
+        contact_forces[:, i] = surface_response_force + elastic_force + damping_force
+        if records is not None:
+            _record_contact(
+                records,
+                i,
+                nearest_face,
+                radius[i] - distance_from_surface,
+                _norm(contact_forces[:, i]),
+            )
+
+    # Update the external forces
+    _elements_to_nodes_inplace(contact_forces, external_forces)
+
+
+"""
+Vectorized kernels
+------------------
+The numpy kernels below evaluate all the candidate element pairs at once, and
+accumulate the contact forces with unbuffered scatter-adds (`np.add.at`), in the
+order the loop kernels add them.
+"""
+
+
+def _scatter_add_element_forces(forces, element_index, force, end_weight, n_elems):
+    """
+    Adds `force` (dim, n_pairs) applied on the elements `element_index` to the
+    nodes of each element, as the loop kernels do: the first and last elements
+    pass 2/3 of twice the force to their outer node and 4/3 to their inner node.
+    Nodes receive the forces of the pairs in order. `end_weight` selects which
+    ends get the special treatment: (first, last).
+    """
+    first_end, last_end = end_weight
+    at_first = (element_index == 0) & first_end
+    at_last = (element_index == n_elems - 1) & last_end
+    force_on_start = np.where(
+        at_first, force * 2 / 3, np.where(at_last, force * 4 / 3, force)
+    )
+    force_on_end = np.where(
+        at_first, force * 4 / 3, np.where(at_last, force * 2 / 3, force)
+    )
+    # Interleave (start, end) of each pair, so that pairs are added in order
+    node_index = np.stack((element_index, element_index + 1), axis=1).ravel()
+    node_force = np.stack((force_on_start, force_on_end), axis=2).reshape(3, -1)
+    np.add.at(forces, (slice(None), node_index), node_force)
+
+
+def _calculate_contact_forces_rod_cylinder_numpy(
+    x_collection_rod,
+    edge_collection_rod,
+    x_cylinder_center,
+    x_cylinder_tip,
+    edge_cylinder,
+    radii_sum,
+    length_sum,
+    internal_forces_rod,
+    external_forces_rod,
+    external_forces_cylinder,
+    external_torques_cylinder,
+    cylinder_director_collection,
+    velocity_rod,
+    velocity_cylinder,
+    contact_k,
+    contact_nu,
+    velocity_damping_coefficient,
+    friction_coefficient,
+    records=None,
+) -> None:
+    n_points = x_collection_rod.shape[1]
+    del_x = x_collection_rod - x_cylinder_tip[:, np.newaxis]
+    norm_del_x = np.sqrt(
+        del_x[0] * del_x[0] + del_x[1] * del_x[1] + del_x[2] * del_x[2]
+    )
+    (i,) = np.nonzero(norm_del_x < (radii_sum + length_sum))
+
+    n_pairs = i.shape[0]
+    distance_vector, s, _ = _find_min_dist_batch(
+        x_collection_rod[:, i],
+        edge_collection_rod[:, i],
+        np.repeat(x_cylinder_tip[:, np.newaxis], n_pairs, axis=1),
+        np.repeat(edge_cylinder[:, np.newaxis], n_pairs, axis=1),
+    )
+    x_cylinder_contact_point = (
+        x_cylinder_tip[:, np.newaxis] + s * edge_cylinder[:, np.newaxis]
+    )
+    distance_vector_length = np.sqrt(_dot_product_batch(distance_vector))
+    distance_vector /= distance_vector_length
+    gamma = radii_sum[i] - distance_vector_length
+
+    in_contact = ~(gamma < -1e-5)
+    i = i[in_contact]
+    distance_vector = distance_vector[:, in_contact]
+    gamma = gamma[in_contact]
+    x_cylinder_contact_point = x_cylinder_contact_point[:, in_contact]
+
+    mask = (gamma > 0.0) * 1.0
+
+    contact_force = contact_k * gamma * distance_vector
+    interpenetration_velocity = velocity_cylinder[..., 0, np.newaxis] - 0.5 * (
+        velocity_rod[:, i] + velocity_rod[:, i + 1]
+    )
+    normal_interpenetration_velocity = (
+        _dot_product_batch(interpenetration_velocity, distance_vector) * distance_vector
+    )
+    contact_damping_force = -contact_nu * normal_interpenetration_velocity
+    net_contact_force = 0.5 * mask * (contact_damping_force + contact_force)
+    if records is not None:
+        _record_contacts(
+            records,
+            i,
+            np.zeros_like(i),
+            gamma,
+            2.0 * np.sqrt(_dot_product_batch(net_contact_force)),
+        )
+
+    # Friction
+    slip_interpenetration_velocity = (
+        interpenetration_velocity - normal_interpenetration_velocity
+    )
+    slip_interpenetration_velocity_mag = np.sqrt(
+        _dot_product_batch(slip_interpenetration_velocity)
+    )
+    slip_interpenetration_velocity_unitized = slip_interpenetration_velocity / (
+        slip_interpenetration_velocity_mag + 1e-14
+    )
+    damping_force_in_slip_direction = (
+        velocity_damping_coefficient * slip_interpenetration_velocity_mag
+    )
+    coulombic_friction_force = friction_coefficient * np.sqrt(
+        _dot_product_batch(net_contact_force)
+    )
+    friction_force = (
+        -np.minimum(damping_force_in_slip_direction, coulombic_friction_force)
+        * slip_interpenetration_velocity_unitized
+    )
+    net_contact_force += friction_force
+
+    _scatter_add_element_forces(
+        external_forces_rod, i, -net_contact_force, (True, True), n_points
+    )
+
+    # Forces and torques on the cylinder, summed over the pairs in order
+    moment_arm = x_cylinder_contact_point - x_cylinder_center[:, np.newaxis]
+    cylinder_total_contact_forces = np.zeros((3, 1))
+    cylinder_total_contact_torques = np.zeros((3, 1))
+    np.add.at(
+        cylinder_total_contact_forces,
+        (slice(None), np.zeros_like(i)),
+        2.0 * net_contact_force,
+    )
+    np.add.at(
+        cylinder_total_contact_torques,
+        (slice(None), np.zeros_like(i)),
+        np.cross(moment_arm, 2.0 * net_contact_force, axis=0),
+    )
+    external_forces_cylinder[..., 0] += cylinder_total_contact_forces[:, 0]
+    external_torques_cylinder[..., 0] += (
+        cylinder_director_collection @ cylinder_total_contact_torques[:, 0]
+    )
+
+
+def _calculate_contact_forces_rod_rigid_bodies_numpy(
+    x_collection_rod,
+    radius_rod,
+    lengths_rod,
+    tangents_rod,
+    internal_forces_rod,
+    external_forces_rod,
+    velocity_rod,
+    x_body_center,
+    x_body_tip,
+    edge_body,
+    half_extent_body,
+    radius_body,
+    length_body,
+    external_forces_body,
+    external_torques_body,
+    director_body,
+    velocity_body,
+    contact_k,
+    contact_nu,
+    velocity_damping_coefficient,
+    friction_coefficient,
+) -> None:
+    """
+    Array-at-once version of `_calculate_contact_forces_rod_rigid_bodies`, on
+    all the (body, element) pairs of the bodies whose box intersects the box of
+    the rod. Pairs are sorted by body, then by element, as the reference kernel
+    visits them.
+    """
+    n_elems = lengths_rod.shape[0]
+    max_possible_dimension = np.max(radius_rod) + np.max(lengths_rod)
+    rod_min = np.min(x_collection_rod, axis=1) - max_possible_dimension
+    rod_max = np.max(x_collection_rod, axis=1) + max_possible_dimension
+    (bodies,) = np.nonzero(
+        ~np.any(
+            (x_body_center + half_extent_body < rod_min[:, np.newaxis])
+            | (x_body_center - half_extent_body > rod_max[:, np.newaxis]),
+            axis=0,
+        )
+    )
+    if bodies.shape[0] == 0:
+        return
+
+    element_position = 0.5 * (x_collection_rod[..., 1:] + x_collection_rod[..., :-1])
+    edge_collection_rod = lengths_rod * tangents_rod
+
+    # Element-wise bounding spheres of all the pairs
+    b = np.repeat(bodies, n_elems)
+    i = np.tile(np.arange(n_elems), bodies.shape[0])
+    del_x = element_position[:, i] - x_body_tip[:, b]
+    norm_del_x = np.sqrt(_dot_product_batch(del_x))
+    candidates = norm_del_x < (
+        radius_rod[i] + radius_body[b] + lengths_rod[i] + length_body[b]
+    )
+    b = b[candidates]
+    i = i[candidates]
+
+    distance_vector, s, _ = _find_min_dist_batch(
+        element_position[:, i],
+        edge_collection_rod[:, i],
+        x_body_tip[:, b],
+        edge_body[:, b],
+    )
+    x_body_contact_point = x_body_tip[:, b] + s * edge_body[:, b]
+    distance_vector_length = np.sqrt(_dot_product_batch(distance_vector))
+    distance_vector /= distance_vector_length
+    gamma = radius_rod[i] + radius_body[b] - distance_vector_length
+
+    in_contact = ~(gamma < -1e-5)
+    b = b[in_contact]
+    i = i[in_contact]
+    distance_vector = distance_vector[:, in_contact]
+    gamma = gamma[in_contact]
+    x_body_contact_point = x_body_contact_point[:, in_contact]
+
+    mask = (gamma > 0.0) * 1.0
+
+    contact_force = contact_k * gamma * distance_vector
+    interpenetration_velocity = velocity_body[:, b] - 0.5 * (
+        velocity_rod[:, i] + velocity_rod[:, i + 1]
+    )
+    normal_interpenetration_velocity = (
+        _dot_product_batch(interpenetration_velocity, distance_vector) * distance_vector
+    )
+    contact_damping_force = -contact_nu * normal_interpenetration_velocity
+    net_contact_force = 0.5 * mask * (contact_damping_force + contact_force)
+
+    # Friction
+    slip_interpenetration_velocity = (
+        interpenetration_velocity - normal_interpenetration_velocity
+    )
+    slip_interpenetration_velocity_mag = np.sqrt(
+        _dot_product_batch(slip_interpenetration_velocity)
+    )
+    slip_interpenetration_velocity_unitized = slip_interpenetration_velocity / (
+        slip_interpenetration_velocity_mag + 1e-14
+    )
+    damping_force_in_slip_direction = (
+        velocity_damping_coefficient * slip_interpenetration_velocity_mag
+    )
+    coulombic_friction_force = friction_coefficient * np.sqrt(
+        _dot_product_batch(net_contact_force)
+    )
+    friction_force = (
+        -np.minimum(damping_force_in_slip_direction, coulombic_friction_force)
+        * slip_interpenetration_velocity_unitized
+    )
+    net_contact_force += friction_force
+
+    _scatter_add_element_forces(
+        external_forces_rod, i, -net_contact_force, (True, True), n_elems
+    )
+
+    # Forces and torques on the bodies, summed over their pairs in order
+    moment_arm = x_body_contact_point - x_body_center[:, b]
+    body_total_contact_forces = np.zeros(x_body_center.shape)
+    body_total_contact_torques = np.zeros(x_body_center.shape)
+    np.add.at(body_total_contact_forces, (slice(None), b), 2.0 * net_contact_force)
+    np.add.at(
+        body_total_contact_torques,
+        (slice(None), b),
+        np.cross(moment_arm, 2.0 * net_contact_force, axis=0),
+    )
+    external_forces_body += body_total_contact_forces
+    external_torques_body += _batch_matvec(director_body, body_total_contact_torques)
+
+
+def _calculate_contact_forces_rod_rod_candidates_numpy(
+    x_collection_rod_one,
+    radius_rod_one,
+    length_rod_one,
+    tangent_rod_one,
+    velocity_rod_one,
+    internal_forces_rod_one,
+    external_forces_rod_one,
+    x_collection_rod_two,
+    radius_rod_two,
+    length_rod_two,
+    tangent_rod_two,
+    velocity_rod_two,
+    internal_forces_rod_two,
+    external_forces_rod_two,
+    candidate_offsets,
+    candidate_indices,
+    contact_k,
+    contact_nu,
+    records=None,
+) -> None:
+    """
+    Notes
+    -----
+    Distances, penetrations and damping forces of all the candidate pairs are
+    evaluated at once. The equilibrium (normal) force of a pair depends on the
+    external forces added by the preceding pairs, so the pairs in contact are
+    then applied one after the other, in the order of the loop kernel.
+    """
+    n_points_rod_one = x_collection_rod_one.shape[1]
+    n_points_rod_two = x_collection_rod_two.shape[1]
+    i = np.repeat(np.arange(n_points_rod_one), np.diff(candidate_offsets))
+    j = candidate_indices
+
+    radii_sum = radius_rod_one[i] + radius_rod_two[j]
+    length_sum = length_rod_one[i] + length_rod_two[j]
+    del_x = x_collection_rod_one[:, i] - x_collection_rod_two[:, j]
+    near = np.sqrt(_dot_product_batch(del_x)) < (radii_sum + length_sum)
+    i, j = i[near], j[near]
+    radii_sum = radii_sum[near]
+
+    distance_vector, _, _ = _find_min_dist_batch(
+        x_collection_rod_one[:, i],
+        length_rod_one[i] * tangent_rod_one[:, i],
+        x_collection_rod_two[:, j],
+        length_rod_two[j] * tangent_rod_two[:, j],
+    )
+    distance_vector_length = np.sqrt(_dot_product_batch(distance_vector))
+    distance_vector /= distance_vector_length
+    gamma = radii_sum - distance_vector_length
+
+    in_contact = ~(gamma < -1e-5)
+    i, j = i[in_contact], j[in_contact]
+    distance_vector = distance_vector[:, in_contact]
+    gamma = gamma[in_contact]
+
+    mask = (gamma > 0.0) * 1.0
+    contact_force = contact_k * gamma
+    interpenetration_velocity = 0.5 * (
+        (velocity_rod_one[:, i] + velocity_rod_one[:, i + 1])
+        - (velocity_rod_two[:, j] + velocity_rod_two[:, j + 1])
+    )
+    contact_damping_force = contact_nu * _dot_product_batch(
+        interpenetration_velocity, distance_vector
+    )
+    elastic_and_damping_force = 0.5 * mask * (contact_damping_force + contact_force)
+
+    for pair in range(i.shape[0]):
+        i_pair = i[pair]
+        j_pair = j[pair]
+        pair_distance_vector = distance_vector[:, pair]
+        rod_one_elemental_forces = 0.5 * (
+            external_forces_rod_one[:, i_pair]
+            + external_forces_rod_one[:, i_pair + 1]
+            + internal_forces_rod_one[:, i_pair]
+            + internal_forces_rod_one[:, i_pair + 1]
+        )
+        rod_two_elemental_forces = 0.5 * (
+            external_forces_rod_two[:, j_pair]
+            + external_forces_rod_two[:, j_pair + 1]
+            + internal_forces_rod_two[:, j_pair]
+            + internal_forces_rod_two[:, j_pair + 1]
+        )
+        equilibrium_forces = -rod_one_elemental_forces + rod_two_elemental_forces
+        normal_force = _dot_product(equilibrium_forces, pair_distance_vector)
+        normal_force = abs(min(normal_force, 0.0))
+
+        net_contact_force = (
+            normal_force + elastic_and_damping_force[pair]
+        ) * pair_distance_vector
+        if records is not None:
+            _record_contact(
+                records, i_pair, j_pair, gamma[pair], 2.0 * _norm(net_contact_force)
+            )
+
+        if i_pair == 0:
+            external_forces_rod_one[:, i_pair] -= net_contact_force * 2 / 3
+            external_forces_rod_one[:, i_pair + 1] -= net_contact_force * 4 / 3
+        elif i_pair == n_points_rod_one - 1:
+            external_forces_rod_one[:, i_pair] -= net_contact_force * 4 / 3
+            external_forces_rod_one[:, i_pair + 1] -= net_contact_force * 2 / 3
+        else:
+            external_forces_rod_one[:, i_pair] -= net_contact_force
+            external_forces_rod_one[:, i_pair + 1] -= net_contact_force
+
+        if j_pair == 0:
+            external_forces_rod_two[:, j_pair] += net_contact_force * 2 / 3
+            external_forces_rod_two[:, j_pair + 1] += net_contact_force * 4 / 3
+        elif j_pair == n_points_rod_two - 1:
+            external_forces_rod_two[:, j_pair] += net_contact_force * 4 / 3
+            external_forces_rod_two[:, j_pair + 1] += net_contact_force * 2 / 3
+        else:
+            external_forces_rod_two[:, j_pair] += net_contact_force
+            external_forces_rod_two[:, j_pair + 1] += net_contact_force
+
+
+def _calculate_contact_forces_self_rod_candidates_numpy(
+    x_collection_rod,
+    radius_rod,
+    length_rod,
+    tangent_rod,
+    velocity_rod,
+    external_forces_rod,
+    candidate_offsets,
+    candidate_indices,
+    contact_k,
+    contact_nu,
+    records=None,
+) -> None:
+    n_points_rod = x_collection_rod.shape[1]
+    i = np.repeat(np.arange(n_points_rod), np.diff(candidate_offsets))
+    j = candidate_indices
+
+    skip = (1 + np.ceil(0.8 * np.pi * radius_rod / length_rod)).astype(np.int64)
+    radii_sum = radius_rod[i] + radius_rod[j]
+    length_sum = length_rod[i] + length_rod[j]
+    del_x = x_collection_rod[:, i] - x_collection_rod[:, j]
+    near = (j <= i - skip[i]) & (
+        np.sqrt(_dot_product_batch(del_x)) < (radii_sum + length_sum)
+    )
+    i, j = i[near], j[near]
+    radii_sum = radii_sum[near]
+
+    distance_vector, _, _ = _find_min_dist_batch(
+        x_collection_rod[:, i],
+        length_rod[i] * tangent_rod[:, i],
+        x_collection_rod[:, j],
+        length_rod[j] * tangent_rod[:, j],
+    )
+    distance_vector_length = np.sqrt(_dot_product_batch(distance_vector))
+    distance_vector /= distance_vector_length
+    gamma = radii_sum - distance_vector_length
+
+    in_contact = ~(gamma < -1e-5)
+    i, j = i[in_contact], j[in_contact]
+    distance_vector = distance_vector[:, in_contact]
+    gamma = gamma[in_contact]
+
+    mask = (gamma > 0.0) * 1.0
+    contact_force = contact_k * gamma
+    interpenetration_velocity = 0.5 * (
+        (velocity_rod[:, i] + velocity_rod[:, i + 1])
+        - (velocity_rod[:, j] + velocity_rod[:, j + 1])
+    )
+    contact_damping_force = contact_nu * _dot_product_batch(
+        interpenetration_velocity, distance_vector
+    )
+    net_contact_force = (
+        0.5 * mask * (contact_damping_force + contact_force)
+    ) * distance_vector
+    if records is not None:
+        _record_contacts(
+            records, i, j, gamma, 2.0 * np.sqrt(_dot_product_batch(net_contact_force))
+        )
+
+    # Element i is after element j, only its last end and the first end of
+    # element j get the special treatment. Forces of each pair go to i then j.
+    n_pairs = i.shape[0]
+    element_index = np.stack((i, j), axis=1).ravel()
+    element_force = np.stack((-net_contact_force, net_contact_force), axis=2)
+    end_weight = (
+        np.tile(np.array([False, True]), n_pairs),
+        np.tile(np.array([True, False]), n_pairs),
+    )
+    _scatter_add_element_forces(
+        external_forces_rod,
+        element_index,
+        element_force.reshape(3, -1),
+        end_weight,
+        n_points_rod,
+    )
+
+
+"""
+The rod-plane kernels below apply to consecutive rods of a memory block at once,
+with the ghosts between the rods. Kernels of a single rod are the same kernels
+applied to a block of one rod.
+"""
+
+
+def _calculate_contact_forces_rod_plane_in_block(
+    plane_origin,
+    plane_normal,
+    surface_tol,
+    k,
+    nu,
+    radius,
+    mass,
+    position_collection,
+    velocity_collection,
+    internal_forces,
+    external_forces,
+    first_elements,
+    last_elements,
+    ghost_elements,
+    records=None,
+):
+    """
+    `_calculate_contact_forces_rod_plane` applied at once to consecutive rods
+    of a memory block. Arrays include the ghosts between the rods, which are
+    never in contact.
+
+    Parameters
+    ----------
+    first_elements: numpy.ndarray
+        1D array containing the index of the first element of each rod.
+    last_elements: numpy.ndarray
+        1D array containing the index of the last element of each rod.
+    ghost_elements: numpy.ndarray
+        1D array containing the indices of the ghost elements.
+    records: tuple or None
+        Buffers of a `ContactRecords`, the pairs in contact are appended to.
+
+    Returns
+    -------
+    magnitude of the plane response, and indices of the elements not in contact
+    """
+
+    # Compute plane response force
+    nodal_total_forces = _batch_vector_sum(internal_forces, external_forces)
+    element_total_forces = _node_to_element_mass_or_force_in_block(
+        nodal_total_forces, first_elements, last_elements
+    )
+
+    force_component_along_normal_direction = _batch_product_i_ik_to_k(
+        plane_normal, element_total_forces
+    )
+    forces_along_normal_direction = _batch_product_i_k_to_ik(
+        plane_normal, force_component_along_normal_direction
+    )
+
+    # If the total force component along the plane normal direction is greater than zero that means,
+    # total force is pushing rod away from the plane not towards the plane. Thus, response force
+    # applied by the surface has to be zero.
+    forces_along_normal_direction[
+        ..., np.where(force_component_along_normal_direction > 0)[0]
+    ] = 0.0
+    # Compute response force on the element. Plane response force
+    # has to be away from the surface and towards the element. Thus
+    # multiply forces along normal direction with negative sign.
+    plane_response_force = -forces_along_normal_direction
+
+    # Elastic force response due to penetration
+    element_position = _node_to_element_position(position_collection)
+    distance_from_plane = _batch_product_i_ik_to_k(
+        plane_normal, (element_position - plane_origin)
+    )
+    plane_penetration = np.minimum(distance_from_plane - radius, 0.0)
+    elastic_force = -k * _batch_product_i_k_to_ik(plane_normal, plane_penetration)
+
+    # Damping force response due to velocity towards the plane
+    element_velocity = _node_to_element_velocity(
+        mass=mass, node_velocity_collection=velocity_collection
+    )
+    normal_component_of_element_velocity = _batch_product_i_ik_to_k(
+        plane_normal, element_velocity
+    )
+    damping_force = -nu * _batch_product_i_k_to_ik(
+        plane_normal, normal_component_of_element_velocity
+    )
+
+    # Compute total plane response force
+    plane_response_force_total = plane_response_force + elastic_force + damping_force
+
+    # Check if the rod elements are in contact with plane.
+    no_contact_point = (distance_from_plane - radius) > surface_tol
+    no_contact_point[ghost_elements] = True
+    no_contact_point_idx = np.where(no_contact_point)[0]
+    # If rod element does not have any contact with plane, plane cannot apply response
+    # force on the element. Thus lets set plane response force to 0.0 for the no contact points.
+    plane_response_force[..., no_contact_point_idx] = 0.0
+    plane_response_force_total[..., no_contact_point_idx] = 0.0
+
+    if records is not None:
+        contact_point_idx = np.where(~no_contact_point)[0]
+        _record_contacts(
+            records,
+            contact_point_idx,
+            np.zeros_like(contact_point_idx),
+            radius[contact_point_idx] - distance_from_plane[contact_point_idx],
+            _batch_norm(plane_response_force_total)[contact_point_idx],
+        )
+
+    # Update the external forces
+    _elements_to_nodes_inplace(plane_response_force_total, external_forces)
+
+    return (_batch_norm(plane_response_force), no_contact_point_idx)
+
+
+def _calculate_contact_forces_rod_plane_with_anisotropic_friction_in_block(
+    plane_origin,
+    plane_normal,
+    surface_tol,
+    slip_velocity_tol,
+    k,
+    nu,
+    kinetic_mu_forward,
+    kinetic_mu_backward,
+    kinetic_mu_sideways,
+    static_mu_forward,
+    static_mu_backward,
+    static_mu_sideways,
+    radius,
+    mass,
+    tangents,
+    position_collection,
+    director_collection,
+    velocity_collection,
+    omega_collection,
+    internal_forces,
+    external_forces,
+    internal_torques,
+    external_torques,
+    first_elements,
+    last_elements,
+    ghost_elements,
+    records=None,
+):
+    """
+    `_calculate_contact_forces_rod_plane_with_anisotropic_friction` applied at
+    once to consecutive rods of a memory block. Arrays include the ghosts
+    between the rods, which are never in contact.
+
+    Parameters
+    ----------
+    first_elements: numpy.ndarray
+        1D array containing the index of the first element of each rod.
+    last_elements: numpy.ndarray
+        1D array containing the index of the last element of each rod.
+    ghost_elements: numpy.ndarray
+        1D array containing the indices of the ghost elements.
+    """
+    (
+        plane_response_force_mag,
+        no_contact_point_idx,
+    ) = _calculate_contact_forces_rod_plane_in_block(
+        plane_origin,
+        plane_normal,
+        surface_tol,
+        k,
+        nu,
+        radius,
+        mass,
+        position_collection,
+        velocity_collection,
+        internal_forces,
+        external_forces,
+        first_elements,
+        last_elements,
+        ghost_elements,
+        records,
+    )
+
+    # First compute component of rod tangent in plane. Because friction forces acts in plane not out of plane. Thus
+    # axial direction has to be in plane, it cannot be out of plane. We are projecting rod element tangent vector in
+    # to the plane. So friction forces can only be in plane forces and not out of plane.
+    tangent_along_normal_direction = _batch_product_i_ik_to_k(plane_normal, tangents)
+    tangent_perpendicular_to_normal_direction = tangents - _batch_product_i_k_to_ik(
+        plane_normal, tangent_along_normal_direction
+    )
+    tangent_perpendicular_to_normal_direction_mag = _batch_norm(
+        tangent_perpendicular_to_normal_direction
+    )
+    # Normalize tangent_perpendicular_to_normal_direction. This is axial direction for plane. Here we are adding
+    # small tolerance (1e-10) for normalization, in order to prevent division by 0.
+    axial_direction = _batch_product_k_ik_to_ik(
+        1 / (tangent_perpendicular_to_normal_direction_mag + 1e-14),
+        tangent_perpendicular_to_normal_direction,
+    )
+    element_velocity = _node_to_element_velocity(
+        mass=mass, node_velocity_collection=velocity_collection
+    )
+    # first apply axial kinetic friction
+    velocity_mag_along_axial_direction = _batch_dot(element_velocity, axial_direction)
+    velocity_along_axial_direction = _batch_product_k_ik_to_ik(
+        velocity_mag_along_axial_direction, axial_direction
+    )
+
+    # Friction forces depends on the direction of velocity, in other words sign
+    # of the velocity vector.
+    velocity_sign_along_axial_direction = np.sign(velocity_mag_along_axial_direction)
+    # Check top for sign convention
+    kinetic_mu = 0.5 * (
+        kinetic_mu_forward * (1 + velocity_sign_along_axial_direction)
+        + kinetic_mu_backward * (1 - velocity_sign_along_axial_direction)
+    )
+    # Call slip function to check if elements slipping or not
+    slip_function_along_axial_direction = _find_slipping_elements(
+        velocity_along_axial_direction, slip_velocity_tol
+    )
+    # Now rolling kinetic friction
+    rolling_direction = _batch_vec_oneD_vec_cross(axial_direction, plane_normal)
+    torque_arm = _batch_product_i_k_to_ik(-plane_normal, radius)
+    velocity_along_rolling_direction = _batch_dot(element_velocity, rolling_direction)
+    directors_transpose = _batch_matrix_transpose(director_collection)
+    # w_rot = Q.T @ omega @ Q @ r
+    rotation_velocity = _batch_matvec(
+        directors_transpose,
+        _batch_cross(omega_collection, _batch_matvec(director_collection, torque_arm)),
+    )
+    rotation_velocity_along_rolling_direction = _batch_dot(
+        rotation_velocity, rolling_direction
+    )
+    slip_velocity_mag_along_rolling_direction = (
+        velocity_along_rolling_direction + rotation_velocity_along_rolling_direction
+    )
+    slip_velocity_along_rolling_direction = _batch_product_k_ik_to_ik(
+        slip_velocity_mag_along_rolling_direction, rolling_direction
+    )
+    slip_function_along_rolling_direction = _find_slipping_elements(
+        slip_velocity_along_rolling_direction, slip_velocity_tol
+    )
+    # Compute unitized total slip velocity vector. We will use this to distribute the weight of the rod in axial
+    # and rolling directions.
+    unitized_total_velocity = (
+        slip_velocity_along_rolling_direction + velocity_along_axial_direction
+    )
+    unitized_total_velocity /= _batch_norm(unitized_total_velocity + 1e-14)
+    # Apply kinetic friction in axial direction.
+    kinetic_friction_force_along_axial_direction = -(
+        (1.0 - slip_function_along_axial_direction)
+        * kinetic_mu
+        * plane_response_force_mag
+        * _batch_dot(unitized_total_velocity, axial_direction)
+        * axial_direction
+    )
+    # If rod element does not have any contact with plane, plane cannot apply friction
+    # force on the element. Thus lets set kinetic friction force to 0.0 for the no contact points.
+    kinetic_friction_force_along_axial_direction[..., no_contact_point_idx] = 0.0
+    _elements_to_nodes_inplace(
+        kinetic_friction_force_along_axial_direction, external_forces
+    )
+    # Apply kinetic friction in rolling direction.
+    kinetic_friction_force_along_rolling_direction = -(
+        (1.0 - slip_function_along_rolling_direction)
+        * kinetic_mu_sideways
+        * plane_response_force_mag
+        * _batch_dot(unitized_total_velocity, rolling_direction)
+        * rolling_direction
+    )
+    # If rod element does not have any contact with plane, plane cannot apply friction
+    # force on the element. Thus lets set kinetic friction force to 0.0 for the no contact points.
+    kinetic_friction_force_along_rolling_direction[..., no_contact_point_idx] = 0.0
+    _elements_to_nodes_inplace(
+        kinetic_friction_force_along_rolling_direction, external_forces
+    )
+    # torque = Q @ r @ Fr
+    external_torques += _batch_matvec(
+        director_collection,
+        _batch_cross(torque_arm, kinetic_friction_force_along_rolling_direction),
+    )
+
+    # now axial static friction
+    nodal_total_forces = _batch_vector_sum(internal_forces, external_forces)
+    element_total_forces = _node_to_element_mass_or_force_in_block(
+        nodal_total_forces, first_elements, last_elements
+    )
+    force_component_along_axial_direction = _batch_dot(
+        element_total_forces, axial_direction
+    )
+    force_component_sign_along_axial_direction = np.sign(
+        force_component_along_axial_direction
+    )
+    # check top for sign convention
+    static_mu = 0.5 * (
+        static_mu_forward * (1 + force_component_sign_along_axial_direction)
+        + static_mu_backward * (1 - force_component_sign_along_axial_direction)
+    )
+    max_friction_force = (
+        slip_function_along_axial_direction * static_mu * plane_response_force_mag
+    )
+    # friction = min(mu N, pushing force)
+    static_friction_force_along_axial_direction = -(
+        np.minimum(np.fabs(force_component_along_axial_direction), max_friction_force)
+        * force_component_sign_along_axial_direction
+        * axial_direction
+    )
+    # If rod element does not have any contact with plane, plane cannot apply friction
+    # force on the element. Thus lets set static friction force to 0.0 for the no contact points.
+    static_friction_force_along_axial_direction[..., no_contact_point_idx] = 0.0
+    _elements_to_nodes_inplace(
+        static_friction_force_along_axial_direction, external_forces
+    )
+
+    # now rolling static friction
+    # there is some normal, tangent and rolling directions inconsitency from Elastica
+    total_torques = _batch_matvec(
+        directors_transpose, (internal_torques + external_torques)
+    )
+    # Elastica has opposite defs of tangents in interaction.h and rod.cpp
+    total_torques_along_axial_direction = _batch_dot(total_torques, axial_direction)
+    force_component_along_rolling_direction = _batch_dot(
+        element_total_forces, rolling_direction
+    )
+    # Ghost elements have no radius, their force is discarded below.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        noslip_force = -(
+            (
+                radius * force_component_along_rolling_direction
+                - 2.0 * total_torques_along_axial_direction
+            )
+            / 3.0
+            / radius
+        )
+    max_friction_force = (
+        slip_function_along_rolling_direction
+        * static_mu_sideways
+        * plane_response_force_mag
+    )
+    noslip_force_sign = np.sign(noslip_force)
+    static_friction_force_along_rolling_direction = (
+        np.minimum(np.fabs(noslip_force), max_friction_force)
+        * noslip_force_sign
+        * rolling_direction
+    )
+    # If rod element does not have any contact with plane, plane cannot apply friction
+    # force on the element. Thus lets set plane static friction force to 0.0 for the no contact points.
+    static_friction_force_along_rolling_direction[..., no_contact_point_idx] = 0.0
+    _elements_to_nodes_inplace(
+        static_friction_force_along_rolling_direction, external_forces
+    )
+    external_torques += _batch_matvec(
+        director_collection,
+        _batch_cross(torque_arm, static_friction_force_along_rolling_direction),
+    )
+
+
+def _calculate_contact_forces_rod_plane_numpy(
+    plane_origin,
+    plane_normal,
+    surface_tol,
+    k,
+    nu,
+    radius,
+    mass,
+    position_collection,
+    velocity_collection,
+    internal_forces,
+    external_forces,
+    records=None,
+):
+    n_elems = radius.shape[0]
+    return _calculate_contact_forces_rod_plane_in_block(
+        plane_origin,
+        plane_normal,
+        surface_tol,
+        k,
+        nu,
+        radius,
+        mass,
+        position_collection,
+        velocity_collection,
+        internal_forces,
+        external_forces,
+        np.array([0]),
+        np.array([n_elems - 1]),
+        np.empty(0, dtype=np.int64),
+        records,
+    )
+
+
+def _calculate_contact_forces_rod_plane_with_anisotropic_friction_numpy(
+    plane_origin,
+    plane_normal,
+    surface_tol,
+    slip_velocity_tol,
+    k,
+    nu,
+    kinetic_mu_forward,
+    kinetic_mu_backward,
+    kinetic_mu_sideways,
+    static_mu_forward,
+    static_mu_backward,
+    static_mu_sideways,
+    radius,
+    mass,
+    tangents,
+    position_collection,
+    director_collection,
+    velocity_collection,
+    omega_collection,
+    internal_forces,
+    external_forces,
+    internal_torques,
+    external_torques,
+    records=None,
+):
+    n_elems = radius.shape[0]
+    _calculate_contact_forces_rod_plane_with_anisotropic_friction_in_block(
+        plane_origin,
+        plane_normal,
+        surface_tol,
+        slip_velocity_tol,
+        k,
+        nu,
+        kinetic_mu_forward,
+        kinetic_mu_backward,
+        kinetic_mu_sideways,
+        static_mu_forward,
+        static_mu_backward,
+        static_mu_sideways,
+        radius,
+        mass,
+        tangents,
+        position_collection,
+        director_collection,
+        velocity_collection,
+        omega_collection,
+        internal_forces,
+        external_forces,
+        internal_torques,
+        external_torques,
+        np.array([0]),
+        np.array([n_elems - 1]),
+        np.empty(0, dtype=np.int64),
+        records,
+    )
+
+
+def _calculate_contact_forces_rod_mesh_surface_numpy(
+    faces,
+    face_normals,
+    candidate_offsets,
+    candidate_indices,
+    surface_tol,
+    k,
+    nu,
+    radius,
+    mass,
+    position_collection,
+    velocity_collection,
+    internal_forces,
+    external_forces,
+    records=None,
+):
+    n_elems = radius.shape[0]
+    nodal_total_forces = _batch_vector_sum(internal_forces, external_forces)
+    element_total_forces = _node_to_element_mass_or_force(nodal_total_forces)
+    element_position = _node_to_element_position(position_collection)
+    element_velocity = _node_to_element_velocity(mass, velocity_collection)
+
+    # Closest point of every candidate triangle
+    pair_element = np.repeat(np.arange(n_elems), np.diff(candidate_offsets))
+    pair_point = element_position[:, pair_element]
+    distance_vector = pair_point - _find_closest_point_on_triangle_batch(
+        pair_point,
+        faces[:, 0, candidate_indices],
+        faces[:, 1, candidate_indices],
+        faces[:, 2, candidate_indices],
+    )
+    distance = np.sqrt(_dot_product_batch(distance_vector))
+
+    # Closest candidate triangle of each element, the first one among equally
+    # close ones
+    order = np.lexsort((distance, pair_element))
+    first_of_element = np.ones(order.size, dtype=bool)
+    first_of_element[1:] = pair_element[order[1:]] != pair_element[order[:-1]]
+    nearest = order[first_of_element]
+    element = pair_element[nearest]
+
+    # Check if the rod elements are in contact with the surface, farther
+    # triangles tell nothing about the side the element is on
+    in_contact = distance[nearest] - radius[element] <= surface_tol
+    nearest = nearest[in_contact]
+    element = element[in_contact]
+    distance_vector = distance_vector[:, nearest]
+    distance = distance[nearest]
+
+    # Contact normal, the face normal for elements below the face
+    normal = face_normals[:, candidate_indices[nearest]]
+    distance_from_surface = _dot_product_batch(distance_vector, normal)
+    above = (distance_from_surface >= 0.0) & (distance > 0.0)
+    normal[:, above] = distance_vector[:, above] / distance[above]
+    distance_from_surface[above] = distance[above]
+
+    force_component_along_normal_direction = _dot_product_batch(
+        element_total_forces[:, element], normal
+    )
+    surface_response_force = (
+        -np.minimum(force_component_along_normal_direction, 0.0) * normal
+    )
+    penetration = np.minimum(distance_from_surface - radius[element], 0.0)
+    elastic_force = -k * (normal * penetration)
+    damping_force = -nu * (
+        normal * _dot_product_batch(element_velocity[:, element], normal)
+    )
+
+    contact_forces = np.zeros((3, n_elems))
+    contact_forces[:, element] = surface_response_force + elastic_force + damping_force
+    if records is not None:
+        _record_contacts(
+            records,
+            element,
+            candidate_indices[nearest],
+            radius[element] - distance_from_surface,
+            np.sqrt(_dot_product_batch(contact_forces[:, element])),
+        )
+    _elements_to_nodes_inplace(contact_forces, external_forces)
+
+
+register_kernels(
+    __name__,
+    "reference",
+    {
+        "_calculate_contact_forces_rod_cylinder": _calculate_contact_forces_rod_cylinder,
+        "_calculate_contact_forces_rod_rod": _calculate_contact_forces_rod_rod,
+        "_calculate_contact_forces_rod_rod_candidates": _calculate_contact_forces_rod_rod_candidates,
+        "_calculate_contact_forces_self_rod": _calculate_contact_forces_self_rod,
+        "_calculate_contact_forces_self_rod_candidates": _calculate_contact_forces_self_rod_candidates,
+        "_calculate_contact_forces_rod_sphere": _calculate_contact_forces_rod_sphere,
+        "_calculate_contact_forces_rod_rigid_bodies": _calculate_contact_forces_rod_rigid_bodies,
+        "_calculate_contact_forces_rod_plane": _calculate_contact_forces_rod_plane,
+        "_calculate_contact_forces_rod_plane_with_anisotropic_friction": _calculate_contact_forces_rod_plane_with_anisotropic_friction,
+        "_calculate_contact_forces_cylinder_plane": _calculate_contact_forces_cylinder_plane,
+        "_calculate_contact_forces_rod_mesh_surface": _calculate_contact_forces_rod_mesh_surface,
+    },
+)
+register_kernels(
+    __name__,
+    "numpy",
+    {
+        "_calculate_contact_forces_rod_cylinder": _calculate_contact_forces_rod_cylinder_numpy,
+        "_calculate_contact_forces_rod_rigid_bodies": _calculate_contact_forces_rod_rigid_bodies_numpy,
+        "_calculate_contact_forces_rod_rod_candidates": _calculate_contact_forces_rod_rod_candidates_numpy,
+        "_calculate_contact_forces_self_rod_candidates": _calculate_contact_forces_self_rod_candidates_numpy,
+        "_calculate_contact_forces_rod_plane": _calculate_contact_forces_rod_plane_numpy,
+        "_calculate_contact_forces_rod_plane_with_anisotropic_friction": _calculate_contact_forces_rod_plane_with_anisotropic_friction_numpy,
+        "_calculate_contact_forces_rod_mesh_surface": _calculate_contact_forces_rod_mesh_surface_numpy,
+    },
+)
+bind_kernels(globals())
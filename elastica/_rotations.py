@@ -5,17 +5,81 @@ from itertools import combinations
 
 import numpy as np
 from numpy import sin
-from numpy import cos
 from numpy import sqrt
-from numpy import arccos
+from numpy import arctan2
 
 
-from elastica._linalg import _batch_matmul
+from elastica._linalg import _batch_matmul, _batch_matvec, _batch_dot, _pair_signs
+from elastica._backends import register_kernels, bind_kernels
 
 
-def _get_rotation_matrix(scale: float, axis_collection):
+# Below this rotation angle, the rotation kernels switch to a Taylor series of
+# their coefficients, which are otherwise 0/0 for a vanishing angle.
+_SMALL_ANGLE = 1e-3
+_TINY = np.finfo(np.float64).tiny
+
+
+def _rotation_coefficients(scale: float, theta: float):
+    """
+    Coefficients of Rodrigues' formula for a rotation of angle `scale * theta`
+    around an (unnormalized) axis of norm `theta`.
+
+    Parameters
+    ----------
+    scale : float
+    theta : float
+        Norm of the rotation axis.
+
+    Returns
+    -------
+    sin_coefficient : float
+        sin(scale * theta) / theta
+    cos_coefficient : float
+        (1 - cos(scale * theta)) / theta^2
+
+    Note
+    ----
+    Multiplying the axis by these coefficients avoids normalizing it. For small
+    angles, the Taylor series of the coefficients is used, so that no division
+    by a vanishing angle takes place.
+    """
+    angle = scale * theta
+    if abs(angle) < _SMALL_ANGLE:
+        angle_sq = angle * angle
+        sin_coefficient = scale * (1.0 - angle_sq / 6.0 + angle_sq * angle_sq / 120.0)
+        cos_coefficient = (
+            scale * scale * (0.5 - angle_sq / 24.0 + angle_sq * angle_sq / 720.0)
+        )
+    else:
+        # 1 - cos(x) = 2 sin^2(x / 2), without cancellation for small x
+        half_sin = sin(0.5 * angle)
+        sin_coefficient = sin(angle) / theta
+        cos_coefficient = 2.0 * half_sin * half_sin / (theta * theta)
+    return sin_coefficient, cos_coefficient
+
+
+def _get_rotation_matrix(scale: float, axis_collection, out=None):
+    """
+    Rotation matrices of angle `scale * |axis|` around each axis, using
+    Rodrigues' formula.
+
+    Parameters
+    ----------
+    scale : float
+    axis_collection : numpy.ndarray
+        2D (dim, blocksize) array
+    out : numpy.ndarray, optional
+        3D (dim, dim, blocksize) array the rotation matrices are written into.
+
+    Returns
+    -------
+    rot_mat : numpy.ndarray
+        3D (dim, dim, blocksize) array
+    """
     blocksize = axis_collection.shape[1]
-    rot_mat = np.empty((3, 3, blocksize))
+    rot_mat = (
+        np.empty((3, 3, blocksize), dtype=axis_collection.dtype) if out is None else out
+    )
 
     for k in range(blocksize):
         v0 = axis_collection[0, k]
@@ -23,14 +87,7 @@ def _get_rotation_matrix(scale: float, axis_collection):
         v2 = axis_collection[2, k]
 
         theta = sqrt(v0 * v0 + v1 * v1 + v2 * v2)
-
-        v0 /= theta + 1e-14
-        v1 /= theta + 1e-14
-        v2 /= theta + 1e-14
-
-        theta *= scale
-        u_prefix = sin(theta)
-        u_sq_prefix = 1.0 - cos(theta)
+        u_prefix, u_sq_prefix = _rotation_coefficients(scale, theta)
 
         rot_mat[0, 0, k] = 1.0 - u_sq_prefix * (v1 * v1 + v2 * v2)
         rot_mat[1, 1, k] = 1.0 - u_sq_prefix * (v0 * v0 + v2 * v2)
@@ -46,7 +103,82 @@ def _get_rotation_matrix(scale: float, axis_collection):
     return rot_mat
 
 
-def _rotate(director_collection, scale: float, axis_collection):
+def _get_rotation_matrix_numpy(scale: float, axis_collection, out=None):
+    """
+    Array-at-once version of `_get_rotation_matrix`, see its documentation.
+
+    Note
+    ----
+    The coefficients are written as sin(x) / x and sin(x / 2) / (x / 2), with x
+    clamped to the machine epsilon: below it both round to one, so no series
+    branch is needed, and no subnormal number (slow, mostly in float32) is
+    produced for vanishing angles. Intermediate results are kept in the entries of
+    `out` that are not yet computed, so that no temporary is allocated.
+    """
+    blocksize = axis_collection.shape[1]
+    rot_mat = (
+        np.empty((3, 3, blocksize), dtype=axis_collection.dtype) if out is None else out
+    )
+    v0, v1, v2 = axis_collection
+
+    # Scratch: theta^2, sin(x) / theta and (1 - cos(x)) / theta^2, stored in
+    # the entries of the last computed pair.
+    theta_sq = rot_mat[0, 2]
+    u_prefix = rot_mat[2, 1]
+    u_sq_prefix = rot_mat[1, 2]
+
+    _batch_dot(axis_collection, axis_collection, out=theta_sq)
+    angle = rot_mat[0, 0]
+    np.sqrt(theta_sq, out=angle)
+    angle *= abs(scale)
+    clamped_angle = rot_mat[1, 1]
+    eps = np.finfo(rot_mat.dtype).eps
+    np.maximum(angle, eps, out=clamped_angle)
+    np.sin(clamped_angle, out=u_prefix)
+    u_prefix /= clamped_angle
+    u_prefix *= scale
+    np.multiply(angle, 0.5, out=clamped_angle)
+    np.maximum(clamped_angle, eps, out=clamped_angle)
+    np.sin(clamped_angle, out=u_sq_prefix)
+    u_sq_prefix /= clamped_angle
+    u_sq_prefix *= u_sq_prefix
+    u_sq_prefix *= 0.5 * scale * scale
+
+    # Diagonal: 1 - u_sq_prefix * (theta^2 - v_i^2)
+    one_minus_cos_term = rot_mat[0, 1]
+    np.multiply(u_sq_prefix, theta_sq, out=one_minus_cos_term)
+    np.subtract(1.0, one_minus_cos_term, out=one_minus_cos_term)
+    for i, v in enumerate(axis_collection):
+        np.multiply(v, v, out=rot_mat[i, i])
+        rot_mat[i, i] *= u_sq_prefix
+        rot_mat[i, i] += one_minus_cos_term
+
+    # Off-diagonal pairs: u_sq_prefix * v_i * v_j -/+ u_prefix * v_k
+    np.multiply(v0, v1, out=rot_mat[0, 1])
+    rot_mat[0, 1] *= u_sq_prefix
+    np.multiply(u_prefix, v2, out=rot_mat[1, 0])
+    rot_mat[0, 1] += rot_mat[1, 0]
+    rot_mat[1, 0] *= -2.0
+    rot_mat[1, 0] += rot_mat[0, 1]
+
+    np.multiply(u_prefix, v1, out=rot_mat[2, 0])
+    np.multiply(v0, v2, out=rot_mat[0, 2])
+    rot_mat[0, 2] *= u_sq_prefix
+    rot_mat[0, 2] -= rot_mat[2, 0]
+    rot_mat[2, 0] *= 2.0
+    rot_mat[2, 0] += rot_mat[0, 2]
+
+    u_sq_prefix *= v1
+    u_sq_prefix *= v2
+    u_prefix *= v0
+    rot_mat[1, 2] += rot_mat[2, 1]
+    rot_mat[2, 1] *= -2.0
+    rot_mat[2, 1] += rot_mat[1, 2]
+
+    return rot_mat
+
+
+def _rotate(director_collection, scale: float, axis_collection, out=None):
     """
     Does alibi rotations
     https://en.wikipedia.org/wiki/Rotation_matrix#Ambiguities
@@ -56,6 +188,9 @@ def _rotate(director_collection, scale: float, axis_collection):
     director_collection
     scale
     axis_collection
+    out : numpy.ndarray, optional
+        3D (dim, dim, blocksize) array the rotated directors are written into.
+        Must not be `director_collection`, see `_rotate_in_place`.
 
     Returns
     -------
@@ -66,11 +201,69 @@ def _rotate(director_collection, scale: float, axis_collection):
     #     director_collection, _get_rotation_matrix(scale, axis_collection)
     # )
     return _batch_matmul(
-        _get_rotation_matrix(scale, axis_collection), director_collection
+        _get_rotation_matrix(scale, axis_collection), director_collection, out
     )
 
 
-def _inv_rotate(director_collection):
+def _rotate_in_place(
+    director_collection,
+    scale: float,
+    axis_collection,
+    matrix_scratch=None,
+    vector_scratch=None,
+):
+    """
+    Does the same alibi rotations as `_rotate`, overwriting `director_collection`
+    with the rotated directors.
+
+    Parameters
+    ----------
+    director_collection : numpy.ndarray
+        3D (dim, dim, blocksize) array
+    scale : float
+    axis_collection : numpy.ndarray
+        2D (dim, blocksize) array
+    matrix_scratch : numpy.ndarray, optional
+        3D (dim, dim, blocksize) scratch buffer for the rotation matrices.
+    vector_scratch : numpy.ndarray, optional
+        2D (dim, blocksize) scratch buffer.
+    """
+    rotation_matrix = _get_rotation_matrix(scale, axis_collection, matrix_scratch)
+
+    for k in range(director_collection.shape[2]):
+        for j in range(3):
+            d0 = director_collection[0, j, k]
+            d1 = director_collection[1, j, k]
+            d2 = director_collection[2, j, k]
+            for i in range(3):
+                director_collection[i, j, k] = (
+                    rotation_matrix[i, 0, k] * d0
+                    + rotation_matrix[i, 1, k] * d1
+                    + rotation_matrix[i, 2, k] * d2
+                )
+
+
+def _rotate_in_place_numpy(
+    director_collection,
+    scale: float,
+    axis_collection,
+    matrix_scratch=None,
+    vector_scratch=None,
+):
+    """
+    Array-at-once version of `_rotate_in_place`, see its documentation.
+    The directors are rotated one column at a time.
+    """
+    rotation_matrix = _get_rotation_matrix(scale, axis_collection, matrix_scratch)
+    if vector_scratch is None:
+        vector_scratch = np.empty(axis_collection.shape, dtype=axis_collection.dtype)
+
+    for j in range(3):
+        _batch_matvec(rotation_matrix, director_collection[:, j], out=vector_scratch)
+        director_collection[:, j] = vector_scratch
+
+
+def _inv_rotate(director_collection, out=None, scalar_scratch=None):
     """
     Calculated rate of change using Rodrigues' formula
 
@@ -78,6 +271,10 @@ def _inv_rotate(director_collection):
     ----------
     director_collection : The collection of frames/directors at every element,
     numpy.ndarray of shape (dim, dim, n)
+    out : numpy.ndarray, optional
+        2D (dim, n-1) array the result is written into.
+    scalar_scratch : numpy.ndarray, optional
+        2D (2, n-1) scratch buffers.
 
     Returns
     -------
@@ -86,11 +283,17 @@ def _inv_rotate(director_collection):
 
     Note
     ----
-    TODO: Benchmark missing
+    The rotation angle is computed from both its sine and cosine, which is
+    well conditioned for all angles. For small angles, theta / sin(theta) is
+    replaced by its Taylor series.
 
     """
     blocksize = director_collection.shape[2] - 1
-    vector_collection = np.empty((3, blocksize))
+    vector_collection = (
+        np.empty((3, blocksize), dtype=director_collection.dtype)
+        if out is None
+        else out
+    )
 
     for k in range(blocksize):
         # Q_{i+i}Q^T_{i} collection
@@ -142,12 +345,94 @@ def _inv_rotate(director_collection):
             )
         )
 
-        # TODO HARDCODED bugfix has to be changed. Remove 1e-14 tolerance
-        theta = arccos(0.5 * trace - 0.5 - 1e-10)
+        # The antisymmetric part of Q_{i+1}Q^T_{i} has norm 2 sin(theta)
+        sin_theta = 0.5 * sqrt(
+            vector_collection[0, k] * vector_collection[0, k]
+            + vector_collection[1, k] * vector_collection[1, k]
+            + vector_collection[2, k] * vector_collection[2, k]
+        )
+        cos_theta = 0.5 * trace - 0.5
+        theta = arctan2(sin_theta, cos_theta)
+
+        if theta < _SMALL_ANGLE:
+            theta_sq = theta * theta
+            theta_upon_sin_theta = (
+                1.0 + theta_sq / 6.0 + 7.0 * theta_sq * theta_sq / 360.0
+            )
+        else:
+            theta_upon_sin_theta = theta / max(sin_theta, _TINY)
 
-        vector_collection[0, k] *= -0.5 * theta / sin(theta + 1e-14)
-        vector_collection[1, k] *= -0.5 * theta / sin(theta + 1e-14)
-        vector_collection[2, k] *= -0.5 * theta / sin(theta + 1e-14)
+        vector_collection[0, k] *= -0.5 * theta_upon_sin_theta
+        vector_collection[1, k] *= -0.5 * theta_upon_sin_theta
+        vector_collection[2, k] *= -0.5 * theta_upon_sin_theta
+
+    return vector_collection
+
+
+def _inv_rotate_numpy(director_collection, out=None, scalar_scratch=None):
+    """
+    Array-at-once version of `_inv_rotate`, see its documentation.
+
+    Note
+    ----
+    theta / sin(theta) is computed with sin(theta) clamped away from zero: the
+    rotation vector vanishes with sin(theta) for small angles, so no series
+    branch is needed.
+    """
+    blocksize = director_collection.shape[2] - 1
+    vector_collection = (
+        np.empty((3, blocksize), dtype=director_collection.dtype)
+        if out is None
+        else out
+    )
+    if scalar_scratch is None:
+        scalar_scratch = np.empty((2, blocksize), dtype=director_collection.dtype)
+    sin_theta, theta = scalar_scratch[:2]
+
+    next_directors = director_collection[..., 1:]
+    directors = director_collection[..., :-1]
+    row_pair_signs = _pair_signs(vector_collection.dtype)
+    # Antisymmetric part of Q_{i+1}Q^T_{i}, as a signed sum over pairs of rows
+    np.einsum(
+        "ijk,ijk,i->k",
+        next_directors[2:0:-1],
+        directors[1:3],
+        row_pair_signs,
+        out=vector_collection[0],
+        casting="same_kind",
+    )
+    np.einsum(
+        "ijk,ijk,i->k",
+        next_directors[0:3:2],
+        directors[2::-2],
+        row_pair_signs,
+        out=vector_collection[1],
+        casting="same_kind",
+    )
+    np.einsum(
+        "ijk,ijk,i->k",
+        next_directors[1::-1],
+        directors[0:2],
+        row_pair_signs,
+        out=vector_collection[2],
+        casting="same_kind",
+    )
+
+    _batch_dot(vector_collection, vector_collection, out=sin_theta)
+    np.sqrt(sin_theta, out=sin_theta)
+    sin_theta *= 0.5
+    # cos(theta) = (trace(Q_{i+1}Q^T_{i}) - 1) / 2, then theta
+    np.einsum("ijk,ijk->k", next_directors, directors, out=theta, casting="same_kind")
+    theta -= 1.0
+    theta *= 0.5
+    np.arctan2(sin_theta, theta, out=theta)
+
+    # The clamp is the smallest normal number of the floating point type used,
+    # as the one of float64 rounds to zero in float32.
+    np.maximum(sin_theta, np.finfo(sin_theta.dtype).tiny, out=sin_theta)
+    theta /= sin_theta
+    theta *= -0.5
+    vector_collection *= theta
 
     return vector_collection
 
@@ -376,3 +661,27 @@ def _inv_skew_symmetrize(matrix):
         vector[tgt_index] = matrix[src_i, src_j]
 
     return vector
+
+
+register_kernels(
+    __name__,
+    "numpy",
+    {
+        "_get_rotation_matrix": _get_rotation_matrix_numpy,
+        "_rotate": _rotate,
+        "_rotate_in_place": _rotate_in_place_numpy,
+        "_inv_rotate": _inv_rotate_numpy,
+    },
+)
+register_kernels(
+    __name__,
+    "reference",
+    {
+        "_rotation_coefficients": _rotation_coefficients,
+        "_get_rotation_matrix": _get_rotation_matrix,
+        "_rotate": _rotate,
+        "_rotate_in_place": _rotate_in_place,
+        "_inv_rotate": _inv_rotate,
+    },
+)
+bind_kernels(globals())
@@ -0,0 +1,153 @@
+__doc__ = """
+Thread pool used to step independent memory blocks and to apply independent
+forcing, connection and contact functors concurrently (see
+`BaseSystemCollection.use_thread_pool`).
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+
+# Marks the worker threads of the pools
+_thread_state = threading.local()
+
+
+def _mark_worker_thread():
+    _thread_state.is_worker = True
+
+
+class ThreadPool:
+    """
+    Fixed size pool of worker threads. The thread calling `map` takes part in the
+    work, so a pool of `n_threads` threads starts `n_threads - 1` workers.
+    Calls of `map` made by a worker, from a function already mapped on the pool,
+    run on that worker: workers never wait for each other.
+
+    Kernels only run concurrently when they release the GIL: large NumPy
+    operations and the kernels of the `numba` backend do, pure Python kernels do
+    not.
+
+        Attributes
+        ----------
+        n_threads: int
+            Number of threads running the work, including the calling thread.
+    """
+
+    def __init__(self, n_threads: Optional[int] = None):
+        """
+
+        Parameters
+        ----------
+        n_threads: int
+            Number of threads, the number of CPUs by default.
+        """
+        if n_threads is None:
+            n_threads = os.cpu_count() or 1
+        if n_threads < 1:
+            raise ValueError(
+                "The number of threads must be positive, not {0}.".format(n_threads)
+            )
+        self.n_threads = int(n_threads)
+        self._workers = (
+            ThreadPoolExecutor(
+                max_workers=self.n_threads - 1,
+                thread_name_prefix="elastica",
+                initializer=_mark_worker_thread,
+            )
+            if self.n_threads > 1
+            else None
+        )
+
+    def map(self, function: Callable, items: Sequence) -> None:
+        """
+        Calls `function` on each of the items and waits for all the calls to
+        return. Items are split into contiguous chunks, one per thread, and each
+        chunk is processed in order.
+
+        Parameters
+        ----------
+        function: Callable
+            Function taking a single item.
+        items: Sequence
+        """
+        n_chunks = min(self.n_threads, len(items))
+        if n_chunks <= 1 or getattr(_thread_state, "is_worker", False):
+            for item in items:
+                function(item)
+            return
+
+        bounds = [len(items) * i // n_chunks for i in range(n_chunks + 1)]
+        futures = [
+            self._workers.submit(_run_chunk, function, items[start:stop])
+            for start, stop in zip(bounds[1:-1], bounds[2:])
+        ]
+        try:
+            _run_chunk(function, items[: bounds[1]])
+        finally:
+            # Always wait for the workers, so that no task is still writing
+            # into the systems when the exception is handled.
+            wait(futures)
+        for future in futures:
+            future.result()
+
+    def shutdown(self) -> None:
+        """Stops the worker threads."""
+        if self._workers is not None:
+            self._workers.shutdown(wait=True)
+            self._workers = None
+            self.n_threads = 1
+
+
+def _run_chunk(function: Callable, items: Iterable) -> None:
+    for item in items:
+        function(item)
+
+
+def schedule_tasks(
+    tasks: Iterable[Tuple[Optional[Iterable[Hashable]], Callable]],
+) -> List[List[Callable]]:
+    """
+    Sorts tasks into levels, such that the tasks of a level write to different
+    systems and can run concurrently, and levels run one after the other.
+
+    A task is placed right after the last preceding task writing to one of its
+    systems. The tasks writing to the same system are thus applied in the order
+    they are given, and running the levels gives the same result, bit for bit, as
+    running the tasks in order.
+
+    Parameters
+    ----------
+    tasks: Iterable
+        Pairs of (keys of the systems the task writes to, function). Tasks with
+        None as keys may write to any system: they run alone, after all the
+        preceding tasks and before all the following ones.
+
+    Returns
+    -------
+    list
+        Levels of tasks.
+
+    """
+    levels = []
+    last_level_of_key = {}
+    # Level of the last task writing to any system
+    barrier = -1
+
+    for keys, function in tasks:
+        if keys is None:
+            level = len(levels)
+            barrier = level
+        else:
+            keys = tuple(keys)
+            level = max([barrier] + [last_level_of_key.get(key, -1) for key in keys])
+            level += 1
+            for key in keys:
+                last_level_of_key[key] = level
+
+        if level == len(levels):
+            levels.append([])
+        levels[level].append(function)
+
+    return levels
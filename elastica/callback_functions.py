@@ -84,6 +84,48 @@ class MyCallBack(CallBackBaseClass):
             return
 
 
+class ContactRecordsCallBack(CallBackBaseClass):
+    """
+    ContactRecordsCallBack class drains the ContactRecords of a contact every
+    sampling step, to follow the element pairs in contact, their penetration
+    and the contact forces between them over time.
+
+        Attributes
+        ----------
+        sample_every: int
+            Collect data using make_callback method every sampling step.
+        records: ContactRecords
+            Records filled by the contact.
+        callback_params: dict
+            Collected callback data is saved in this dictionary.
+    """
+
+    def __init__(self, step_skip: int, records, callback_params):
+        """
+
+        Parameters
+        ----------
+        step_skip: int
+            Collect data using make_callback method every step_skip step.
+        records: ContactRecords
+            Records filled by the contact, see `elastica.ContactRecords`.
+        callback_params: dict
+            Collected data is saved in this dictionary, e.g. a
+            `defaultdict(list)`. The records of each sample are appended to
+            `callback_params["records"]`.
+        """
+        CallBackBaseClass.__init__(self)
+        self.sample_every = step_skip
+        self.records = records
+        self.callback_params = callback_params
+
+    def make_callback(self, system, time, current_step: int):
+        if current_step % self.sample_every == 0:
+            self.callback_params["time"].append(time)
+            self.callback_params["step"].append(current_step)
+            self.callback_params["records"].append(self.records.drain())
+
+
 class ExportCallBack(CallBackBaseClass):
     """
     ExportCallback is an example callback class to demonstrate
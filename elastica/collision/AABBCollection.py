@@ -103,9 +103,12 @@ class AABBHierarchy:
         self, position_collection, dimension_collection, avg_n_dofs_in_final_level
     ):
         """
-        scaling is always set to 4, so that theres' 1 major AABBCollection, then scaling_factor
+        scaling is always set to 4, so that theres' 1 major AABB, then scaling_factor
         smaller AABBs, then scaling factor even smaller AABBs (which cover the elements
         basically)
+
+        Boxes of each level are stored in one (dim, 2, n_aabbs) array, the children
+        of box i are boxes 4i to 4i + 3 of the next level.
         :param position_collection:
         """
         # Determine empirical scaling factor based on how many dofs are available in the
@@ -120,10 +123,10 @@ class AABBHierarchy:
         )
 
         # nearest power of 4 that is less than the number
-        n_levels_bound_below = np.int(
+        n_levels_bound_below = int(
             np.floor(0.5 * np.log2(potential_n_aabbs_in_final_level))
         )
-        n_levels_bound_above = np.int(
+        n_levels_bound_above = int(
             np.ceil(0.5 * np.log2(potential_n_aabbs_in_final_level))
         )
         # Check which is the closest and use that as the number of levels
@@ -138,6 +141,10 @@ class AABBHierarchy:
             # the same code works
             self.n_levels = n_levels_bound_above + 1
 
+        # Every AABB in the final level needs at least one dof
+        while self.n_levels > 1 and 4 ** (self.n_levels - 1) > n_positions:
+            self.n_levels -= 1
+
         n_aabbs_in_final_level = 4 ** (self.n_levels - 1)
         self.avg_n_dofs_in_final_level = n_positions // n_aabbs_in_final_level
         # Needs to be distributed across aabbs
@@ -145,119 +152,224 @@ class AABBHierarchy:
 
         assert self.extra_n_dofs_in_final_level < n_aabbs_in_final_level
 
-        # self.n_aabbs_in_first_level = find_nearest_integer_square_root(n_positions)
-        # self.avg_n_dofs_in_second_level = n_positions // self.n_aabbs_in_first_level
-        # self.extra_n_dofs_in_second_level = n_positions % self.n_aabbs_in_first_level
-
-        # We now need to construct all AABBs in the hierarchy sequentially from bottom
-        # up
-        self.aabb = []
-
-        # Bottom level, already updated
-        # Need to slice position collections and dimension_collections
-        # elements_per_aabb is 1 as we are going to have the finest discretization
-        stop = 0
-        for i in range(n_aabbs_in_final_level - self.extra_n_dofs_in_final_level):
-            start = stop
-            stop = (i + 1) * self.avg_n_dofs_in_final_level
-            self.aabb.append(
-                AABBCollection(
-                    position_collection[..., start:stop],
-                    dimension_collection[..., start:stop],
-                    self.avg_n_dofs_in_final_level,
-                )
-            )
-
-        # Slice with an extra element (+1) to accommodate extra dofs
-        # Done extra_n_dofs times
-        for i in range(
-            n_aabbs_in_final_level - self.extra_n_dofs_in_final_level,
-            n_aabbs_in_final_level,
-        ):
-            start = stop
-            stop = start + (self.avg_n_dofs_in_final_level + 1)
-            self.aabb.append(
-                AABBCollection(
-                    position_collection[..., start:stop],
-                    dimension_collection[..., start:stop],
-                    self.avg_n_dofs_in_final_level + 1,
-                )
-            )
-
-        # Now for all levels above, add an AABB taking cues from the previously constructed AABBs
-        # Depends on the current level, start from 0
-        count_elapsed_n_aabbs = 0
-        for level in range(self.n_levels - 1):
-            # Traverse bottom down
-            # If 0, traverse n_level - 1 hierarchy, 1 traverse n_level -2 hierarchy and so on...
-            # if levle = self.n_levels - 2, correct_level is 0
-            correct_level = self.n_levels - level - 2
-            n_aabbs_in_current_level = 4 ** (correct_level)
-            n_aabbs_in_next_level = 4 ** (correct_level + 1)
-            for i_aabb in range(n_aabbs_in_current_level):
-                # Get start, stop indices of n_aabbs from previous level
-                start_idx_in_aabb_list = i_aabb * 4 + count_elapsed_n_aabbs
-                stop_idx_in_aabb_list = (i_aabb + 1) * 4 + count_elapsed_n_aabbs
-                # n_aabb from prev levels
-                assert (
-                    stop_idx_in_aabb_list
-                    <= count_elapsed_n_aabbs + n_aabbs_in_next_level
-                )
-                self.aabb.append(
-                    AABBCollection.make_from_aabb(
-                        self.aabb[start_idx_in_aabb_list:stop_idx_in_aabb_list]
-                    )
-                )
-            count_elapsed_n_aabbs += n_aabbs_in_next_level
-
-        # Add one for the middle level
-        # self.aabb.append(AABBCollection(position_collection, dimension_collection, self.n_aabbs_in_first_level))
+        # Slice with an extra element (+1) to accommodate extra dofs, done
+        # extra_n_dofs times at the end of the final level.
+        n_dofs_in_final_level = np.full(
+            n_aabbs_in_final_level, self.avg_n_dofs_in_final_level, dtype=np.int64
+        )
+        n_dofs_in_final_level[
+            n_aabbs_in_final_level - self.extra_n_dofs_in_final_level :
+        ] += 1
+        # dofs of AABB i of the final level are dof_offsets[i]:dof_offsets[i + 1]
+        self.dof_offsets = np.zeros(n_aabbs_in_final_level + 1, dtype=np.int64)
+        np.cumsum(n_dofs_in_final_level, out=self.dof_offsets[1:])
+
+        # aabb[level] is the (dim, 2, 4**level) array of boxes at level, 0 is the
+        # top level
+        self.aabb = [
+            np.empty((MaxDimension.value(), 2, self.n_aabbs_at_level(level)))
+            for level in range(self.n_levels)
+        ]
+        self.update(position_collection, dimension_collection)
 
     def n_aabbs_at_level(self, i: int):
         assert i < self.n_levels
         return 4 ** (i)
 
     def update(self, position_collection, dimension_collection):
-        # Update bottom level first, the first level entries
-        n_aabbs_in_final_level = self.n_aabbs_at_level(self.n_levels - 1)
-        stop = 0
-        for i in range(n_aabbs_in_final_level - self.extra_n_dofs_in_final_level):
-            start = stop
-            stop = (i + 1) * self.avg_n_dofs_in_final_level
-            self.aabb[i].update(
-                position_collection[..., start:stop],
-                dimension_collection[..., start:stop],
+        """
+        Refits all boxes of the hierarchy to the new positions and dimensions,
+        keeping the assignment of dofs to the boxes of the final level.
+        """
+        # Update bottom level first, one reduction over all of its boxes
+        final_level = self.aabb[-1]
+        starts = self.dof_offsets[:-1]
+        np.minimum.reduceat(position_collection, starts, axis=1, out=final_level[:, 0])
+        np.maximum.reduceat(position_collection, starts, axis=1, out=final_level[:, 1])
+        max_dimension = np.maximum.reduceat(dimension_collection, starts, axis=1)
+        final_level[:, 0] -= max_dimension
+        final_level[:, 1] += max_dimension
+
+        # Update all other levels from the level below, bottom up
+        for level in range(self.n_levels - 2, -1, -1):
+            children = self.aabb[level + 1].reshape(
+                MaxDimension.value(), 2, self.n_aabbs_at_level(level), 4
             )
-
-        # Slice with an extra element (+1) to accommodate extra dofs
-        # Done extra_n_dofs times
-        for i in range(
-            n_aabbs_in_final_level - self.extra_n_dofs_in_final_level,
-            n_aabbs_in_final_level,
-        ):
-            start = stop
-            stop = start + (self.avg_n_dofs_in_final_level + 1)
-            self.aabb[i].update(
-                position_collection[..., start:stop],
-                dimension_collection[..., start:stop],
+            np.amin(children[:, 0], axis=-1, out=self.aabb[level][:, 0])
+            np.amax(children[:, 1], axis=-1, out=self.aabb[level][:, 1])
+
+
+def morton_order(position_collection, n_bits_per_axis: int = 10):
+    """
+    Order of the positions along a Z-order (Morton) curve, on a grid of
+    2**n_bits_per_axis cells per axis spanning the positions. Positions close to
+    each other along the curve are close in space, so that an AABBHierarchy over
+    the ordered positions has tight boxes.
+
+    Parameters
+    ----------
+    position_collection : numpy.ndarray
+        2D (dim, n) array of positions.
+    n_bits_per_axis : int
+
+    Returns
+    -------
+    order : numpy.ndarray
+        1D (n,) array of indices sorting the positions along the curve.
+    """
+    dim = position_collection.shape[0]
+    lower = np.min(position_collection, axis=1, keepdims=True)
+    extent = np.max(position_collection, axis=1, keepdims=True) - lower
+    scale = np.divide(
+        (1 << n_bits_per_axis) - 1,
+        extent,
+        out=np.zeros_like(extent),
+        where=extent > 0.0,
+    )
+    cells = ((position_collection - lower) * scale).astype(np.uint64)
+
+    # Interleave the bits of the cell indices along all axes
+    codes = np.zeros(position_collection.shape[1], dtype=np.uint64)
+    for bit in range(n_bits_per_axis):
+        for axis in range(dim):
+            codes |= ((cells[axis] >> np.uint64(bit)) & np.uint64(1)) << np.uint64(
+                dim * bit + axis
             )
-
-        # Update all other levels middle level from bottom level's aabbs
-        count_elapsed_n_aabbs = 0
-        for level in range(self.n_levels - 2, 0 - 1, -1):
-            # Traverse bottom down
-            # If 0, traverse n_level - 1 hierarchy, 1 traverse n_level -2 hierarchy and so on...
-            # if levle = self.n_levels - 2, correct_level is 0
-            n_aabbs_in_current_level = self.n_aabbs_at_level(level)
-            n_aabbs_in_next_level = self.n_aabbs_at_level(level + 1)
-            for i_aabb in range(n_aabbs_in_current_level):
-                # Get start, stop indices of n_aabbs from previous level
-                start_idx_in_aabb_list = i_aabb * 4 + count_elapsed_n_aabbs
-                stop_idx_in_aabb_list = (i_aabb + 1) * 4 + count_elapsed_n_aabbs
-                self.aabb[
-                    count_elapsed_n_aabbs + n_aabbs_in_next_level + i_aabb
-                ]._update(self.aabb[start_idx_in_aabb_list:stop_idx_in_aabb_list])
-            count_elapsed_n_aabbs += n_aabbs_in_next_level
+    return np.argsort(codes, kind="stable")
+
+
+def _aabbs_intersecting(first_aabbs, second_aabbs):
+    """
+    Element-wise intersection test of two (dim, 2, n) arrays of boxes, boxes
+    touching each other intersect.
+    """
+    return np.all(
+        (first_aabbs[:, 0] <= second_aabbs[:, 1])
+        & (first_aabbs[:, 1] >= second_aabbs[:, 0]),
+        axis=0,
+    )
+
+
+def find_overlapping_leaves(first_hierarchy, second_hierarchy):
+    """
+    Traverses two hierarchies together, descending only into pairs of
+    intersecting boxes. All pairs of one level are tested at once.
+
+    Returns
+    -------
+    first_leaves, second_leaves : numpy.ndarray
+        Indices of the intersecting pairs of boxes of the final levels.
+    """
+    first_level = 0
+    second_level = 0
+    first_boxes = np.zeros(1, dtype=np.int64)
+    second_boxes = np.zeros(1, dtype=np.int64)
+    children = np.arange(4)
+    while True:
+        intersecting = _aabbs_intersecting(
+            first_hierarchy.aabb[first_level][..., first_boxes],
+            second_hierarchy.aabb[second_level][..., second_boxes],
+        )
+        first_boxes = first_boxes[intersecting]
+        second_boxes = second_boxes[intersecting]
+
+        descend_first = first_level < first_hierarchy.n_levels - 1
+        descend_second = second_level < second_hierarchy.n_levels - 1
+        if not (descend_first or descend_second) or first_boxes.size == 0:
+            return first_boxes, second_boxes
+
+        if descend_first:
+            first_boxes = (4 * first_boxes[:, np.newaxis] + children).ravel()
+            second_boxes = np.repeat(second_boxes, 4)
+            first_level += 1
+        if descend_second:
+            second_boxes = (4 * second_boxes[:, np.newaxis] + children).ravel()
+            first_boxes = np.repeat(first_boxes, 4)
+            second_level += 1
+
+
+def find_overlapping_dofs(first_hierarchy, second_hierarchy):
+    """
+    Pairs of dofs of two hierarchies whose boxes of the final level intersect.
+
+    Returns
+    -------
+    dof_offsets : numpy.ndarray
+        1D (n_dofs_first + 1) array. The dofs of the second hierarchy paired
+        with dof i of the first hierarchy are
+        dof_indices[dof_offsets[i]:dof_offsets[i + 1]].
+    dof_indices : numpy.ndarray
+        1D array of dofs of the second hierarchy, in increasing order for each
+        dof of the first hierarchy.
+    """
+    first_leaves, second_leaves = find_overlapping_leaves(
+        first_hierarchy, second_hierarchy
+    )
+    n_first_dofs = first_hierarchy.dof_offsets[-1]
+
+    # Expand each pair of leaves into all pairs of their dofs
+    first_start = first_hierarchy.dof_offsets[first_leaves]
+    first_count = first_hierarchy.dof_offsets[first_leaves + 1] - first_start
+    second_start = second_hierarchy.dof_offsets[second_leaves]
+    second_count = second_hierarchy.dof_offsets[second_leaves + 1] - second_start
+
+    first_dofs = np.repeat(first_start, first_count) + (
+        np.arange(np.sum(first_count))
+        - np.repeat(np.cumsum(first_count) - first_count, first_count)
+    )
+    # Each dof of the first leaf is paired with every dof of the second leaf
+    pair_count = np.repeat(second_count, first_count)
+    pair_start = np.repeat(second_start, first_count)
+    first_dofs = np.repeat(first_dofs, pair_count)
+    second_dofs = np.repeat(pair_start, pair_count) + (
+        np.arange(np.sum(pair_count))
+        - np.repeat(np.cumsum(pair_count) - pair_count, pair_count)
+    )
+
+    sorted_pairs = np.lexsort((second_dofs, first_dofs))
+    dof_offsets = np.searchsorted(
+        first_dofs[sorted_pairs], np.arange(n_first_dofs + 1)
+    ).astype(np.int64)
+    return dof_offsets, second_dofs[sorted_pairs].astype(np.int64)
+
+
+def sweep_and_prune(aabbs):
+    """
+    Finds all pairs of intersecting boxes, sweeping along the first axis. Boxes
+    are sorted by their lower bound along the sweep axis, so that a box can only
+    intersect the boxes starting between its own lower and upper bounds, which
+    are then tested along the other axes.
+
+    Parameters
+    ----------
+    aabbs : numpy.ndarray
+        3D (dim, 2, n_aabbs) array of boxes.
+
+    Returns
+    -------
+    first_aabbs, second_aabbs : numpy.ndarray
+        Indices of the intersecting pairs of boxes, first_aabbs < second_aabbs,
+        sorted by first_aabbs then second_aabbs.
+    """
+    n_aabbs = aabbs.shape[-1]
+    order = np.argsort(aabbs[0, 0], kind="stable")
+    sorted_lower_bound = aabbs[0, 0, order]
+    # Boxes after box k in sweep order start before box k ends
+    stop = np.searchsorted(sorted_lower_bound, aabbs[0, 1, order], side="right")
+    start = np.arange(1, n_aabbs + 1)
+    count = np.maximum(stop - start, 0)
+
+    first = np.repeat(np.arange(n_aabbs), count)
+    second = np.repeat(start, count) + (
+        np.arange(np.sum(count)) - np.repeat(np.cumsum(count) - count, count)
+    )
+    first, second = order[first], order[second]
+    intersecting = _aabbs_intersecting(aabbs[1:, :, first], aabbs[1:, :, second])
+    first, second = first[intersecting], second[intersecting]
+
+    first, second = np.minimum(first, second), np.maximum(first, second)
+    sorted_pairs = np.lexsort((second, first))
+    return first[sorted_pairs], second[sorted_pairs]
 
 
 def are_aabb_intersecting(first_aabb_collection, second_aabb_collection):
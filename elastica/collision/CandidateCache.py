@@ -0,0 +1,111 @@
+"""Persistent (Verlet list) cache of contact candidates"""
+
+import numpy as np
+
+
+class CandidateCache:
+    """
+    Keeps the candidates of a broadphase across time steps, Verlet list style.
+
+    Candidates are found with bounding volumes inflated by a `skin` margin, and
+    are kept as long as no bounding volume has moved and grown by more than half
+    of the skin since they were found. Candidates found with the inflated
+    volumes then include all the pairs whose current volumes intersect, so the
+    broadphase is skipped on most steps.
+
+    Attributes
+    ----------
+    skin : float
+        Margin added to the distance at which two bounding volumes are
+        candidates. A skin of 0 finds the candidates again whenever the
+        bounding volumes change.
+    n_updates : int
+        Number of calls to `update`.
+    n_rebuilds : int
+        Number of calls to `update` that ran the broadphase.
+    max_drift : float
+        Largest displacement plus growth of a bounding volume since the last
+        rebuild, as of the last update. A rebuild happens when it exceeds half
+        of the skin.
+    """
+
+    def __init__(self, skin: float = 0.0):
+        """
+        Parameters
+        ----------
+        skin : float
+            Margin added to the distance at which two bounding volumes are
+            candidates.
+        """
+        if skin < 0.0:
+            raise ValueError("Skin of a candidate cache must be non-negative")
+        self.skin = skin
+        self.candidates = None
+        self._reference_positions = None
+        self._reference_extents = None
+        self.n_updates = 0
+        self.n_rebuilds = 0
+        self.max_drift = 0.0
+
+    def invalidate(self) -> None:
+        """
+        Forces the broadphase to run on the next update, e.g. when something
+        other than positions and extents changes the candidates.
+        """
+        self.candidates = None
+
+    def update(self, positions, extents, find_candidates):
+        """
+        Returns the cached candidates, or the result of `find_candidates()` when
+        a bounding volume moved too far since the candidates were found.
+
+        Parameters
+        ----------
+        positions : numpy.ndarray
+            2D (dim, n) array containing the centers of the bounding volumes.
+        extents : numpy.ndarray
+            1D (n,) array of radii, or 2D (dim, n) array of half-extents, of the
+            bounding volumes.
+        find_candidates : Callable
+            Broadphase, called without arguments. It must inflate the distance
+            at which two bounding volumes are candidates by `skin`.
+
+        Returns
+        -------
+        Candidates returned by the last call to `find_candidates`.
+        """
+        self.n_updates += 1
+        if (
+            self.candidates is not None
+            and self._reference_positions.shape == positions.shape
+            and self._reference_extents.shape == np.shape(extents)
+        ):
+            displacement = positions - self._reference_positions
+            drift = np.sqrt(np.einsum("ij,ij->j", displacement, displacement))
+            growth = np.asarray(extents) - self._reference_extents
+            if growth.ndim > 1:
+                growth = np.max(growth, axis=0)
+            drift += np.maximum(growth, 0.0)
+            self.max_drift = np.max(drift, initial=0.0)
+            if self.max_drift <= 0.5 * self.skin:
+                return self.candidates
+
+        self.candidates = find_candidates()
+        self._reference_positions = np.array(positions, copy=True)
+        self._reference_extents = np.array(extents, copy=True)
+        self.n_rebuilds += 1
+        self.max_drift = 0.0
+        return self.candidates
+
+    def statistics(self) -> dict:
+        """
+        Returns the rebuild statistics of the cache, to tune the skin: a larger
+        skin rebuilds less often but keeps more candidates.
+        """
+        return {
+            "skin": self.skin,
+            "n_updates": self.n_updates,
+            "n_rebuilds": self.n_rebuilds,
+            "rebuild_ratio": self.n_rebuilds / max(self.n_updates, 1),
+            "max_drift": self.max_drift,
+        }
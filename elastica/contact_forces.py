@@ -3,20 +3,33 @@ __doc__ = """ Numba implementation module containing contact between rods and ri
 from elastica.typing import RodType, SystemType, AllowedContactType
 from elastica.rod import RodBase
 from elastica.rigidbody import Cylinder, Sphere
-from elastica.surface import Plane
+from elastica.surface import Plane, MeshSurface
+from elastica.collision.AABBCollection import AABBHierarchy, find_overlapping_dofs
+from elastica.collision.CandidateCache import CandidateCache
+from elastica.contact_records import ContactRecords
 from elastica.contact_utils import (
     _prune_using_aabbs_rod_cylinder,
     _prune_using_aabbs_rod_rod,
     _prune_using_aabbs_rod_sphere,
+    _find_self_contact_candidates,
+    _node_to_element_position,
 )
 from elastica._contact_functions import (
     _calculate_contact_forces_rod_cylinder,
-    _calculate_contact_forces_rod_rod,
-    _calculate_contact_forces_self_rod,
+    # Re-exported, RodRodContact uses the candidate kernel below
+    _calculate_contact_forces_rod_rod,  # noqa: F401
+    _calculate_contact_forces_rod_rod_candidates,
+    # Re-exported, RodSelfContact uses the candidate kernel below
+    _calculate_contact_forces_self_rod,  # noqa: F401
+    _calculate_contact_forces_self_rod_candidates,
     _calculate_contact_forces_rod_sphere,
+    _calculate_contact_forces_rod_rigid_bodies,
     _calculate_contact_forces_rod_plane,
     _calculate_contact_forces_rod_plane_with_anisotropic_friction,
+    _calculate_contact_forces_rod_plane_in_block,
+    _calculate_contact_forces_rod_plane_with_anisotropic_friction_in_block,
     _calculate_contact_forces_cylinder_plane,
+    _calculate_contact_forces_rod_mesh_surface,
 )
 import numpy as np
 
@@ -30,13 +43,22 @@ class NoContact:
     Every new contact class must be derived
     from NoContact class.
 
+    Contact classes taking a `records` argument fill these ContactRecords
+    with the element pairs in contact at every step.
+
     """
 
+    records = None
+
     def __init__(self):
         """
         NoContact class does not need any input parameters.
         """
 
+    def _records_buffers(self):
+        # Arguments of the kernels filling the records, None when not recorded
+        return None if self.records is None else self.records.buffers
+
     def _check_systems_validity(
         self,
         system_one: SystemType,
@@ -99,9 +121,27 @@ class RodRodContact(NoContact):
     ...    nu=10,
     ... )
 
+    Candidate element pairs can be kept across steps, until an element moves
+    by more than half of `skin`. Rebuild statistics of the candidates are
+    given by `candidate_cache.statistics()`.
+
+    >>> simulator.detect_contact_between(first_rod, second_rod).using(
+    ...    RodRodContact,
+    ...    k=1e4,
+    ...    nu=10,
+    ...    skin=0.2 * base_radius,
+    ... )
+
     """
 
-    def __init__(self, k: float, nu: float):
+    def __init__(
+        self,
+        k: float,
+        nu: float,
+        elements_per_aabb: int = 4,
+        skin: float = 0.0,
+        records: ContactRecords = None,
+    ):
         """
         Parameters
         ----------
@@ -109,10 +149,23 @@ class RodRodContact(NoContact):
             Contact spring constant.
         nu : float
             Contact damping constant.
+        elements_per_aabb : int
+            Average number of elements in the finest bounding boxes of the
+            hierarchy built for each rod.
+        skin : float
+            Margin added to the bounding boxes of the elements when candidate
+            element pairs are found. Candidates are found again once an element
+            moved and grew by more than half of the skin.
+        records : ContactRecords
+            Records of the element pairs in contact, filled at every step.
         """
         super(RodRodContact, self).__init__()
         self.k = k
         self.nu = nu
+        self.records = records
+        self.elements_per_aabb = elements_per_aabb
+        self.candidate_cache = CandidateCache(skin)
+        self._aabb_hierarchies = None
 
     def _check_systems_validity(
         self,
@@ -172,7 +225,28 @@ class RodRodContact(NoContact):
         ):
             return
 
-        _calculate_contact_forces_rod_rod(
+        # Then, traverse the element-wise AABB hierarchies of both rods, so that
+        # only elements in intersecting boxes reach the narrowphase. Candidates
+        # are kept until elements move too far from where they were found.
+        candidate_offsets, candidate_indices = self.candidate_cache.update(
+            np.hstack(
+                (
+                    system_one.position_collection[..., :-1],
+                    system_two.position_collection[..., :-1],
+                )
+            ),
+            np.hstack(
+                (
+                    system_one.radius + system_one.lengths,
+                    system_two.radius + system_two.lengths,
+                )
+            ),
+            lambda: find_overlapping_dofs(
+                *self._update_aabb_hierarchies(system_one, system_two)
+            ),
+        )
+
+        _calculate_contact_forces_rod_rod_candidates(
             system_one.position_collection[
                 ..., :-1
             ],  # Discount last node, we want element start position
@@ -191,10 +265,46 @@ class RodRodContact(NoContact):
             system_two.velocity_collection,
             system_two.internal_forces,
             system_two.external_forces,
+            candidate_offsets,
+            candidate_indices,
             self.k,
             self.nu,
+            self._records_buffers(),
         )
 
+    def _update_aabb_hierarchies(
+        self, system_one: RodType, system_two: RodType
+    ) -> tuple:
+        """
+        Builds the AABB hierarchies of both rods on the first call, and refits
+        them to the current configuration of the rods afterwards.
+
+        An element is bounded by a box around its start position, expanded by
+        its radius and length, as the element-wise bounding sphere test of the
+        narrowphase, and by half of the skin of the candidate cache.
+        """
+        element_positions = [
+            system.position_collection[..., :-1] for system in (system_one, system_two)
+        ]
+        element_dimensions = [
+            np.broadcast_to(
+                system.radius + system.lengths + 0.5 * self.candidate_cache.skin,
+                position.shape,
+            )
+            for system, position in zip((system_one, system_two), element_positions)
+        ]
+        if self._aabb_hierarchies is None:
+            self._aabb_hierarchies = tuple(
+                AABBHierarchy(position, dimension, self.elements_per_aabb)
+                for position, dimension in zip(element_positions, element_dimensions)
+            )
+        else:
+            for hierarchy, position, dimension in zip(
+                self._aabb_hierarchies, element_positions, element_dimensions
+            ):
+                hierarchy.update(position, dimension)
+        return self._aabb_hierarchies
+
 
 class RodCylinderContact(NoContact):
     """
@@ -229,6 +339,7 @@ class RodCylinderContact(NoContact):
         nu: float,
         velocity_damping_coefficient=0.0,
         friction_coefficient=0.0,
+        records: ContactRecords = None,
     ):
         """
 
@@ -243,10 +354,13 @@ class RodCylinderContact(NoContact):
             slip direction.
         friction_coefficient : float
             For Coulombic friction coefficient for rigid-body and rod contact.
+        records : ContactRecords
+            Records of the element pairs in contact, filled at every step.
         """
         super(RodCylinderContact, self).__init__()
         self.k = k
         self.nu = nu
+        self.records = records
         self.velocity_damping_coefficient = velocity_damping_coefficient
         self.friction_coefficient = friction_coefficient
 
@@ -319,6 +433,65 @@ class RodCylinderContact(NoContact):
             self.nu,
             self.velocity_damping_coefficient,
             self.friction_coefficient,
+            self._records_buffers(),
+        )
+
+    def _body_batch_key(self):
+        # Contacts with the same key and the same rod are applied at once to
+        # consecutive cylinders of a memory block, see apply_contact_to_bodies.
+        # Records are filled with the index of a single cylinder.
+        if (
+            type(self).apply_contact is not RodCylinderContact.apply_contact
+            or self.records is not None
+        ):
+            return None
+        return (
+            RodCylinderContact,
+            self.k,
+            self.nu,
+            self.velocity_damping_coefficient,
+            self.friction_coefficient,
+        )
+
+    def apply_contact_to_bodies(self, system_one: RodType, bodies) -> None:
+        """
+        Apply contact forces and torques between a rod and consecutive cylinders
+        of a memory block, as `apply_contact` does for each of the cylinders.
+
+        Parameters
+        ----------
+        system_one: object
+            Rod object.
+        bodies: MemoryBlockRigidBodyChunk
+            Consecutive cylinders of a memory block.
+
+        """
+        axis = bodies.director_collection[2]
+        _calculate_contact_forces_rod_rigid_bodies(
+            system_one.position_collection,
+            system_one.radius,
+            system_one.lengths,
+            system_one.tangents,
+            system_one.internal_forces,
+            system_one.external_forces,
+            system_one.velocity_collection,
+            bodies.position_collection,
+            bodies.position_collection - 0.5 * bodies.length * axis,
+            bodies.length * axis,
+            _body_aabb_half_extent(
+                bodies.director_collection,
+                (bodies.radius, bodies.radius, 0.5 * bodies.length),
+            ),
+            bodies.radius,
+            bodies.length,
+            bodies.external_forces,
+            bodies.external_torques,
+            bodies.director_collection,
+            bodies.velocity_collection,
+            self.k,
+            self.nu,
+            self.velocity_damping_coefficient,
+            self.friction_coefficient,
         )
 
 
@@ -336,9 +509,15 @@ class RodSelfContact(NoContact):
     ...    nu=10,
     ... )
 
+    Candidate element pairs can be kept across steps, until an element moves
+    by more than half of `skin`. Rebuild statistics of the candidates are
+    given by `candidate_cache.statistics()`.
+
     """
 
-    def __init__(self, k: float, nu: float):
+    def __init__(
+        self, k: float, nu: float, skin: float = 0.0, records: ContactRecords = None
+    ):
         """
 
         Parameters
@@ -347,10 +526,19 @@ class RodSelfContact(NoContact):
             Contact spring constant.
         nu : float
             Contact damping constant.
+        skin : float
+            Margin added to the bounding spheres of the elements when candidate
+            element pairs are found. Candidates are found again once an element
+            moved and grew by more than half of the skin.
+        records : ContactRecords
+            Records of the element pairs in contact, filled at every step.
         """
         super(RodSelfContact, self).__init__()
         self.k = k
         self.nu = nu
+        self.records = records
+        self.candidate_cache = CandidateCache(skin)
+        self._candidates_skip = None
 
     def _check_systems_validity(
         self,
@@ -394,17 +582,42 @@ class RodSelfContact(NoContact):
             Rod object.
 
         """
-        _calculate_contact_forces_self_rod(
-            system_one.position_collection[
-                ..., :-1
-            ],  # Discount last node, we want element start position
+        # Discount last node, we want element start position
+        element_position = system_one.position_collection[..., :-1]
+
+        # Candidates exclude the neighbours skipped by each element when they
+        # are found, so they are found again if an element skips fewer now.
+        skip = 1 + np.ceil(0.8 * np.pi * system_one.radius / system_one.lengths)
+        if self._candidates_skip is not None and np.any(skip < self._candidates_skip):
+            self.candidate_cache.invalidate()
+
+        candidate_offsets, candidate_indices = self.candidate_cache.update(
+            element_position,
+            system_one.radius + system_one.lengths,
+            lambda: self._find_candidates(element_position, system_one, skip),
+        )
+
+        _calculate_contact_forces_self_rod_candidates(
+            element_position,
             system_one.radius,
             system_one.lengths,
             system_one.tangents,
             system_one.velocity_collection,
             system_one.external_forces,
+            candidate_offsets,
+            candidate_indices,
             self.k,
             self.nu,
+            self._records_buffers(),
+        )
+
+    def _find_candidates(self, element_position, system: RodType, skip) -> tuple:
+        self._candidates_skip = skip
+        return _find_self_contact_candidates(
+            element_position,
+            system.radius,
+            system.lengths,
+            self.candidate_cache.skin,
         )
 
 
@@ -439,6 +652,7 @@ class RodSphereContact(NoContact):
         nu: float,
         velocity_damping_coefficient=0.0,
         friction_coefficient=0.0,
+        records: ContactRecords = None,
     ):
         """
         Parameters
@@ -452,10 +666,13 @@ class RodSphereContact(NoContact):
             slip direction.
         friction_coefficient : float
             For Coulombic friction coefficient for rigid-body and rod contact.
+        records : ContactRecords
+            Records of the element pairs in contact, filled at every step.
         """
         super(RodSphereContact, self).__init__()
         self.k = k
         self.nu = nu
+        self.records = records
         self.velocity_damping_coefficient = velocity_damping_coefficient
         self.friction_coefficient = friction_coefficient
 
@@ -537,6 +754,65 @@ class RodSphereContact(NoContact):
             self.nu,
             self.velocity_damping_coefficient,
             self.friction_coefficient,
+            self._records_buffers(),
+        )
+
+    def _body_batch_key(self):
+        # Contacts with the same key and the same rod are applied at once to
+        # consecutive spheres of a memory block, see apply_contact_to_bodies.
+        # Records are filled with the index of a single sphere.
+        if (
+            type(self).apply_contact is not RodSphereContact.apply_contact
+            or self.records is not None
+        ):
+            return None
+        return (
+            RodSphereContact,
+            self.k,
+            self.nu,
+            self.velocity_damping_coefficient,
+            self.friction_coefficient,
+        )
+
+    def apply_contact_to_bodies(self, system_one: RodType, bodies) -> None:
+        """
+        Apply contact forces and torques between a rod and consecutive spheres
+        of a memory block, as `apply_contact` does for each of the spheres.
+
+        Parameters
+        ----------
+        system_one: object
+            Rod object.
+        bodies: MemoryBlockRigidBodyChunk
+            Consecutive spheres of a memory block.
+
+        """
+        axis = bodies.director_collection[2]
+        _calculate_contact_forces_rod_rigid_bodies(
+            system_one.position_collection,
+            system_one.radius,
+            system_one.lengths,
+            system_one.tangents,
+            system_one.internal_forces,
+            system_one.external_forces,
+            system_one.velocity_collection,
+            bodies.position_collection,
+            bodies.position_collection - bodies.radius * axis,
+            bodies.radius * axis,
+            _body_aabb_half_extent(
+                bodies.director_collection,
+                (bodies.radius, bodies.radius, bodies.radius),
+            ),
+            bodies.radius,
+            2.0 * bodies.radius,
+            bodies.external_forces,
+            bodies.external_torques,
+            bodies.director_collection,
+            bodies.velocity_collection,
+            self.k,
+            self.nu,
+            self.velocity_damping_coefficient,
+            self.friction_coefficient,
         )
 
 
@@ -562,6 +838,7 @@ class RodPlaneContact(NoContact):
         self,
         k: float,
         nu: float,
+        records: ContactRecords = None,
     ):
         """
         Parameters
@@ -570,10 +847,13 @@ class RodPlaneContact(NoContact):
             Contact spring constant.
         nu : float
             Contact damping constant.
+        records : ContactRecords
+            Records of the element pairs in contact, filled at every step.
         """
         super(RodPlaneContact, self).__init__()
         self.k = k
         self.nu = nu
+        self.records = records
         self.surface_tol = 1e-4
 
     def _check_systems_validity(
@@ -626,6 +906,61 @@ class RodPlaneContact(NoContact):
             system_one.velocity_collection,
             system_one.internal_forces,
             system_one.external_forces,
+            self._records_buffers(),
+        )
+
+    def _batch_key(self):
+        # Contacts with the same key and the same plane are applied at once to
+        # consecutive rods of a memory block, see apply_contact_in_block.
+        # Records index the elements of each rod, they are filled rod by rod.
+        if (
+            type(self).apply_contact is not RodPlaneContact.apply_contact
+            or self.records is not None
+        ):
+            return None
+        return (RodPlaneContact, self.k, self.nu, self.surface_tol)
+
+    def apply_contact_in_block(
+        self,
+        rods,
+        system_two: SystemType,
+        first_elements: np.ndarray,
+        last_elements: np.ndarray,
+        ghost_elements: np.ndarray,
+    ) -> None:
+        """
+        Apply contact forces between consecutive rods of a memory block and a
+        Plane object, as `apply_contact` does for each of the rods.
+
+        Parameters
+        ----------
+        rods: MemoryBlockCosseratRodChunk
+            Consecutive rods of a memory block.
+        system_two: object
+            Plane object.
+        first_elements: numpy.ndarray
+            1D array containing the index of the first element of each rod.
+        last_elements: numpy.ndarray
+            1D array containing the index of the last element of each rod.
+        ghost_elements: numpy.ndarray
+            1D array containing the indices of the ghost elements between rods.
+
+        """
+        _calculate_contact_forces_rod_plane_in_block(
+            system_two.origin,
+            system_two.normal,
+            self.surface_tol,
+            self.k,
+            self.nu,
+            rods.radius,
+            rods.mass,
+            rods.position_collection,
+            rods.velocity_collection,
+            rods.internal_forces,
+            rods.external_forces,
+            first_elements,
+            last_elements,
+            ghost_elements,
         )
 
 
@@ -657,6 +992,7 @@ class RodPlaneContactWithAnisotropicFriction(NoContact):
         slip_velocity_tol: float,
         static_mu_array: np.ndarray,
         kinetic_mu_array: np.ndarray,
+        records: ContactRecords = None,
     ):
         """
         Parameters
@@ -673,10 +1009,13 @@ class RodPlaneContactWithAnisotropicFriction(NoContact):
         kinetic_mu_array: numpy.ndarray
             1D (3,) array containing data with 'float' type.
             [forward, backward, sideways] kinetic friction coefficients.
+        records : ContactRecords
+            Records of the element pairs in contact, filled at every step.
         """
         super(RodPlaneContactWithAnisotropicFriction, self).__init__()
         self.k = k
         self.nu = nu
+        self.records = records
         self.surface_tol = 1e-4
         self.slip_velocity_tol = slip_velocity_tol
         (
@@ -753,6 +1092,87 @@ class RodPlaneContactWithAnisotropicFriction(NoContact):
             system_one.external_forces,
             system_one.internal_torques,
             system_one.external_torques,
+            self._records_buffers(),
+        )
+
+    def _batch_key(self):
+        # Contacts with the same key and the same plane are applied at once to
+        # consecutive rods of a memory block, see apply_contact_in_block.
+        # Records index the elements of each rod, they are filled rod by rod.
+        if (
+            type(self).apply_contact
+            is not RodPlaneContactWithAnisotropicFriction.apply_contact
+            or self.records is not None
+        ):
+            return None
+        return (
+            RodPlaneContactWithAnisotropicFriction,
+            self.k,
+            self.nu,
+            self.surface_tol,
+            self.slip_velocity_tol,
+            self.kinetic_mu_forward,
+            self.kinetic_mu_backward,
+            self.kinetic_mu_sideways,
+            self.static_mu_forward,
+            self.static_mu_backward,
+            self.static_mu_sideways,
+        )
+
+    def apply_contact_in_block(
+        self,
+        rods,
+        system_two: SystemType,
+        first_elements: np.ndarray,
+        last_elements: np.ndarray,
+        ghost_elements: np.ndarray,
+    ) -> None:
+        """
+        Apply contact forces and torques between consecutive rods of a memory
+        block and a Plane object with anisotropic friction, as `apply_contact`
+        does for each of the rods.
+
+        Parameters
+        ----------
+        rods: MemoryBlockCosseratRodChunk
+            Consecutive rods of a memory block.
+        system_two: object
+            Plane object.
+        first_elements: numpy.ndarray
+            1D array containing the index of the first element of each rod.
+        last_elements: numpy.ndarray
+            1D array containing the index of the last element of each rod.
+        ghost_elements: numpy.ndarray
+            1D array containing the indices of the ghost elements between rods.
+
+        """
+        _calculate_contact_forces_rod_plane_with_anisotropic_friction_in_block(
+            system_two.origin,
+            system_two.normal,
+            self.surface_tol,
+            self.slip_velocity_tol,
+            self.k,
+            self.nu,
+            self.kinetic_mu_forward,
+            self.kinetic_mu_backward,
+            self.kinetic_mu_sideways,
+            self.static_mu_forward,
+            self.static_mu_backward,
+            self.static_mu_sideways,
+            rods.radius,
+            rods.mass,
+            rods.tangents,
+            rods.position_collection,
+            rods.director_collection,
+            rods.velocity_collection,
+            rods.omega_collection,
+            rods.internal_forces,
+            rods.external_forces,
+            rods.internal_torques,
+            rods.external_torques,
+            first_elements,
+            last_elements,
+            ghost_elements,
         )
 
 
@@ -843,3 +1263,157 @@ class CylinderPlaneContact(NoContact):
             system_one.velocity_collection,
             system_one.external_forces,
         )
+
+
+class RodMeshSurfaceContact(NoContact):
+    """
+    This class is for applying contact forces between rod-mesh surface.
+    First system is always rod and second system is always a mesh surface.
+    Each element of the rod is in contact with its closest triangle of the
+    surface, with the contact model of RodPlaneContact.
+
+    Unlike a plane, the surface is a thin shell: elements whose centers are
+    farther than their radius plus the tolerance from it, also below it, are
+    not in contact. A flat mesh gives the forces of a plane only as long as
+    the elements penetrate it by less than their radius, e.g. not after a
+    high speed impact.
+
+    Triangles are stored in a static bounding volume hierarchy of the surface,
+    built once when the simulator is finalized, and elements in a hierarchy
+    refitted to the rod at every step. Only the triangles whose boxes overlap
+    the box of an element are tested against it, so that surfaces with many
+    triangles, e.g. scanned terrains, do not need a brute-force search.
+
+    Examples
+    --------
+    How to define contact between rod and mesh surface.
+
+    >>> mesh = Mesh("terrain.stl")
+    >>> surface = MeshSurface(mesh)
+    >>> simulator.append(surface)
+    >>> simulator.detect_contact_between(rod, surface).using(
+    ...    RodMeshSurfaceContact,
+    ...    k=1e4,
+    ...    nu=10,
+    ... )
+    """
+
+    def __init__(
+        self,
+        k: float,
+        nu: float,
+        elements_per_aabb: int = 4,
+        faces_per_aabb: int = 4,
+        records: ContactRecords = None,
+    ):
+        """
+        Parameters
+        ----------
+        k : float
+            Contact spring constant.
+        nu : float
+            Contact damping constant.
+        elements_per_aabb : int
+            Average number of elements in the finest bounding boxes of the
+            hierarchy built for the rod.
+        faces_per_aabb : int
+            Average number of triangles in the finest bounding boxes of the
+            hierarchy built for the surface.
+        records : ContactRecords
+            Records of the element pairs in contact, filled at every step.
+        """
+        super(RodMeshSurfaceContact, self).__init__()
+        self.k = k
+        self.nu = nu
+        self.records = records
+        self.surface_tol = 1e-4
+        self.elements_per_aabb = elements_per_aabb
+        self.faces_per_aabb = faces_per_aabb
+        self._aabb_hierarchy = None
+
+    def _check_systems_validity(
+        self,
+        system_one: SystemType,
+        system_two: AllowedContactType,
+    ) -> None:
+        """
+        This checks the contact order and type of a SystemType object and an AllowedContactType object.
+        For the RodMeshSurfaceContact class first_system should be a rod and second_system should be a mesh surface.
+        The hierarchy of the surface is built here, at finalize.
+
+        Parameters
+        ----------
+        system_one
+            SystemType
+        system_two
+            AllowedContactType
+        """
+        if not issubclass(system_one.__class__, RodBase) or not issubclass(
+            system_two.__class__, MeshSurface
+        ):
+            raise TypeError(
+                "Systems provided to the contact class have incorrect order/type. \n"
+                " First system is {0} and second system is {1}. \n"
+                " First system should be a rod, second should be a mesh surface".format(
+                    system_one.__class__, system_two.__class__
+                )
+            )
+        system_two.aabb_hierarchy(self.faces_per_aabb)
+
+    def apply_contact(self, system_one: RodType, system_two: SystemType) -> None:
+        """
+        Apply contact forces between RodType object and MeshSurface object.
+
+        Parameters
+        ----------
+        system_one: object
+            Rod object.
+        system_two: object
+            MeshSurface object.
+
+        """
+        surface_hierarchy, face_order = system_two.aabb_hierarchy(self.faces_per_aabb)
+
+        # An element is bounded by a box around its center, expanded by its
+        # radius and the contact tolerance.
+        element_position = _node_to_element_position(system_one.position_collection)
+        element_dimension = np.broadcast_to(
+            system_one.radius + self.surface_tol, element_position.shape
+        )
+        if self._aabb_hierarchy is None:
+            self._aabb_hierarchy = AABBHierarchy(
+                element_position, element_dimension, self.elements_per_aabb
+            )
+        else:
+            self._aabb_hierarchy.update(element_position, element_dimension)
+
+        candidate_offsets, candidate_indices = find_overlapping_dofs(
+            self._aabb_hierarchy, surface_hierarchy
+        )
+        if candidate_indices.size == 0:
+            return
+
+        _calculate_contact_forces_rod_mesh_surface(
+            system_two.faces,
+            system_two.face_normals,
+            candidate_offsets,
+            face_order[candidate_indices],
+            self.surface_tol,
+            self.k,
+            self.nu,
+            system_one.radius,
+            system_one.mass,
+            system_one.position_collection,
+            system_one.velocity_collection,
+            system_one.internal_forces,
+            system_one.external_forces,
+            self._records_buffers(),
+        )
+
+
+def _body_aabb_half_extent(director_collection, dimensions_in_local_FOR):
+    # Half extent of the boxes of rigid bodies, as in the rod-cylinder and
+    # rod-sphere pruning: Q^T * d of each body, in absolute value.
+    return np.abs(
+        np.einsum("jib,jb->ib", director_collection, np.stack(dimensions_in_local_FOR))
+    )
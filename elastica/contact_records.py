@@ -0,0 +1,104 @@
+__doc__ = """Preallocated buffer of the element pairs in contact, filled by the contact classes"""
+
+import numpy as np
+
+
+class ContactRecords:
+    """
+    Buffer of the element pairs in contact during the last contact step, with
+    their penetration and the normal contact force between them. It is given
+    to a contact class (or to all the contact classes of a contact group) as
+    `records`, and read with `drain`, e.g. by a `ContactRecordsCallBack`.
+
+    The buffer is allocated once. Pairs beyond its capacity are counted, but not
+    stored. Contact classes without records skip recording altogether.
+
+    Examples
+    --------
+    >>> records = ContactRecords(capacity=1000)
+    >>> simulator.detect_contact_between(first_rod, second_rod).using(
+    ...    RodRodContact, k=1e4, nu=10, records=records
+    ... )
+    >>> simulator.collect_diagnostics(first_rod).using(
+    ...    ContactRecordsCallBack,
+    ...    step_skip=100,
+    ...    records=records,
+    ...    callback_params=defaultdict(list),
+    ... )
+
+        Attributes
+        ----------
+        capacity: int
+            Maximum number of pairs stored.
+        indices: numpy.ndarray
+            2D (4, capacity) array, for each pair the index of the first system,
+            the element of the first system, the index of the second system and
+            the element (or face) of the second system in contact. Rigid bodies
+            and planes have a single element 0.
+        values: numpy.ndarray
+            2D (2, capacity) array, for each pair the penetration gamma, positive
+            when the pair overlaps, and the magnitude of the normal contact force
+            applied to the element of the first system.
+        count: numpy.ndarray
+            1D (1,) array, number of pairs recorded since the last clear,
+            including the pairs that were not stored.
+        systems: numpy.ndarray
+            1D (2,) array, indices of the systems of the pairs being recorded,
+            set by the contact module.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Parameters
+        ----------
+        capacity: int
+            Maximum number of pairs stored per contact step.
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity of contact records must be positive")
+        self.capacity = capacity
+        self.indices = np.zeros((4, capacity), dtype=np.int64)
+        self.values = np.zeros((2, capacity))
+        self.count = np.zeros(1, dtype=np.int64)
+        self.systems = np.zeros(2, dtype=np.int64)
+        # Arguments of the kernels filling the records
+        self.buffers = (self.indices, self.values, self.count, self.systems)
+
+    @property
+    def n_records(self) -> int:
+        """Number of pairs stored."""
+        return min(int(self.count[0]), self.capacity)
+
+    @property
+    def n_dropped(self) -> int:
+        """Number of pairs recorded beyond the capacity, and not stored."""
+        return max(int(self.count[0]) - self.capacity, 0)
+
+    def clear(self) -> None:
+        """Forgets the recorded pairs, the contact module clears the records
+        before each contact step."""
+        self.count[0] = 0
+
+    def drain(self) -> dict:
+        """
+        Returns copies of the stored pairs, and clears the records.
+
+        Returns
+        -------
+        records: dict
+            `first_system`, `first_element`, `second_system`, `second_element`,
+            `gamma` and `force` arrays of the stored pairs, and the number of
+            pairs not stored `n_dropped`.
+        """
+        n_records = self.n_records
+        records = {
+            "first_system": self.indices[0, :n_records].copy(),
+            "first_element": self.indices[1, :n_records].copy(),
+            "second_system": self.indices[2, :n_records].copy(),
+            "second_element": self.indices[3, :n_records].copy(),
+            "gamma": self.values[0, :n_records].copy(),
+            "force": self.values[1, :n_records].copy(),
+            "n_dropped": self.n_dropped,
+        }
+        self.clear()
+        return records
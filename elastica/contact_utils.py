@@ -2,6 +2,7 @@ __doc__ = """ Helper functions for contact force calculation """
 
 from math import sqrt
 import numpy as np
+from elastica._backends import register_kernels, bind_kernels
 from elastica._linalg import (
     _batch_norm,
 )
@@ -14,6 +15,13 @@ def _dot_product(a, b):
     return sum
 
 
+def _dot_product_batch(a, b=None):
+    # Same order of operations as _dot_product, for each column
+    if b is None:
+        b = a
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
 def _norm(a):
     return sqrt(_dot_product(a, a))
 
@@ -28,6 +36,13 @@ def _out_of_bounds(x, low, high):
 
 
 def _find_min_dist(x1, e1, x2, e2):
+    s, t = _find_min_dist_parameters(x1, e1, x2, e2)
+
+    # Return distance, contact point of system 2, contact point of system 1
+    return x2 + s * e2 - x1 - t * e1, x2 + s * e2, x1 - t * e1
+
+
+def _find_min_dist_parameters(x1, e1, x2, e2):
     e1e1 = _dot_product(e1, e1)
     e1e2 = _dot_product(e1, e2)
     e2e2 = _dot_product(e2, e2)
@@ -88,8 +103,267 @@ def _find_min_dist(x1, e1, x2, e2):
                 s = potential_s
                 t = 1.0
 
-    # Return distance, contact point of system 2, contact point of system 1
-    return x2 + s * e2 - x1 - t * e1, x2 + s * e2, x1 - t * e1
+    # Positions of the closest points along the segments x2 + s e2, x1 + t e1
+    return s, t
+
+
+def _find_min_dist_batch(x1, e1, x2, e2):
+    """
+    Batched `_find_min_dist`, for pairs of segments x1 + t e1 and x2 + s e2.
+
+    Parameters
+    ----------
+    x1, e1, x2, e2 : numpy.ndarray
+        2D (dim, n_pairs) arrays, start points and edges of the segments.
+
+    Returns
+    -------
+    distance_vector : numpy.ndarray
+        2D (dim, n_pairs) array, x2 + s e2 - x1 - t e1 at the closest points.
+    s, t : numpy.ndarray
+        1D (n_pairs) arrays, positions of the closest points along the segments.
+    """
+    n_pairs = x1.shape[1]
+    distance_vector = np.empty((3, n_pairs))
+    s = np.empty(n_pairs)
+    t = np.empty(n_pairs)
+    for k in range(n_pairs):
+        s[k], t[k] = _find_min_dist_parameters(x1[:, k], e1[:, k], x2[:, k], e2[:, k])
+        distance_vector[:, k] = x2[:, k] + s[k] * e2[:, k] - x1[:, k] - t[k] * e1[:, k]
+    return distance_vector, s, t
+
+
+def _find_min_dist_batch_numpy(x1, e1, x2, e2):
+    """
+    Array-at-once version of `_find_min_dist_batch`. Both branches of
+    `_find_min_dist` are evaluated for all pairs and the result of each pair is
+    selected with masks, with the same operations as `_find_min_dist`.
+    """
+    e1e1 = _dot_product_batch(e1, e1)
+    e1e2 = _dot_product_batch(e1, e2)
+    e2e2 = _dot_product_batch(e2, e2)
+
+    x1e1 = _dot_product_batch(x1, e1)
+    x1e2 = _dot_product_batch(x1, e2)
+    x2e1 = _dot_product_batch(e1, x2)
+    x2e2 = _dot_product_batch(x2, e2)
+
+    def clip(x):
+        return np.maximum(0.0, np.minimum(x, 1.0))
+
+    def norm(a):
+        return np.sqrt(_dot_product_batch(a, a))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        parallel = np.abs(1.0 - e1e2**2 / (e1e1 * e2e2)) < 1e-6
+
+        # Parallel segments
+        t_parallel = clip((x2e1 - x1e1) / e1e1)
+        s_parallel = clip((x1e2 + t_parallel * e1e2 - x2e2) / e2e2)
+
+        # Using the Cauchy-Binet formula
+        s = (e1e1 * (x1e2 - x2e2) + e1e2 * (x2e1 - x1e1)) / (e1e1 * e2e2 - (e1e2) ** 2)
+        t = (e1e2 * s + x2e1 - x1e1) / e1e1
+
+        # Closest points out of the segments: closest of the endpoint candidates,
+        # the first candidate winning ties
+        out_of_bounds = (s < 0.0) | (s > 1.0) | (t < 0.0) | (t > 1.0)
+        candidate_t = clip((x2e1 - x1e1) / e1e1)
+        candidate_s = np.zeros_like(candidate_t)
+        minimum_distance = norm(x1 + e1 * candidate_t - x2)
+
+        potential_t = clip((x2e1 + e1e2 - x1e1) / e1e1)
+        potential_d = norm(x1 + e1 * potential_t - x2 - e2)
+        closer = potential_d < minimum_distance
+        candidate_s = np.where(closer, 1.0, candidate_s)
+        candidate_t = np.where(closer, potential_t, candidate_t)
+        minimum_distance = np.where(closer, potential_d, minimum_distance)
+
+        potential_s = clip((x1e2 - x2e2) / e2e2)
+        potential_d = norm(x2 + potential_s * e2 - x1)
+        closer = potential_d < minimum_distance
+        candidate_s = np.where(closer, potential_s, candidate_s)
+        candidate_t = np.where(closer, 0.0, candidate_t)
+        minimum_distance = np.where(closer, potential_d, minimum_distance)
+
+        potential_s = clip((x1e2 + e1e2 - x2e2) / e2e2)
+        potential_d = norm(x2 + potential_s * e2 - x1 - e1)
+        closer = potential_d < minimum_distance
+        candidate_s = np.where(closer, potential_s, candidate_s)
+        candidate_t = np.where(closer, 1.0, candidate_t)
+
+    s = np.where(parallel, s_parallel, np.where(out_of_bounds, candidate_s, s))
+    t = np.where(parallel, t_parallel, np.where(out_of_bounds, candidate_t, t))
+    return x2 + s * e2 - x1 - t * e1, s, t
+
+
+def _find_closest_point_on_triangle(point, a, b, c):
+    """
+    Closest point to `point` on the triangle (a, b, c), found from the Voronoi
+    region of the triangle containing the point (vertex, edge or face).
+
+    Reference: Ericson, Real-Time Collision Detection (2004), Section 5.1.5.
+    """
+    ab = b - a
+    ac = c - a
+    ap = point - a
+    d1 = _dot_product(ab, ap)
+    d2 = _dot_product(ac, ap)
+    if d1 <= 0.0 and d2 <= 0.0:
+        return a.copy()
+
+    bp = point - b
+    d3 = _dot_product(ab, bp)
+    d4 = _dot_product(ac, bp)
+    if d3 >= 0.0 and d4 <= d3:
+        return b.copy()
+
+    # Edges of zero length are skipped, so that points around degenerate
+    # triangles are projected on the edges left
+    vc = d1 * d4 - d3 * d2
+    if vc <= 0.0 and d1 >= 0.0 and d3 <= 0.0 and d1 > d3:
+        return a + d1 / (d1 - d3) * ab
+
+    cp = point - c
+    d5 = _dot_product(ab, cp)
+    d6 = _dot_product(ac, cp)
+    if d6 >= 0.0 and d5 <= d6:
+        return c.copy()
+
+    vb = d5 * d2 - d1 * d6
+    if vb <= 0.0 and d2 >= 0.0 and d6 <= 0.0 and d2 > d6:
+        return a + d2 / (d2 - d6) * ac
+
+    va = d3 * d6 - d5 * d4
+    if (
+        va <= 0.0
+        and (d4 - d3) >= 0.0
+        and (d5 - d6) >= 0.0
+        and (d4 - d3) + (d5 - d6) > 0.0
+    ):
+        return b + (d4 - d3) / ((d4 - d3) + (d5 - d6)) * (c - b)
+
+    denominator = va + vb + vc
+    return a + vb / denominator * ab + vc / denominator * ac
+
+
+def _find_closest_point_on_triangle_batch(points, a, b, c):
+    """
+    Batched `_find_closest_point_on_triangle`, for pairs of points and
+    triangles.
+
+    Parameters
+    ----------
+    points, a, b, c : numpy.ndarray
+        2D (dim, n_pairs) arrays, points and vertices of the triangles.
+
+    Returns
+    -------
+    closest_points : numpy.ndarray
+        2D (dim, n_pairs) array, closest point of each triangle to its point.
+    """
+    n_pairs = points.shape[1]
+    closest_points = np.empty((3, n_pairs))
+    for k in range(n_pairs):
+        closest_points[:, k] = _find_closest_point_on_triangle(
+            points[:, k], a[:, k], b[:, k], c[:, k]
+        )
+    return closest_points
+
+
+def _find_closest_point_on_triangle_batch_numpy(points, a, b, c):
+    """
+    Array-at-once version of `_find_closest_point_on_triangle_batch`. The closest
+    point of every Voronoi region is evaluated for all pairs, and the one of
+    the region containing the point is selected, in the order of the tests of
+    `_find_closest_point_on_triangle`.
+    """
+    ab = b - a
+    ac = c - a
+    ap = points - a
+    d1 = _dot_product_batch(ab, ap)
+    d2 = _dot_product_batch(ac, ap)
+    bp = points - b
+    d3 = _dot_product_batch(ab, bp)
+    d4 = _dot_product_batch(ac, bp)
+    cp = points - c
+    d5 = _dot_product_batch(ab, cp)
+    d6 = _dot_product_batch(ac, cp)
+    vc = d1 * d4 - d3 * d2
+    vb = d5 * d2 - d1 * d6
+    va = d3 * d6 - d5 * d4
+
+    in_vertex_a = (d1 <= 0.0) & (d2 <= 0.0)
+    in_vertex_b = (d3 >= 0.0) & (d4 <= d3)
+    in_edge_ab = (vc <= 0.0) & (d1 >= 0.0) & (d3 <= 0.0) & (d1 > d3)
+    in_vertex_c = (d6 >= 0.0) & (d5 <= d6)
+    in_edge_ac = (vb <= 0.0) & (d2 >= 0.0) & (d6 <= 0.0) & (d2 > d6)
+    in_edge_bc = (
+        (va <= 0.0)
+        & ((d4 - d3) >= 0.0)
+        & ((d5 - d6) >= 0.0)
+        & ((d4 - d3) + (d5 - d6) > 0.0)
+    )
+
+    # Denominators of the regions not containing the point may vanish, their
+    # result is discarded.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        on_edge_ab = a + d1 / (d1 - d3) * ab
+        on_edge_ac = a + d2 / (d2 - d6) * ac
+        on_edge_bc = b + (d4 - d3) / ((d4 - d3) + (d5 - d6)) * (c - b)
+        denominator = va + vb + vc
+        on_face = a + vb / denominator * ab + vc / denominator * ac
+
+    return np.select(
+        [in_vertex_a, in_vertex_b, in_edge_ab, in_vertex_c, in_edge_ac, in_edge_bc],
+        [a, b, on_edge_ab, c, on_edge_ac, on_edge_bc],
+        on_face,
+    )
+
+
+def _record_contact(records, first_element, second_element, gamma, force):
+    """
+    Appends a pair in contact to the buffers of `ContactRecords`
+    (indices, values, count, systems). Pairs beyond the capacity are only
+    counted.
+    """
+    indices, values, count, systems = records
+    n_records = count[0]
+    if n_records < indices.shape[1]:
+        indices[0, n_records] = systems[0]
+        indices[1, n_records] = first_element
+        indices[2, n_records] = systems[1]
+        indices[3, n_records] = second_element
+        values[0, n_records] = gamma
+        values[1, n_records] = force
+    count[0] = n_records + 1
+
+
+def _record_contacts(records, first_elements, second_elements, gamma, force):
+    """
+    Batched `_record_contact`, for 1D arrays of pairs in contact.
+    """
+    for k in range(first_elements.shape[0]):
+        _record_contact(
+            records, first_elements[k], second_elements[k], gamma[k], force[k]
+        )
+
+
+def _record_contacts_numpy(records, first_elements, second_elements, gamma, force):
+    """
+    Array-at-once version of `_record_contacts`.
+    """
+    indices, values, count, systems = records
+    n_records = count[0]
+    n_stored = max(min(indices.shape[1] - n_records, first_elements.shape[0]), 0)
+    stored = slice(n_records, n_records + n_stored)
+    indices[0, stored] = systems[0]
+    indices[1, stored] = first_elements[:n_stored]
+    indices[2, stored] = systems[1]
+    indices[3, stored] = second_elements[:n_stored]
+    values[0, stored] = gamma[:n_stored]
+    values[1, stored] = force[:n_stored]
+    count[0] = n_records + first_elements.shape[0]
 
 
 def _aabbs_not_intersecting(aabb_one, aabb_two):
@@ -220,6 +494,167 @@ def _prune_using_aabbs_rod_sphere(
     return _aabbs_not_intersecting(aabb_sphere, aabb_rod)
 
 
+def _find_self_contact_candidates(x_collection_rod, radius_rod, length_rod, skin):
+    """
+    Broadphase of rod self contact. Elements are hashed into a uniform grid,
+    whose cells are as large as the largest possible contact distance between
+    two elements, so that an element can only touch elements of its own cell
+    and of the 26 neighbouring cells.
+
+    Parameters
+    ----------
+    x_collection_rod : numpy.ndarray
+        2D (dim, n_elems) array containing the start positions of the elements.
+    radius_rod : numpy.ndarray
+        1D (n_elems) array containing the element radii.
+    length_rod : numpy.ndarray
+        1D (n_elems) array containing the element lengths.
+    skin : float
+        Margin added to the contact distance of the bounding spheres, so that
+        the candidates stay valid while elements move by less than half of it.
+
+    Returns
+    -------
+    candidate_offsets : numpy.ndarray
+        1D (n_elems + 1) array. The candidates of element i are
+        candidate_indices[candidate_offsets[i]:candidate_offsets[i + 1]].
+    candidate_indices : numpy.ndarray
+        1D array of element indices. The candidates of each element are the
+        earlier elements, beyond the neighbours skipped by self contact, whose
+        bounding spheres intersect the one of the element, in decreasing order.
+
+    Notes
+    -----
+    Candidates are listed in the order the brute-force loop over all pairs
+    visits them, so that contact forces are accumulated in the same order.
+    The cost is linear in the number of elements, plus the number of
+    candidates.
+    """
+    n_points = x_collection_rod.shape[1]
+    candidate_offsets = np.zeros(n_points + 1, dtype=np.int64)
+    candidate_indices = np.empty(0, dtype=np.int64)
+    if n_points == 0:
+        return candidate_offsets, candidate_indices
+
+    cell_size = 2.0 * (np.max(radius_rod) + np.max(length_rod)) + skin
+    cell_index = np.empty((3, n_points), dtype=np.int64)
+    for i in range(3):
+        lower_bound = np.min(x_collection_rod[i])
+        for k in range(n_points):
+            cell_index[i, k] = int(
+                np.floor((x_collection_rod[i, k] - lower_bound) / cell_size)
+            )
+    n_cells_x = np.max(cell_index[0]) + 1
+    n_cells_y = np.max(cell_index[1]) + 1
+    n_cells_z = np.max(cell_index[2]) + 1
+    cell_key = cell_index[0] + n_cells_x * (cell_index[1] + n_cells_y * cell_index[2])
+    order = np.argsort(cell_key, kind="mergesort")
+    sorted_cell_key = cell_key[order]
+
+    # First pass counts the candidates, second pass stores them
+    for fill in range(2):
+        n_candidates = 0
+        for i in range(n_points):
+            skip = int(1 + np.ceil(0.8 * np.pi * radius_rod[i] / length_rod[i]))
+            start = n_candidates
+            for dz in range(-1, 2):
+                cz = cell_index[2, i] + dz
+                if cz < 0 or cz >= n_cells_z:
+                    continue
+                for dy in range(-1, 2):
+                    cy = cell_index[1, i] + dy
+                    if cy < 0 or cy >= n_cells_y:
+                        continue
+                    for dx in range(-1, 2):
+                        cx = cell_index[0, i] + dx
+                        if cx < 0 or cx >= n_cells_x:
+                            continue
+                        key = cx + n_cells_x * (cy + n_cells_y * cz)
+                        low = np.searchsorted(sorted_cell_key, key, side="left")
+                        high = np.searchsorted(sorted_cell_key, key, side="right")
+                        for idx in range(low, high):
+                            j = order[idx]
+                            if j > i - skip:
+                                continue
+                            radii_sum = radius_rod[i] + radius_rod[j]
+                            length_sum = length_rod[i] + length_rod[j]
+                            norm_del_x = _norm(
+                                x_collection_rod[..., i] - x_collection_rod[..., j]
+                            )
+                            if norm_del_x >= (radii_sum + length_sum) + skin:
+                                continue
+                            if fill:
+                                candidate_indices[n_candidates] = j
+                            n_candidates += 1
+            if fill:
+                candidate_indices[start:n_candidates] = np.sort(
+                    candidate_indices[start:n_candidates]
+                )[::-1]
+                candidate_offsets[i + 1] = n_candidates
+        if not fill:
+            candidate_indices = np.empty(n_candidates, dtype=np.int64)
+
+    return candidate_offsets, candidate_indices
+
+
+def _find_self_contact_candidates_numpy(x_collection_rod, radius_rod, length_rod, skin):
+    """
+    Array-at-once version of `_find_self_contact_candidates`, returning the
+    same candidates.
+    """
+    n_points = x_collection_rod.shape[1]
+    if n_points == 0:
+        return np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    cell_size = 2.0 * (np.max(radius_rod) + np.max(length_rod)) + skin
+    cell_index = np.floor(
+        (x_collection_rod - np.min(x_collection_rod, axis=1, keepdims=True)) / cell_size
+    ).astype(np.int64)
+    n_cells = np.max(cell_index, axis=1) + 1
+    cell_key = cell_index[0] + n_cells[0] * (cell_index[1] + n_cells[1] * cell_index[2])
+    order = np.argsort(cell_key, kind="stable")
+    sorted_cell_key = cell_key[order]
+
+    # (3, n_elems, 27) cells neighbouring each element, -1 outside of the grid
+    cell_offsets = np.indices((3, 3, 3)).reshape(3, -1) - 1
+    neighbour_index = cell_index[:, :, np.newaxis] + cell_offsets[:, np.newaxis, :]
+    inside_grid = np.all(
+        (neighbour_index >= 0) & (neighbour_index < n_cells[:, None, None]), axis=0
+    )
+    neighbour_key = np.where(
+        inside_grid,
+        neighbour_index[0]
+        + n_cells[0] * (neighbour_index[1] + n_cells[1] * neighbour_index[2]),
+        -1,
+    ).ravel()
+    low = np.searchsorted(sorted_cell_key, neighbour_key, side="left")
+    count = np.searchsorted(sorted_cell_key, neighbour_key, side="right") - low
+
+    # Expand the (element, cell) ranges into (element, other element) pairs
+    first = np.cumsum(count) - count
+    i = np.repeat(np.arange(n_points).repeat(cell_offsets.shape[1]), count)
+    j = order[np.repeat(low - first, count) + np.arange(np.sum(count))]
+
+    skip = (1 + np.ceil(0.8 * np.pi * radius_rod / length_rod)).astype(np.int64)
+    keep = j <= i - skip[i]
+    i = i[keep]
+    j = j[keep]
+    del_x = x_collection_rod[:, i] - x_collection_rod[:, j]
+    norm_del_x = np.sqrt(
+        del_x[0] * del_x[0] + del_x[1] * del_x[1] + del_x[2] * del_x[2]
+    )
+    keep = (
+        norm_del_x
+        < (radius_rod[i] + radius_rod[j]) + (length_rod[i] + length_rod[j]) + skin
+    )
+    i = i[keep]
+    j = j[keep]
+
+    sorted_pairs = np.lexsort((-j, i))
+    candidate_offsets = np.searchsorted(i[sorted_pairs], np.arange(n_points + 1))
+    return candidate_offsets.astype(np.int64), j[sorted_pairs]
+
+
 def _find_slipping_elements(velocity_slip, velocity_threshold):
     """
     This function takes the velocity of elements and checks if they are larger than the threshold velocity.
@@ -403,3 +838,112 @@ def _node_to_element_velocity(mass, node_velocity_collection):
         element_velocity_collection[:, k] /= mass[k + 1] + mass[k]
 
     return element_velocity_collection
+
+
+def _node_to_element_mass_or_force_numpy(input):
+    """
+    Array-at-once version of `_node_to_element_mass_or_force`.
+    """
+    output = 0.5 * (input[..., :-1] + input[..., 1:])
+    output[..., 0] += 0.5 * input[..., 0]
+    output[..., -1] += 0.5 * input[..., -1]
+    return output
+
+
+def _node_to_element_mass_or_force_in_block(input, first_elements, last_elements):
+    """
+    Converts the mass/forces on the nodes of consecutive rods of a memory block
+    to their elements, as `_node_to_element_mass_or_force` does for each rod.
+
+    Parameters
+    ----------
+    input: numpy.ndarray
+        2D (dim, n_nodes) array containing nodal mass/forces, ghosts included.
+    first_elements: numpy.ndarray
+        1D array containing the index of the first element of each rod.
+    last_elements: numpy.ndarray
+        1D array containing the index of the last element of each rod.
+
+    Returns
+    -------
+    output: numpy.ndarray
+        2D (dim, n_elems) array containing elemental mass/forces. Values of
+        ghost elements are meaningless.
+    """
+    output = 0.5 * (input[..., :-1] + input[..., 1:])
+    output[..., first_elements] += 0.5 * input[..., first_elements]
+    output[..., last_elements] += 0.5 * input[..., last_elements + 1]
+    return output
+
+
+def _elements_to_nodes_inplace_numpy(vector_in_element_frame, vector_in_node_frame):
+    """
+    Array-at-once version of `_elements_to_nodes_inplace`. Each node receives
+    the force of its previous element first, as in the loop.
+    """
+    half_vector_in_element_frame = 0.5 * vector_in_element_frame
+    vector_in_node_frame[..., 1:] += half_vector_in_element_frame
+    vector_in_node_frame[..., :-1] += half_vector_in_element_frame
+
+
+def _node_to_element_position_numpy(node_position_collection):
+    """
+    Array-at-once version of `_node_to_element_position`.
+    """
+    return 0.5 * (
+        node_position_collection[..., 1:] + node_position_collection[..., :-1]
+    )
+
+
+def _node_to_element_velocity_numpy(mass, node_velocity_collection):
+    """
+    Array-at-once version of `_node_to_element_velocity`.
+    """
+    return (
+        mass[1:] * node_velocity_collection[..., 1:]
+        + mass[:-1] * node_velocity_collection[..., :-1]
+    ) / (mass[1:] + mass[:-1])
+
+
+register_kernels(
+    __name__,
+    "reference",
+    {
+        "_dot_product": _dot_product,
+        "_norm": _norm,
+        "_clip": _clip,
+        "_out_of_bounds": _out_of_bounds,
+        "_find_min_dist": _find_min_dist,
+        "_find_min_dist_parameters": _find_min_dist_parameters,
+        "_find_min_dist_batch": _find_min_dist_batch,
+        "_find_closest_point_on_triangle": _find_closest_point_on_triangle,
+        "_find_closest_point_on_triangle_batch": _find_closest_point_on_triangle_batch,
+        "_record_contact": _record_contact,
+        "_record_contacts": _record_contacts,
+        "_aabbs_not_intersecting": _aabbs_not_intersecting,
+        "_prune_using_aabbs_rod_cylinder": _prune_using_aabbs_rod_cylinder,
+        "_prune_using_aabbs_rod_rod": _prune_using_aabbs_rod_rod,
+        "_prune_using_aabbs_rod_sphere": _prune_using_aabbs_rod_sphere,
+        "_find_self_contact_candidates": _find_self_contact_candidates,
+        "_find_slipping_elements": _find_slipping_elements,
+        "_node_to_element_mass_or_force": _node_to_element_mass_or_force,
+        "_elements_to_nodes_inplace": _elements_to_nodes_inplace,
+        "_node_to_element_position": _node_to_element_position,
+        "_node_to_element_velocity": _node_to_element_velocity,
+    },
+)
+register_kernels(
+    __name__,
+    "numpy",
+    {
+        "_find_min_dist_batch": _find_min_dist_batch_numpy,
+        "_find_closest_point_on_triangle_batch": _find_closest_point_on_triangle_batch_numpy,
+        "_record_contacts": _record_contacts_numpy,
+        "_find_self_contact_candidates": _find_self_contact_candidates_numpy,
+        "_node_to_element_mass_or_force": _node_to_element_mass_or_force_numpy,
+        "_elements_to_nodes_inplace": _elements_to_nodes_inplace_numpy,
+        "_node_to_element_position": _node_to_element_position_numpy,
+        "_node_to_element_velocity": _node_to_element_velocity_numpy,
+    },
+)
+bind_kernels(globals())
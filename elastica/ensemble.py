@@ -0,0 +1,187 @@
+__doc__ = """
+Ensemble
+--------
+
+Integration of many structurally identical simulations in lockstep, as a single
+simulator.
+"""
+
+from typing import Any, Callable, List
+
+import numpy as np
+
+from elastica.modules.base_system import BaseSystemCollection
+
+
+class Ensemble:
+    """
+    Ensemble of structurally identical simulations (members), built into a single
+    simulator. The systems of all the members are held by the same memory blocks,
+    so one time step of the simulator steps all the members with one call of each
+    kernel, instead of one per member: the Python overhead of a step is shared by
+    the members. Typical uses are parameter sweeps and the evaluation of the
+    candidates of an optimizer.
+
+    Members are built by a function adding the systems and features of a member
+    to the simulator, e.g. for a sweep over the Young's modulus:
+
+    >>> def build_member(simulator, member_idx):
+    ...     rod = CosseratRod.straight_rod(..., youngs_modulus=youngs_moduli[member_idx])
+    ...     simulator.append(rod)
+    ...     simulator.constrain(rod).using(OneEndFixedBC, ...)
+    ...     return rod
+    >>> ensemble = Ensemble(simulator, len(youngs_moduli), build_member)
+    >>> ensemble.finalize()
+    >>> integrate(PositionVerlet(), ensemble.simulator, final_time, total_steps)
+    >>> tip_positions = ensemble.stack("position_collection")[..., -1]
+
+    Members must refer to their systems by object, not by index, and must only
+    interact with their own systems, or with systems appended to the simulator
+    before the ensemble is built (e.g. a ground plane shared by all members).
+
+        Attributes
+        ----------
+        simulator: BaseSystemCollection
+            Simulator holding all the members.
+        n_members: int
+            Number of members.
+        members: list
+            Values returned by the build function, one per member.
+    """
+
+    def __init__(
+        self,
+        simulator: BaseSystemCollection,
+        n_members: int,
+        build_member: Callable[[BaseSystemCollection, int], Any],
+    ):
+        """
+
+        Parameters
+        ----------
+        simulator: BaseSystemCollection
+            Simulator, not finalized.
+        n_members: int
+            Number of members.
+        build_member: Callable
+            Function called with the simulator and the index of a member, adding
+            the systems and features of the member to the simulator. Its return
+            value is stored in `members`.
+        """
+        assert simulator._finalize_flag is not True, (
+            "The ensemble must be built before calling finalize."
+        )
+        if n_members < 1:
+            raise ValueError(
+                "The number of members must be positive, not {0}.".format(n_members)
+            )
+
+        self.simulator = simulator
+        self.n_members = int(n_members)
+        self.members = []
+        self._member_systems: List[List] = []
+        for member_idx in range(self.n_members):
+            n_systems = len(simulator)
+            self.members.append(build_member(simulator, member_idx))
+            self._member_systems.append(simulator[n_systems:])
+
+        structure = self._structure(0)
+        for member_idx in range(1, self.n_members):
+            if self._structure(member_idx) != structure:
+                raise ValueError(
+                    "Members of an ensemble must have the same systems, in the same "
+                    "order and of the same size: member {0} differs from member 0.\n"
+                    "Member 0: {1}\n"
+                    "Member {0}: {2}".format(
+                        member_idx, structure, self._structure(member_idx)
+                    )
+                )
+
+    def _structure(self, member_idx: int):
+        return [
+            (type(system).__name__, getattr(system, "n_elems", None))
+            for system in self._member_systems[member_idx]
+        ]
+
+    def finalize(self, dtype=np.float64):
+        """
+        Finalizes the simulator (see `BaseSystemCollection.finalize`).
+
+        Parameters
+        ----------
+        dtype: numpy.dtype
+            Floating point type of the memory blocks.
+        """
+        self.simulator.finalize(dtype=dtype)
+
+    def systems(self, member_idx: int) -> list:
+        """
+        Returns the systems of a member, in the order they are appended.
+
+        Parameters
+        ----------
+        member_idx: int
+
+        Returns
+        -------
+        list
+        """
+        return list(self._member_systems[member_idx])
+
+    def stack(self, attribute: str, system_idx: int = 0) -> np.ndarray:
+        """
+        Returns a variable of a system of all the members, stacked along a leading
+        ensemble axis: the result has the shape (n_members, *shape of the variable).
+
+        After `finalize`, member systems are views of the memory blocks, at a
+        constant distance from each other, and the result is a read-only view of
+        the memory blocks: it follows the simulation without copying. Otherwise,
+        the result is a read-only copy.
+
+        Parameters
+        ----------
+        attribute: str
+            Name of the variable, e.g. "position_collection".
+        system_idx: int
+            Index of the system in its member.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        arrays = [
+            np.asarray(getattr(systems[system_idx], attribute))
+            for systems in self._member_systems
+        ]
+        stacked = _strided_stack(arrays)
+        if stacked is None:
+            stacked = np.stack(arrays)
+        stacked.flags.writeable = False
+        return stacked
+
+
+def _strided_stack(arrays: List[np.ndarray]):
+    # Stacks views of the same buffer, at constant distance from each other,
+    # without copy. Returns None if the arrays are not such views.
+    first = arrays[0]
+    if any(
+        array.shape != first.shape
+        or array.strides != first.strides
+        or array.dtype != first.dtype
+        or array.base is None
+        or array.base is not first.base
+        for array in arrays
+    ):
+        return None
+
+    addresses = np.array([array.__array_interface__["data"][0] for array in arrays])
+    distances = np.diff(addresses)
+    if distances.size == 0 or np.any(distances != distances[0]) or distances[0] <= 0:
+        return None
+
+    return np.lib.stride_tricks.as_strided(
+        first,
+        shape=(len(arrays), *first.shape),
+        strides=(int(distances[0]), *first.strides),
+        writeable=False,
+    )
@@ -10,6 +10,7 @@ from elastica.contact_utils import (
 from elastica._contact_functions import (
     _calculate_contact_forces_rod_plane,
     _calculate_contact_forces_rod_plane_with_anisotropic_friction,
+    _calculate_contact_forces_rod_plane_with_anisotropic_friction_in_block,
     _calculate_contact_forces_cylinder_plane,
 )
 
@@ -265,6 +266,76 @@ class AnisotropicFrictionalPlane(NoForces, InteractionPlane):
             system.external_torques,
         )
 
+    def _batch_key(self):
+        # Planes with the same key are applied at once to consecutive rods of a
+        # memory block, see apply_forces_in_block.
+        if type(self).apply_forces is not AnisotropicFrictionalPlane.apply_forces:
+            return None
+        return (
+            AnisotropicFrictionalPlane,
+            self.k,
+            self.nu,
+            tuple(np.ravel(self.plane_origin)),
+            tuple(np.ravel(self.plane_normal)),
+            self.surface_tol,
+            self.slip_velocity_tol,
+            self.kinetic_mu_forward,
+            self.kinetic_mu_backward,
+            self.kinetic_mu_sideways,
+            self.static_mu_forward,
+            self.static_mu_backward,
+            self.static_mu_sideways,
+        )
+
+    def apply_forces_in_block(
+        self, rods, first_elements, last_elements, ghost_elements, time=0.0
+    ):
+        """
+        Apply friction forces to consecutive rods of a memory block, as
+        `apply_forces` does for each of the rods.
+
+        Parameters
+        ----------
+        rods: MemoryBlockCosseratRodChunk
+            Consecutive rods of a memory block.
+        first_elements: numpy.ndarray
+            1D array containing the index of the first element of each rod.
+        last_elements: numpy.ndarray
+            1D array containing the index of the last element of each rod.
+        ghost_elements: numpy.ndarray
+            1D array containing the indices of the ghost elements between rods.
+        time
+
+        """
+        _calculate_contact_forces_rod_plane_with_anisotropic_friction_in_block(
+            self.plane_origin,
+            self.plane_normal,
+            self.surface_tol,
+            self.slip_velocity_tol,
+            self.k,
+            self.nu,
+            self.kinetic_mu_forward,
+            self.kinetic_mu_backward,
+            self.kinetic_mu_sideways,
+            self.static_mu_forward,
+            self.static_mu_backward,
+            self.static_mu_sideways,
+            rods.radius,
+            rods.mass,
+            rods.tangents,
+            rods.position_collection,
+            rods.director_collection,
+            rods.velocity_collection,
+            rods.omega_collection,
+            rods.internal_forces,
+            rods.external_forces,
+            rods.internal_torques,
+            rods.external_torques,
+            first_elements,
+            last_elements,
+            ghost_elements,
+        )
+
 
 def anisotropic_friction(
     plane_origin,
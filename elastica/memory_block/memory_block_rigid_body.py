@@ -2,12 +2,21 @@ __doc__ = """Create block-structure class for collection of rigid body systems."
 import numpy as np
 from typing import Sequence, Literal
 
+from elastica._linalg import _batch_matvec, _batch_cross
 from elastica.rigidbody import RigidBodyBase
 from elastica.rigidbody.data_structures import _RigidRodSymplecticStepperMixin
+from elastica.memory_block.workspace import MemoryBlockWorkspace
 
 
 class MemoryBlockRigidBody(RigidBodyBase, _RigidRodSymplecticStepperMixin):
-    def __init__(self, systems: Sequence, system_idx_list: Sequence[np.int64]):
+    def __init__(
+        self,
+        systems: Sequence,
+        system_idx_list: Sequence[np.int64],
+        dtype=np.float64,
+    ):
+        # Floating point type of the block variables and of the workspace
+        self.dtype = np.dtype(dtype)
         self.n_bodies = len(systems)
         self.n_elems = self.n_bodies
         self.n_nodes = self.n_elems
@@ -19,9 +28,44 @@ class MemoryBlockRigidBody(RigidBodyBase, _RigidRodSymplecticStepperMixin):
         self._allocate_block_variables_matrix(systems)
         self._allocate_block_variables_for_symplectic_stepper(systems)
 
+        # Scratch buffers for the kernels, so that time steps do not allocate.
+        self.workspace = MemoryBlockWorkspace(
+            self.n_nodes, self.n_elems, 0, self.dvdt_dwdt_collection, dtype=self.dtype
+        )
+
+        # In single precision, the position increments of slowly moving nodes are
+        # close to the rounding error of the positions. The part lost to rounding
+        # is kept here and added back at the next kinematic update.
+        self.position_residual = (
+            np.zeros_like(self.position_collection)
+            if self.dtype == np.float32
+            else None
+        )
+
         # Initialize the mixin class for symplectic time-stepper.
         _RigidRodSymplecticStepperMixin.__init__(self)
 
+    def update_accelerations(self, time):
+        """
+        Updates the acceleration variables of all bodies in the block, using the
+        preallocated scratch buffers of the block.
+        """
+        np.divide(self.external_forces, self.mass, out=self.acceleration_collection)
+
+        J_omega, lagrangian_transport = self.workspace.vectors_in_elements[:2]
+        # I apply common sub expression elimination here, as J w
+        _batch_matvec(
+            self.mass_second_moment_of_inertia, self.omega_collection, out=J_omega
+        )
+        # (J \omega_L ) x \omega_L
+        _batch_cross(J_omega, self.omega_collection, out=lagrangian_transport)
+        lagrangian_transport += self.external_torques
+        _batch_matvec(
+            self.inv_mass_second_moment_of_inertia,
+            lagrangian_transport,
+            out=self.alpha_collection,
+        )
+
     def _allocate_block_variables_scalars(self, systems: Sequence):
         """
         This function takes system collection and allocates the variables for
@@ -51,7 +95,7 @@ class MemoryBlockRigidBody(RigidBodyBase, _RigidRodSymplecticStepperMixin):
             "mass": 4,
         }
         self.scalar_dofs_in_rigid_bodies = np.zeros(
-            (len(map_scalar_dofs_in_rigid_bodies), self.n_elems)
+            (len(map_scalar_dofs_in_rigid_bodies), self.n_elems), dtype=self.dtype
         )
 
         self._map_system_properties_to_block_memory(
@@ -87,7 +131,7 @@ class MemoryBlockRigidBody(RigidBodyBase, _RigidRodSymplecticStepperMixin):
         }
 
         self.vector_dofs_in_rigid_bodies = np.zeros(
-            (len(map_vector_dofs_in_rigid_bodies), 3 * self.n_elems)
+            (len(map_vector_dofs_in_rigid_bodies), 3 * self.n_elems), dtype=self.dtype
         )
 
         self._map_system_properties_to_block_memory(
@@ -123,7 +167,7 @@ class MemoryBlockRigidBody(RigidBodyBase, _RigidRodSymplecticStepperMixin):
         }
 
         self.matrix_dofs_in_rigid_bodies = np.zeros(
-            (len(map_matrix_dofs_in_rigid_bodies), 9 * self.n_elems)
+            (len(map_matrix_dofs_in_rigid_bodies), 9 * self.n_elems), dtype=self.dtype
         )
 
         self._map_system_properties_to_block_memory(
@@ -160,7 +204,9 @@ class MemoryBlockRigidBody(RigidBodyBase, _RigidRodSymplecticStepperMixin):
             "acceleration_collection": 2,
             "alpha_collection": 3,
         }
-        self.rate_collection = np.zeros((len(map_rate_collection), 3 * self.n_elems))
+        self.rate_collection = np.zeros(
+            (len(map_rate_collection), 3 * self.n_elems), dtype=self.dtype
+        )
         self._map_system_properties_to_block_memory(
             mapping_dict=map_rate_collection,
             systems=systems,
@@ -228,3 +274,46 @@ class MemoryBlockRigidBody(RigidBodyBase, _RigidRodSymplecticStepperMixin):
                 system.__dict__[k] = np.ndarray.view(
                     self.__dict__[k][..., system_idx : system_idx + 1]
                 )
+
+
+class MemoryBlockRigidBodyChunk:
+    """
+    Chunk of a memory block of rigid bodies: views of the variables of the block
+    on a range of consecutive bodies, e.g. to apply the contacts of a rod with
+    all of them at once.
+
+        Attributes
+        ----------
+        n_bodies: int
+            Number of bodies of the chunk.
+        system_idx_list: numpy.ndarray
+            Indices of the bodies of the chunk in the simulator.
+    """
+
+    variables = (
+        "radius",
+        "length",
+        "mass",
+        "position_collection",
+        "director_collection",
+        "velocity_collection",
+        "omega_collection",
+        "external_forces",
+        "external_torques",
+    )
+
+    def __init__(self, memory_block: MemoryBlockRigidBody, start: int, end: int):
+        """
+
+        Parameters
+        ----------
+        memory_block: MemoryBlockRigidBody
+        start: int
+            Index of the first body of the chunk in the block.
+        end: int
+            Index after the last body of the chunk in the block.
+        """
+        self.n_bodies = end - start
+        self.system_idx_list = memory_block.system_idx_list[start:end]
+        for name in self.variables:
+            setattr(self, name, getattr(memory_block, name)[..., start:end])
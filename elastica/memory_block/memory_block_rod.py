@@ -4,14 +4,18 @@ from typing import Sequence, Literal, Callable
 from elastica.memory_block.memory_block_rod_base import (
     MemoryBlockRodBase,
     make_block_memory_metadata,
+    make_block_memory_ghost_mask,
     make_block_memory_periodic_boundary_metadata,
 )
-from elastica.rod.data_structures import _RodSymplecticStepperMixin
+from elastica.rod.data_structures import _RodSymplecticStepperMixin, _KinematicState
 from elastica.reset_functions_for_block_structure import _reset_scalar_ghost
 from elastica.rod.cosserat_rod import (
     CosseratRod,
     _compute_sigma_kappa_for_blockstructure,
+    _compute_internal_forces_and_torques,
+    _update_accelerations,
 )
+from elastica.memory_block.workspace import MemoryBlockWorkspace
 from elastica._synchronize_periodic_boundary import (
     _synchronize_periodic_boundary_of_vector_collection,
     _synchronize_periodic_boundary_of_scalar_collection,
@@ -31,7 +35,21 @@ class MemoryBlockCosseratRod(
     TODO: need more documentation!
     """
 
-    def __init__(self, systems: Sequence, system_idx_list):
+    # Substeps of the block per step of the collection, more than one for the
+    # rods subcycled with BaseSystemCollection.subcycle
+    n_substeps = 1
+    # Nodes and elements constrained by boundary conditions, and the lab frame
+    # components of their rates they constrain, set by the Constraints module
+    # and held by the implicit steps
+    constrained_nodes_idx = np.zeros(0, dtype=np.int64)
+    constrained_nodes_selector = np.zeros((0, 3), dtype=bool)
+    constrained_elems_idx = np.zeros(0, dtype=np.int64)
+    constrained_elems_selector = np.zeros((0, 3), dtype=bool)
+
+    def __init__(self, systems: Sequence, system_idx_list, dtype=np.float64):
+        # Floating point type of the block variables and of the workspace
+        self.dtype = np.dtype(dtype)
+
         # separate straight and ring rods
         system_straight_rod = []
         system_ring_rod = []
@@ -73,6 +91,13 @@ class MemoryBlockCosseratRod(
         ) = make_block_memory_metadata(self.n_elems_in_rods)
         self.n_nodes = self.n_elems + 1
         self.n_voronoi = self.n_elems - 1
+        # Ghost masks used by the block-structure kernels
+        self.elems_mask = make_block_memory_ghost_mask(
+            self.n_elems, self.ghost_elems_idx, self.dtype
+        )
+        self.voronoi_mask = make_block_memory_ghost_mask(
+            self.n_voronoi, self.ghost_voronoi_idx, self.dtype
+        )
 
         # n_nodes_in_rods = self.n_elems_in_rods + 1
         # n_voronois_in_rods = self.n_elems_in_rods - 1
@@ -195,9 +220,146 @@ class MemoryBlockCosseratRod(
                 self.rest_kappa, self.periodic_boundary_voronoi_idx
             )
 
+        # Scratch buffers for the kernels, so that time steps do not allocate.
+        self.workspace = MemoryBlockWorkspace(
+            self.n_nodes,
+            self.n_elems,
+            self.n_voronoi,
+            self.dvdt_dwdt_collection,
+            dtype=self.dtype,
+        )
+
+        # In single precision, the position increments of slowly moving nodes are
+        # close to the rounding error of the positions. The part lost to rounding
+        # is kept here and added back at the next kinematic update.
+        self.position_residual = (
+            np.zeros_like(self.position_collection)
+            if self.dtype == np.float32
+            else None
+        )
+
+        # Chunks of the block, processed concurrently by a thread pool (see
+        # split_into_chunks). Empty if the block is not split.
+        self.chunks = []
+        self._chunk_thread_pool = None
+
         # Initialize the mixin class for symplectic time-stepper.
         _RodSymplecticStepperMixin.__init__(self)
 
+    def split_into_chunks(self, chunk_policy, thread_pool):
+        """
+        Splits the block into chunks of whole rods, as given by the chunk policy.
+        Chunks are views of the block, with the same kernels, and can be updated
+        concurrently. Accelerations of the block are then computed by the thread
+        pool, chunk by chunk.
+
+        Ghosts between two chunks are not updated by the chunks. Ghosts do not
+        contribute to the rods, so the rods are updated as with the whole block.
+
+        Parameters
+        ----------
+        chunk_policy: BlockChunkPolicy
+        thread_pool: ThreadPool
+
+        Returns
+        -------
+        chunks: list
+            Chunks of the block, empty if the block is not split.
+        """
+        rod_bounds = chunk_policy.split(self.n_elems_in_rods, thread_pool.n_threads)
+        if rod_bounds.shape[0] <= 2:
+            self.chunks = []
+            self._chunk_thread_pool = None
+            return self.chunks
+
+        # Chunks start after the ghost node preceding their first rod, and end
+        # before the ghost node following their last rod.
+        start_idx_in_chunk_nodes = np.hstack((0, self.ghost_nodes_idx + 1))
+        end_idx_in_chunk_nodes = np.hstack((self.ghost_nodes_idx, self.n_nodes))
+        self.chunks = [
+            MemoryBlockCosseratRodChunk(
+                self, start_idx_in_chunk_nodes[first], end_idx_in_chunk_nodes[last - 1]
+            )
+            for first, last in zip(rod_bounds[:-1], rod_bounds[1:])
+        ]
+        self._chunk_thread_pool = thread_pool
+        return self.chunks
+
+    def compute_internal_forces_and_torques(self, time):
+        """
+        Compute internal forces and torques of all rods in the block, using the
+        preallocated scratch buffers of the block.
+
+        Parameters
+        ----------
+        time: float
+            current time
+
+        """
+        _compute_internal_forces_and_torques(
+            self.position_collection,
+            self.velocity_collection,
+            self.volume,
+            self.lengths,
+            self.tangents,
+            self.radius,
+            self.rest_lengths,
+            self.rest_voronoi_lengths,
+            self.dilatation,
+            self.voronoi_dilatation,
+            self.director_collection,
+            self.sigma,
+            self.rest_sigma,
+            self.shear_matrix,
+            self.internal_stress,
+            self.bend_matrix,
+            self.rest_kappa,
+            self.kappa,
+            self.internal_couple,
+            self.mass_second_moment_of_inertia,
+            self.omega_collection,
+            self.dilatation_rate,
+            self.internal_forces,
+            self.internal_torques,
+            self.elems_mask,
+            self.voronoi_mask,
+            self.workspace.vectors_in_elements,
+            self.workspace.vectors_in_voronoi,
+            self.workspace.scalars_in_elements,
+            self.workspace.scalars_in_voronoi,
+        )
+
+    def update_accelerations(self, time):
+        """
+        Updates the acceleration variables of all rods in the block, using the
+        preallocated scratch buffers of the block. If the block is split into
+        chunks, chunks are updated concurrently.
+
+        Parameters
+        ----------
+        time: float
+            current time
+
+        """
+        if self._chunk_thread_pool is not None:
+            self._chunk_thread_pool.map(
+                lambda chunk: chunk.update_accelerations(time), self.chunks
+            )
+            return
+
+        _update_accelerations(
+            self.acceleration_collection,
+            self.internal_forces,
+            self.external_forces,
+            self.mass,
+            self.alpha_collection,
+            self.inv_mass_second_moment_of_inertia,
+            self.internal_torques,
+            self.external_torques,
+            self.dilatation,
+            self.workspace.vectors_in_elements,
+        )
+
     def _allocate_block_variables_in_nodes(self, systems: Sequence):
         """
         This function takes system collection and allocates the variables on
@@ -217,7 +379,7 @@ class MemoryBlockCosseratRod(
         #             0 ("mass", float64[:]),
         map_scalar_dofs_in_rod_nodes = {"mass": 0}
         self.scalar_dofs_in_rod_nodes = np.zeros(
-            (len(map_scalar_dofs_in_rod_nodes), self.n_nodes)
+            (len(map_scalar_dofs_in_rod_nodes), self.n_nodes), dtype=self.dtype
         )
         self._map_system_properties_to_block_memory(
             mapping_dict=map_scalar_dofs_in_rod_nodes,
@@ -238,7 +400,7 @@ class MemoryBlockCosseratRod(
             "external_forces": 2,
         }
         self.vector_dofs_in_rod_nodes = np.zeros(
-            (len(map_vector_dofs_in_rod_nodes), 3 * self.n_nodes)
+            (len(map_vector_dofs_in_rod_nodes), 3 * self.n_nodes), dtype=self.dtype
         )
         self._map_system_properties_to_block_memory(
             mapping_dict=map_vector_dofs_in_rod_nodes,
@@ -281,7 +443,7 @@ class MemoryBlockCosseratRod(
             "dilatation_rate": 6,
         }
         self.scalar_dofs_in_rod_elems = np.zeros(
-            (len(map_scalar_dofs_in_rod_elems), self.n_elems)
+            (len(map_scalar_dofs_in_rod_elems), self.n_elems), dtype=self.dtype
         )
         self._map_system_properties_to_block_memory(
             mapping_dict=map_scalar_dofs_in_rod_elems,
@@ -307,7 +469,7 @@ class MemoryBlockCosseratRod(
             "internal_stress": 5,
         }
         self.vector_dofs_in_rod_elems = np.zeros(
-            (len(map_vector_dofs_in_rod_elems), 3 * self.n_elems)
+            (len(map_vector_dofs_in_rod_elems), 3 * self.n_elems), dtype=self.dtype
         )
         self._map_system_properties_to_block_memory(
             mapping_dict=map_vector_dofs_in_rod_elems,
@@ -329,7 +491,7 @@ class MemoryBlockCosseratRod(
             "shear_matrix": 3,
         }
         self.matrix_dofs_in_rod_elems = np.zeros(
-            (len(map_matrix_dofs_in_rod_elems), 9 * self.n_elems)
+            (len(map_matrix_dofs_in_rod_elems), 9 * self.n_elems), dtype=self.dtype
         )
         self._map_system_properties_to_block_memory(
             mapping_dict=map_matrix_dofs_in_rod_elems,
@@ -362,7 +524,7 @@ class MemoryBlockCosseratRod(
             "rest_voronoi_lengths": 1,
         }
         self.scalar_dofs_in_rod_voronois = np.zeros(
-            (len(map_scalar_dofs_in_rod_voronois), self.n_voronoi)
+            (len(map_scalar_dofs_in_rod_voronois), self.n_voronoi), dtype=self.dtype
         )
         self._map_system_properties_to_block_memory(
             mapping_dict=map_scalar_dofs_in_rod_voronois,
@@ -382,7 +544,7 @@ class MemoryBlockCosseratRod(
             "internal_couple": 2,
         }
         self.vector_dofs_in_rod_voronois = np.zeros(
-            (len(map_vector_dofs_in_rod_voronois), 3 * self.n_voronoi)
+            (len(map_vector_dofs_in_rod_voronois), 3 * self.n_voronoi), dtype=self.dtype
         )
         self._map_system_properties_to_block_memory(
             mapping_dict=map_vector_dofs_in_rod_voronois,
@@ -396,7 +558,7 @@ class MemoryBlockCosseratRod(
         #             0 ("bend_matrix", float64[:, :, :]),
         map_matrix_dofs_in_rod_voronois = {"bend_matrix": 0}
         self.matrix_dofs_in_rod_voronois = np.zeros(
-            (len(map_matrix_dofs_in_rod_voronois), 9 * self.n_voronoi)
+            (len(map_matrix_dofs_in_rod_voronois), 9 * self.n_voronoi), dtype=self.dtype
         )
         self._map_system_properties_to_block_memory(
             mapping_dict=map_matrix_dofs_in_rod_voronois,
@@ -433,7 +595,9 @@ class MemoryBlockCosseratRod(
             "acceleration_collection": 2,
             "alpha_collection": 3,
         }
-        self.rate_collection = np.zeros((len(map_rate_collection), 3 * self.n_nodes))
+        self.rate_collection = np.zeros(
+            (len(map_rate_collection), 3 * self.n_nodes), dtype=self.dtype
+        )
 
         # For Dynamic state update of position Verlet create references
         self.v_w_collection = np.lib.stride_tricks.as_strided(
@@ -575,3 +739,143 @@ class MemoryBlockCosseratRod(
 
             # Synchronize periodic boundaries
             synchronize_periodic_boundary(self.__dict__[k], periodic_boundary_idx)
+
+
+class MemoryBlockCosseratRodChunk:
+    """
+    Chunk of a memory block of Cosserat rods: views of the variables of the block
+    on a range of consecutive rods, and of its scratch buffers. Chunks of a block
+    are disjoint, and can be updated concurrently with the kernels of the block.
+
+    Chunks are not systems, and only provide what the steppers need to update
+    them: internal forces and torques, accelerations, the kinematic update and the
+    reset of the external forces and torques. The dynamic update works on the
+    rate collection of the whole block.
+
+        Attributes
+        ----------
+        n_nodes: int
+            Number of nodes of the chunk.
+        n_elems: int
+            Number of elements of the chunk.
+        n_voronoi: int
+            Number of voronoi of the chunk.
+    """
+
+    # Variables of the block, by domain
+    variables_in_nodes = (
+        "mass",
+        "position_collection",
+        "internal_forces",
+        "external_forces",
+        "velocity_collection",
+        "acceleration_collection",
+    )
+    variables_in_elements = (
+        "radius",
+        "volume",
+        "density",
+        "lengths",
+        "rest_lengths",
+        "dilatation",
+        "dilatation_rate",
+        "tangents",
+        "sigma",
+        "rest_sigma",
+        "internal_torques",
+        "external_torques",
+        "internal_stress",
+        "director_collection",
+        "mass_second_moment_of_inertia",
+        "inv_mass_second_moment_of_inertia",
+        "shear_matrix",
+        "omega_collection",
+        "alpha_collection",
+        "elems_mask",
+    )
+    variables_in_voronoi = (
+        "voronoi_dilatation",
+        "rest_voronoi_lengths",
+        "kappa",
+        "rest_kappa",
+        "internal_couple",
+        "bend_matrix",
+        "voronoi_mask",
+    )
+
+    def __init__(
+        self, memory_block: MemoryBlockCosseratRod, start_node: int, end_node: int
+    ):
+        """
+
+        Parameters
+        ----------
+        memory_block: MemoryBlockCosseratRod
+        start_node: int
+            Index of the first node of the chunk in the block.
+        end_node: int
+            Index after the last node of the chunk in the block.
+        """
+        self.n_nodes = end_node - start_node
+        self.n_elems = self.n_nodes - 1
+        self.n_voronoi = self.n_nodes - 2
+        nodes = slice(start_node, end_node)
+        elems = slice(start_node, end_node - 1)
+        voronoi = slice(start_node, end_node - 2)
+
+        for domain, variables in (
+            (nodes, self.variables_in_nodes),
+            (elems, self.variables_in_elements),
+            (voronoi, self.variables_in_voronoi),
+        ):
+            for name in variables:
+                setattr(self, name, getattr(memory_block, name)[..., domain])
+
+        self.workspace = memory_block.workspace.chunk(nodes, elems, voronoi)
+        self.position_residual = (
+            None
+            if memory_block.position_residual is None
+            else memory_block.position_residual[..., nodes]
+        )
+        self.kinematic_states = _KinematicState(
+            self.position_collection,
+            self.director_collection,
+            self.workspace,
+            self.position_residual,
+        )
+
+    compute_internal_forces_and_torques = (
+        MemoryBlockCosseratRod.compute_internal_forces_and_torques
+    )
+    zeroed_out_external_forces_and_torques = (
+        CosseratRod.zeroed_out_external_forces_and_torques
+    )
+    update_internal_forces_and_torques = (
+        _RodSymplecticStepperMixin.update_internal_forces_and_torques
+    )
+    reset_external_forces_and_torques = (
+        _RodSymplecticStepperMixin.reset_external_forces_and_torques
+    )
+
+    def update_accelerations(self, time):
+        """
+        Updates the acceleration variables of the rods of the chunk.
+
+        Parameters
+        ----------
+        time: float
+            current time
+
+        """
+        _update_accelerations(
+            self.acceleration_collection,
+            self.internal_forces,
+            self.external_forces,
+            self.mass,
+            self.alpha_collection,
+            self.inv_mass_second_moment_of_inertia,
+            self.internal_torques,
+            self.external_torques,
+            self.dilatation,
+            self.workspace.vectors_in_elements,
+        )
@@ -52,6 +52,33 @@ def make_block_memory_metadata(n_elems_in_rods: np.ndarray) -> Iterable:
     return n_elems_with_ghosts, ghost_nodes_idx, ghost_elems_idx, ghost_voronoi_idx
 
 
+def make_block_memory_ghost_mask(
+    n_entries: int, ghost_idx: np.ndarray, dtype=np.float64
+) -> np.ndarray:
+    """
+    This function, takes the indices of the ghosts of a memory block domain (nodes,
+    elements or voronoi) and returns a mask of this domain, which block-structure
+    kernels multiply with their inputs instead of resetting ghosts one by one.
+
+    Parameters
+    ----------
+    n_entries: int
+        Number of entries of the domain, ghosts included.
+    ghost_idx: ndarray
+        An integer array containing the indices of ghosts in the domain.
+    dtype: numpy.dtype
+        Floating point type of the mask, the one of the block variables.
+
+    Returns
+    -------
+    ghost_mask: ndarray
+        A float array of length n_entries, 0.0 on ghosts and 1.0 elsewhere.
+    """
+    ghost_mask = np.ones(n_entries, dtype=dtype)
+    ghost_mask[ghost_idx] = 0.0
+    return ghost_mask
+
+
 def make_block_memory_periodic_boundary_metadata(n_elems_in_rods):
     """
     This function, takes the number of elements of ring rods and computes the periodic boundary node,
@@ -155,6 +182,80 @@ def make_block_memory_periodic_boundary_metadata(n_elems_in_rods):
     )
 
 
+class BlockChunkPolicy:
+    """
+    Policy splitting a memory block of rods into chunks, processed concurrently by
+    the thread pool of the simulator (see `BaseSystemCollection.use_thread_pool`).
+
+    Chunks hold whole rods: a chunk boundary is always the ghost node between two
+    rods, so that the ghost elements and ghost voronoi around it separate the
+    chunks, as they separate the rods. Chunks are balanced by their number of
+    elements.
+
+    Derive from this class and override `split` for another policy.
+
+        Attributes
+        ----------
+        n_chunks: int
+            Number of chunks, the number of threads if None.
+        min_elems_per_chunk: int
+            Minimum number of elements of a chunk. Blocks smaller than two chunks
+            are not split.
+    """
+
+    def __init__(self, n_chunks: int = None, min_elems_per_chunk: int = 4096):
+        """
+
+        Parameters
+        ----------
+        n_chunks: int
+            Number of chunks, the number of threads if None.
+        min_elems_per_chunk: int
+            Minimum number of elements of a chunk.
+        """
+        self.n_chunks = n_chunks
+        self.min_elems_per_chunk = min_elems_per_chunk
+
+    def split(self, n_elems_in_rods: np.ndarray, n_threads: int) -> np.ndarray:
+        """
+        Splits the rods of a block into chunks of consecutive rods.
+
+        Parameters
+        ----------
+        n_elems_in_rods: ndarray
+            An integer array containing the number of elements in each rod of the
+            block, in the order of the block.
+        n_threads: int
+            Number of threads processing the chunks.
+
+        Returns
+        -------
+        rod_bounds: ndarray
+            An integer array of length n_chunks + 1. Chunk i holds the rods
+            rod_bounds[i] to rod_bounds[i + 1] (excluded).
+        """
+        n_rods = n_elems_in_rods.shape[0]
+        n_elems = int(np.sum(n_elems_in_rods))
+        n_chunks = n_threads if self.n_chunks is None else self.n_chunks
+        n_chunks = max(
+            1, min(n_chunks, n_rods, n_elems // max(self.min_elems_per_chunk, 1))
+        )
+
+        # Close each chunk at the rod boundary closest to its share of the
+        # elements. Boundaries are kept between the first and the last rod, so
+        # that every chunk holds at least one rod.
+        cumulative_n_elems = np.hstack((0, np.cumsum(n_elems_in_rods)))
+        targets = n_elems * np.arange(1, n_chunks) / n_chunks
+        rod_bounds = np.searchsorted(cumulative_n_elems, targets)
+        closer_to_previous = (
+            targets - cumulative_n_elems[rod_bounds - 1]
+            <= cumulative_n_elems[rod_bounds] - targets
+        )
+        rod_bounds = np.clip(rod_bounds - closer_to_previous, 1, n_rods - 1)
+        rod_bounds = np.unique(np.hstack((0, rod_bounds, n_rods)))
+        return rod_bounds.astype(np.int64)
+
+
 class MemoryBlockRodBase:
     """
     This is the base class for memory blocks for rods.
@@ -0,0 +1,99 @@
+__doc__ = """Preallocated scratch buffers for the kernels of a memory block."""
+import numpy as np
+
+
+class MemoryBlockWorkspace:
+    """
+    Scratch buffers used by the kernels of a memory block during a time step.
+    Buffers are allocated once, when the memory block is constructed, and are passed
+    to the kernels as `out=` or scratch arguments, so that a steady-state time step
+    does not allocate any array.
+
+    Buffers are stacked by the domain they are defined on (elements, voronoi), in the
+    same way the block variables are stacked. Their content is only meaningful inside
+    a single kernel call: any kernel can overwrite them.
+
+        Attributes
+        ----------
+        vectors_in_nodes: numpy.ndarray
+            3D (n_vectors_in_nodes, dim, n_nodes) array containing data with 'float' type.
+        vectors_in_elements: numpy.ndarray
+            3D (n_vectors_in_elements, dim, n_elems) array containing data with 'float' type.
+        vectors_in_voronoi: numpy.ndarray
+            3D (n_vectors_in_voronoi, dim, n_voronoi) array containing data with 'float' type.
+        scalars_in_elements: numpy.ndarray
+            2D (n_scalars_in_elements, n_elems) array containing data with 'float' type.
+        scalars_in_voronoi: numpy.ndarray
+            2D (n_scalars_in_voronoi, n_voronoi) array containing data with 'float' type.
+        matrices_in_elements: numpy.ndarray
+            4D (n_matrices_in_elements, dim, dim, n_elems) array containing data with 'float' type.
+        scaled_dvdt_dwdt_collection: numpy.ndarray
+            2D (2, dim * n_nodes) array containing data with 'float' type.
+            Holds dt * (dv/dt, dω/dt) for the dynamic update of symplectic steppers.
+    """
+
+    # Number of buffers per domain, enough for the kernels of the time step.
+    n_vectors_in_nodes = 1
+    n_vectors_in_elements = 7
+    n_vectors_in_voronoi = 4
+    n_scalars_in_elements = 1
+    n_scalars_in_voronoi = 3
+    n_matrices_in_elements = 1
+
+    def __init__(
+        self,
+        n_nodes: int,
+        n_elems: int,
+        n_voronoi: int,
+        dvdt_dwdt_collection: np.ndarray,
+        dtype=np.float64,
+    ):
+        self.vectors_in_nodes = np.zeros(
+            (self.n_vectors_in_nodes, 3, n_nodes), dtype=dtype
+        )
+        self.vectors_in_elements = np.zeros(
+            (self.n_vectors_in_elements, 3, n_elems), dtype=dtype
+        )
+        self.vectors_in_voronoi = np.zeros(
+            (self.n_vectors_in_voronoi, 3, n_voronoi), dtype=dtype
+        )
+        self.scalars_in_elements = np.zeros(
+            (self.n_scalars_in_elements, n_elems), dtype=dtype
+        )
+        self.scalars_in_voronoi = np.zeros(
+            (self.n_scalars_in_voronoi, n_voronoi), dtype=dtype
+        )
+        self.matrices_in_elements = np.zeros(
+            (self.n_matrices_in_elements, 3, 3, n_elems), dtype=dtype
+        )
+        self.scaled_dvdt_dwdt_collection = np.zeros_like(
+            dvdt_dwdt_collection, dtype=dtype
+        )
+
+    def chunk(self, nodes: slice, elems: slice, voronoi: slice):
+        """
+        Returns the workspace of a chunk of the block (see
+        `MemoryBlockCosseratRodChunk`): views of the buffers of the block on the
+        nodes, elements and voronoi of the chunk. Workspaces of disjoint chunks do
+        not overlap.
+
+        Parameters
+        ----------
+        nodes: slice
+        elems: slice
+        voronoi: slice
+
+        Returns
+        -------
+        workspace: MemoryBlockWorkspace
+        """
+        workspace = MemoryBlockWorkspace.__new__(MemoryBlockWorkspace)
+        workspace.vectors_in_nodes = self.vectors_in_nodes[..., nodes]
+        workspace.vectors_in_elements = self.vectors_in_elements[..., elems]
+        workspace.vectors_in_voronoi = self.vectors_in_voronoi[..., voronoi]
+        workspace.scalars_in_elements = self.scalars_in_elements[..., elems]
+        workspace.scalars_in_voronoi = self.scalars_in_voronoi[..., voronoi]
+        workspace.matrices_in_elements = self.matrices_in_elements[..., elems]
+        # The dynamic update works on the whole block
+        workspace.scaled_dvdt_dwdt_collection = None
+        return workspace
@@ -5,15 +5,21 @@ Base System
 Basic coordinating for multiple, smaller systems that have an independently integrable
 interface (i.e. works with symplectic or explicit routines `timestepper.py`.)
 """
-from typing import Iterable, Callable, AnyStr
+from typing import Iterable, Callable, AnyStr, Dict, Optional
 
 from collections.abc import MutableSequence
+from functools import partial
+
+import numpy as np
 
 from elastica.rod import RodBase
 from elastica.rigidbody import RigidBodyBase
 from elastica.surface import SurfaceBase
 from elastica.modules.memory_block import construct_memory_block_structures
+from elastica.memory_block import BlockChunkPolicy
 from elastica._synchronize_periodic_boundary import _ConstrainPeriodicBoundaries
+from elastica._backends import precompile_kernels
+from elastica._thread_pool import ThreadPool, schedule_tasks
 
 
 class BaseSystemCollection(MutableSequence):
@@ -52,6 +58,13 @@ class BaseSystemCollection(MutableSequence):
             Callable[[float, int, AnyStr], None]
         ] = []
         self._feature_group_finalize: Iterable[Callable] = []
+        # Features moving systems during the kinematic step, each called with the
+        # kinematic step of the memory blocks, which it must apply once (see drift).
+        self._feature_group_drift: Iterable[Callable] = []
+        # Features of the synchronize group that can be split into tasks, each
+        # applied to a few systems, register the function listing their tasks
+        # here (see _schedule_synchronize).
+        self._feature_group_synchronize_tasks: Dict[Callable, Callable] = {}
         # We need to initialize our mixin classes
         super(BaseSystemCollection, self).__init__()
         # List of system types/bases that are allowed
@@ -61,6 +74,12 @@ class BaseSystemCollection(MutableSequence):
         # Flag Finalize: Finalizing twice will cause an error,
         # but the error message is very misleading
         self._finalize_flag = False
+        # Thread pool, only used if enabled with use_thread_pool.
+        self._thread_pool = None
+        self._chunk_policy = None
+        self._synchronize_levels = None
+        # Number of substeps of the subcycled rods, by index of the rod.
+        self._n_substeps = {}
 
     def _check_type(self, sys_to_be_added: AnyStr):
         if not issubclass(sys_to_be_added.__class__, self.allowed_sys_types):
@@ -129,19 +148,147 @@ class BaseSystemCollection(MutableSequence):
 
         return sys_idx
 
-    def finalize(self):
+    def use_thread_pool(
+        self,
+        n_threads: Optional[int] = None,
+        chunk_policy: Optional[BlockChunkPolicy] = None,
+    ):
+        """
+        Enables the concurrent execution of the simulation on a pool of threads.
+        Memory blocks are stepped concurrently, and the forcing, connection and
+        contact functors applied to different systems are called concurrently.
+        Functors applied to the same system are called in the order they are
+        called without the thread pool, so the results do not change.
+
+        Large memory blocks of rods are also split into chunks of whole rods, as
+        given by the chunk policy, and chunks are stepped concurrently.
+
+        This method must be called before `finalize`.
+
+        Parameters
+        ----------
+        n_threads: int
+            Number of threads, the number of CPUs by default.
+        chunk_policy: BlockChunkPolicy
+            Policy splitting the memory blocks of rods into chunks. By default, one
+            chunk per thread, of at least 4096 elements.
+        """
+        assert self._finalize_flag is not True, (
+            "The thread pool must be enabled before calling finalize."
+        )
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown()
+        self._thread_pool = ThreadPool(n_threads)
+        self._chunk_policy = (
+            BlockChunkPolicy() if chunk_policy is None else chunk_policy
+        )
+
+    def subcycle(self, systems, n_substeps: int):
+        """
+        Steps the rods with `n_substeps` substeps per time step of the
+        simulation, e.g. stiff rods among soft ones, which would need a smaller
+        time step for all the rods otherwise.
+
+        Rods with the same number of substeps are put in their own memory block.
+        Its internal forces and torques, and the boundary conditions of its
+        rods, are evaluated at every substep. Forcing, connections, contacts
+        and damping are evaluated at the time step of the simulation, and
+        their forces are applied to the rods at once, as an impulse (multiple
+        time stepping of Tuckerman, Berne and Martyna, J. Chem. Phys. 97, 1990
+        (1992)). The external forces and torques of the subcycled rods are
+        thus zeroed once applied.
+
+        This method must be called before `finalize`. It is only supported by
+        the symplectic steppers, without thread pool.
+
+        Parameters
+        ----------
+        systems: list
+            Rods to step with substeps.
+        n_substeps: int
+            Number of substeps per time step.
+        """
+        assert self._finalize_flag is not True, (
+            "Rods must be subcycled before calling finalize."
+        )
+        if int(n_substeps) != n_substeps or n_substeps < 1:
+            raise ValueError(
+                "Number of substeps must be a positive integer, not {0}".format(
+                    n_substeps
+                )
+            )
+        for system in systems:
+            sys_idx = self._get_sys_idx_if_valid(system) % len(self._systems)
+            if not isinstance(self._systems[sys_idx], RodBase):
+                raise TypeError(
+                    "Only rods can be subcycled, not {0}".format(
+                        self._systems[sys_idx].__class__
+                    )
+                )
+            if n_substeps == 1:
+                self._n_substeps.pop(sys_idx, None)
+            else:
+                self._n_substeps[sys_idx] = int(n_substeps)
+
+    def _system_keys(self, sys_idx: int):
+        # Keys of the memory a functor applied to the system writes to. Systems
+        # are views of their memory block, so a functor applied to a block
+        # writes to all its systems.
+        sys_idx = sys_idx % len(self._systems)
+        system_idx_list = getattr(self._systems[sys_idx], "system_idx_list", ())
+        return (sys_idx, *(int(idx) for idx in system_idx_list))
+
+    def _schedule_synchronize(self):
+        """
+        Splits the synchronize features into tasks, each writing to the systems it
+        is applied to, and sorts the tasks into levels of independent tasks.
+        Features without registered tasks may write to any system, and run alone.
+        """
+        tasks = []
+        for feature in self._feature_group_synchronize:
+            feature_tasks = self._feature_group_synchronize_tasks.get(feature)
+            if feature_tasks is None:
+                tasks.append((None, feature))
+                continue
+            for sys_indices, task in feature_tasks():
+                keys = [key for idx in sys_indices for key in self._system_keys(idx)]
+                tasks.append((keys, task))
+        return schedule_tasks(tasks)
+
+    def finalize(self, dtype=np.float64):
         """
         This method finalizes the simulator class. When it is called, it is assumed that the user has appended
         all rod-like objects to the simulator as well as all boundary conditions, callbacks, etc.,
         acting on these rod-like objects. After the finalize method called,
         the user cannot add new features to the simulator class.
+
+        Parameters
+        ----------
+        dtype: numpy.dtype
+            Floating point type of the memory blocks, either float64 (default) or
+            float32. The state of the systems is moved to the memory blocks, so
+            with float32 the systems are simulated in single precision.
         """
 
         # This generates more straight-forward error.
         assert self._finalize_flag is not True, "The finalize cannot be called twice."
 
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError(
+                "Memory blocks can only be allocated in float32 or float64, "
+                "not {0}.".format(dtype)
+            )
+
+        if self._n_substeps and self._thread_pool is not None:
+            raise NotImplementedError(
+                "Subcycled rods are not supported with a thread pool."
+            )
+
         # construct memory block
-        self._memory_blocks = construct_memory_block_structures(self._systems)
+        self._memory_blocks = construct_memory_block_structures(
+            self._systems, dtype=dtype, n_substeps=self._n_substeps
+        )
 
         """
         In case memory block have ring rod, then periodic boundaries have to be synched. In order to synchronize
@@ -159,6 +306,19 @@ class BaseSystemCollection(MutableSequence):
                     _ConstrainPeriodicBoundaries,
                 )
 
+        # With a thread pool, memory blocks are stepped chunk by chunk. Blocks
+        # that are not split are a single chunk.
+        self._memory_block_chunks = []
+        for memory_block in self._memory_blocks:
+            chunks = []
+            if self._thread_pool is not None and hasattr(
+                memory_block, "split_into_chunks"
+            ):
+                chunks = memory_block.split_into_chunks(
+                    self._chunk_policy, self._thread_pool
+                )
+            self._memory_block_chunks.extend(chunks if chunks else [memory_block])
+
         # Recurrent call finalize functions for all components.
         for finalize in self._feature_group_finalize:
             finalize()
@@ -167,6 +327,17 @@ class BaseSystemCollection(MutableSequence):
         self._feature_group_finalize.clear()
         self._feature_group_finalize = None
 
+        # With a JIT kernel backend, compile the hot-path kernels now so that
+        # the first time step is not the slow one.
+        precompile_kernels(self._memory_blocks)
+        precompile_kernels(
+            [
+                chunk
+                for chunk in self._memory_block_chunks
+                if chunk not in self._memory_blocks
+            ]
+        )
+
         # Toggle the finalize_flag
         self._finalize_flag = True
         # sort _feature_group_synchronize so that _call_contacts is at the end
@@ -181,11 +352,30 @@ class BaseSystemCollection(MutableSequence):
                 self._feature_group_synchronize.pop(index)
             )
 
+        if self._thread_pool is not None:
+            self._synchronize_levels = self._schedule_synchronize()
+
     def synchronize(self, time: float):
+        if self._synchronize_levels is not None:
+            # Tasks of a level write to different systems.
+            for level in self._synchronize_levels:
+                self._thread_pool.map(lambda task: task(time), level)
+            return
+
         # Collection call _feature_group_synchronize
         for feature in self._feature_group_synchronize:
             feature(time)
 
+    def drift(self, kinematic_update: Callable[[], None], time: float, duration: float):
+        """
+        Applies `kinematic_update`, the kinematic step of the memory blocks over
+        `duration`, through the features of the drift group, e.g. the substeps
+        of stiff contacts.
+        """
+        for feature in self._feature_group_drift:
+            kinematic_update = partial(feature, kinematic_update, time, duration)
+        kinematic_update()
+
     def constrain_values(self, time: float):
         # Collection call _feature_group_constrain_values
         for feature in self._feature_group_constrain_values:
@@ -5,6 +5,8 @@ Connect
 Provides the connections interface to connect entities (rods,
 rigid bodies) using joints (see `joints.py`).
 """
+from functools import partial
+
 import numpy as np
 from elastica.joint import FreeJoint
 
@@ -25,6 +27,9 @@ class Connections:
         self._connections = []
         super(Connections, self).__init__()
         self._feature_group_synchronize.append(self._call_connections)
+        self._feature_group_synchronize_tasks[self._call_connections] = (
+            self._connections_tasks
+        )
         self._feature_group_finalize.append(self._finalize_connections)
 
     def connect(
@@ -103,6 +108,41 @@ class Connections:
                 second_connect_idx,
             )
 
+    def _connections_tasks(self):
+        # Tasks of _call_connections, one per joint, with the indices of the two
+        # systems it connects.
+        return [
+            (
+                (first_sys_idx, second_sys_idx),
+                partial(
+                    _apply_connection,
+                    connection,
+                    self._systems[first_sys_idx],
+                    first_connect_idx,
+                    self._systems[second_sys_idx],
+                    second_connect_idx,
+                ),
+            )
+            for (
+                first_sys_idx,
+                second_sys_idx,
+                first_connect_idx,
+                second_connect_idx,
+                connection,
+            ) in self._connections
+        ]
+
+
+def _apply_connection(
+    connection, first_system, first_connect_idx, second_system, second_connect_idx, time
+):
+    connection.apply_forces(
+        first_system, first_connect_idx, second_system, second_connect_idx
+    )
+    connection.apply_torques(
+        first_system, first_connect_idx, second_system, second_connect_idx
+    )
+
 
 class _Connect:
     """
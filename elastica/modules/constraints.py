@@ -6,6 +6,9 @@ Provides the constraints interface to enforce displacement boundary conditions (
 """
 
 from elastica.boundary_conditions import ConstraintBase
+from elastica.modules.memory_block import (
+    mark_constrained_nodes_and_elements_in_memory_blocks,
+)
 
 
 class Constraints:
@@ -70,6 +73,24 @@ class Constraints:
         # to sort constraints.
         self._constraints.sort(key=lambda x: x[0])
 
+        # Mark the nodes and elements constrained in the memory blocks of the
+        # rods, and their constrained components, which the implicit steps hold
+        # (see SemiImplicitPositionVerlet). Constraints without selectors
+        # constrain all the components.
+        mark_constrained_nodes_and_elements_in_memory_blocks(
+            getattr(self, "_memory_blocks", ()),
+            [
+                (
+                    sys_id % len(self._systems),
+                    getattr(constraint, "constrained_position_idx", ()),
+                    getattr(constraint, "constrained_director_idx", ()),
+                    getattr(constraint, "translational_constraint_selector", True),
+                    getattr(constraint, "rotational_constraint_selector", True),
+                )
+                for sys_id, constraint in self._constraints
+            ],
+        )
+
         # At t=0.0, constrain all the boundary conditions (for compatability with
         # initial conditions)
         self._constrain_values(time=0.0)
@@ -6,7 +6,18 @@ Provides the contact interface to apply contact forces between objects
 (rods, rigid bodies, surfaces).
 """
 
+from functools import partial
+from typing import Iterable
+
+import numpy as np
+
 from elastica.typing import SystemType, AllowedContactType
+from elastica.collision.AABBCollection import sweep_and_prune
+from elastica.collision.CandidateCache import CandidateCache
+from elastica.modules.memory_block import (
+    find_rod_batches_in_memory_blocks,
+    find_body_batches_in_memory_blocks,
+)
 
 
 class Contact:
@@ -18,12 +29,25 @@ class Contact:
         ----------
         _contacts: list
             List of contact classes defined for rod-like objects.
+        _contact_groups: list
+            List of groups of systems in contact with each other.
+        _contact_records: list
+            Records of the contacts, cleared before each contact step.
+        _contact_substepper: _ContactSubstepper
+            Stiff contacts applied in substeps of the kinematic step, if any.
     """
 
     def __init__(self):
         self._contacts = []
+        self._contact_groups = []
+        self._contact_records = []
+        self._contact_substep_settings = None
+        self._contact_substepper = None
         super(Contact, self).__init__()
         self._feature_group_synchronize.append(self._call_contacts)
+        self._feature_group_synchronize_tasks[self._call_contacts] = (
+            self._contacts_tasks
+        )
         self._feature_group_finalize.append(self._finalize_contact)
 
     def detect_contact_between(
@@ -54,6 +78,131 @@ class Contact:
 
         return _contact
 
+    def detect_contact_among(self, systems: Iterable[SystemType], skin: float = 0.0):
+        """
+        This method adds contact detection among all the objects of a group, using
+        the selected contact classes. A sweep and prune over the bounding boxes
+        of the objects finds the pairs of objects that may be in contact, and
+        only those pairs are handed to the contact classes. Pairs are kept until
+        a bounding box moves or grows by more than half of `skin`.
+
+        Each pair is handled by the first contact class accepting it, in either
+        order. Pairs no contact class accepts (e.g. two cylinders) are ignored.
+
+        Examples
+        --------
+        >>> simulator.detect_contact_among(rods + cylinders + spheres).using(
+        ...    RodRodContact, k=1e4, nu=10
+        ... ).using(
+        ...    RodCylinderContact, k=1e4, nu=10
+        ... ).using(
+        ...    RodSphereContact, k=1e4, nu=10
+        ... )
+
+        Parameters
+        ----------
+        systems : Iterable[SystemType]
+            Rods, cylinders or spheres.
+        skin : float
+            Margin added to the bounding boxes of the objects when pairs are
+            found.
+
+        Returns
+        -------
+
+        """
+        sys_idx = [self._get_sys_idx_if_valid(sys) for sys in systems]
+
+        # Create _ContactGroup object, cache it and return to user
+        _contact_group = _ContactGroup(sys_idx, skin)
+        self._contact_groups.append(_contact_group)
+
+        return _contact_group
+
+    def substep_contacts(self, max_substeps: int = 64, safety_factor: float = 0.1):
+        """
+        This method applies the rod-rod and rod self contacts between pairs of
+        rods (see `detect_contact_between`) in substeps of the kinematic steps
+        of symplectic time steppers, so that stiff contacts do not limit the
+        time step of the whole simulation.
+
+        While any of these contacts is active, the rods in contact are moved
+        over the kinematic step in substeps, each kicking their velocities with
+        the contact forces alone. The other forces, and the other systems, are
+        still integrated at the time step of the simulation. The substep is
+        chosen from the stiffness and damping of the contacts and the node
+        masses of the rods in contact.
+
+        Examples
+        --------
+        >>> simulator.detect_contact_between(first_rod, second_rod).using(
+        ...    RodRodContact, k=1e6, nu=10
+        ... )
+        >>> simulator.substep_contacts(max_substeps=32)
+
+        Parameters
+        ----------
+        max_substeps : int
+            Maximum number of substeps of a kinematic step.
+        safety_factor : float
+            Fraction of the stability limit of the contact springs used as the
+            substep.
+
+        Returns
+        -------
+
+        """
+        if max_substeps < 1:
+            raise ValueError(
+                "The number of substeps must be positive, got {0}".format(max_substeps)
+            )
+        if safety_factor <= 0.0:
+            raise ValueError(
+                "The safety factor must be positive, got {0}".format(safety_factor)
+            )
+        self._contact_substep_settings = (max_substeps, safety_factor)
+
+    def contact_substep_statistics(self) -> dict:
+        """
+        This method returns the statistics of the substeps of the contacts, once
+        the simulator is finalized (see `substep_contacts`).
+
+        Returns
+        -------
+        statistics : dict
+            Number of kinematic steps ("drifts"), of kinematic steps with an
+            active contact ("drifts_in_contact") and of substeps ("substeps"),
+            and the largest substep ("max_substep").
+        """
+        if self._contact_substepper is None:
+            return {}
+        return self._contact_substepper.statistics()
+
+    def contact_candidate_statistics(self) -> dict:
+        """
+        This method returns the rebuild statistics of the candidate caches of
+        the contacts and contact groups keeping one, once the simulator is
+        finalized. They help to choose the `skin` of the caches.
+
+        Returns
+        -------
+        statistics : dict
+            Statistics of each cache (see `CandidateCache.statistics`), keyed by
+            the indices of the systems of the contact or contact group.
+        """
+        statistics = {}
+        contacts = list(self._contacts)
+        if self._contact_substepper is not None:
+            contacts += self._contact_substepper.contacts
+        for first_sys_idx, second_sys_idx, contact in contacts:
+            if isinstance(getattr(contact, "candidate_cache", None), CandidateCache):
+                statistics[(first_sys_idx, second_sys_idx)] = (
+                    contact.candidate_cache.statistics()
+                )
+        for contact_group in self._contact_groups:
+            statistics[contact_group.id()] = contact_group.candidate_cache.statistics()
+        return statistics
+
     def _finalize_contact(self) -> None:
         # dev : the first indices stores the
         # (first_rod_idx, second_rod_idx)
@@ -73,7 +222,146 @@ class Contact:
                 self._systems[second_sys_idx],
             )
 
+        self._batch_contacts_in_memory_blocks()
+        self._batch_contacts_with_bodies_in_memory_blocks()
+
+        self._contact_groups[:] = [
+            contact_group() for contact_group in self._contact_groups
+        ]
+        for contact_group in self._contact_groups:
+            contact_group._check_systems_validity(
+                [self._systems[sys_idx] for sys_idx in contact_group.id()]
+            )
+
+        self._finalize_contact_records()
+        self._finalize_contact_substeps()
+
+    def _finalize_contact_records(self) -> None:
+        # Records are filled by a single contact, or by the contacts of a single
+        # group, so that contacts applied concurrently never share them.
+        owners = {}
+        for first_sys_idx, second_sys_idx, contact in self._contacts:
+            records = getattr(contact, "records", None)
+            if records is None:
+                continue
+            owners.setdefault(id(records), []).append((first_sys_idx, second_sys_idx))
+            records.systems[:] = (first_sys_idx, second_sys_idx)
+            self._contact_records.append(records)
+        for contact_group in self._contact_groups:
+            for records in contact_group.records:
+                owners.setdefault(id(records), []).append(contact_group.id())
+        for systems in owners.values():
+            if len(systems) > 1:
+                raise ValueError(
+                    "Contact records can only be filled by one contact or contact"
+                    " group, but the same records are given to the contacts of"
+                    " systems {0}.".format(systems)
+                )
+
+    def _finalize_contact_substeps(self) -> None:
+        if self._contact_substep_settings is None:
+            return
+        contacts = [
+            (first_sys_idx, second_sys_idx, contact)
+            for first_sys_idx, second_sys_idx, contact in self._contacts
+            if _is_substepped_contact(contact)
+        ]
+        if not contacts:
+            return
+        self._contacts[:] = [
+            entry for entry in self._contacts if not _is_substepped_contact(entry[2])
+        ]
+        records = [contact.records for _, _, contact in contacts]
+        self._contact_records[:] = [
+            contact_records
+            for contact_records in self._contact_records
+            if all(contact_records is not other for other in records)
+        ]
+        self._contact_substepper = _ContactSubstepper(
+            contacts, self._systems, *self._contact_substep_settings
+        )
+        self._feature_group_drift.append(self._contact_substepper.drift)
+
+    def _batch_contacts_in_memory_blocks(self) -> None:
+        # Contacts of consecutive rods of a memory block with the same system,
+        # e.g. a plane, are applied at once to the rods, on the memory block.
+        memory_blocks = getattr(self, "_memory_blocks", ())
+        if not memory_blocks:
+            return
+        batches = find_rod_batches_in_memory_blocks(
+            memory_blocks,
+            [
+                (
+                    first_sys_idx,
+                    (
+                        *self._system_keys(first_sys_idx),
+                        *self._system_keys(second_sys_idx),
+                    ),
+                    _contact_batch_key(contact, second_sys_idx),
+                )
+                for first_sys_idx, second_sys_idx, contact in self._contacts
+            ],
+        )
+        batched_contacts = {}
+        for positions, rods, first_elements, last_elements, ghost_elements in batches:
+            first_sys_idx, second_sys_idx, contact = self._contacts[positions[-1]]
+            block_contact = _ContactInMemoryBlock(
+                contact,
+                rods,
+                first_elements,
+                last_elements,
+                ghost_elements,
+                tuple(self._contacts[position][0] for position in positions),
+            )
+            for position in positions[:-1]:
+                batched_contacts[position] = None
+            batched_contacts[positions[-1]] = (
+                first_sys_idx,
+                second_sys_idx,
+                block_contact,
+            )
+        self._contacts[:] = [
+            batched_contacts.get(position, contact)
+            for position, contact in enumerate(self._contacts)
+            if batched_contacts.get(position, contact) is not None
+        ]
+
+    def _batch_contacts_with_bodies_in_memory_blocks(self) -> None:
+        # Contacts of a rod with consecutive rigid bodies of a memory block, e.g.
+        # many spheres, are applied at once to the bodies, on the memory block.
+        memory_blocks = getattr(self, "_memory_blocks", ())
+        if not memory_blocks:
+            return
+        batches = find_body_batches_in_memory_blocks(
+            memory_blocks,
+            [
+                (
+                    second_sys_idx,
+                    _contact_system_indices(first_sys_idx, second_sys_idx, contact),
+                    _contact_body_batch_key(contact, first_sys_idx),
+                )
+                for first_sys_idx, second_sys_idx, contact in self._contacts
+            ],
+        )
+        batched_contacts = {}
+        for positions, bodies in batches:
+            first_sys_idx, second_sys_idx, contact = self._contacts[positions[-1]]
+            for position in positions[:-1]:
+                batched_contacts[position] = None
+            batched_contacts[positions[-1]] = (
+                first_sys_idx,
+                second_sys_idx,
+                _ContactWithBodiesInMemoryBlock(contact, bodies),
+            )
+        self._contacts[:] = [
+            batched_contacts.get(position, contact)
+            for position, contact in enumerate(self._contacts)
+            if batched_contacts.get(position, contact) is not None
+        ]
+
     def _call_contacts(self, time: float):
+        for records in self._contact_records:
+            records.clear()
         for (
             first_sys_idx,
             second_sys_idx,
@@ -83,6 +371,161 @@ class Contact:
                 self._systems[first_sys_idx],
                 self._systems[second_sys_idx],
             )
+        for contact_group in self._contact_groups:
+            contact_group.apply_contact()
+        if self._contact_substepper is not None:
+            self._contact_substepper.apply_contact_if_inactive()
+
+    def _contacts_tasks(self):
+        # Tasks of _call_contacts, one per contact, with the indices of the two
+        # systems in contact.
+        tasks = [
+            (
+                _contact_system_indices(first_sys_idx, second_sys_idx, contact),
+                partial(
+                    _apply_contact
+                    if getattr(contact, "records", None) is None
+                    else _apply_recorded_contact,
+                    contact,
+                    self._systems[first_sys_idx],
+                    self._systems[second_sys_idx],
+                ),
+            )
+            for (first_sys_idx, second_sys_idx, contact) in self._contacts
+        ] + [
+            # Pairs of a group change every step, so a group is a single task
+            # writing to all of its systems.
+            (contact_group.id(), partial(_apply_contact_group, contact_group))
+            for contact_group in self._contact_groups
+        ]
+        if self._contact_substepper is not None:
+            tasks.append(
+                (
+                    self._contact_substepper.system_indices,
+                    partial(_apply_substepped_contacts, self._contact_substepper),
+                )
+            )
+        return tasks
+
+
+def _apply_contact(contact, first_system, second_system, time):
+    contact.apply_contact(first_system, second_system)
+
+
+def _apply_recorded_contact(contact, first_system, second_system, time):
+    contact.records.clear()
+    contact.apply_contact(first_system, second_system)
+
+
+def _apply_contact_group(contact_group, time):
+    contact_group.apply_contact()
+
+
+def _apply_substepped_contacts(substepper, time):
+    substepper.apply_contact_if_inactive()
+
+
+def _is_substepped_contact(contact):
+    from elastica.contact_forces import RodRodContact, RodSelfContact
+
+    # Overridden contacts may not only apply forces to the rods
+    return type(contact) in (
+        RodRodContact,
+        RodSelfContact,
+    ) and "apply_contact" not in vars(contact)
+
+
+def _contact_stability_limit(contact, mass):
+    # Stability limit of the time step of a damped contact spring on a node
+    return 2.0 / (np.sqrt(contact.k / mass) + contact.nu / mass)
+
+
+def _contact_batch_key(contact, second_sys_idx):
+    batch_key = getattr(contact, "_batch_key", None)
+    key = batch_key() if batch_key is not None else None
+    return None if key is None else (key, second_sys_idx)
+
+
+def _contact_body_batch_key(contact, first_sys_idx):
+    batch_key = getattr(contact, "_body_batch_key", None)
+    key = batch_key() if batch_key is not None else None
+    return None if key is None else (key, first_sys_idx)
+
+
+def _contact_system_indices(first_sys_idx, second_sys_idx, contact):
+    # Indices of all the systems a contact writes to
+    if isinstance(contact, _ContactWithBodiesInMemoryBlock):
+        return (first_sys_idx, *contact.system_indices)
+    return (*getattr(contact, "system_indices", (first_sys_idx,)), second_sys_idx)
+
+
+class _ContactInMemoryBlock:
+    """
+    Contact module private class, for the same contact applied at once to
+    consecutive rods of a memory block.
+
+    Attributes
+    ----------
+    contact: NoContact
+        Contact applied, providing `apply_contact_in_block`.
+    rods: MemoryBlockCosseratRodChunk
+        Rods in contact, as a chunk of their memory block.
+    system_indices: tuple
+        Indices of the rods in contact.
+    """
+
+    def __init__(
+        self,
+        contact,
+        rods,
+        first_elements,
+        last_elements,
+        ghost_elements,
+        system_indices,
+    ) -> None:
+        self.contact = contact
+        self.rods = rods
+        self.first_elements = first_elements
+        self.last_elements = last_elements
+        self.ghost_elements = ghost_elements
+        self.system_indices = system_indices
+
+    def apply_contact(self, system_one, system_two) -> None:
+        # system_one is the last rod of the batch, the contact is applied to all
+        # of them.
+        self.contact.apply_contact_in_block(
+            self.rods,
+            system_two,
+            self.first_elements,
+            self.last_elements,
+            self.ghost_elements,
+        )
+
+
+class _ContactWithBodiesInMemoryBlock:
+    """
+    Contact module private class, for the same contact applied at once between a
+    rod and consecutive rigid bodies of a memory block.
+
+    Attributes
+    ----------
+    contact: NoContact
+        Contact applied, providing `apply_contact_to_bodies`.
+    bodies: MemoryBlockRigidBodyChunk
+        Bodies in contact, as a chunk of their memory block.
+    system_indices: tuple
+        Indices of the bodies in contact.
+    """
+
+    def __init__(self, contact, bodies) -> None:
+        self.contact = contact
+        self.bodies = bodies
+        self.system_indices = tuple(int(idx) for idx in bodies.system_idx_list)
+
+    def apply_contact(self, system_one, system_two) -> None:
+        # system_two is the last body of the batch, the contact is applied to all
+        # of them.
+        self.contact.apply_contact_to_bodies(system_one, self.bodies)
 
 
 class _Contact:
@@ -168,3 +611,387 @@ class _Contact:
                 r"Unable to construct contact class.\n"
                 r"Did you provide all necessary contact properties?"
             )
+
+
+class _ContactSubstepper:
+    """
+    Contact module private class, for stiff contacts between rods applied in
+    substeps of the kinematic step of symplectic steppers.
+
+    Over a kinematic step of duration tau, the rods in contact are moved with
+    `n` substeps h = tau / n of
+
+        x <- x + h / 2 v,  v <- v + h F_contact(x, v) / m,  x <- x + h / 2 v
+
+    instead of x <- x + tau v. The substep h is the largest one below
+    `safety_factor` times the stability limit 2 / (sqrt(k / m) + nu / m) of
+    the contacts, with m the smallest node mass of the rods in contact, with
+    at most `max_substeps` substeps. Kinematic steps are not split while no
+    contact is active, neither at their start nor at their end.
+
+    Explicit steppers do not call `drift`, so the contacts are then applied
+    with the other contacts.
+
+    Attributes
+    ----------
+    contacts: list
+        Substepped contacts, as (first_sys_idx, second_sys_idx, contact).
+    rods: list
+        Rods of the contacts.
+    system_indices: tuple
+        Indices of the rods of the contacts.
+    max_substep: float
+        Largest substep.
+    max_substeps: int
+        Maximum number of substeps of a kinematic step.
+    active: bool
+        Whether the contacts are applied in substeps, i.e. once a kinematic
+        step went through `drift`.
+    """
+
+    def __init__(self, contacts, systems, max_substeps: int, safety_factor: float):
+        self.contacts = contacts
+        self.system_indices = tuple(
+            sorted(
+                {
+                    sys_idx
+                    for first_sys_idx, second_sys_idx, _ in contacts
+                    for sys_idx in (first_sys_idx, second_sys_idx)
+                }
+            )
+        )
+        self.rods = [systems[sys_idx] for sys_idx in self.system_indices]
+        self._pairs = [
+            (systems[first_sys_idx], systems[second_sys_idx], contact)
+            for first_sys_idx, second_sys_idx, contact in contacts
+        ]
+        self._records = [
+            contact.records for _, _, contact in contacts if contact.records is not None
+        ]
+        self.max_substeps = max_substeps
+        self.max_substep = safety_factor * min(
+            _contact_stability_limit(
+                contact, min(first_rod.mass.min(), second_rod.mass.min())
+            )
+            for first_rod, second_rod, contact in self._pairs
+        )
+        self.active = False
+        self._start_positions = [rod.position_collection.copy() for rod in self.rods]
+        self._contact_forces = [np.zeros_like(rod.external_forces) for rod in self.rods]
+        self._external_forces = [
+            np.zeros_like(rod.external_forces) for rod in self.rods
+        ]
+        self._n_drifts = 0
+        self._n_drifts_in_contact = 0
+        self._n_substeps = 0
+
+    def apply_contact_if_inactive(self) -> None:
+        if self.active:
+            return
+        for records in self._records:
+            records.clear()
+        self._apply_contacts()
+
+    def drift(self, kinematic_update, time: float, duration: float) -> None:
+        """
+        Applies `kinematic_update`, moving the rods in substeps if any contact
+        is active.
+        """
+        self.active = True
+        self._n_drifts += 1
+        for rod, start_position in zip(self.rods, self._start_positions):
+            start_position[:] = rod.position_collection
+        self._update_geometry()
+        in_contact = self._compute_contact_forces()
+        kinematic_update()
+        if not in_contact:
+            self._update_geometry()
+            in_contact = self._compute_contact_forces()
+        if not in_contact:
+            return
+
+        n_substeps = int(
+            min(max(np.ceil(abs(duration) / self.max_substep), 1), self.max_substeps)
+        )
+        substep = duration / n_substeps
+        self._n_drifts_in_contact += 1
+        self._n_substeps += n_substeps
+
+        for rod, start_position in zip(self.rods, self._start_positions):
+            rod.position_collection[:] = start_position
+        self._update_geometry()
+        for _ in range(n_substeps):
+            self._move(0.5 * substep)
+            self._compute_contact_forces()
+            for rod, contact_forces in zip(self.rods, self._contact_forces):
+                rod.velocity_collection += substep * contact_forces / rod.mass
+            self._move(0.5 * substep)
+
+    def statistics(self) -> dict:
+        return {
+            "drifts": self._n_drifts,
+            "drifts_in_contact": self._n_drifts_in_contact,
+            "substeps": self._n_substeps,
+            "max_substep": self.max_substep,
+        }
+
+    def _move(self, duration: float) -> None:
+        for rod in self.rods:
+            rod.position_collection += duration * rod.velocity_collection
+        self._update_geometry()
+
+    def _update_geometry(self) -> None:
+        from elastica.rod.cosserat_rod import _compute_geometry_from_state
+
+        for rod in self.rods:
+            _compute_geometry_from_state(
+                rod.position_collection,
+                rod.volume,
+                rod.lengths,
+                rod.tangents,
+                rod.radius,
+            )
+
+    def _compute_contact_forces(self) -> bool:
+        # Contact forces on the rods at their current state, leaving their
+        # external forces untouched. Returns whether any contact is active.
+        # The contacts see the external forces of the rods, as the rod-rod
+        # normal force depends on them, and the contact forces are what the
+        # contacts add to them.
+        for records in self._records:
+            records.clear()
+        for rod, external_forces in zip(self.rods, self._external_forces):
+            external_forces[:] = rod.external_forces
+        self._apply_contacts()
+        in_contact = False
+        for rod, external_forces, contact_forces in zip(
+            self.rods, self._external_forces, self._contact_forces
+        ):
+            np.subtract(rod.external_forces, external_forces, out=contact_forces)
+            rod.external_forces[:] = external_forces
+            in_contact = in_contact or bool(np.any(contact_forces))
+        return in_contact
+
+    def _apply_contacts(self) -> None:
+        for first_rod, second_rod, contact in self._pairs:
+            contact.apply_contact(first_rod, second_rod)
+
+
+class _ContactGroup:
+    """
+    Contact module private class, for contact among all the systems of a group
+
+    Attributes
+    ----------
+    sys_idx: tuple
+        Indices of the systems of the group.
+    _contact_cls: list
+        Contact classes, with their arguments, applied to the pairs of the group.
+    _pair_contacts: dict
+        Contact applied to each pair of systems of the group found by the
+        broadphase so far, as (first_idx, second_idx, contact), or None if no
+        contact class accepts the pair. Indices are positions in the group.
+    candidate_cache: CandidateCache
+        Pairs of systems found by the last sweep and prune.
+    records: list
+        Records of the contact classes of the group, cleared before each
+        contact step.
+    """
+
+    def __init__(self, sys_idx: Iterable[int], skin: float = 0.0) -> None:
+        """
+
+        Parameters
+        ----------
+        sys_idx
+        skin
+        """
+        self.sys_idx = tuple(sys_idx)
+        self.candidate_cache = CandidateCache(skin)
+        self._contact_cls = []
+        self._pair_contacts = {}
+        self._contact_prototypes = None
+        self._systems = None
+        self._aabb_functions = None
+        self._aabbs = None
+        self.records = []
+
+    def using(self, contact_cls: object, *args, **kwargs):
+        """
+        This method adds a contact class used to apply contact between the pairs
+        of the group it accepts. It can be called several times, for the
+        different kinds of pairs of the group.
+
+        Parameters
+        ----------
+        contact_cls: object
+            User defined contact class.
+        *args
+            Variable length argument list
+        **kwargs
+            Arbitrary keyword arguments.
+
+        Returns
+        -------
+
+        """
+        from elastica.contact_forces import NoContact
+
+        assert issubclass(contact_cls, NoContact), (
+            "{} is not a valid contact class. Did you forget to derive from NoContact?".format(
+                contact_cls
+            )
+        )
+        self._contact_cls.append((contact_cls, args, kwargs))
+        return self
+
+    def id(self):
+        return self.sys_idx
+
+    def __call__(self, *args, **kwargs):
+        if not self._contact_cls:
+            raise RuntimeError(
+                "No contacts provided to establish contact among rod-like objects"
+                " id {0}, but a Contact was intended as per code. Did you forget to"
+                " call the `using` method?".format(self.id())
+            )
+
+        # Contact objects are only used to check pairs here, contact is applied
+        # by one contact object per pair, holding its own state.
+        self._contact_prototypes = [
+            self._construct_contact(contact_cls, args, kwargs)
+            for contact_cls, args, kwargs in self._contact_cls
+        ]
+        # Contact classes may share their records
+        for prototype in self._contact_prototypes:
+            records = getattr(prototype, "records", None)
+            if records is not None and all(
+                records is not other for other in self.records
+            ):
+                self.records.append(records)
+        return self
+
+    def _construct_contact(self, contact_cls, args, kwargs):
+        try:
+            return contact_cls(*args, **kwargs)
+        except (TypeError, IndexError):
+            raise TypeError(
+                r"Unable to construct contact class.\n"
+                r"Did you provide all necessary contact properties?"
+            )
+
+    def _check_systems_validity(self, systems) -> None:
+        """
+        Checks that each system of the group has a bounding box, and keeps the
+        systems of the group.
+        """
+        from elastica.rod import RodBase
+        from elastica.rigidbody import Cylinder, Sphere
+
+        if len(set(self.sys_idx)) != len(self.sys_idx):
+            raise ValueError(
+                "Systems of a contact group must be distinct, got system ids {0}".format(
+                    self.sys_idx
+                )
+            )
+
+        self._aabb_functions = []
+        for system in systems:
+            if isinstance(system, RodBase):
+                self._aabb_functions.append(_rod_aabb)
+            elif isinstance(system, Cylinder):
+                self._aabb_functions.append(_cylinder_aabb)
+            elif isinstance(system, Sphere):
+                self._aabb_functions.append(_sphere_aabb)
+            else:
+                raise TypeError(
+                    "Systems of a contact group must be rods, cylinders or spheres."
+                    " System {0} is not supported.".format(system.__class__)
+                )
+        self._systems = list(systems)
+        self._aabbs = np.empty((3, 2, len(self._systems)))
+
+    def _find_pair_contact(self, first: int, second: int):
+        # First contact class accepting the pair, in either order
+        for prototype, (contact_cls, args, kwargs) in zip(
+            self._contact_prototypes, self._contact_cls
+        ):
+            for first_idx, second_idx in ((first, second), (second, first)):
+                try:
+                    prototype._check_systems_validity(
+                        self._systems[first_idx], self._systems[second_idx]
+                    )
+                except TypeError:
+                    continue
+                return (
+                    first_idx,
+                    second_idx,
+                    self._construct_contact(contact_cls, args, kwargs),
+                )
+        return None
+
+    def apply_contact(self) -> None:
+        """
+        Applies contact between the pairs of systems of the group whose bounding
+        boxes intersect.
+        """
+        for records in self.records:
+            records.clear()
+
+        for idx, (aabb_function, system) in enumerate(
+            zip(self._aabb_functions, self._systems)
+        ):
+            aabb_function(system, self._aabbs[..., idx])
+
+        first_pairs, second_pairs = self.candidate_cache.update(
+            0.5 * (self._aabbs[:, 0] + self._aabbs[:, 1]),
+            0.5 * (self._aabbs[:, 1] - self._aabbs[:, 0]),
+            self._sweep_and_prune,
+        )
+        for first, second in zip(first_pairs, second_pairs):
+            key = (int(first), int(second))
+            if key not in self._pair_contacts:
+                self._pair_contacts[key] = self._find_pair_contact(*key)
+            pair_contact = self._pair_contacts[key]
+            if pair_contact is None:
+                continue
+            first_idx, second_idx, contact = pair_contact
+            if contact.records is not None:
+                contact.records.systems[:] = (
+                    self.sys_idx[first_idx],
+                    self.sys_idx[second_idx],
+                )
+            contact.apply_contact(self._systems[first_idx], self._systems[second_idx])
+
+    def _sweep_and_prune(self):
+        # Pairs of boxes grown by half of the skin
+        half_skin = 0.5 * self.candidate_cache.skin
+        return sweep_and_prune(
+            self._aabbs + np.array([-half_skin, half_skin])[:, np.newaxis]
+        )
+
+
+def _rod_aabb(rod, aabb) -> None:
+    # Same box as the rod-rod, rod-cylinder and rod-sphere pruning
+    max_possible_dimension = np.max(rod.radius) + np.max(rod.lengths)
+    aabb[:, 0] = np.min(rod.position_collection, axis=1) - max_possible_dimension
+    aabb[:, 1] = np.max(rod.position_collection, axis=1) + max_possible_dimension
+
+
+def _cylinder_aabb(cylinder, aabb) -> None:
+    # Bounds both the cylinder and the capsule of radius `radius` around its axis,
+    # which is used by the rod-cylinder contact.
+    director = cylinder.director_collection[..., 0]
+    half_extent = np.abs(director[2]) * 0.5 * cylinder.length[0] + cylinder.radius[
+        0
+    ] * np.maximum(1.0, np.abs(director[0]) + np.abs(director[1]))
+    aabb[:, 0] = cylinder.position_collection[:, 0] - half_extent
+    aabb[:, 1] = cylinder.position_collection[:, 0] + half_extent
+
+
+def _sphere_aabb(sphere, aabb) -> None:
+    # The rod-sphere contact treats the sphere as a capsule of radius `radius`
+    # around the segment from its center to `radius` behind it along its third
+    # director, which extends up to twice the radius from the center.
+    aabb[:, 0] = sphere.position_collection[:, 0] - 2.0 * sphere.radius[0]
+    aabb[:, 1] = sphere.position_collection[:, 0] + 2.0 * sphere.radius[0]
@@ -5,7 +5,10 @@ Forcing
 Provides the forcing interface to apply forces and torques to rod-like objects
 (external point force, muscle torques, etc).
 """
+from functools import partial
+
 from elastica.interaction import AnisotropicFrictionalPlane
+from elastica.modules.memory_block import find_rod_batches_in_memory_blocks
 
 
 class Forcing:
@@ -24,6 +27,9 @@ class Forcing:
         self._ext_forces_torques = []
         super(Forcing, self).__init__()
         self._feature_group_synchronize.append(self._call_ext_forces_torques)
+        self._feature_group_synchronize_tasks[self._call_ext_forces_torques] = (
+            self._ext_forces_torques_tasks
+        )
         self._feature_group_finalize.append(self._finalize_forcing)
 
     def add_forcing_to(self, system):
@@ -71,14 +77,68 @@ class Forcing:
 
         # Find if there are any friction plane forcing, if add them to the end of the list,
         # since friction planes uses external forces.
-        friction_plane_index = []
-        for idx, ext_force_torque in enumerate(self._ext_forces_torques):
-            if isinstance(ext_force_torque[1], AnisotropicFrictionalPlane):
-                friction_plane_index.append(idx)
+        is_friction_plane = [
+            isinstance(ext_force_torque[1], AnisotropicFrictionalPlane)
+            for ext_force_torque in self._ext_forces_torques
+        ]
 
         # Move to the friction forces to the end of the external force and torques list.
-        for index in friction_plane_index:
-            self._ext_forces_torques.append(self._ext_forces_torques.pop(index))
+        self._ext_forces_torques[:] = [
+            ext_force_torque
+            for ext_force_torque, friction in zip(
+                self._ext_forces_torques, is_friction_plane
+            )
+            if not friction
+        ] + [
+            ext_force_torque
+            for ext_force_torque, friction in zip(
+                self._ext_forces_torques, is_friction_plane
+            )
+            if friction
+        ]
+
+        self._batch_forcing_in_memory_blocks()
+
+    def _batch_forcing_in_memory_blocks(self):
+        # Forcing of consecutive rods of a memory block with the same plane are
+        # applied at once to the rods, on the memory block.
+        memory_blocks = getattr(self, "_memory_blocks", ())
+        if not memory_blocks:
+            return
+        batches = find_rod_batches_in_memory_blocks(
+            memory_blocks,
+            [
+                (
+                    sys_id,
+                    self._system_keys(sys_id),
+                    _forcing_batch_key(ext_force_torque),
+                )
+                for sys_id, ext_force_torque in self._ext_forces_torques
+            ],
+        )
+        batched_forcing = {}
+        for positions, rods, first_elements, last_elements, ghost_elements in batches:
+            sys_id, ext_force_torque = self._ext_forces_torques[positions[-1]]
+            for position in positions[:-1]:
+                batched_forcing[position] = None
+            batched_forcing[positions[-1]] = (
+                sys_id,
+                _ForcingInMemoryBlock(
+                    ext_force_torque,
+                    rods,
+                    first_elements,
+                    last_elements,
+                    ghost_elements,
+                    tuple(
+                        self._ext_forces_torques[position][0] for position in positions
+                    ),
+                ),
+            )
+        self._ext_forces_torques[:] = [
+            batched_forcing.get(position, ext_force_torque)
+            for position, ext_force_torque in enumerate(self._ext_forces_torques)
+            if batched_forcing.get(position, ext_force_torque) is not None
+        ]
 
     def _call_ext_forces_torques(self, time, *args, **kwargs):
         for sys_id, ext_force_torque in self._ext_forces_torques:
@@ -86,6 +146,75 @@ class Forcing:
             ext_force_torque.apply_torques(self._systems[sys_id], time, *args, **kwargs)
             # TODO Apply torque, see if necessary
 
+    def _ext_forces_torques_tasks(self):
+        # Tasks of _call_ext_forces_torques, one per forcing, with the index of the
+        # system it is applied to.
+        return [
+            (
+                getattr(ext_force_torque, "system_indices", (sys_id,)),
+                partial(
+                    _apply_ext_force_torque, ext_force_torque, self._systems[sys_id]
+                ),
+            )
+            for sys_id, ext_force_torque in self._ext_forces_torques
+        ]
+
+
+def _apply_ext_force_torque(ext_force_torque, system, time):
+    ext_force_torque.apply_forces(system, time)
+    ext_force_torque.apply_torques(system, time)
+
+
+def _forcing_batch_key(ext_force_torque):
+    batch_key = getattr(ext_force_torque, "_batch_key", None)
+    return batch_key() if batch_key is not None else None
+
+
+class _ForcingInMemoryBlock:
+    """
+    Forcing module private class, for the same forcing applied at once to
+    consecutive rods of a memory block.
+
+    Attributes
+    ----------
+    forcing: NoForces
+        Forcing applied, providing `apply_forces_in_block`.
+    rods: MemoryBlockCosseratRodChunk
+        Rods the forcing is applied to, as a chunk of their memory block.
+    system_indices: tuple
+        Indices of the rods the forcing is applied to.
+    """
+
+    def __init__(
+        self,
+        forcing,
+        rods,
+        first_elements,
+        last_elements,
+        ghost_elements,
+        system_indices,
+    ):
+        self.forcing = forcing
+        self.rods = rods
+        self.first_elements = first_elements
+        self.last_elements = last_elements
+        self.ghost_elements = ghost_elements
+        self.system_indices = system_indices
+
+    def apply_forces(self, system, time=0.0):
+        # system is the last rod of the batch, the forcing is applied to all of
+        # them.
+        self.forcing.apply_forces_in_block(
+            self.rods,
+            self.first_elements,
+            self.last_elements,
+            self.ghost_elements,
+            time,
+        )
+
+    def apply_torques(self, system, time=0.0):
+        pass
+
 
 class _ExtForceTorque:
     """
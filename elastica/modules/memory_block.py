@@ -3,30 +3,58 @@ This function is a module to construct memory blocks for different types of syst
 Cosserat Rods, Rigid Body etc.
 """
 
+import numpy as np
+
 from elastica.rod import RodBase
 from elastica.rigidbody import RigidBodyBase
 from elastica.surface import SurfaceBase
 from elastica.memory_block import MemoryBlockCosseratRod, MemoryBlockRigidBody
+from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRodChunk
+from elastica.memory_block.memory_block_rigid_body import MemoryBlockRigidBodyChunk
 
 
-def construct_memory_block_structures(systems):
+def construct_memory_block_structures(systems, dtype=np.float64, n_substeps=None):
     """
     This function takes the systems (rod or rigid body) appended to the simulator class and
     separates them into lists depending on if system is Cosserat rod or rigid body. Then using
     these separated out systems it creates the memory blocks for Cosserat rods and rigid bodies.
+    Rods with a number of substeps (see `BaseSystemCollection.subcycle`) are put in a
+    separate memory block for each number of substeps.
+
+    Parameters
+    ----------
+    systems
+    dtype: numpy.dtype
+        Floating point type of the memory blocks, float64 by default.
+    n_substeps: dict
+        Number of substeps of the rods stepped with more than one substep, by
+        index of the rod.
 
     Returns
     -------
 
     """
     _memory_blocks = []
+    n_substeps = {} if n_substeps is None else n_substeps
     temp_list_for_cosserat_rod_systems = []
     temp_list_for_rigid_body_systems = []
     temp_list_for_cosserat_rod_systems_idx = []
+    temp_list_for_subcycled_rod_systems = {}
     temp_list_for_rigid_body_systems_idx = []
 
     for system_idx, sys_to_be_added in enumerate(systems):
-        if issubclass(sys_to_be_added.__class__, RodBase):
+        if issubclass(sys_to_be_added.__class__, RodBase) and system_idx in n_substeps:
+            temp_list_for_subcycled_rod_systems.setdefault(
+                n_substeps[system_idx], ([], [])
+            )
+            temp_list_for_subcycled_rod_systems[n_substeps[system_idx]][0].append(
+                sys_to_be_added
+            )
+            temp_list_for_subcycled_rod_systems[n_substeps[system_idx]][1].append(
+                system_idx
+            )
+
+        elif issubclass(sys_to_be_added.__class__, RodBase):
             temp_list_for_cosserat_rod_systems.append(sys_to_be_added)
             temp_list_for_cosserat_rod_systems_idx.append(system_idx)
 
@@ -56,14 +84,272 @@ def construct_memory_block_structures(systems):
             MemoryBlockCosseratRod(
                 temp_list_for_cosserat_rod_systems,
                 temp_list_for_cosserat_rod_systems_idx,
+                dtype=dtype,
             )
         )
 
+    for n_substeps_of_block in sorted(temp_list_for_subcycled_rod_systems):
+        rods, rods_idx = temp_list_for_subcycled_rod_systems[n_substeps_of_block]
+        memory_block = MemoryBlockCosseratRod(rods, rods_idx, dtype=dtype)
+        memory_block.n_substeps = n_substeps_of_block
+        _memory_blocks.append(memory_block)
+
     if temp_list_for_rigid_body_systems:
         _memory_blocks.append(
             MemoryBlockRigidBody(
-                temp_list_for_rigid_body_systems, temp_list_for_rigid_body_systems_idx
+                temp_list_for_rigid_body_systems,
+                temp_list_for_rigid_body_systems_idx,
+                dtype=dtype,
             )
         )
 
     return _memory_blocks
+
+
+def find_rod_batches_in_memory_blocks(memory_blocks, entries):
+    """
+    This function finds the operations on rods (e.g. contacts of many rods with
+    the same plane) that can be applied at once on consecutive rods of a memory
+    block.
+
+    Operations with the same key are batched together, at the position of the
+    last one of the batch. An operation is only moved there if no other operation
+    in between writes to its rod, so that each rod sees the same sequence of
+    operations. Ring rods are never batched.
+
+    Parameters
+    ----------
+    memory_blocks: list
+        Memory blocks of the simulator.
+    entries: list
+        (rod_idx, sys_indices, key) of each operation, in the order they are
+        applied: index of the rod the operation is applied to, indices of all
+        the systems it writes to, and a hashable key, equal for the operations
+        that can be applied together, or None if the operation is applied alone.
+
+    Returns
+    -------
+    batches: list
+        (positions, rods, first_elements, last_elements, ghost_elements) of each
+        batch: positions of its operations in entries, chunk of the memory block
+        on the rods of the batch, and indices of the first and last element of
+        each rod and of the ghost elements in the chunk.
+    """
+    rod_location = {}
+    for memory_block in memory_blocks:
+        if not isinstance(memory_block, MemoryBlockCosseratRod) or getattr(
+            memory_block, "ring_rod_flag", False
+        ):
+            continue
+        for rod_idx_in_block, sys_idx in enumerate(memory_block.system_idx_list):
+            rod_location[int(sys_idx)] = (memory_block, rod_idx_in_block)
+
+    groups = {}
+    for position, (rod_idx, _, key) in enumerate(entries):
+        if key is not None and rod_idx in rod_location:
+            groups.setdefault(key, []).append(position)
+
+    batches = []
+    for positions in groups.values():
+        last_position = positions[-1]
+        rods_in_blocks = {}
+        for position in positions:
+            rod_idx = entries[position][0]
+            if any(
+                rod_idx in entries[other][1]
+                for other in range(position + 1, last_position + 1)
+            ):
+                continue
+            memory_block, rod_idx_in_block = rod_location[rod_idx]
+            rods_in_blocks.setdefault(id(memory_block), (memory_block, {}))[1][
+                rod_idx_in_block
+            ] = position
+
+        for memory_block, rods in rods_in_blocks.values():
+            rod_indices_in_block = sorted(rods)
+            run_start = 0
+            for i in range(1, len(rod_indices_in_block) + 1):
+                if (
+                    i < len(rod_indices_in_block)
+                    and rod_indices_in_block[i] == rod_indices_in_block[i - 1] + 1
+                ):
+                    continue
+                run = rod_indices_in_block[run_start:i]
+                run_start = i
+                if len(run) < 2:
+                    continue
+                batches.append(
+                    (
+                        sorted(rods[rod] for rod in run),
+                        *_make_rod_batch(memory_block, run),
+                    )
+                )
+
+    return batches
+
+
+def find_body_batches_in_memory_blocks(memory_blocks, entries):
+    """
+    This function finds the operations on rigid bodies (e.g. contacts of a rod
+    with many spheres) that can be applied at once on consecutive bodies of a
+    memory block.
+
+    Operations with the same key are batched together, at the position of the
+    last one of the batch. An operation is only moved there if no operation in
+    between, other than the ones with the same key, writes to any of its
+    systems.
+
+    Parameters
+    ----------
+    memory_blocks: list
+        Memory blocks of the simulator.
+    entries: list
+        (body_idx, sys_indices, key) of each operation, in the order they are
+        applied: index of the body the operation is applied to, indices of all
+        the systems it writes to, and a hashable key, equal for the operations
+        that can be applied together, or None if the operation is applied alone.
+
+    Returns
+    -------
+    batches: list
+        (positions, bodies) of each batch: positions of its operations in
+        entries, and chunk of the memory block on the bodies of the batch.
+    """
+    body_location = {}
+    for memory_block in memory_blocks:
+        if not isinstance(memory_block, MemoryBlockRigidBody):
+            continue
+        for body_idx_in_block, sys_idx in enumerate(memory_block.system_idx_list):
+            body_location[int(sys_idx)] = (memory_block, body_idx_in_block)
+
+    groups = {}
+    for position, (body_idx, _, key) in enumerate(entries):
+        if key is not None and body_idx in body_location:
+            groups.setdefault(key, []).append(position)
+
+    batches = []
+    for key, positions in groups.items():
+        last_position = positions[-1]
+        bodies_in_blocks = {}
+        for position in positions:
+            sys_indices = entries[position][1]
+            if any(
+                entries[other][2] != key
+                and any(sys_idx in entries[other][1] for sys_idx in sys_indices)
+                for other in range(position + 1, last_position + 1)
+            ):
+                continue
+            memory_block, body_idx_in_block = body_location[entries[position][0]]
+            bodies_in_blocks.setdefault(id(memory_block), (memory_block, {}))[1][
+                body_idx_in_block
+            ] = position
+
+        for memory_block, bodies in bodies_in_blocks.values():
+            body_indices_in_block = sorted(bodies)
+            run_start = 0
+            for i in range(1, len(body_indices_in_block) + 1):
+                if (
+                    i < len(body_indices_in_block)
+                    and body_indices_in_block[i] == body_indices_in_block[i - 1] + 1
+                ):
+                    continue
+                run = body_indices_in_block[run_start:i]
+                run_start = i
+                if len(run) < 2:
+                    continue
+                batches.append(
+                    (
+                        sorted(bodies[body] for body in run),
+                        MemoryBlockRigidBodyChunk(memory_block, run[0], run[-1] + 1),
+                    )
+                )
+
+    return batches
+
+
+def _make_rod_batch(memory_block, rod_indices_in_block):
+    start_node = memory_block.start_idx_in_rod_nodes[rod_indices_in_block[0]]
+    end_node = memory_block.end_idx_in_rod_nodes[rod_indices_in_block[-1]]
+    rods = MemoryBlockCosseratRodChunk(memory_block, start_node, end_node)
+    first_elements = (
+        memory_block.start_idx_in_rod_elems[rod_indices_in_block] - start_node
+    )
+    last_elements = (
+        memory_block.end_idx_in_rod_elems[rod_indices_in_block] - 1 - start_node
+    )
+    ghost_elements = np.flatnonzero(rods.elems_mask == 0)
+    return rods, first_elements, last_elements, ghost_elements
+
+
+def mark_constrained_nodes_and_elements_in_memory_blocks(memory_blocks, entries):
+    """
+    This function sets the indices of the nodes and elements of the memory
+    blocks of rods that are constrained by boundary conditions, as the
+    `constrained_nodes_idx` and `constrained_elems_idx` of the blocks, and the
+    lab frame components of their velocities and angular velocities that are
+    constrained, as the `constrained_nodes_selector` and
+    `constrained_elems_selector` of the blocks.
+
+    Parameters
+    ----------
+    memory_blocks: list
+        Memory blocks of the simulator.
+    entries: list
+        (rod_idx, node_indices, element_indices, translational_selector,
+        rotational_selector) of each boundary condition: index of the rod it
+        is applied to, indices of the nodes and elements of the rod it
+        constrains, and the components of their velocities and angular
+        velocities it constrains, in the lab frame.
+    """
+    rod_location = {}
+    constrained = {}
+    for memory_block in memory_blocks:
+        if not isinstance(memory_block, MemoryBlockCosseratRod):
+            continue
+        for rod_idx_in_block, sys_idx in enumerate(memory_block.system_idx_list):
+            rod_location[int(sys_idx)] = (memory_block, rod_idx_in_block)
+        constrained[id(memory_block)] = (memory_block, {}, {})
+
+    for (
+        rod_idx,
+        node_indices,
+        element_indices,
+        translational_selector,
+        rotational_selector,
+    ) in entries:
+        if rod_idx not in rod_location:
+            continue
+        memory_block, rod_idx_in_block = rod_location[rod_idx]
+        start_node = memory_block.start_idx_in_rod_nodes[rod_idx_in_block]
+        n_nodes = memory_block.end_idx_in_rod_nodes[rod_idx_in_block] - start_node
+        start_elem = memory_block.start_idx_in_rod_elems[rod_idx_in_block]
+        n_elems = memory_block.end_idx_in_rod_elems[rod_idx_in_block] - start_elem
+        translational_selector = np.broadcast_to(
+            np.asarray(translational_selector, dtype=bool), 3
+        )
+        rotational_selector = np.broadcast_to(
+            np.asarray(rotational_selector, dtype=bool), 3
+        )
+        _, nodes, elements = constrained[id(memory_block)]
+        for idx in node_indices:
+            node = int(start_node + idx % n_nodes)
+            nodes[node] = nodes.get(node, False) | translational_selector
+        for idx in element_indices:
+            element = int(start_elem + idx % n_elems)
+            elements[element] = elements.get(element, False) | rotational_selector
+
+    for memory_block, nodes, elements in constrained.values():
+        nodes = sorted(nodes.items())
+        elements = sorted(elements.items())
+        memory_block.constrained_nodes_idx = np.array(
+            [node for node, _ in nodes], dtype=np.int64
+        )
+        memory_block.constrained_nodes_selector = np.array(
+            [selector for _, selector in nodes], dtype=bool
+        ).reshape(-1, 3)
+        memory_block.constrained_elems_idx = np.array(
+            [element for element, _ in elements], dtype=np.int64
+        )
+        memory_block.constrained_elems_selector = np.array(
+            [selector for _, selector in elements], dtype=bool
+        ).reshape(-1, 3)
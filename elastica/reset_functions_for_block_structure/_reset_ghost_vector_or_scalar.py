@@ -1,4 +1,5 @@
 __doc__ = """Reset the ghost vectors or scalar variables using functions implemented in Numba"""
+from elastica._backends import register_kernels, bind_kernels
 
 
 def _reset_vector_ghost(input, ghost_idx, reset_value=0.0):
@@ -68,3 +69,14 @@ def _reset_scalar_ghost(input, ghost_idx, reset_value=0.0):
     """
     for k in ghost_idx:
         input[k] = reset_value
+
+
+register_kernels(
+    __name__,
+    "reference",
+    {
+        "_reset_vector_ghost": _reset_vector_ghost,
+        "_reset_scalar_ghost": _reset_scalar_ghost,
+    },
+)
+bind_kernels(globals())
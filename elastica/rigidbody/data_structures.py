@@ -2,7 +2,7 @@ __doc__ = "Data structure wrapper for rod components"
 
 import numpy as np
 
-from elastica._rotations import _get_rotation_matrix
+from elastica._rotations import _rotate_in_place
 from elastica.rod.data_structures import _RodSymplecticStepperMixin
 
 """
@@ -417,12 +417,7 @@ class _KinematicState:
         # x += v*dt
         self.position_collection += velocity_collection
         # Devs : see `_State.__iadd__` for reasons why we do matmul here
-        np.einsum(
-            "ijk,jlk->ilk",
-            _get_rotation_matrix(1.0, omega_collection),
-            self.director_collection.copy(),
-            out=self.director_collection,
-        )
+        _rotate_in_place(self.director_collection, 1.0, omega_collection)
         return self
 
 
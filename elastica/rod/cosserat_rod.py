@@ -16,10 +16,13 @@ from elastica.rod.knot_theory import KnotTheory
 from elastica._calculus import (
     quadrature_kernel_for_block_structure,
     difference_kernel_for_block_structure,
+    _masked_trapezoidal_for_block_structure,
+    _masked_two_point_difference_for_block_structure,
     _difference,
     _average,
 )
 from typing import Optional
+from elastica._backends import register_kernels, bind_kernels
 
 position_difference_kernel = _difference
 position_average = _average
@@ -545,8 +548,9 @@ class CosseratRod(RodBase, KnotTheory):
             current time
 
         """
-        _compute_internal_forces(
+        _compute_internal_forces_and_torques(
             self.position_collection,
+            self.velocity_collection,
             self.volume,
             self.lengths,
             self.tangents,
@@ -560,30 +564,17 @@ class CosseratRod(RodBase, KnotTheory):
             self.rest_sigma,
             self.shear_matrix,
             self.internal_stress,
-            self.internal_forces,
-            self.ghost_elems_idx,
-        )
-
-        _compute_internal_torques(
-            self.position_collection,
-            self.velocity_collection,
-            self.tangents,
-            self.lengths,
-            self.rest_lengths,
-            self.director_collection,
-            self.rest_voronoi_lengths,
             self.bend_matrix,
             self.rest_kappa,
             self.kappa,
-            self.voronoi_dilatation,
+            self.internal_couple,
             self.mass_second_moment_of_inertia,
             self.omega_collection,
-            self.internal_stress,
-            self.internal_couple,
-            self.dilatation,
             self.dilatation_rate,
+            self.internal_forces,
             self.internal_torques,
-            self.ghost_voronoi_idx,
+            self.elems_mask,
+            self.voronoi_mask,
         )
 
     # Interface to time-stepper mixins (Symplectic, Explicit), which calls this method
@@ -872,7 +863,7 @@ def _compute_internal_bending_twist_stresses_from_model(
     )  # concept : needs to compute kappa
 
     blocksize = kappa.shape[1]
-    temp = np.empty((3, blocksize))
+    temp = np.empty((3, blocksize), dtype=kappa.dtype)
     for i in range(3):
         for k in range(blocksize):
             temp[i, k] = kappa[i, k] - rest_kappa[i, k]
@@ -925,7 +916,7 @@ def _compute_internal_forces(
     # Not using batch matvec as I don't want to take directors.T here
 
     blocksize = internal_stress.shape[1]
-    cosserat_internal_stress = np.zeros((3, blocksize))
+    cosserat_internal_stress = np.zeros((3, blocksize), dtype=internal_stress.dtype)
 
     for i in range(3):
         for j in range(3):
@@ -1028,6 +1019,403 @@ def _compute_internal_torques(
             )
 
 
+def _compute_internal_forces_and_torques(
+    position_collection,
+    velocity_collection,
+    volume,
+    lengths,
+    tangents,
+    radius,
+    rest_lengths,
+    rest_voronoi_lengths,
+    dilatation,
+    voronoi_dilatation,
+    director_collection,
+    sigma,
+    rest_sigma,
+    shear_matrix,
+    internal_stress,
+    bend_matrix,
+    rest_kappa,
+    kappa,
+    internal_couple,
+    mass_second_moment_of_inertia,
+    omega_collection,
+    dilatation_rate,
+    internal_forces,
+    internal_torques,
+    elems_mask,
+    voronoi_mask,
+    vector_scratch_in_elements=None,
+    vector_scratch_in_voronoi=None,
+    scalar_scratch_in_elements=None,
+    scalar_scratch_in_voronoi=None,
+):
+    """
+    Update <internal force and internal torque> in a single pass over the elements
+    and the voronoi domain.
+
+    Equivalent to `_compute_internal_forces` followed by `_compute_internal_torques`,
+    but the director-tangent product Q t and the geometry are computed once, and the
+    difference/quadrature of the stresses and couples are accumulated directly into
+    `internal_forces` and `internal_torques`.
+    Ghost elements and ghost voronoi of the block structure do not contribute.
+
+    Scratch buffers (see `MemoryBlockWorkspace`) are optional, they are allocated
+    when not given.
+
+    Notes
+    -----
+    The intermediate fields (lengths, tangents, radius, dilatation, sigma,
+    internal_stress, kappa, internal_couple, dilatation_rate, ...) are updated as
+    in the separate kernels.
+
+    Ghosts are given by `elems_mask` and `voronoi_mask`, 1D arrays that are 0.0
+    on the ghosts of the block structure and 1.0 elsewhere (see
+    `make_block_memory_ghost_mask`), so that no pass over the ghosts is needed.
+    """
+    n_elems = lengths.shape[0]
+    n_voronoi = rest_voronoi_lengths.shape[0]
+
+    cosserat_internal_stress = (
+        np.empty((3, n_elems), dtype=position_collection.dtype)
+        if vector_scratch_in_elements is None
+        else vector_scratch_in_elements[0]
+    )
+    curvature = (
+        np.empty((3, n_voronoi), dtype=position_collection.dtype)
+        if vector_scratch_in_voronoi is None
+        else vector_scratch_in_voronoi[0]
+    )
+    bend_twist_couple_2D = (
+        np.empty((3, n_voronoi), dtype=position_collection.dtype)
+        if vector_scratch_in_voronoi is None
+        else vector_scratch_in_voronoi[1]
+    )
+    bend_twist_couple_3D = (
+        np.empty((3, n_voronoi), dtype=position_collection.dtype)
+        if vector_scratch_in_voronoi is None
+        else vector_scratch_in_voronoi[2]
+    )
+
+    # Pass over elements : geometry, shear/stretch stress and the element-local part
+    # of the internal torques.
+    for k in range(n_elems):
+        dx0 = position_collection[0, k + 1] - position_collection[0, k]
+        dx1 = position_collection[1, k + 1] - position_collection[1, k]
+        dx2 = position_collection[2, k + 1] - position_collection[2, k]
+        # FIXME: Here 1E-14 is added to fix ghost lengths, which is 0, and causes division by zero error!
+        length = np.sqrt(dx0 * dx0 + dx1 * dx1 + dx2 * dx2) + 1e-14
+        lengths[k] = length
+        tangents[0, k] = dx0 / length
+        tangents[1, k] = dx1 / length
+        tangents[2, k] = dx2 / length
+        radius[k] = np.sqrt(volume[k] / length / np.pi)
+        e = length / rest_lengths[k]
+        dilatation[k] = e
+
+        # Q t, shared by the shear/stretch strain and the shear/stretch couple
+        qt0 = (
+            director_collection[0, 0, k] * tangents[0, k]
+            + director_collection[0, 1, k] * tangents[1, k]
+            + director_collection[0, 2, k] * tangents[2, k]
+        )
+        qt1 = (
+            director_collection[1, 0, k] * tangents[0, k]
+            + director_collection[1, 1, k] * tangents[1, k]
+            + director_collection[1, 2, k] * tangents[2, k]
+        )
+        qt2 = (
+            director_collection[2, 0, k] * tangents[0, k]
+            + director_collection[2, 1, k] * tangents[1, k]
+            + director_collection[2, 2, k] * tangents[2, k]
+        )
+        # sigma = e Q t - d3, where Q d3 = (0, 0, 1)
+        sigma[0, k] = e * qt0
+        sigma[1, k] = e * qt1
+        sigma[2, k] = e * qt2 - 1.0
+        s0 = sigma[0, k] - rest_sigma[0, k]
+        s1 = sigma[1, k] - rest_sigma[1, k]
+        s2 = sigma[2, k] - rest_sigma[2, k]
+        for i in range(3):
+            internal_stress[i, k] = (
+                shear_matrix[i, 0, k] * s0
+                + shear_matrix[i, 1, k] * s1
+                + shear_matrix[i, 2, k] * s2
+            )
+        n0 = internal_stress[0, k]
+        n1 = internal_stress[1, k]
+        n2 = internal_stress[2, k]
+
+        # Q^T n_L / e, ghost elements do not contribute
+        for i in range(3):
+            cosserat_internal_stress[i, k] = (
+                (
+                    director_collection[0, i, k] * n0
+                    + director_collection[1, i, k] * n1
+                    + director_collection[2, i, k] * n2
+                )
+                / e
+                * elems_mask[k]
+            )
+
+        # de/dt = (x_{k+1} - x_k) . (v_{k+1} - v_k) / (l \hat{l})
+        de_dt = (
+            (
+                dx0 * (velocity_collection[0, k + 1] - velocity_collection[0, k])
+                + dx1 * (velocity_collection[1, k + 1] - velocity_collection[1, k])
+                + dx2 * (velocity_collection[2, k + 1] - velocity_collection[2, k])
+            )
+            / length
+            / rest_lengths[k]
+        )
+        dilatation_rate[k] = de_dt
+
+        # J \omega_L / e
+        w0 = omega_collection[0, k]
+        w1 = omega_collection[1, k]
+        w2 = omega_collection[2, k]
+        jw0 = (
+            mass_second_moment_of_inertia[0, 0, k] * w0
+            + mass_second_moment_of_inertia[0, 1, k] * w1
+            + mass_second_moment_of_inertia[0, 2, k] * w2
+        ) / e
+        jw1 = (
+            mass_second_moment_of_inertia[1, 0, k] * w0
+            + mass_second_moment_of_inertia[1, 1, k] * w1
+            + mass_second_moment_of_inertia[1, 2, k] * w2
+        ) / e
+        jw2 = (
+            mass_second_moment_of_inertia[2, 0, k] * w0
+            + mass_second_moment_of_inertia[2, 1, k] * w1
+            + mass_second_moment_of_inertia[2, 2, k] * w2
+        ) / e
+
+        # (Q t x n_L) * \hat{l} + (J \omega_L / e) x \omega_L
+        # + (J \omega_L / e^2) . (de/dt)
+        internal_torques[0, k] = (
+            (qt1 * n2 - qt2 * n1) * rest_lengths[k]
+            + (jw1 * w2 - jw2 * w1)
+            + jw0 * de_dt / e
+        )
+        internal_torques[1, k] = (
+            (qt2 * n0 - qt0 * n2) * rest_lengths[k]
+            + (jw2 * w0 - jw0 * w2)
+            + jw1 * de_dt / e
+        )
+        internal_torques[2, k] = (
+            (qt0 * n1 - qt1 * n0) * rest_lengths[k]
+            + (jw0 * w1 - jw1 * w0)
+            + jw2 * de_dt / e
+        )
+
+    # Delta(Q^T n_L / e)
+    for i in range(3):
+        internal_forces[i, 0] = cosserat_internal_stress[i, 0]
+        for k in range(1, n_elems):
+            internal_forces[i, k] = (
+                cosserat_internal_stress[i, k] - cosserat_internal_stress[i, k - 1]
+            )
+        internal_forces[i, n_elems] = -cosserat_internal_stress[i, n_elems - 1]
+
+    # Pass over voronoi : bending/twist couple
+    _inv_rotate(director_collection, curvature)
+    for k in range(n_voronoi):
+        voronoi_dilatation[k] = (
+            0.5 * (lengths[k] + lengths[k + 1]) / rest_voronoi_lengths[k]
+        )
+        for i in range(3):
+            kappa[i, k] = curvature[i, k] / rest_voronoi_lengths[k]
+        c0 = kappa[0, k] - rest_kappa[0, k]
+        c1 = kappa[1, k] - rest_kappa[1, k]
+        c2 = kappa[2, k] - rest_kappa[2, k]
+        for i in range(3):
+            internal_couple[i, k] = (
+                bend_matrix[i, 0, k] * c0
+                + bend_matrix[i, 1, k] * c1
+                + bend_matrix[i, 2, k] * c2
+            )
+
+        tau0 = internal_couple[0, k]
+        tau1 = internal_couple[1, k]
+        tau2 = internal_couple[2, k]
+        # Ghost voronoi do not contribute
+        voronoi_dilatation_inv_cube = voronoi_mask[k] / voronoi_dilatation[k] ** 3
+        # \tau_L / \Epsilon^3
+        bend_twist_couple_2D[0, k] = tau0 * voronoi_dilatation_inv_cube
+        bend_twist_couple_2D[1, k] = tau1 * voronoi_dilatation_inv_cube
+        bend_twist_couple_2D[2, k] = tau2 * voronoi_dilatation_inv_cube
+        # (\kappa x \tau_L ) * \hat{D} / \Epsilon^3, halved for the quadrature
+        half_quadrature_weight = (
+            0.5 * rest_voronoi_lengths[k] * voronoi_dilatation_inv_cube
+        )
+        bend_twist_couple_3D[0, k] = (
+            kappa[1, k] * tau2 - kappa[2, k] * tau1
+        ) * half_quadrature_weight
+        bend_twist_couple_3D[1, k] = (
+            kappa[2, k] * tau0 - kappa[0, k] * tau2
+        ) * half_quadrature_weight
+        bend_twist_couple_3D[2, k] = (
+            kappa[0, k] * tau1 - kappa[1, k] * tau0
+        ) * half_quadrature_weight
+
+    # Delta(\tau_L / \Epsilon^3) + \mathcal{A}[ (\kappa x \tau_L ) * \hat{D} / \Epsilon^3 ]
+    for i in range(3):
+        for k in range(n_voronoi):
+            internal_torques[i, k] += (
+                bend_twist_couple_2D[i, k] + bend_twist_couple_3D[i, k]
+            )
+            internal_torques[i, k + 1] += (
+                bend_twist_couple_3D[i, k] - bend_twist_couple_2D[i, k]
+            )
+
+
+def _compute_internal_forces_and_torques_numpy(
+    position_collection,
+    velocity_collection,
+    volume,
+    lengths,
+    tangents,
+    radius,
+    rest_lengths,
+    rest_voronoi_lengths,
+    dilatation,
+    voronoi_dilatation,
+    director_collection,
+    sigma,
+    rest_sigma,
+    shear_matrix,
+    internal_stress,
+    bend_matrix,
+    rest_kappa,
+    kappa,
+    internal_couple,
+    mass_second_moment_of_inertia,
+    omega_collection,
+    dilatation_rate,
+    internal_forces,
+    internal_torques,
+    elems_mask,
+    voronoi_mask,
+    vector_scratch_in_elements=None,
+    vector_scratch_in_voronoi=None,
+    scalar_scratch_in_elements=None,
+    scalar_scratch_in_voronoi=None,
+):
+    """
+    Array-at-once version of `_compute_internal_forces_and_torques`, see its
+    documentation. With the scratch buffers given, it does not allocate.
+    """
+    n_elems = lengths.shape[0]
+    n_voronoi = rest_voronoi_lengths.shape[0]
+    if vector_scratch_in_elements is None:
+        vector_scratch_in_elements = np.empty(
+            (7, 3, n_elems), dtype=position_collection.dtype
+        )
+    if vector_scratch_in_voronoi is None:
+        vector_scratch_in_voronoi = np.empty(
+            (4, 3, n_voronoi), dtype=position_collection.dtype
+        )
+    if scalar_scratch_in_elements is None:
+        scalar_scratch_in_elements = np.empty(
+            (1, n_elems), dtype=position_collection.dtype
+        )
+    if scalar_scratch_in_voronoi is None:
+        scalar_scratch_in_voronoi = np.empty(
+            (3, n_voronoi), dtype=position_collection.dtype
+        )
+    (
+        position_diff,
+        director_tangents,
+        strain_from_rest,
+        cosserat_internal_stress,
+        velocity_diff,
+        J_omega_upon_e,
+        torque_term,
+    ) = vector_scratch_in_elements[:7]
+    (
+        curvature,
+        curvature_from_rest,
+        bend_twist_couple_2D,
+        bend_twist_couple_3D,
+    ) = vector_scratch_in_voronoi[:4]
+    dilatation_rate_upon_e = scalar_scratch_in_elements[0]
+    voronoi_dilatation_inv_cube = scalar_scratch_in_voronoi[0]
+
+    # Geometry and dilatations
+    np.subtract(
+        position_collection[:, 1:], position_collection[:, :-1], out=position_diff
+    )
+    _batch_dot(position_diff, position_diff, out=lengths)
+    np.sqrt(lengths, out=lengths)
+    # FIXME: Here 1E-14 is added to fix ghost lengths, which is 0, and causes division by zero error!
+    lengths += 1e-14
+    np.divide(position_diff, lengths, out=tangents)
+    np.divide(volume, lengths, out=radius)
+    radius /= np.pi
+    np.sqrt(radius, out=radius)
+    np.divide(lengths, rest_lengths, out=dilatation)
+    np.add(lengths[1:], lengths[:-1], out=voronoi_dilatation)
+    voronoi_dilatation *= 0.5
+    voronoi_dilatation /= rest_voronoi_lengths
+
+    # Q t, shared by the shear/stretch strain and the shear/stretch couple
+    _batch_matvec(director_collection, tangents, out=director_tangents)
+    np.multiply(dilatation, director_tangents, out=sigma)
+    sigma[2] -= 1.0
+    np.subtract(sigma, rest_sigma, out=strain_from_rest)
+    _batch_matvec(shear_matrix, strain_from_rest, out=internal_stress)
+
+    # Delta(Q^T n_L / e), ghost elements do not contribute
+    np.einsum(
+        "jik,jk->ik", director_collection, internal_stress, out=cosserat_internal_stress
+    )
+    cosserat_internal_stress /= dilatation
+    _masked_two_point_difference_for_block_structure(
+        cosserat_internal_stress, elems_mask, out=internal_forces
+    )
+
+    # Curvature, bending/twist couple and dilatation rate
+    _inv_rotate(director_collection, curvature, scalar_scratch_in_voronoi[1:3])
+    np.divide(curvature, rest_voronoi_lengths, out=kappa)
+    np.subtract(kappa, rest_kappa, out=curvature_from_rest)
+    _batch_matvec(bend_matrix, curvature_from_rest, out=internal_couple)
+    np.subtract(
+        velocity_collection[:, 1:], velocity_collection[:, :-1], out=velocity_diff
+    )
+    _batch_dot(position_diff, velocity_diff, out=dilatation_rate)
+    dilatation_rate /= lengths
+    dilatation_rate /= rest_lengths
+
+    # (Q t x n_L) * \hat{l}
+    _batch_cross(director_tangents, internal_stress, out=internal_torques)
+    internal_torques *= rest_lengths
+    # (J \omega_L / e) x \omega_L
+    _batch_matvec(mass_second_moment_of_inertia, omega_collection, out=J_omega_upon_e)
+    J_omega_upon_e /= dilatation
+    internal_torques += _batch_cross(J_omega_upon_e, omega_collection, out=torque_term)
+    # (J \omega_L / e^2) . (de/dt)
+    np.divide(dilatation_rate, dilatation, out=dilatation_rate_upon_e)
+    internal_torques += np.multiply(
+        J_omega_upon_e, dilatation_rate_upon_e, out=torque_term
+    )
+
+    # Delta(\tau_L / \Epsilon^3) + \mathcal{A}[ (\kappa x \tau_L ) * \hat{D} / \Epsilon^3 ],
+    # ghost voronoi do not contribute
+    np.power(voronoi_dilatation, 3, out=voronoi_dilatation_inv_cube)
+    np.divide(1.0, voronoi_dilatation_inv_cube, out=voronoi_dilatation_inv_cube)
+    np.multiply(internal_couple, voronoi_dilatation_inv_cube, out=bend_twist_couple_2D)
+    internal_torques += _masked_two_point_difference_for_block_structure(
+        bend_twist_couple_2D, voronoi_mask, out=torque_term
+    )
+    _batch_cross(kappa, internal_couple, out=bend_twist_couple_3D)
+    bend_twist_couple_3D *= rest_voronoi_lengths
+    bend_twist_couple_3D *= voronoi_dilatation_inv_cube
+    internal_torques += _masked_trapezoidal_for_block_structure(
+        bend_twist_couple_3D, voronoi_mask, out=torque_term
+    )
+
+
 def _update_accelerations(
     acceleration_collection,
     internal_forces,
@@ -1038,6 +1426,7 @@ def _update_accelerations(
     internal_torques,
     external_torques,
     dilatation,
+    vector_scratch_in_elements=None,
 ):
     """
     Update <acceleration and angular acceleration> given <internal force/torque and external force/torque>.
@@ -1062,6 +1451,37 @@ def _update_accelerations(
                 ) * dilatation[k]
 
 
+def _update_accelerations_numpy(
+    acceleration_collection,
+    internal_forces,
+    external_forces,
+    mass,
+    alpha_collection,
+    inv_mass_second_moment_of_inertia,
+    internal_torques,
+    external_torques,
+    dilatation,
+    vector_scratch_in_elements=None,
+):
+    """
+    Array-at-once version of `_update_accelerations`, see its documentation.
+    With the scratch buffers given, it does not allocate.
+    """
+    np.add(internal_forces, external_forces, out=acceleration_collection)
+    acceleration_collection /= mass
+
+    total_torques = (
+        np.empty(internal_torques.shape, dtype=internal_torques.dtype)
+        if vector_scratch_in_elements is None
+        else vector_scratch_in_elements[0]
+    )
+    np.add(internal_torques, external_torques, out=total_torques)
+    total_torques *= dilatation
+    _batch_matvec(
+        inv_mass_second_moment_of_inertia, total_torques, out=alpha_collection
+    )
+
+
 def _zeroed_out_external_forces_and_torques(external_forces, external_torques):
     """
     This function is to zeroed out external forces and torques.
@@ -1082,3 +1502,41 @@ def _zeroed_out_external_forces_and_torques(external_forces, external_torques):
     for i in range(3):
         for k in range(n_elems):
             external_torques[i, k] = 0.0
+
+
+def _zeroed_out_external_forces_and_torques_numpy(external_forces, external_torques):
+    """
+    Array-at-once version of `_zeroed_out_external_forces_and_torques`.
+    """
+    external_forces.fill(0.0)
+    external_torques.fill(0.0)
+
+
+register_kernels(
+    __name__,
+    "reference",
+    {
+        "_compute_geometry_from_state": _compute_geometry_from_state,
+        "_compute_all_dilatations": _compute_all_dilatations,
+        "_compute_dilatation_rate": _compute_dilatation_rate,
+        "_compute_shear_stretch_strains": _compute_shear_stretch_strains,
+        "_compute_internal_shear_stretch_stresses_from_model": _compute_internal_shear_stretch_stresses_from_model,
+        "_compute_bending_twist_strains": _compute_bending_twist_strains,
+        "_compute_internal_bending_twist_stresses_from_model": _compute_internal_bending_twist_stresses_from_model,
+        "_compute_internal_forces": _compute_internal_forces,
+        "_compute_internal_torques": _compute_internal_torques,
+        "_compute_internal_forces_and_torques": _compute_internal_forces_and_torques,
+        "_update_accelerations": _update_accelerations,
+        "_zeroed_out_external_forces_and_torques": _zeroed_out_external_forces_and_torques,
+    },
+)
+register_kernels(
+    __name__,
+    "numpy",
+    {
+        "_compute_internal_forces_and_torques": _compute_internal_forces_and_torques_numpy,
+        "_update_accelerations": _update_accelerations_numpy,
+        "_zeroed_out_external_forces_and_torques": _zeroed_out_external_forces_and_torques_numpy,
+    },
+)
+bind_kernels(globals())
@@ -1,8 +1,8 @@
 __doc__ = "Data structure wrapper for rod components"
 
 import numpy as np
-from elastica._rotations import _get_rotation_matrix, _rotate
-from elastica._linalg import _batch_matmul
+from elastica._rotations import _rotate_in_place
+from elastica._backends import register_kernels, bind_kernels
 
 
 # FIXME : Explicit Stepper doesn't work as States lose the
@@ -45,14 +45,20 @@ class _RodExplicitStepperMixin:
 
 class _RodSymplecticStepperMixin:
     def __init__(self):
+        # Memory blocks provide preallocated scratch buffers for the kernels
+        workspace = getattr(self, "workspace", None)
         self.kinematic_states = _KinematicState(
-            self.position_collection, self.director_collection
+            self.position_collection,
+            self.director_collection,
+            workspace,
+            getattr(self, "position_residual", None),
         )
         self.dynamic_states = _DynamicState(
             self.v_w_collection,
             self.dvdt_dwdt_collection,
             self.velocity_collection,
             self.omega_collection,
+            workspace,
         )
 
         # Expose rate returning functions in the interface
@@ -173,6 +179,37 @@ class _State:
         self.position_collection = position_collection_view
         self.director_collection = director_collection_view
         self.kinematic_rate_collection = kinematic_rate_collection_view
+        # Scratch buffers of the director rotations, allocated once per state
+        n_directors = director_collection_view.shape[2]
+        dtype = director_collection_view.dtype
+        self.vector_scratch_in_elements = np.empty((3, n_directors), dtype=dtype)
+        self.matrix_scratch_in_elements = np.empty((3, 3, n_directors), dtype=dtype)
+
+    def copy(self, out=None):
+        """Copies the state, in `out` if given.
+
+        Parameters
+        ----------
+        out : _State, optional
+            State of the same size the data is copied into, e.g. a stage
+            buffer of a time-stepper.
+
+        Returns
+        -------
+        state : `out`, or a new _State object with copied data
+
+        """
+        if out is None:
+            return _State(
+                self.n_nodes - 1,
+                self.position_collection.copy(),
+                self.director_collection.copy(),
+                self.kinematic_rate_collection.copy(),
+            )
+        np.copyto(out.position_collection, self.position_collection)
+        np.copyto(out.director_collection, self.director_collection)
+        np.copyto(out.kinematic_rate_collection, self.kinematic_rate_collection)
+        return out
 
     def __iadd__(self, scaled_deriv_array):
         """overloaded += operator
@@ -227,15 +264,12 @@ class _State:
         # TODO the scale factor 1.0 does not seem to be necessary, although
         # we perform more work in the present framework (muliply dt to entire vector, then take
         # norm) rather than vector norm then multiple by dt (1/3 operation costs)
-        # TODO optimize (somehow) extra copy away : if we don't make a copy
-        # its even more slower, maybe due to aliasing effects
-        np.einsum(
-            "ijk,jlk->ilk",
-            _get_rotation_matrix(
-                1.0, scaled_deriv_array[..., self.n_nodes : self.n_kinematic_rates]
-            ),
-            self.director_collection.copy(),
-            out=self.director_collection,
+        _rotate_in_place(
+            self.director_collection,
+            1.0,
+            scaled_deriv_array[..., self.n_nodes : self.n_kinematic_rates],
+            self.matrix_scratch_in_elements,
+            self.vector_scratch_in_elements,
         )
         # (v,ω) += (dv/dt, dω/dt)*dt
         self.kinematic_rate_collection += scaled_deriv_array[
@@ -265,27 +299,63 @@ class _State:
         method. This reflects the most common use-case in time-steppers
 
         """
-        # x += v*dt
-        position_collection = (
-            self.position_collection + scaled_derivative_state[..., : self.n_nodes]
+        return self.add(scaled_derivative_state)
+
+    def add(self, scaled_derivative_state, scale=1.0, out=None):
+        """self + scale * scaled_derivative_state, written into `out` if given.
+
+        Explicit steppers update the state of a system from the state at the
+        start of the step and the rates of the stages. Writing the update into
+        the state of the system keeps the views of the state on the system
+        data, and allocates no array.
+
+        Parameters
+        ----------
+        scaled_derivative_state : np.ndarray with dt * (v, ω, dv/dt, dω/dt)
+        ,as returned from _DerivativeState's __mul__ method
+        scale : float
+            Scale of `scaled_derivative_state`, e.g. 0.5 for the midpoint
+            stages of RungeKutta4.
+        out : _State, optional
+            State of the same size the result is written into. Must not
+            be `self`, use `+=` instead.
+
+        Returns
+        -------
+        state : `out`, or a new _State object with modified data (copied)
+
+        """
+        if out is None:
+            out = _State(
+                self.n_nodes - 1,
+                np.empty_like(self.position_collection),
+                np.empty_like(self.director_collection),
+                np.empty_like(self.kinematic_rate_collection),
+            )
+        # x = x_0 + scale * v*dt
+        np.multiply(
+            scale,
+            scaled_derivative_state[..., : self.n_nodes],
+            out=out.position_collection,
         )
+        out.position_collection += self.position_collection
         # Devs : see `_State.__iadd__` for reasons why we do matmul here
-        director_collection = _rotate(
-            self.director_collection,
-            1.0,
+        np.copyto(out.director_collection, self.director_collection)
+        _rotate_in_place(
+            out.director_collection,
+            scale,
             scaled_derivative_state[..., self.n_nodes : self.n_kinematic_rates],
+            self.matrix_scratch_in_elements,
+            self.vector_scratch_in_elements,
         )
-        # (v,ω) += (dv/dt, dω/dt)*dt
-        kinematic_rate_collection = (
-            self.kinematic_rate_collection
-            + scaled_derivative_state[..., self.n_kinematic_rates :]
-        )
-        return _State(
-            self.n_nodes - 1,
-            position_collection,
-            director_collection,
-            kinematic_rate_collection,
+        # (v,ω) = (v,ω)_0 + scale * (dv/dt, dω/dt)*dt
+        np.multiply(
+            scale,
+            scaled_derivative_state[..., self.n_kinematic_rates :],
+            out=out.kinematic_rate_collection,
         )
+        out.kinematic_rate_collection += self.kinematic_rate_collection
+        return out
 
 
 class _DerivativeState:
@@ -373,6 +443,23 @@ class _DerivativeState:
         """
         return self.__rmul__(scalar)
 
+    def scale(self, scalar, out=None):
+        """scalar * self, written into `out` if given
+
+        Parameters
+        ----------
+        scalar : float, typically dt (the time-step)
+        out : np.ndarray, optional
+            Array of the shape of the rates the result is written into, e.g.
+            a stage buffer of a time-stepper.
+
+        Returns
+        -------
+        output : np.ndarray containing (v*dt, ω*dt, dv/dt*dt, dω/dt*dt)
+
+        """
+        return np.multiply(scalar, self.rate_collection, out=out)
+
 
 """
 Symplectic stepper interface
@@ -389,17 +476,37 @@ class _KinematicState:
     only these methods are provided.
     """
 
-    def __init__(self, position_collection_view, director_collection_view):
+    def __init__(
+        self,
+        position_collection_view,
+        director_collection_view,
+        workspace=None,
+        position_residual=None,
+    ):
         """
         Parameters
         ----------
         position_collection_view : view of positions (or) x
         director_collection_view : view of directors (or) Q
+        workspace : MemoryBlockWorkspace, optional
+            Scratch buffers passed to `overload_operator_kinematic_numba`.
+        position_residual : np.ndarray, optional
+            Position increments lost to rounding, carried over to the next
+            update by `overload_operator_kinematic_numba`.
         """
         # super(_KinematicState, self).__init__()
 
         self.position_collection = position_collection_view
         self.director_collection = director_collection_view
+        self.position_residual = position_residual
+        if workspace is None:
+            self.vector_scratch_in_nodes = None
+            self.vector_scratch_in_elements = None
+            self.matrix_scratch_in_elements = None
+        else:
+            self.vector_scratch_in_nodes = workspace.vectors_in_nodes
+            self.vector_scratch_in_elements = workspace.vectors_in_elements
+            self.matrix_scratch_in_elements = workspace.matrices_in_elements
 
 
 def overload_operator_kinematic_numba(
@@ -409,6 +516,10 @@ def overload_operator_kinematic_numba(
     director_collection,
     velocity_collection,
     omega_collection,
+    vector_scratch_in_nodes=None,
+    vector_scratch_in_elements=None,
+    matrix_scratch_in_elements=None,
+    position_residual=None,
 ):
     """overloaded += operator
 
@@ -418,6 +529,18 @@ def overload_operator_kinematic_numba(
     ----------
     scaled_deriv_array : np.ndarray containing dt * (v, ω),
     as retured from _DynamicState's `kinematic_rates` method
+    vector_scratch_in_nodes : np.ndarray, optional
+        (n, 3, n_nodes) scratch buffers, see `MemoryBlockWorkspace`.
+    vector_scratch_in_elements : np.ndarray, optional
+        (n, 3, n_elems) scratch buffers, see `MemoryBlockWorkspace`.
+    matrix_scratch_in_elements : np.ndarray, optional
+        (n, 3, 3, n_elems) scratch buffers, see `MemoryBlockWorkspace`.
+    position_residual : np.ndarray, optional
+        (3, n_nodes) part of the position increments lost to rounding. If given,
+        positions are updated with a compensated sum: the lost part is added back
+        at the next update. Used by single precision memory blocks, where the
+        increments of slowly moving nodes are close to the rounding error of the
+        positions.
     Returns
     -------
     self : _KinematicState instance with inplace modified data
@@ -428,15 +551,80 @@ def overload_operator_kinematic_numba(
     method
     """
     # x += v*dt
-    for i in range(3):
-        for k in range(n_nodes):
-            position_collection[i, k] += prefac * velocity_collection[i, k]
-    rotation_matrix = _get_rotation_matrix(1.0, prefac * omega_collection)
-    director_collection[:] = _batch_matmul(rotation_matrix, director_collection)
+    if position_residual is None:
+        for i in range(3):
+            for k in range(n_nodes):
+                position_collection[i, k] += prefac * velocity_collection[i, k]
+    else:
+        for i in range(3):
+            for k in range(n_nodes):
+                increment = prefac * velocity_collection[i, k] + position_residual[i, k]
+                previous_position = position_collection[i, k]
+                position_collection[i, k] += increment
+                position_residual[i, k] = increment - (
+                    position_collection[i, k] - previous_position
+                )
+    # Q = exp(-ω dt) Q, using Rodrigues' formula
+    if matrix_scratch_in_elements is None:
+        _rotate_in_place(director_collection, prefac, omega_collection)
+    else:
+        _rotate_in_place(
+            director_collection,
+            prefac,
+            omega_collection,
+            matrix_scratch_in_elements[0],
+            vector_scratch_in_elements[0],
+        )
 
     return
 
 
+def _overload_operator_kinematic_numpy(
+    n_nodes,
+    prefac,
+    position_collection,
+    director_collection,
+    velocity_collection,
+    omega_collection,
+    vector_scratch_in_nodes=None,
+    vector_scratch_in_elements=None,
+    matrix_scratch_in_elements=None,
+    position_residual=None,
+):
+    """
+    Array-at-once version of `overload_operator_kinematic_numba`, see its
+    documentation.
+    """
+    # x += v*dt
+    if vector_scratch_in_nodes is None:
+        scaled_velocity = prefac * velocity_collection[:, :n_nodes]
+    else:
+        scaled_velocity = vector_scratch_in_nodes[0]
+        np.multiply(prefac, velocity_collection[:, :n_nodes], out=scaled_velocity)
+    if position_residual is None:
+        position_collection[:, :n_nodes] += scaled_velocity
+    else:
+        # Compensated sum, the residual ends up as
+        # increment - (new position - previous position)
+        scaled_velocity += position_residual
+        np.copyto(position_residual, position_collection[:, :n_nodes])
+        position_collection[:, :n_nodes] += scaled_velocity
+        position_residual -= position_collection[:, :n_nodes]
+        position_residual += scaled_velocity
+
+    # Q = exp(-ω dt) Q, using Rodrigues' formula
+    if matrix_scratch_in_elements is None:
+        _rotate_in_place(director_collection, prefac, omega_collection)
+    else:
+        _rotate_in_place(
+            director_collection,
+            prefac,
+            omega_collection,
+            matrix_scratch_in_elements[0],
+            vector_scratch_in_elements[0],
+        )
+
+
 class _DynamicState:
     """State storing (v,ω, dv/dt, dω/dt) for symplectic steppers.
 
@@ -453,6 +641,7 @@ class _DynamicState:
         dvdt_dwdt_collection,
         velocity_collection,
         omega_collection,
+        workspace=None,
     ):
         """
         Parameters
@@ -460,6 +649,8 @@ class _DynamicState:
         n_elems : int, number of rod elements
         rate_collection_view : np.ndarray containing (v, ω, dv/dt, dω/dt)
         v_w_collection : numpy.ndarray
+        workspace : MemoryBlockWorkspace, optional
+            If given, `dynamic_rates` writes into its preallocated buffer.
 
         """
         super(_DynamicState, self).__init__()
@@ -469,6 +660,9 @@ class _DynamicState:
         self.dvdt_dwdt_collection = dvdt_dwdt_collection
         self.velocity_collection = velocity_collection
         self.omega_collection = omega_collection
+        self.scaled_dvdt_dwdt_collection = (
+            None if workspace is None else workspace.scaled_dvdt_dwdt_collection
+        )
 
     def kinematic_rates(self, time, *args, **kwargs):
         """Yields kinematic rates to interact with _KinematicState
@@ -496,8 +690,14 @@ class _DynamicState:
         Doesn't return a _DynamicState with (dt*v, dt*w) as members,
         as one expects the _Dynamic __add__ operator to interact
         with another _DynamicState. This is done for efficiency purposes.
+        With a workspace, the returned array is a buffer overwritten by the next
+        call.
         """
-        return prefac * self.dvdt_dwdt_collection
+        if self.scaled_dvdt_dwdt_collection is None:
+            return prefac * self.dvdt_dwdt_collection
+        return np.multiply(
+            prefac, self.dvdt_dwdt_collection, out=self.scaled_dvdt_dwdt_collection
+        )
 
 
 def overload_operator_dynamic_numba(rate_collection, scaled_second_deriv_array):
@@ -524,3 +724,31 @@ def overload_operator_dynamic_numba(rate_collection, scaled_second_deriv_array):
             rate_collection[i, k] += scaled_second_deriv_array[i, k]
 
     return
+
+
+def _overload_operator_dynamic_numpy(rate_collection, scaled_second_deriv_array):
+    """
+    Array-at-once version of `overload_operator_dynamic_numba`, see its
+    documentation.
+    """
+    blocksize = scaled_second_deriv_array.shape[1]
+    rate_collection[:2, :blocksize] += scaled_second_deriv_array[:2]
+
+
+register_kernels(
+    __name__,
+    "reference",
+    {
+        "overload_operator_kinematic_numba": overload_operator_kinematic_numba,
+        "overload_operator_dynamic_numba": overload_operator_dynamic_numba,
+    },
+)
+register_kernels(
+    __name__,
+    "numpy",
+    {
+        "overload_operator_kinematic_numba": _overload_operator_kinematic_numpy,
+        "overload_operator_dynamic_numba": _overload_operator_dynamic_numpy,
+    },
+)
+bind_kernels(globals())
@@ -1,3 +1,4 @@
 __doc__ = """Surface classes"""
 from elastica.surface.surface_base import SurfaceBase
 from elastica.surface.plane import Plane
+from elastica.surface.mesh_surface import MeshSurface
@@ -0,0 +1,85 @@
+__doc__ = """Triangle mesh surface"""
+
+import numpy as np
+
+from elastica.surface.surface_base import SurfaceBase
+from elastica.collision.AABBCollection import AABBHierarchy, morton_order
+
+
+class MeshSurface(SurfaceBase):
+    """
+    Static surface made of the triangles of a mesh, i.e. a terrain loaded with
+    `elastica.mesh.Mesh`.
+
+        Attributes
+        ----------
+        faces: numpy.ndarray
+            3D (dim, 3, n_faces) array containing the vertices of the triangles.
+        face_normals: numpy.ndarray
+            2D (dim, n_faces) array containing the unit normals of the triangles,
+            pointing to the side of the surface systems are in contact with.
+        face_centers: numpy.ndarray
+            2D (dim, n_faces) array containing the centers of the triangles.
+        n_faces: int
+            Number of triangles.
+    """
+
+    def __init__(self, mesh):
+        """
+        Mesh surface initializer.
+
+        Parameters
+        ----------
+        mesh: elastica.mesh.Mesh
+            Triangle mesh. Any object with `faces` (dim, 3, n_faces) and
+            `face_normals` (dim, n_faces) arrays can be given.
+        """
+        faces = np.array(mesh.faces, dtype=np.float64)
+        if faces.ndim != 3 or faces.shape[:2] != (3, 3):
+            raise ValueError(
+                "Mesh surfaces are made of triangles, faces must be a "
+                "(3, 3, n_faces) array, got an array of shape {0}. Triangulate "
+                "the mesh first (e.g. with pyvista `triangulate()`).".format(
+                    faces.shape
+                )
+            )
+        face_normals = np.array(mesh.face_normals, dtype=np.float64)
+        self.faces = faces
+        self.face_normals = face_normals / np.linalg.norm(face_normals, axis=0)
+        self.face_centers = np.mean(faces, axis=1)
+        self.n_faces = faces.shape[-1]
+        self._aabb_hierarchies = {}
+
+    def aabb_hierarchy(self, faces_per_aabb: int = 4):
+        """
+        Returns the bounding volume hierarchy of the triangles, built on the
+        first call. The surface is static, so the hierarchy is never updated.
+
+        Triangles are sorted along a Morton curve before being grouped in
+        boxes, so that each box of the hierarchy holds neighbouring triangles.
+
+        Parameters
+        ----------
+        faces_per_aabb: int
+            Average number of triangles in the finest boxes of the hierarchy.
+
+        Returns
+        -------
+        hierarchy: AABBHierarchy
+            Hierarchy over the sorted triangles.
+        face_order: numpy.ndarray
+            1D (n_faces,) array, index of the triangle of each dof of the
+            hierarchy.
+        """
+        if faces_per_aabb not in self._aabb_hierarchies:
+            lower = np.min(self.faces, axis=1)
+            upper = np.max(self.faces, axis=1)
+            centers = 0.5 * (lower + upper)
+            face_order = morton_order(centers)
+            hierarchy = AABBHierarchy(
+                centers[:, face_order],
+                0.5 * (upper - lower)[:, face_order],
+                faces_per_aabb,
+            )
+            self._aabb_hierarchies[faces_per_aabb] = (hierarchy, face_order)
+        return self._aabb_hierarchies[faces_per_aabb]
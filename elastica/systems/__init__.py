@@ -62,7 +62,13 @@ def make_memory_for_explicit_stepper(stepper, system):
 
         memory_cls = MemoryRungeKutta4
     elif EulerForward in stepper.__class__.mro():
-        memory_cls = NotImplementedError
+
+        class MemoryEulerForward:
+            def __init__(self):
+                super(MemoryEulerForward, self).__init__()
+                self.k = None
+
+        memory_cls = MemoryEulerForward
     else:
         # TODO Memory allocation for other integrators
         raise NotImplementedError("Making memory for other types not supported")
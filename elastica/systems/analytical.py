@@ -54,6 +54,11 @@ class TestKinematicState:
             self.position_collection[:, k] = state[k]
             self.director_collection[:, :, k] = np.identity(3)
         self.n_nodes = state.shape[0]
+        # No preallocated scratch buffers for the kinematic update
+        self.vector_scratch_in_nodes = None
+        self.vector_scratch_in_elements = None
+        self.matrix_scratch_in_elements = None
+        self.position_residual = None
 
 
 class TestDynamicState:
@@ -308,6 +313,9 @@ class CollectiveSystem:
     def __iter__(self):
         return self._memory_blocks.__iter__()
 
+    def drift(self, kinematic_update, time, duration):
+        kinematic_update()
+
     def synchronize(self, time):
         pass
 
@@ -7,12 +7,14 @@ from elastica.timestepper.symplectic_steppers import (
     SymplecticStepperTag,
     PositionVerlet,
     PEFRL,
+    SemiImplicitPositionVerlet,
 )
 from elastica.timestepper.explicit_steppers import (
     ExplicitStepperTag,
     RungeKutta4,
     EulerForward,
 )
+from elastica.timestepper.adaptive import integrate_adaptive
 
 
 # TODO: Both extend_stepper_interface and integrate should be in separate file.
@@ -39,7 +41,20 @@ def extend_stepper_interface(Stepper, System):
             _SystemCollectionStepper,
             SymplecticStepperMethods as StepperMethodCollector,
         )
+
+        # Memory blocks of collections with a thread pool are stepped concurrently
+        if getattr(System, "_thread_pool", None) is not None:
+            from elastica.timestepper.symplectic_steppers import (
+                _ThreadPoolSystemCollectionStepper as _SystemCollectionStepper,
+            )
     elif type(ConcreteStepper.Tag) == ExplicitStepperTag:
+        if any(
+            getattr(block, "n_substeps", 1) > 1
+            for block in getattr(System, "_memory_blocks", ())
+        ):
+            raise NotImplementedError(
+                "Subcycled rods are only supported by symplectic steppers."
+            )
         from elastica.timestepper.explicit_steppers import (
             _SystemInstanceStepper,
             _SystemCollectionStepper,
@@ -63,6 +78,40 @@ def extend_stepper_interface(Stepper, System):
     return do_step_method, stepper_methods.step_methods()
 
 
+def compile_step_plan(do_step, Stepper, stages_and_updates, System, dt):
+    """
+    Returns the step of `System` by `dt`, as a callable taking and returning
+    the time. Symplectic steps of system collections are flattened once into
+    a plan of calls with evaluated prefactors (see `_SystemCollectionStepPlan`),
+    other steps call `do_step`.
+
+    Parameters
+    ----------
+    do_step :
+        Step method, as returned by `extend_stepper_interface`.
+    Stepper :
+        Stepper algorithm to use.
+    stages_and_updates :
+        Stages of the stepper, as returned by `extend_stepper_interface`.
+    System :
+        The elastica-system to simulate.
+    dt : float
+        Time step.
+    """
+    from elastica.timestepper.symplectic_steppers import (
+        _SystemCollectionStepper,
+        _SystemCollectionStepPlan,
+    )
+
+    if do_step is _SystemCollectionStepper.do_step:
+        return _SystemCollectionStepPlan(Stepper, stages_and_updates, System, dt)
+
+    def step(time):
+        return do_step(Stepper, stages_and_updates, System, time, dt)
+
+    return step
+
+
 # TODO Improve interface of this function to take args and kwargs for ease of use
 def integrate(
     StatefulStepper,
@@ -102,8 +151,9 @@ def integrate(
     dt = np.float64(float(final_time) / n_steps)
     time = restart_time
 
+    step = compile_step_plan(do_step, StatefulStepper, stages_and_updates, System, dt)
     for i in tqdm(range(n_steps), disable=(not progress_bar)):
-        time = do_step(StatefulStepper, stages_and_updates, System, time, dt)
+        time = step(time)
 
     print("Final time of simulation is : ", time)
     return time
@@ -0,0 +1,275 @@
+__doc__ = """Adaptive time stepping of symplectic steppers, with step doubling error control."""
+
+import numpy as np
+from tqdm import tqdm
+
+
+def integrate_adaptive(
+    StatefulStepper,
+    System,
+    final_time: float,
+    output_interval: float,
+    dt_min: float,
+    dt_max: float,
+    tolerance: float,
+    director_tolerance: float = 1e-6,
+    restart_time: float = 0.0,
+    progress_bar: bool = True,
+):
+    """
+    Integrates a system collection with a symplectic stepper and a time step
+    adapted to the motion of the systems, within `dt_min` and `dt_max`.
+
+    Each step is taken once with the time step, and again as two steps of
+    half of the time step. The difference of the positions and directors
+    reached by both, scaled by 1 / (2^p - 1) for a stepper of order p,
+    estimates the error of the two half steps, which are kept. Steps whose
+    error exceeds the tolerances are taken again with a smaller time step,
+    and the time step grows back while errors are small. Steps at `dt_min`
+    are kept whatever their error.
+
+    Callbacks are called at the output times, every `output_interval` from
+    `restart_time`, which steps land on exactly, with the index of the output
+    time as the current step. A callback with a `step_skip` of 1 collects
+    data at every output time.
+
+    Forcing and damping classes taking the time step (e.g.
+    `AnalyticalLinearDamper`) assume a fixed time step and should not be used
+    with adaptive time steps.
+
+    Parameters
+    ----------
+    StatefulStepper :
+        Symplectic stepper algorithm to use, e.g. PositionVerlet or PEFRL.
+    System :
+        The elastica-system collection to simulate.
+    final_time : float
+        Total simulation time.
+    output_interval : float
+        Time between two calls of the callbacks.
+    dt_min : float
+        Smallest time step.
+    dt_max : float
+        Largest time step.
+    tolerance : float
+        Error of the positions allowed per step.
+    director_tolerance : float
+        Error of the directors allowed per step. (default: 1e-6)
+    restart_time : float
+        The timestamp of the first integration step. (default: 0.0)
+    progress_bar : bool
+        Toggle the tqdm progress bar. (default: True)
+
+    Returns
+    -------
+    time : float
+        Final time of the simulation.
+    """
+    assert final_time > 0.0, "Final time is negative!"
+    assert output_interval > 0.0, "Output interval is negative!"
+
+    controller = _AdaptiveStepController(
+        StatefulStepper, System, dt_min, dt_max, tolerance, director_tolerance
+    )
+
+    time = np.float64(restart_time)
+    n_outputs = int(np.ceil(final_time / output_interval - 1e-9))
+    for i_output in tqdm(range(1, n_outputs + 1), disable=(not progress_bar)):
+        output_time = np.float64(
+            restart_time + min(i_output * output_interval, final_time)
+        )
+        while time < output_time:
+            time = controller.step(time, output_time)
+        System.apply_callbacks(time, round(time / output_interval))
+
+    statistics = controller.statistics()
+    print(
+        "Final time of simulation is : ",
+        time,
+        "in {0} steps ({1} rejected)".format(
+            statistics["accepted_steps"], statistics["rejected_steps"]
+        ),
+    )
+    return time
+
+
+class _AdaptiveStepController:
+    """
+    Adaptive time stepping private class, taking the steps of a system
+    collection with step doubling error control (see `integrate_adaptive`).
+
+    Steps are taken with the step plan of the collection (see
+    `_SystemCollectionStepPlan`), without callbacks, re-evaluated for each
+    time step. The state of the memory blocks (positions, directors,
+    velocities and angular velocities) is saved before each step, to take it
+    again.
+
+    Attributes
+    ----------
+    dt: float
+        Time step of the next step.
+    """
+
+    # Bounds of the change of the time step from one step to the next
+    safety_factor = 0.9
+    min_step_ratio = 0.2
+    max_step_ratio = 5.0
+
+    def __init__(
+        self,
+        StatefulStepper,
+        System,
+        dt_min: float,
+        dt_max: float,
+        tolerance: float,
+        director_tolerance: float,
+    ):
+        from elastica.timestepper import extend_stepper_interface
+        from elastica.timestepper.symplectic_steppers import (
+            SymplecticStepperTag,
+            _SystemCollectionStepper,
+            _SystemCollectionStepPlan,
+        )
+
+        if not 0.0 < dt_min <= dt_max:
+            raise ValueError(
+                "Time step bounds must satisfy 0 < dt_min <= dt_max, got dt_min={0}"
+                " and dt_max={1}".format(dt_min, dt_max)
+            )
+        if tolerance <= 0.0 or director_tolerance <= 0.0:
+            raise ValueError(
+                "Tolerances must be positive, got {0} and {1}".format(
+                    tolerance, director_tolerance
+                )
+            )
+
+        do_step, stages_and_updates = extend_stepper_interface(StatefulStepper, System)
+        if (
+            type(StatefulStepper.Tag) != SymplecticStepperTag
+            or do_step is not _SystemCollectionStepper.do_step
+        ):
+            raise NotImplementedError(
+                "Adaptive time stepping is only supported for symplectic steppers"
+                " over system collections without thread pool."
+            )
+
+        self._plan = _SystemCollectionStepPlan(
+            StatefulStepper, stages_and_updates, System, dt_min, apply_callbacks=False
+        )
+        # Error of the two half steps, from their difference with the full step
+        self._error_scale = 1.0 / (2.0 ** getattr(StatefulStepper, "order", 2) - 1.0)
+        self._error_exponent = 1.0 / (getattr(StatefulStepper, "order", 2) + 1.0)
+        self.dt_min = np.float64(dt_min)
+        self.dt_max = np.float64(dt_max)
+        self.dt = self.dt_min
+        self.tolerance = tolerance
+        self.director_tolerance = director_tolerance
+
+        self._states = [_block_state(block) for block in System._memory_blocks]
+        self._start_states = [
+            [array.copy() for array in state] for state in self._states
+        ]
+        self._full_step_states = [
+            [array.copy() for array in state] for state in self._states
+        ]
+
+        self._n_accepted_steps = 0
+        self._n_rejected_steps = 0
+        self._smallest_step = np.inf
+        self._largest_step = 0.0
+
+    def step(self, time: np.float64, end_time: np.float64) -> np.float64:
+        """
+        Takes a step from `time`, not beyond `end_time`, retaking it with a
+        smaller time step until its error is within the tolerances.
+
+        Returns
+        -------
+        time: float
+            Time reached, `end_time` if the step reached it.
+        """
+        _copy_states(self._states, self._start_states)
+        while True:
+            dt = min(self.dt, end_time - time)
+            reaches_end_time = dt == end_time - time
+
+            self._plan.set_time_step(dt)
+            self._plan(time)
+            _copy_states(self._states, self._full_step_states)
+            _copy_states(self._start_states, self._states)
+
+            self._plan.set_time_step(0.5 * dt)
+            new_time = self._plan(self._plan(time))
+            error = self._error()
+
+            ratio = (
+                self.min_step_ratio
+                if not np.isfinite(error)
+                else min(
+                    max(
+                        self.safety_factor
+                        * max(error, 1e-10) ** (-self._error_exponent),
+                        self.min_step_ratio,
+                    ),
+                    self.max_step_ratio,
+                )
+            )
+            if error <= 1.0 or dt <= self.dt_min:
+                self._n_accepted_steps += 1
+                self._smallest_step = min(self._smallest_step, dt)
+                self._largest_step = max(self._largest_step, dt)
+                # Steps cut short by end_time do not shrink the next step
+                if not reaches_end_time or ratio > 1.0:
+                    self.dt = min(max(ratio * dt, self.dt_min), self.dt_max)
+                return end_time if reaches_end_time else new_time
+
+            self._n_rejected_steps += 1
+            self.dt = max(ratio * dt, self.dt_min)
+            _copy_states(self._start_states, self._states)
+
+    def statistics(self) -> dict:
+        """
+        Returns the number of accepted and rejected steps, and the smallest and
+        largest accepted time steps.
+        """
+        return {
+            "accepted_steps": self._n_accepted_steps,
+            "rejected_steps": self._n_rejected_steps,
+            "smallest_step": self._smallest_step,
+            "largest_step": self._largest_step,
+        }
+
+    def _error(self) -> float:
+        # Largest error of the positions and directors of the half steps,
+        # relative to their tolerances
+        error = 0.0
+        for state, full_step_state in zip(self._states, self._full_step_states):
+            position_error = np.max(np.abs(state[0] - full_step_state[0]), initial=0.0)
+            director_error = np.max(np.abs(state[1] - full_step_state[1]), initial=0.0)
+            error = max(
+                error,
+                self._error_scale * position_error / self.tolerance,
+                self._error_scale * director_error / self.director_tolerance,
+            )
+            if not np.isfinite(error):
+                return np.inf
+        return error
+
+
+def _block_state(block) -> list:
+    # Arrays of the state of a memory block advanced by the steppers
+    state = [
+        block.position_collection,
+        block.director_collection,
+        block.velocity_collection,
+        block.omega_collection,
+    ]
+    if getattr(block, "position_residual", None) is not None:
+        state.append(block.position_residual)
+    return state
+
+
+def _copy_states(sources, destinations) -> None:
+    for source, destination in zip(sources, destinations):
+        for source_array, destination_array in zip(source, destination):
+            destination_array[...] = source_array
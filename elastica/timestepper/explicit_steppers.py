@@ -2,6 +2,8 @@ __doc__ = """Explicit timesteppers  and concepts"""
 import numpy as np
 from copy import copy
 
+from elastica.rod.data_structures import _State, _DerivativeState
+
 
 """
 Developer Note
@@ -189,6 +191,49 @@ class StatefulLinearExponentialIntegrator(_StatefulStepper):
 """
 
 
+def _copy_state(state, out=None):
+    """
+    Returns a copy of `state`, copied into the stage buffer `out` once it has
+    been allocated. States that are not arrays, e.g. scalars, are copied.
+    """
+    if isinstance(state, _State):
+        return state.copy(out)
+    if isinstance(state, np.ndarray):
+        if out is None:
+            return state.copy()
+        np.copyto(out, state)
+        return out
+    return copy(state)
+
+
+def _scale_rates(scalar, rates, out=None):
+    """
+    Returns `scalar * rates`, written into the stage buffer `out` once it has
+    been allocated.
+    """
+    if isinstance(rates, _DerivativeState):
+        return rates.scale(scalar, out)
+    if isinstance(rates, np.ndarray):
+        return np.multiply(scalar, rates, out=out)
+    return scalar * rates
+
+
+def _update_state(System, initial_state, scale, scaled_rates):
+    """
+    Sets the state of `System` to `initial_state + scale * scaled_rates`. States
+    that are arrays are overwritten in place, so that they keep sharing memory
+    with the system.
+    """
+    state = System.state
+    if isinstance(state, _State):
+        initial_state.add(scaled_rates, scale, state)
+    elif isinstance(state, np.ndarray):
+        np.multiply(scale, scaled_rates, out=state)
+        state += initial_state
+    else:
+        System.state = initial_state + scale * scaled_rates
+
+
 class ExplicitStepperTag:
     def __init__(self):
         pass
@@ -198,6 +243,10 @@ class RungeKutta4:
     """
     Stateless runge-kutta4. coordinates operations only, memory needs
     to be externally managed and allocated.
+
+    The initial state and the stage rates k_1, ..., k_4 are kept in `Memory`,
+    allocated on the first step and overwritten in place by later steps. The
+    state of the system is updated in place.
     """
 
     Tag = ExplicitStepperTag()
@@ -209,43 +258,63 @@ class RungeKutta4:
     # discovery in ExplicitStepper, these are bound to the RungeKutta4 class
     # For automatic discovery, the order of declaring stages here is very important
     def _first_stage(self, System, Memory, time: np.float64, dt: np.float64):
-        Memory.initial_state = copy(System.state)
-        Memory.k_1 = dt * System(time, dt)  # Don't update state yet
+        Memory.initial_state = _copy_state(
+            System.state, getattr(Memory, "initial_state", None)
+        )
+        Memory.k_1 = _scale_rates(
+            dt, System(time, dt), getattr(Memory, "k_1", None)
+        )  # Don't update state yet
 
     def _first_update(self, System, Memory, time: np.float64, dt: np.float64):
         # prepare for next stage
-        System.state = Memory.initial_state + 0.5 * Memory.k_1
+        _update_state(System, Memory.initial_state, 0.5, Memory.k_1)
         return time + 0.5 * dt
 
     def _second_stage(self, System, Memory, time: np.float64, dt: np.float64):
-        Memory.k_2 = dt * System(time, dt)  # Don't update state yet
+        Memory.k_2 = _scale_rates(
+            dt, System(time, dt), getattr(Memory, "k_2", None)
+        )  # Don't update state yet
 
     def _second_update(self, System, Memory, time: np.float64, dt: np.float64):
         # prepare for next stage
-        System.state = Memory.initial_state + 0.5 * Memory.k_2
+        _update_state(System, Memory.initial_state, 0.5, Memory.k_2)
         return time
 
     def _third_stage(self, System, Memory, time: np.float64, dt: np.float64):
-        Memory.k_3 = dt * System(time, dt)  # Don't update state yet
+        Memory.k_3 = _scale_rates(
+            dt, System(time, dt), getattr(Memory, "k_3", None)
+        )  # Don't update state yet
 
     def _third_update(self, System, Memory, time: np.float64, dt: np.float64):
         # prepare for next stage
-        System.state = Memory.initial_state + Memory.k_3
+        _update_state(System, Memory.initial_state, 1.0, Memory.k_3)
         return time + 0.5 * dt
 
     def _fourth_stage(self, System, Memory, time: np.float64, dt: np.float64):
-        Memory.k_4 = dt * System(time, dt)  # Don't update state yet
+        Memory.k_4 = _scale_rates(
+            dt, System(time, dt), getattr(Memory, "k_4", None)
+        )  # Don't update state yet
 
     def _fourth_update(self, System, Memory, time: np.float64, dt: np.float64):
-        # prepare for next stage
-        System.state = (
-            Memory.initial_state
-            + (Memory.k_1 + 2.0 * Memory.k_2 + 2.0 * Memory.k_3 + Memory.k_4) / 6.0
-        )
+        # (k_1 + 2 k_2 + 2 k_3 + k_4) / 6, summed in the stage buffers
+        # in the same order as the formula
+        increment = Memory.k_1
+        Memory.k_2 *= 2.0
+        increment += Memory.k_2
+        Memory.k_3 *= 2.0
+        increment += Memory.k_3
+        increment += Memory.k_4
+        increment /= 6.0
+        _update_state(System, Memory.initial_state, 1.0, increment)
         return time
 
 
 class EulerForward:
+    """
+    Forward Euler. The scaled rates are kept in `Memory`, allocated on the
+    first step and overwritten in place by later steps.
+    """
+
     Tag = ExplicitStepperTag()
 
     def __init__(self):
@@ -255,5 +324,6 @@ class EulerForward:
         pass
 
     def _first_update(self, System, Memory, time, dt):
-        System.state += dt * System(time, dt)
+        Memory.k = _scale_rates(dt, System(time, dt), getattr(Memory, "k", None))
+        System.state += Memory.k
         return time + dt
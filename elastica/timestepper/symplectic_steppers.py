@@ -1,6 +1,9 @@
 __doc__ = """Symplectic time steppers and concepts for integrating the kinematic and dynamic equations of rod-like objects.  """
 
+from functools import partial
+
 import numpy as np
+from scipy.linalg import solveh_banded
 
 # from elastica._elastica_numba._timestepper._symplectic_steppers import (
 #     SymplecticStepperTag,
@@ -26,6 +29,13 @@ is referred to the same section on `explicit_steppers.py`.
 """
 
 
+def _kinematic_update(kin_step, TimeStepper, systems, time, dt, subcycled_steps=()):
+    for system in systems:
+        kin_step(TimeStepper, system, time, dt)
+    for subcycled_step in subcycled_steps:
+        subcycled_step(time, dt)
+
+
 class _SystemInstanceStepper:
     @staticmethod
     def do_step(
@@ -71,9 +81,25 @@ class _SystemCollectionStepper:
         -------
 
         """
+        memory_blocks, subcycled_blocks = _split_subcycled_blocks(SystemCollection)
+
         for kin_prefactor, kin_step, dyn_step in _steps_and_prefactors[:-1]:
-            for system in SystemCollection._memory_blocks:
-                kin_step(TimeStepper, system, time, dt)
+            SystemCollection.drift(
+                partial(
+                    _kinematic_update,
+                    kin_step,
+                    TimeStepper,
+                    memory_blocks,
+                    time,
+                    dt,
+                    [
+                        partial(block.kinematic_step, kin_prefactor, TimeStepper)
+                        for block in subcycled_blocks
+                    ],
+                ),
+                time,
+                kin_prefactor(TimeStepper, dt),
+            )
 
             time += kin_prefactor(TimeStepper, dt)
 
@@ -88,8 +114,10 @@ class _SystemCollectionStepper:
             # Add external forces, controls etc.
             SystemCollection.synchronize(time)
 
-            for system in SystemCollection._memory_blocks:
+            for system in memory_blocks:
                 dyn_step(TimeStepper, system, time, dt)
+            for block in subcycled_blocks:
+                block.dynamic_step(dyn_step, TimeStepper, time, dt)
 
             # Constrain only rates
             SystemCollection.constrain_rates(time)
@@ -98,8 +126,22 @@ class _SystemCollectionStepper:
         last_kin_prefactor = _steps_and_prefactors[-1][0]
         last_kin_step = _steps_and_prefactors[-1][1]
 
-        for system in SystemCollection._memory_blocks:
-            last_kin_step(TimeStepper, system, time, dt)
+        SystemCollection.drift(
+            partial(
+                _kinematic_update,
+                last_kin_step,
+                TimeStepper,
+                memory_blocks,
+                time,
+                dt,
+                [
+                    partial(block.kinematic_step, last_kin_prefactor, TimeStepper)
+                    for block in subcycled_blocks
+                ],
+            ),
+            time,
+            last_kin_prefactor(TimeStepper, dt),
+        )
         time += last_kin_prefactor(TimeStepper, dt)
         SystemCollection.constrain_values(time)
 
@@ -113,6 +155,328 @@ class _SystemCollectionStepper:
         return time
 
 
+class _SystemCollectionStepPlan:
+    """
+    Step of `_SystemCollectionStepper.do_step` compiled for a given stepper,
+    system collection and time step, as used by `integrate`.
+
+    The stages are flattened once into lists of calls: the prefactors of the
+    kinematic steps are evaluated for the time step, the steps of the stepper
+    are bound to the memory blocks, and the features of the collection are
+    called directly, instead of through the methods of the collection. Calls
+    and their order are the same as those of `do_step`, so that the plan
+    steps the collection exactly as `do_step` does.
+
+    Attributes
+    ----------
+    dt: float
+        Time step of the plan.
+    """
+
+    def __init__(
+        self,
+        TimeStepper,
+        _steps_and_prefactors,
+        SystemCollection,
+        dt,
+        apply_callbacks: bool = True,
+    ):
+        self._time_stepper = TimeStepper
+        self._system_collection = SystemCollection
+        memory_blocks, subcycled_blocks = _split_subcycled_blocks(SystemCollection)
+        self._kin_prefactors = tuple(
+            kin_prefactor for kin_prefactor, _, _ in _steps_and_prefactors
+        )
+        self._steps = tuple(
+            (
+                tuple(
+                    partial(kin_step, TimeStepper, system) for system in memory_blocks
+                )
+                + tuple(
+                    partial(block.kinematic_step, kin_prefactor, TimeStepper)
+                    for block in subcycled_blocks
+                ),
+                tuple(
+                    partial(dyn_step, TimeStepper, system) for system in memory_blocks
+                )
+                + tuple(
+                    partial(block.dynamic_step, dyn_step, TimeStepper)
+                    for block in subcycled_blocks
+                ),
+            )
+            for kin_prefactor, kin_step, dyn_step in _steps_and_prefactors
+        )
+        self.set_time_step(dt)
+        self._internal_forces_and_torques_updates = tuple(
+            system.update_internal_forces_and_torques
+            for system in SystemCollection._memory_blocks
+        )
+        self._external_forces_and_torques_resets = tuple(
+            system.reset_external_forces_and_torques
+            for system in SystemCollection._memory_blocks
+        )
+        # Feature groups are fixed once the collection is finalized
+        self._drift = getattr(SystemCollection, "_feature_group_drift", None)
+        self._constrain_values = _features(SystemCollection, "constrain_values")
+        self._synchronize = _features(SystemCollection, "synchronize")
+        self._constrain_rates = _features(SystemCollection, "constrain_rates")
+        self._callbacks = (
+            _features(SystemCollection, "callback", SystemCollection.apply_callbacks)
+            if apply_callbacks
+            else ()
+        )
+
+    def set_time_step(self, dt) -> None:
+        """
+        Evaluates the prefactors of the plan for the time step `dt`.
+        """
+        self.dt = dt
+        self._stages = tuple(
+            (kin_prefactor(self._time_stepper, dt), kin_steps, dyn_steps)
+            for kin_prefactor, (kin_steps, dyn_steps) in zip(
+                self._kin_prefactors, self._steps
+            )
+        )
+
+    def __call__(self, time: np.float64) -> np.float64:
+        """
+        Steps the collection from `time` by the time step of the plan.
+
+        Parameters
+        ----------
+        time: float
+
+        Returns
+        -------
+        time: float
+        """
+        dt = self.dt
+        for kin_prefactor, kin_steps, dyn_steps in self._stages[:-1]:
+            self._kinematic_update(kin_steps, time, kin_prefactor)
+            time += kin_prefactor
+
+            for feature in self._constrain_values:
+                feature(time)
+            for update in self._internal_forces_and_torques_updates:
+                update(time)
+            for feature in self._synchronize:
+                feature(time)
+            for dyn_step in dyn_steps:
+                dyn_step(time, dt)
+            for feature in self._constrain_rates:
+                feature(time)
+
+        last_kin_prefactor, last_kin_steps, _ = self._stages[-1]
+        self._kinematic_update(last_kin_steps, time, last_kin_prefactor)
+        time += last_kin_prefactor
+        for feature in self._constrain_values:
+            feature(time)
+
+        if self._callbacks:
+            current_step = round(time / dt)
+            for feature in self._callbacks:
+                feature(time, current_step)
+
+        for reset in self._external_forces_and_torques_resets:
+            reset(time)
+
+        return time
+
+    def _kinematic_update(self, kin_steps, time, duration) -> None:
+        if self._drift is None or self._drift:
+            self._system_collection.drift(
+                partial(_apply_kinematic_steps, kin_steps, time, self.dt),
+                time,
+                duration,
+            )
+            return
+        dt = self.dt
+        for kin_step in kin_steps:
+            kin_step(time, dt)
+
+
+def _split_subcycled_blocks(SystemCollection):
+    # Memory blocks stepped once per step, and subcycled memory blocks
+    memory_blocks = []
+    subcycled_blocks = []
+    for block in SystemCollection._memory_blocks:
+        if getattr(block, "n_substeps", 1) > 1:
+            subcycled_blocks.append(_SubcycledBlock(block, SystemCollection))
+        else:
+            memory_blocks.append(block)
+    return memory_blocks, subcycled_blocks
+
+
+class _SubcycledBlock:
+    """
+    Memory block stepped with `n_substeps` substeps per step of the collection
+    (see `BaseSystemCollection.subcycle`).
+
+    The kinematic steps of the stepper move the block with substeps of
+    position Verlet under its internal forces and torques only, enforcing the
+    boundary conditions of its rods at each substep. The dynamic steps of the
+    stepper apply the external forces and torques of the block only, which
+    are then zeroed, so that they are not applied again by the substeps.
+    """
+
+    def __init__(self, block, SystemCollection):
+        self.block = block
+        self.n_substeps = block.n_substeps
+        n_systems = len(SystemCollection)
+        sys_indices = {int(sys_idx) for sys_idx in block.system_idx_list}
+        sys_indices.add(SystemCollection._get_sys_idx_if_valid(block) % n_systems)
+        self._constraints = [
+            (SystemCollection[sys_idx], constraint)
+            for sys_idx, constraint in getattr(SystemCollection, "_constraints", ())
+            if sys_idx % n_systems in sys_indices
+        ]
+        self._substepper = PositionVerlet()
+
+    def kinematic_step(self, kin_prefactor, TimeStepper, time, dt) -> None:
+        block = self.block
+        substepper = self._substepper
+        # Substeps of at most dt / n_substeps
+        duration = kin_prefactor(TimeStepper, dt)
+        n_substeps = max(int(np.ceil(abs(duration) / dt * self.n_substeps - 1e-9)), 1)
+        substep = duration / n_substeps
+        for _ in range(n_substeps):
+            substepper._first_kinematic_step(block, time, substep)
+            time += 0.5 * substep
+            self._constrain_values(time)
+            block.update_internal_forces_and_torques(time)
+            substepper._first_dynamic_step(block, time, substep)
+            self._constrain_rates(time)
+            substepper._first_kinematic_step(block, time, substep)
+            time += 0.5 * substep
+            self._constrain_values(time)
+
+    def dynamic_step(self, dyn_step, TimeStepper, time, dt) -> None:
+        block = self.block
+        block.internal_forces[...] = 0.0
+        block.internal_torques[...] = 0.0
+        dyn_step(TimeStepper, block, time, dt)
+        block.reset_external_forces_and_torques(time)
+
+    def _constrain_values(self, time) -> None:
+        for system, constraint in self._constraints:
+            constraint.constrain_values(system, time)
+
+    def _constrain_rates(self, time) -> None:
+        for system, constraint in self._constraints:
+            constraint.constrain_rates(system, time)
+
+
+def _features(SystemCollection, group, method=None):
+    # Features of a group of the collection, or the method of the collection
+    # calling them for collections without feature groups
+    features = getattr(SystemCollection, "_feature_group_" + group, None)
+    if features is None:
+        return [method or getattr(SystemCollection, group)]
+    return features
+
+
+def _apply_kinematic_steps(kin_steps, time, dt):
+    for kin_step in kin_steps:
+        kin_step(time, dt)
+
+
+class _ThreadPoolSystemCollectionStepper:
+    """
+    Symplectic stepper collection class, stepping the memory blocks of the
+    collection concurrently on its thread pool (see
+    `BaseSystemCollection.use_thread_pool`).
+
+    Memory blocks split into chunks are updated chunk by chunk, except for the
+    dynamic update, which works on the rate collection of the whole block (the
+    accelerations of the block are computed chunk by chunk).
+    """
+
+    @staticmethod
+    def do_step(
+        TimeStepper,
+        _steps_and_prefactors,
+        SystemCollection,
+        time: np.float64,
+        dt: np.float64,
+    ):
+        """
+        Function for doing symplectic stepper over the user defined rods (system),
+        with the same stages as `_SystemCollectionStepper.do_step`.
+
+        Parameters
+        ----------
+        SystemCollection: rod object
+        time: float
+        dt: float
+
+        Returns
+        -------
+
+        """
+        thread_pool = SystemCollection._thread_pool
+        memory_blocks = SystemCollection._memory_blocks
+        memory_block_chunks = SystemCollection._memory_block_chunks
+
+        for kin_prefactor, kin_step, dyn_step in _steps_and_prefactors[:-1]:
+            SystemCollection.drift(
+                partial(
+                    thread_pool.map,
+                    lambda system: kin_step(TimeStepper, system, time, dt),
+                    memory_block_chunks,
+                ),
+                time,
+                kin_prefactor(TimeStepper, dt),
+            )
+
+            time += kin_prefactor(TimeStepper, dt)
+
+            # Constrain only values
+            SystemCollection.constrain_values(time)
+
+            # We need internal forces and torques because they are used by interaction module.
+            thread_pool.map(
+                lambda system: system.update_internal_forces_and_torques(time),
+                memory_block_chunks,
+            )
+
+            # Add external forces, controls etc.
+            SystemCollection.synchronize(time)
+
+            thread_pool.map(
+                lambda system: dyn_step(TimeStepper, system, time, dt), memory_blocks
+            )
+
+            # Constrain only rates
+            SystemCollection.constrain_rates(time)
+
+        # Peel the last kinematic step and prefactor alone
+        last_kin_prefactor = _steps_and_prefactors[-1][0]
+        last_kin_step = _steps_and_prefactors[-1][1]
+
+        SystemCollection.drift(
+            partial(
+                thread_pool.map,
+                lambda system: last_kin_step(TimeStepper, system, time, dt),
+                memory_block_chunks,
+            ),
+            time,
+            last_kin_prefactor(TimeStepper, dt),
+        )
+        time += last_kin_prefactor(TimeStepper, dt)
+        SystemCollection.constrain_values(time)
+
+        # Call back function, will call the user defined call back functions and store data
+        SystemCollection.apply_callbacks(time, round(time / dt))
+
+        # Zero out the external forces and torques
+        thread_pool.map(
+            lambda system: system.reset_external_forces_and_torques(time),
+            memory_block_chunks,
+        )
+
+        return time
+
+
 class SymplecticStepperMethods:
     def __init__(self, timestepper_instance):
         take_methods_from = timestepper_instance
@@ -210,6 +574,8 @@ class PositionVerlet:
     """
 
     Tag = SymplecticStepperTag()
+    # Order of accuracy, used by adaptive time stepping
+    order = 2
 
     def __init__(self):
         pass
@@ -227,6 +593,10 @@ class PositionVerlet:
             System.kinematic_states.director_collection,
             System.velocity_collection,
             System.omega_collection,
+            System.kinematic_states.vector_scratch_in_nodes,
+            System.kinematic_states.vector_scratch_in_elements,
+            System.kinematic_states.matrix_scratch_in_elements,
+            System.kinematic_states.position_residual,
         )
 
     def _first_dynamic_step(self, System, time: np.float64, dt: np.float64):
@@ -253,6 +623,7 @@ class PEFRL:
     xi_chi_dash_coeff = 1.0 - 2.0 * (ξ + χ)
 
     Tag = SymplecticStepperTag()
+    order = 4
 
     def __init__(self):
         pass
@@ -269,6 +640,10 @@ class PEFRL:
             System.kinematic_states.director_collection,
             System.velocity_collection,
             System.omega_collection,
+            System.kinematic_states.vector_scratch_in_nodes,
+            System.kinematic_states.vector_scratch_in_elements,
+            System.kinematic_states.matrix_scratch_in_elements,
+            System.kinematic_states.position_residual,
         )
         # System.kinematic_states += prefac * System.kinematic_rates(time, prefac)
 
@@ -292,6 +667,10 @@ class PEFRL:
             System.kinematic_states.director_collection,
             System.velocity_collection,
             System.omega_collection,
+            System.kinematic_states.vector_scratch_in_nodes,
+            System.kinematic_states.vector_scratch_in_elements,
+            System.kinematic_states.matrix_scratch_in_elements,
+            System.kinematic_states.position_residual,
         )
         # System.kinematic_states += prefac * System.kinematic_rates(time, prefac)
 
@@ -316,5 +695,192 @@ class PEFRL:
             System.kinematic_states.director_collection,
             System.velocity_collection,
             System.omega_collection,
+            System.kinematic_states.vector_scratch_in_nodes,
+            System.kinematic_states.vector_scratch_in_elements,
+            System.kinematic_states.matrix_scratch_in_elements,
+            System.kinematic_states.position_residual,
         )
         # System.kinematic_states += prefac * System.kinematic_rates(time, prefac)
+
+
+class SemiImplicitPositionVerlet:
+    """
+    Implicit-explicit (IMEX) position Verlet time stepper class, for rods
+    whose time step is limited by their shear and stretch stiffness, e.g.
+    nearly inextensible rods.
+
+    The kinematic steps are those of position Verlet. In the dynamic step, the
+    shear and stretch forces and torques of the rods, linearised around the
+    current configuration, are evaluated implicitly at the average of the
+    positions and directors before and after the step (implicit midpoint).
+    Their stiffness couples the velocities of the nodes and the angular
+    velocities of the elements of a rod, ordered node, element, node, ..., in
+    a banded system solved at each step. Bending, twist and all other forces
+    and torques are explicit, so that the time step is limited by the bending
+    and twist stiffness only.
+
+    Rigid bodies are stepped as with position Verlet. Ring rods are not
+    supported.
+    """
+
+    Tag = SymplecticStepperTag()
+    # Order of accuracy, used by adaptive time stepping
+    order = 2
+
+    def __init__(self):
+        pass
+
+    def _first_prefactor(self, dt):
+        return 0.5 * dt
+
+    def _first_kinematic_step(self, System, time: np.float64, dt: np.float64):
+        prefac = self._first_prefactor(dt)
+
+        overload_operator_kinematic_numba(
+            System.n_nodes,
+            prefac,
+            System.kinematic_states.position_collection,
+            System.kinematic_states.director_collection,
+            System.velocity_collection,
+            System.omega_collection,
+            System.kinematic_states.vector_scratch_in_nodes,
+            System.kinematic_states.vector_scratch_in_elements,
+            System.kinematic_states.matrix_scratch_in_elements,
+            System.kinematic_states.position_residual,
+        )
+
+    def _first_dynamic_step(self, System, time: np.float64, dt: np.float64):
+        if not hasattr(System, "shear_matrix"):
+            overload_operator_dynamic_numba(
+                System.dynamic_states.rate_collection,
+                System.dynamic_rates(time, dt),
+            )
+            return
+        if getattr(System, "ring_rod_flag", False):
+            raise NotImplementedError(
+                "Ring rods are not supported by SemiImplicitPositionVerlet."
+            )
+        System.update_accelerations(time)
+        _implicit_shear_stretch_update(System, dt)
+
+
+# Upper triangle of the 9 x 9 block of an element, over the velocity of its
+# first node, its angular velocity and the velocity of its second node.
+_ELEMENT_BLOCK_ROWS, _ELEMENT_BLOCK_COLS = np.triu_indices(9)
+_INERTIA_BLOCK_ROWS, _INERTIA_BLOCK_COLS = np.triu_indices(3)
+
+
+def _implicit_shear_stretch_update(System, dt) -> None:
+    """
+    Updates the velocities and angular velocities of the rods of `System` by
+    `dt` times their accelerations, with the shear and stretch forces and
+    torques evaluated at the implicit midpoint (see
+    `SemiImplicitPositionVerlet`).
+
+    The shear and stretch strain of element k, sigma = Q (x_{k+1} - x_k) / l
+    - d3, changes by Q u / l, with u = dx_{k+1} - dx_k + [x_{k+1} - x_k]x Q^T
+    dtheta for displacements dx of the nodes and rotations dtheta of the
+    element in its frame. Its force changes by K u, with K = Q^T S Q / (l e),
+    so that the stiffness of the element over (dx_k, dtheta, dx_{k+1}) is
+    B^T K B, with B = [-I, [x_{k+1} - x_k]x Q^T, I]. The changes of the rates
+    solve (M + dt^2 / 4 H) (dv, domega) = dt M (a, alpha), for the mass and
+    inertia M and the stiffness H of the rods.
+
+    Ghost nodes and elements of memory blocks are decoupled and updated
+    explicitly. The components of the velocities of nodes constrained by
+    boundary conditions, which are in the lab frame as the selectors of the
+    constraints, are decoupled and held. Elements whose rotations are fully
+    constrained are decoupled and held, while elements whose rotations are
+    constrained around some axes only are decoupled and updated explicitly,
+    their rates being then constrained as after an explicit step.
+    """
+    n_nodes = System.n_nodes
+    n_elems = n_nodes - 1
+    n_dofs = 6 * n_nodes - 3
+
+    ghost_nodes = np.zeros(n_nodes, dtype=bool)
+    ghost_nodes[getattr(System, "ghost_nodes_idx", [])] = True
+    ghost_elems = np.zeros(n_elems, dtype=bool)
+    ghost_elems[getattr(System, "ghost_elems_idx", [])] = True
+    held_node_dofs = np.zeros((n_nodes, 3), dtype=bool)
+    held_node_dofs[getattr(System, "constrained_nodes_idx", [])] = getattr(
+        System, "constrained_nodes_selector", np.zeros((0, 3), dtype=bool)
+    )
+    elems_selector = np.zeros((n_elems, 3), dtype=bool)
+    elems_selector[getattr(System, "constrained_elems_idx", [])] = getattr(
+        System, "constrained_elems_selector", np.zeros((0, 3), dtype=bool)
+    )
+    held_elems = elems_selector.all(axis=1)
+    decoupled_node_dofs = ghost_nodes[:, None] | held_node_dofs
+    decoupled_elems = ghost_elems | elems_selector.any(axis=1)
+
+    # Stiffness of the shear and stretch strains of the elements, in the lab frame
+    directors = System.director_collection.transpose(2, 0, 1).astype(np.float64)
+    shear_matrix = System.shear_matrix.transpose(2, 0, 1)
+    scale = np.where(
+        ghost_elems, 0.0, 0.25 * dt**2 / (System.rest_lengths * System.dilatation)
+    )
+    stiffness = (np.swapaxes(directors, 1, 2) @ shear_matrix @ directors) * scale[
+        :, None, None
+    ]
+    # Change of the shear and stretch strains with the rotation of the elements
+    tangents = np.diff(System.position_collection, axis=1).T
+    rotation = np.swapaxes(np.cross(tangents[:, None, :], directors), 1, 2)
+    stiffness_rotation = stiffness @ rotation
+
+    element_blocks = np.empty((n_elems, 9, 9))
+    element_blocks[:, 0:3, 0:3] = stiffness
+    element_blocks[:, 0:3, 3:6] = -stiffness_rotation
+    element_blocks[:, 0:3, 6:9] = -stiffness
+    element_blocks[:, 3:6, 3:6] = np.swapaxes(rotation, 1, 2) @ stiffness_rotation
+    element_blocks[:, 3:6, 6:9] = np.swapaxes(stiffness_rotation, 1, 2)
+    element_blocks[:, 6:9, 6:9] = stiffness
+    coupled = ~np.concatenate(
+        (
+            decoupled_node_dofs[:-1],
+            np.repeat(decoupled_elems[:, None], 3, axis=1),
+            decoupled_node_dofs[1:],
+        ),
+        axis=1,
+    )
+    element_blocks *= coupled[:, :, None] & coupled[:, None, :]
+
+    # Upper banded storage of the system, as taken by solveh_banded
+    elem_dofs = 6 * np.arange(n_elems)
+    banded = np.bincount(
+        (
+            (8 + _ELEMENT_BLOCK_ROWS - _ELEMENT_BLOCK_COLS) * n_dofs
+            + elem_dofs[:, None]
+            + _ELEMENT_BLOCK_COLS
+        ).ravel(),
+        weights=element_blocks[:, _ELEMENT_BLOCK_ROWS, _ELEMENT_BLOCK_COLS].ravel(),
+        minlength=9 * n_dofs,
+    ).reshape(9, n_dofs)
+
+    mass = np.where(decoupled_node_dofs, 1.0, System.mass[:, None])
+    inertia = (
+        System.mass_second_moment_of_inertia.transpose(2, 0, 1)
+        / np.where(ghost_elems, 1.0, System.dilatation)[:, None, None]
+    )
+    inertia[decoupled_elems] = np.eye(3)
+    node_dofs = 6 * np.arange(n_nodes)[:, None] + np.arange(3)
+    elem_rotation_dofs = elem_dofs[:, None] + 3 + np.arange(3)
+    banded[8, node_dofs] += mass
+    banded[
+        8 + _INERTIA_BLOCK_ROWS - _INERTIA_BLOCK_COLS,
+        elem_dofs[:, None] + 3 + _INERTIA_BLOCK_COLS,
+    ] += inertia[:, _INERTIA_BLOCK_ROWS, _INERTIA_BLOCK_COLS]
+
+    rhs = np.empty(n_dofs)
+    rhs[node_dofs] = dt * mass * System.acceleration_collection.T
+    rhs[elem_rotation_dofs] = dt * (
+        inertia @ System.alpha_collection.T[:, :, None]
+    ).reshape(n_elems, 3)
+    rhs[node_dofs[held_node_dofs]] = 0.0
+    rhs[elem_rotation_dofs[held_elems]] = 0.0
+
+    rate_change = solveh_banded(
+        banded, rhs, overwrite_ab=True, overwrite_b=True, check_finite=False
+    )
+    System.velocity_collection += rate_change[node_dofs].T
+    System.omega_collection += rate_change[elem_rotation_dofs].T
@@ -0,0 +1,138 @@
+__doc__ = """ Test AABB hierarchy in elastica/collision/AABBCollection.py """
+
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+from elastica.collision.AABBCollection import (
+    AABBHierarchy,
+    find_overlapping_leaves,
+    find_overlapping_dofs,
+    sweep_and_prune,
+    morton_order,
+)
+
+
+def random_rod_positions(n_elem, seed):
+    rng = np.random.default_rng(seed)
+    steps = rng.standard_normal((3, n_elem))
+    steps /= np.linalg.norm(steps, axis=0)
+    position = np.cumsum(steps, axis=1)
+    dimension = np.broadcast_to(0.5 + rng.random(n_elem), (3, n_elem))
+    return position, dimension
+
+
+@pytest.mark.parametrize("n_elem", [1, 3, 10, 37, 100])
+@pytest.mark.parametrize("avg_n_dofs_in_final_level", [1, 4])
+def test_aabb_hierarchy_bounds_its_dofs(n_elem, avg_n_dofs_in_final_level):
+    position, dimension = random_rod_positions(n_elem, 0)
+    hierarchy = AABBHierarchy(position, dimension, avg_n_dofs_in_final_level)
+
+    # Boxes of the final level partition the dofs
+    assert hierarchy.dof_offsets[0] == 0
+    assert hierarchy.dof_offsets[-1] == n_elem
+    assert np.all(np.diff(hierarchy.dof_offsets) > 0)
+    assert len(hierarchy.aabb) == hierarchy.n_levels
+
+    # Refit to a new configuration
+    position, dimension = random_rod_positions(n_elem, 1)
+    hierarchy.update(position, dimension)
+
+    final_level = hierarchy.aabb[-1]
+    for i in range(hierarchy.n_aabbs_at_level(hierarchy.n_levels - 1)):
+        start, stop = hierarchy.dof_offsets[i], hierarchy.dof_offsets[i + 1]
+        max_dimension = np.max(dimension[:, start:stop], axis=1)
+        assert_allclose(
+            final_level[:, 0, i],
+            np.min(position[:, start:stop], axis=1) - max_dimension,
+        )
+        assert_allclose(
+            final_level[:, 1, i],
+            np.max(position[:, start:stop], axis=1) + max_dimension,
+        )
+
+    # Each box is the union of its four children
+    for level in range(hierarchy.n_levels - 1):
+        children = hierarchy.aabb[level + 1]
+        for i in range(hierarchy.n_aabbs_at_level(level)):
+            assert_allclose(
+                hierarchy.aabb[level][:, 0, i],
+                np.min(children[:, 0, 4 * i : 4 * i + 4], axis=1),
+            )
+            assert_allclose(
+                hierarchy.aabb[level][:, 1, i],
+                np.max(children[:, 1, 4 * i : 4 * i + 4], axis=1),
+            )
+
+
+@pytest.mark.parametrize("n_elem_one, n_elem_two", [(1, 5), (16, 16), (50, 70)])
+def test_find_overlapping_dofs_against_all_pairs(n_elem_one, n_elem_two):
+    position_one, dimension_one = random_rod_positions(n_elem_one, 2)
+    position_two, dimension_two = random_rod_positions(n_elem_two, 3)
+    position_two += 3.0
+    first_hierarchy = AABBHierarchy(position_one, dimension_one, 4)
+    second_hierarchy = AABBHierarchy(position_two, dimension_two, 4)
+
+    first_leaves, second_leaves = find_overlapping_leaves(
+        first_hierarchy, second_hierarchy
+    )
+    first_final_level = first_hierarchy.aabb[-1]
+    second_final_level = second_hierarchy.aabb[-1]
+    expected_leaves = {
+        (i, j)
+        for i in range(first_final_level.shape[-1])
+        for j in range(second_final_level.shape[-1])
+        if np.all(first_final_level[:, 0, i] <= second_final_level[:, 1, j])
+        and np.all(first_final_level[:, 1, i] >= second_final_level[:, 0, j])
+    }
+    assert set(zip(first_leaves, second_leaves)) == expected_leaves
+
+    dof_offsets, dof_indices = find_overlapping_dofs(first_hierarchy, second_hierarchy)
+    assert dof_offsets.shape == (n_elem_one + 1,)
+    leaf_one = np.searchsorted(
+        first_hierarchy.dof_offsets, np.arange(n_elem_one), side="right"
+    )
+    leaf_two = np.searchsorted(
+        second_hierarchy.dof_offsets, np.arange(n_elem_two), side="right"
+    )
+    for i in range(n_elem_one):
+        expected = [
+            j
+            for j in range(n_elem_two)
+            if (leaf_one[i] - 1, leaf_two[j] - 1) in expected_leaves
+        ]
+        assert list(dof_indices[dof_offsets[i] : dof_offsets[i + 1]]) == expected
+
+
+@pytest.mark.parametrize("n_aabbs", [1, 2, 50])
+def test_sweep_and_prune_against_all_pairs(n_aabbs):
+    rng = np.random.default_rng(n_aabbs)
+    center = 10.0 * rng.random((3, n_aabbs))
+    half_extent = rng.random((3, n_aabbs))
+    aabbs = np.stack((center - half_extent, center + half_extent), axis=1)
+    # Boxes touching each other intersect
+    if n_aabbs > 1:
+        aabbs[:, :, 1] = aabbs[:, :, 0]
+        aabbs[0, :, 1] = aabbs[0, 1, 0] + np.array([0.0, 1.0])
+
+    first_aabbs, second_aabbs = sweep_and_prune(aabbs)
+
+    expected = [
+        (i, j)
+        for i in range(n_aabbs)
+        for j in range(i + 1, n_aabbs)
+        if np.all(aabbs[:, 0, i] <= aabbs[:, 1, j])
+        and np.all(aabbs[:, 1, i] >= aabbs[:, 0, j])
+    ]
+    assert list(zip(first_aabbs, second_aabbs)) == expected
+    if n_aabbs > 1:
+        assert (0, 1) in expected
+
+
+def test_morton_order():
+    # Cells of a 4 x 4 grid are visited in Z order
+    x, y = np.meshgrid(np.arange(4.0), np.arange(4.0), indexing="ij")
+    position = np.vstack((x.ravel(), y.ravel(), np.zeros(16)))
+    order = morton_order(position, n_bits_per_axis=2)
+    z_order = [(0, 0), (1, 0), (0, 1), (1, 1), (2, 0), (3, 0), (2, 1), (3, 1)]
+    assert [tuple(position[:2, i].astype(int)) for i in order[:8]] == z_order
+    assert sorted(order) == list(range(16))
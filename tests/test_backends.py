@@ -0,0 +1,136 @@
+__doc__ = """ Test kernel backend registry and the JIT (numba) backend """
+import os
+import subprocess
+import sys
+import textwrap
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from elastica._backends import (
+    KERNEL_BACKEND_ENV,
+    KERNEL_CACHE_DIR_ENV,
+    available_backends,
+    bind_kernels,
+    get_kernels,
+    register_kernels,
+    selected_backend,
+)
+from elastica.utils import Tolerance
+
+
+def _run_with_backend(script, backend, cache_dir):
+    env = dict(os.environ)
+    env[KERNEL_BACKEND_ENV] = backend
+    env[KERNEL_CACHE_DIR_ENV] = str(cache_dir)
+    return subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(script)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+def test_selected_backend_from_environment(monkeypatch):
+    monkeypatch.delenv(KERNEL_BACKEND_ENV, raising=False)
+    assert selected_backend() == "numpy"
+
+    monkeypatch.setenv(KERNEL_BACKEND_ENV, "reference")
+    assert selected_backend() == "reference"
+
+    monkeypatch.setenv(KERNEL_BACKEND_ENV, "not_a_backend")
+    with pytest.raises(ValueError):
+        selected_backend()
+
+
+def test_bind_kernels_keeps_module_definitions_without_backend():
+    def kernel():
+        return "module"
+
+    def other_kernel():
+        return "other"
+
+    module_globals = {"__name__": "test_backends.mock_module", "kernel": kernel}
+    register_kernels("test_backends.mock_module", "other", {"kernel": other_kernel})
+
+    bind_kernels(module_globals, "numpy")
+    assert module_globals["kernel"] is kernel
+
+    bind_kernels(module_globals, "other")
+    assert module_globals["kernel"] is other_kernel
+
+
+@pytest.mark.parametrize(
+    "module_name",
+    [
+        "elastica._linalg",
+        "elastica._calculus",
+        "elastica._rotations",
+        "elastica.rod.cosserat_rod",
+        "elastica.rod.data_structures",
+        "elastica.contact_utils",
+        "elastica._contact_functions",
+    ],
+)
+def test_kernel_modules_provide_reference_backend(module_name):
+    assert "reference" in available_backends(module_name)
+
+
+def test_numba_backend_matches_reference():
+    pytest.importorskip("numba")
+
+    vector_collection = np.random.randn(3, 16)
+    director_collection = np.repeat(np.eye(3)[..., np.newaxis], 17, axis=2)
+
+    reference = get_kernels("elastica._calculus", "reference")
+    compiled = get_kernels("elastica._calculus", "numba")
+    assert_allclose(
+        compiled["_difference"](vector_collection),
+        reference["_difference"](vector_collection),
+        atol=Tolerance.atol(),
+    )
+    # Aliases share the compiled kernel
+    assert compiled["position_difference_kernel"] is compiled["_difference"]
+
+    reference = get_kernels("elastica._rotations", "reference")
+    compiled = get_kernels("elastica._rotations", "numba")
+    assert_allclose(
+        compiled["_inv_rotate"](director_collection),
+        reference["_inv_rotate"](director_collection),
+        atol=Tolerance.atol(),
+    )
+
+
+def test_numba_backend_precompiles_at_finalize_and_caches_on_disk(tmp_path):
+    pytest.importorskip("numba")
+
+    script = """
+    import numpy as np
+    import elastica as ea
+    from elastica.rod import cosserat_rod
+
+    class Simulator(ea.BaseSystemCollection):
+        pass
+
+    simulator = Simulator()
+    rod = ea.CosseratRod.straight_rod(
+        10, np.zeros(3), np.array([0.0, 0.0, 1.0]), np.array([1.0, 0.0, 0.0]),
+        1.0, 0.1, 1000.0, youngs_modulus=1e6,
+    )
+    simulator.append(rod)
+    position = rod.position_collection.copy()
+    internal_forces = rod.internal_forces.copy()
+
+    simulator.finalize()
+
+    assert np.array_equal(position, rod.position_collection)
+    assert np.array_equal(internal_forces, rod.internal_forces)
+    print(len(cosserat_rod._compute_internal_forces_and_torques.signatures))
+    """
+    assert int(_run_with_backend(script, "numba", tmp_path)) > 0
+    # Compiled kernels are written to the cache directory
+    assert any(
+        name.endswith(".nbi") for _, _, names in os.walk(tmp_path) for name in names
+    )
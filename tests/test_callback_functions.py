@@ -5,7 +5,15 @@ import os
 import logging
 import numpy as np
 from numpy.testing import assert_allclose
-from elastica.callback_functions import CallBackBaseClass, MyCallBack, ExportCallBack
+from collections import defaultdict
+from elastica.callback_functions import (
+    CallBackBaseClass,
+    MyCallBack,
+    ContactRecordsCallBack,
+    ExportCallBack,
+)
+from elastica.contact_records import ContactRecords
+from elastica.contact_utils import _record_contact
 from elastica.utils import Tolerance
 import tempfile
 import pytest
@@ -102,6 +110,27 @@ class TestMyCallBackClass:
         )
 
 
+class TestContactRecordsCallBackClass:
+    def test_contact_records_call_back_class(self):
+        """
+        This test case is for testing ContactRecordsCallBack function.
+        """
+        records = ContactRecords(capacity=4)
+        callback_params = defaultdict(list)
+        callback = ContactRecordsCallBack(2, records, callback_params)
+        for current_step in range(4):
+            _record_contact(records.buffers, current_step, 0, 0.1, 1.0)
+            callback.make_callback(MockRod(), 0.1 * current_step, current_step)
+
+        assert callback_params["step"] == [0, 2]
+        assert_allclose(callback_params["time"], [0.0, 0.2], atol=Tolerance.atol())
+        # Records are drained at every sample
+        assert [
+            sample["first_element"].tolist() for sample in callback_params["records"]
+        ] == [[0], [1, 2]]
+        assert records.n_records == 1
+
+
 class TestExportCallBackClass:
     @pytest.mark.parametrize("method", ["0", 1, "numba", "test", "some string", None])
     def test_export_call_back_unavailable_save_methods(self, method):
@@ -0,0 +1,75 @@
+__doc__ = """ Test candidate cache in elastica/collision/CandidateCache.py """
+
+import pytest
+import numpy as np
+from elastica.collision.CandidateCache import CandidateCache
+
+
+class CountingBroadphase:
+    def __init__(self):
+        self.n_calls = 0
+
+    def __call__(self):
+        self.n_calls += 1
+        return self.n_calls
+
+
+def test_candidate_cache_with_negative_skin_throws():
+    with pytest.raises(ValueError) as excinfo:
+        CandidateCache(skin=-1.0)
+    assert "non-negative" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("extents_shape", [(10,), (3, 10)])
+def test_candidate_cache_rebuilds_when_drift_exceeds_half_skin(extents_shape):
+    cache = CandidateCache(skin=0.2)
+    broadphase = CountingBroadphase()
+    positions = np.zeros((3, 10))
+    extents = np.ones(extents_shape)
+
+    assert cache.update(positions, extents, broadphase) == 1
+
+    # Displacement and growth of a single element add up
+    positions[0, 3] = 0.06
+    extents[..., 3] = 1.03
+    assert cache.update(positions, extents, broadphase) == 1
+    assert cache.max_drift == pytest.approx(0.09)
+
+    # Shrinking does not count
+    extents[..., 5] = 0.5
+    assert cache.update(positions, extents, broadphase) == 1
+
+    positions[0, 3] = 0.08
+    assert cache.update(positions, extents, broadphase) == 2
+    assert cache.max_drift == 0.0
+
+    # Drift is measured from the last rebuild
+    positions[0, 3] = 0.1
+    assert cache.update(positions, extents, broadphase) == 2
+
+    cache.invalidate()
+    assert cache.update(positions, extents, broadphase) == 3
+
+    # A different number of elements needs new candidates
+    assert cache.update(np.zeros((3, 5)), np.ones(5), broadphase) == 4
+
+    statistics = cache.statistics()
+    assert statistics["n_updates"] == 7
+    assert statistics["n_rebuilds"] == 4
+    assert statistics["rebuild_ratio"] == pytest.approx(4 / 7)
+    assert statistics["skin"] == 0.2
+
+
+def test_candidate_cache_without_skin_rebuilds_when_anything_moves():
+    cache = CandidateCache()
+    broadphase = CountingBroadphase()
+    positions = np.zeros((3, 4))
+    extents = np.ones(4)
+
+    cache.update(positions, extents, broadphase)
+    cache.update(positions, extents, broadphase)
+    assert broadphase.n_calls == 1
+
+    positions[2, 1] = 1e-12
+    cache.update(positions, extents, broadphase)
+    assert broadphase.n_calls == 2
@@ -11,14 +11,17 @@ from elastica.contact_forces import (
     RodPlaneContact,
     RodPlaneContactWithAnisotropicFriction,
     CylinderPlaneContact,
+    RodMeshSurfaceContact,
 )
 from elastica.typing import RodBase
 from elastica.rigidbody import Cylinder, Sphere
-from elastica.surface import Plane
+from elastica.surface import Plane, MeshSurface
 import pytest
 from elastica.contact_utils import (
     _node_to_element_mass_or_force,
 )
+from elastica._contact_functions import _calculate_contact_forces_rod_rod
+from elastica.rod.cosserat_rod import CosseratRod
 
 
 def mock_rod_init(self):
@@ -416,6 +419,85 @@ class TestRodRodContact:
             mock_rod_two.external_forces, mock_rod_two_external_forces_before_execution
         )
 
+    @pytest.mark.parametrize("n_elem", [10, 100])
+    @pytest.mark.parametrize("skin", [0.0, 0.05])
+    def test_contact_with_two_crossing_rods_matches_all_pairs(self, n_elem, skin):
+        "Testing Rod Rod Contact wrapper against the loop over all pairs of elements"
+
+        """
+        Two rods cross each other at one spot, while they move, over several
+        calls, so that the AABB hierarchies of the rods are refitted. With a
+        skin, candidates found on the first call are kept.
+        """
+        rng = np.random.default_rng(0)
+        base_length = n_elem / 50
+        rod_one = CosseratRod.straight_rod(
+            n_elem,
+            np.zeros(3),
+            np.array([1.0, 0.0, 0.0]),
+            np.array([0.0, 1.0, 0.0]),
+            base_length,
+            0.01,
+            1e3,
+            youngs_modulus=1e6,
+        )
+        rod_two = CosseratRod.straight_rod(
+            n_elem,
+            np.array([0.5 * base_length, -0.5 * base_length, 0.015]),
+            np.array([0.0, 1.0, 0.0]),
+            np.array([1.0, 0.0, 0.0]),
+            base_length,
+            0.01,
+            1e3,
+            youngs_modulus=1e6,
+        )
+        rod_rod_contact = RodRodContact(k=1e3, nu=1.0, skin=skin)
+
+        for _ in range(3):
+            for rod in (rod_one, rod_two):
+                rod.position_collection += 0.002 * rng.standard_normal(
+                    rod.position_collection.shape
+                )
+                rod.velocity_collection[...] = rng.standard_normal(
+                    rod.velocity_collection.shape
+                )
+                rod.external_forces[...] = rng.standard_normal(
+                    rod.external_forces.shape
+                )
+            expected_external_forces = [
+                rod.external_forces.copy() for rod in (rod_one, rod_two)
+            ]
+            _calculate_contact_forces_rod_rod(
+                rod_one.position_collection[..., :-1],
+                rod_one.radius,
+                rod_one.lengths,
+                rod_one.tangents,
+                rod_one.velocity_collection,
+                rod_one.internal_forces,
+                expected_external_forces[0],
+                rod_two.position_collection[..., :-1],
+                rod_two.radius,
+                rod_two.lengths,
+                rod_two.tangents,
+                rod_two.velocity_collection,
+                rod_two.internal_forces,
+                expected_external_forces[1],
+                1e3,
+                1.0,
+            )
+            rod_rod_contact.apply_contact(rod_one, rod_two)
+
+            assert_allclose(
+                rod_one.external_forces, expected_external_forces[0], atol=0.0
+            )
+            assert_allclose(
+                rod_two.external_forces, expected_external_forces[1], atol=0.0
+            )
+
+        statistics = rod_rod_contact.candidate_cache.statistics()
+        assert statistics["n_updates"] == 3
+        assert statistics["n_rebuilds"] == (1 if skin > 0.0 else 3)
+
 
 class TestRodSelfContact:
     def test_check_systems_validity_with_invalid_systems(
@@ -505,6 +587,44 @@ class TestRodSelfContact:
             mock_rod.external_forces, mock_rod_external_forces_before_execution
         )
 
+    def test_self_contact_with_skin_matches_self_contact_without_skin(self):
+        "Testing Self Contact wrapper keeping its candidates across calls"
+
+        """
+        A helix moving slightly over several calls, whose turns touch each
+        other.
+        """
+        rng = np.random.default_rng(0)
+        n_elem = 100
+        angle = np.linspace(0.0, 0.2 * np.pi * n_elem, n_elem + 1)
+        node_position = np.vstack((np.cos(angle), np.sin(angle), 0.015 * angle))
+        rods = [MockRod(), MockRod()]
+        self_contacts = [
+            RodSelfContact(k=1e2, nu=1.0),
+            RodSelfContact(k=1e2, nu=1.0, skin=0.05),
+        ]
+        for rod in rods:
+            rod.radius = 0.05 * np.ones(n_elem)
+            rod.velocity_collection = np.zeros((3, n_elem + 1))
+
+        for _ in range(5):
+            node_position += 0.002 * rng.standard_normal(node_position.shape)
+            edges = np.diff(node_position, axis=1)
+            velocity = rng.standard_normal(node_position.shape)
+            for rod, self_contact in zip(rods, self_contacts):
+                rod.position_collection = node_position.copy()
+                rod.lengths = np.linalg.norm(edges, axis=0)
+                rod.tangents = edges / rod.lengths
+                rod.velocity_collection = velocity.copy()
+                rod.external_forces = np.zeros((3, n_elem + 1))
+                self_contact.apply_contact(rod, rod)
+
+            assert np.any(rods[0].external_forces != 0.0)
+            assert_allclose(rods[1].external_forces, rods[0].external_forces, atol=0.0)
+
+        assert self_contacts[0].candidate_cache.n_rebuilds == 5
+        assert self_contacts[1].candidate_cache.n_rebuilds == 1
+
 
 class TestRodSphereContact:
     def test_check_systems_validity_with_invalid_systems(
@@ -1410,3 +1530,131 @@ class TestCylinderPlaneContact:
         cylinder_plane_contact.apply_contact(cylinder, plane)
 
         assert_allclose(correct_forces, cylinder.external_forces, atol=Tolerance.atol())
+
+
+class TestRodMeshSurfaceContact:
+    @staticmethod
+    def terrain(n_cells, height):
+        "Triangulated height field y = height(x, z) over [-1, 1] x [-1, 1]"
+        from types import SimpleNamespace
+
+        grid = np.linspace(-1.0, 1.0, n_cells + 1)
+        x, z = np.meshgrid(grid, grid, indexing="ij")
+        vertices = np.stack((x, height(x, z), z))
+        a = vertices[:, :-1, :-1].reshape(3, -1)
+        b = vertices[:, 1:, :-1].reshape(3, -1)
+        c = vertices[:, 1:, 1:].reshape(3, -1)
+        d = vertices[:, :-1, 1:].reshape(3, -1)
+        faces = np.concatenate(
+            (np.stack((a, c, b), axis=1), np.stack((a, d, c), axis=1)), axis=-1
+        )
+        face_normals = np.cross(
+            faces[:, 1] - faces[:, 0], faces[:, 2] - faces[:, 0], axis=0
+        )
+        return MeshSurface(SimpleNamespace(faces=faces, face_normals=face_normals))
+
+    @staticmethod
+    def rod_on_terrain(seed):
+        rng = np.random.default_rng(seed)
+        direction = np.array([1.0, 0.0, 0.3])
+        rod = CosseratRod.straight_rod(
+            50,
+            np.array([-0.5, 0.009, 0.013]),
+            direction / np.linalg.norm(direction),
+            np.array([0.0, 1.0, 0.0]),
+            1.0,
+            0.01,
+            1e3,
+            youngs_modulus=1e5,
+        )
+        rod.position_collection[1] += rng.uniform(-0.005, 0.005, 51)
+        rod.velocity_collection[...] = rng.standard_normal((3, 51))
+        rod.internal_forces[...] = rng.standard_normal((3, 51))
+        return rod
+
+    def test_check_systems_validity_with_invalid_systems(self):
+        mock_rod = MockRod()
+        mock_plane = MockPlane()
+        rod_mesh_contact = RodMeshSurfaceContact(k=1.0, nu=0.0)
+
+        "Testing Rod Mesh Surface Contact wrapper with a plane for second argument"
+        with pytest.raises(TypeError) as excinfo:
+            rod_mesh_contact._check_systems_validity(mock_rod, mock_plane)
+        assert (
+            "Systems provided to the contact class have incorrect order/type. \n"
+            " First system is {0} and second system is {1}. \n"
+            " First system should be a rod, second should be a mesh surface"
+        ).format(mock_rod.__class__, mock_plane.__class__) == str(excinfo.value)
+
+    def test_rod_mesh_surface_contact_with_flat_mesh_matches_plane_contact(self):
+        "A flat mesh acts as a plane for elements penetrating it by less than their radius"
+        surface = self.terrain(100, lambda x, z: 0.0 * x)
+        plane = Plane(np.zeros(3), np.array([0.0, 1.0, 0.0]))
+        rod_on_mesh = self.rod_on_terrain(0)
+        rod_on_plane = self.rod_on_terrain(0)
+
+        rod_mesh_contact = RodMeshSurfaceContact(k=10.0, nu=1.0)
+        rod_mesh_contact._check_systems_validity(rod_on_mesh, surface)
+        rod_mesh_contact.apply_contact(rod_on_mesh, surface)
+        RodPlaneContact(k=10.0, nu=1.0).apply_contact(rod_on_plane, plane)
+
+        assert np.any(rod_on_plane.external_forces != 0.0)
+        assert_allclose(
+            rod_on_mesh.external_forces, rod_on_plane.external_forces, atol=1e-12
+        )
+
+    def test_rod_mesh_surface_contact_without_contact_below_radius_depth(self):
+        "Unlike a plane, a mesh does not push back elements deeper than their radius"
+        surface = self.terrain(100, lambda x, z: 0.0 * x)
+        plane = Plane(np.zeros(3), np.array([0.0, 1.0, 0.0]))
+        rod_on_mesh = self.rod_on_terrain(0)
+        rod_on_mesh.position_collection[1] = -0.05
+        rod_on_plane = self.rod_on_terrain(0)
+        rod_on_plane.position_collection[1] = -0.05
+
+        rod_mesh_contact = RodMeshSurfaceContact(k=10.0, nu=1.0)
+        rod_mesh_contact._check_systems_validity(rod_on_mesh, surface)
+        rod_mesh_contact.apply_contact(rod_on_mesh, surface)
+        RodPlaneContact(k=10.0, nu=1.0).apply_contact(rod_on_plane, plane)
+
+        assert np.any(rod_on_plane.external_forces != 0.0)
+        assert_allclose(rod_on_mesh.external_forces, 0.0)
+
+    def test_rod_mesh_surface_contact_matches_brute_force_search(self):
+        """
+        Contact on a bumpy terrain using the hierarchies, over several calls,
+        must match the contact with all the triangles as candidates.
+        """
+        from elastica._contact_functions import (
+            _calculate_contact_forces_rod_mesh_surface,
+        )
+
+        surface = self.terrain(
+            40, lambda x, z: 0.01 * np.sin(7.0 * x) * np.cos(5.0 * z)
+        )
+        rod = self.rod_on_terrain(1)
+        rod_mesh_contact = RodMeshSurfaceContact(k=10.0, nu=1.0)
+        rng = np.random.default_rng(2)
+        for _ in range(3):
+            rod.position_collection[1] += 0.002 * rng.standard_normal(51)
+            rod.external_forces[...] = 0.0
+            expected = np.zeros((3, 51))
+            _calculate_contact_forces_rod_mesh_surface(
+                surface.faces,
+                surface.face_normals,
+                np.arange(51) * surface.n_faces,
+                np.tile(np.arange(surface.n_faces), 50),
+                rod_mesh_contact.surface_tol,
+                rod_mesh_contact.k,
+                rod_mesh_contact.nu,
+                rod.radius,
+                rod.mass,
+                rod.position_collection,
+                rod.velocity_collection,
+                rod.internal_forces,
+                expected,
+            )
+            rod_mesh_contact.apply_contact(rod, surface)
+
+            assert np.any(expected != 0.0)
+            assert_allclose(rod.external_forces, expected, atol=1e-12)
@@ -1,9 +1,13 @@
 __doc__ = """ Test specific functions used in contact in Elastica.contact_forces implementation"""
 
+import pytest
 import numpy as np
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_array_equal
 from elastica.typing import RodBase
 from elastica.rigidbody import Cylinder, Sphere
+from elastica._backends import get_kernels
+from elastica.contact_utils import _find_self_contact_candidates
+from elastica.contact_records import ContactRecords
 
 from elastica._contact_functions import (
     _calculate_contact_forces_rod_cylinder,
@@ -671,3 +675,754 @@ class TestCalculateContactForcesRodSphere:
             np.array([[0.166666, 0.333333, 0], [0, 0, 0], [0, 0, 0]]),
             atol=1e-6,
         )
+
+
+class TestVectorizedContactKernels:
+    "Class to test the numpy contact kernels against the reference loops"
+
+    """
+    Rods are random walks folded onto themselves and onto each other, so that
+    many element pairs are in contact at the same time.
+    """
+
+    @staticmethod
+    def random_rod(n_elem, rng, offset=0.0):
+        step = rng.standard_normal((3, n_elem))
+        step /= np.linalg.norm(step, axis=0)
+        node_position = 0.2 * np.cumsum(np.hstack((np.zeros((3, 1)), step)), axis=1)
+        node_position += offset
+        lengths = np.linalg.norm(np.diff(node_position, axis=1), axis=0)
+        tangents = np.diff(node_position, axis=1) / lengths
+        radius = 0.1 + 0.05 * rng.random(n_elem)
+        velocity = rng.standard_normal((3, n_elem + 1))
+        internal_forces = rng.standard_normal((3, n_elem + 1))
+        external_forces = rng.standard_normal((3, n_elem + 1))
+        return (
+            node_position,
+            radius,
+            lengths,
+            tangents,
+            velocity,
+            internal_forces,
+            external_forces,
+        )
+
+    def test_rod_cylinder(self):
+        rng = np.random.default_rng(0)
+        n_elem = 50
+        (position, radius, lengths, tangents, velocity, internal, external) = (
+            self.random_rod(n_elem, rng)
+        )
+        cylinder_radius = 0.3
+        cylinder_length = 1.0
+        cylinder_center = np.mean(position, axis=1)
+        cylinder_direction = rng.standard_normal(3)
+        cylinder_direction /= np.linalg.norm(cylinder_direction)
+        edge_cylinder = cylinder_length * cylinder_direction
+        cylinder_tip = cylinder_center - 0.5 * edge_cylinder
+        director = np.linalg.qr(rng.standard_normal((3, 3)))[0]
+        velocity_cylinder = rng.standard_normal((3, 1))
+
+        results = []
+        for backend in ["reference", "numpy"]:
+            kernel = get_kernels("elastica._contact_functions", backend)[
+                "_calculate_contact_forces_rod_cylinder"
+            ]
+            external_forces_rod = external.copy()
+            external_forces_cylinder = np.zeros((3, 1))
+            external_torques_cylinder = np.zeros((3, 1))
+            kernel(
+                position[..., :-1],
+                lengths * tangents,
+                cylinder_center,
+                cylinder_tip,
+                edge_cylinder,
+                radius + cylinder_radius,
+                lengths + cylinder_length,
+                internal,
+                external_forces_rod,
+                external_forces_cylinder,
+                external_torques_cylinder,
+                director,
+                velocity,
+                velocity_cylinder,
+                1e2,
+                1e-1,
+                1e-1,
+                0.5,
+            )
+            results.append(
+                (
+                    external_forces_rod,
+                    external_forces_cylinder,
+                    external_torques_cylinder,
+                )
+            )
+
+        assert not np.allclose(results[0][0], external)
+        for reference, vectorized in zip(*results):
+            assert_allclose(vectorized, reference, rtol=1e-12, atol=1e-12)
+
+    @staticmethod
+    def rod_rod_contact_forces(
+        backend, rod_one, rod_two, candidate_offsets, candidate_indices
+    ):
+        "Contact forces added to the external forces of both rods"
+        external_forces_one = rod_one[6].copy()
+        external_forces_two = rod_two[6].copy()
+        get_kernels("elastica._contact_functions", backend)[
+            "_calculate_contact_forces_rod_rod_candidates"
+        ](
+            rod_one[0][..., :-1],
+            *rod_one[1:6],
+            external_forces_one,
+            rod_two[0][..., :-1],
+            *rod_two[1:6],
+            external_forces_two,
+            candidate_offsets,
+            candidate_indices,
+            1e2,
+            1e-1,
+        )
+        return external_forces_one - rod_one[6], external_forces_two - rod_two[6]
+
+    def test_rod_rod(self):
+        "Elements in several contacts see the forces of the pairs before them"
+        rng = np.random.default_rng(1)
+        rod_one = self.random_rod(40, rng)
+        rod_two = self.random_rod(30, rng, offset=0.05)
+        candidates = (np.arange(41) * 30, np.arange(40 * 30) % 30)
+
+        expected = self.rod_rod_contact_forces(
+            "reference", rod_one, rod_two, *candidates
+        )
+        forces = self.rod_rod_contact_forces("numpy", rod_one, rod_two, *candidates)
+        assert np.any(expected[0] != 0.0)
+        for force, expected_force in zip(forces, expected):
+            assert_allclose(force, expected_force, rtol=1e-10, atol=1e-10)
+
+    def test_rod_rod_with_shared_nodes(self):
+        """
+        Two parallel rods pressed together, each element in a single contact.
+        Consecutive elements share a node, so the normal force of each pair
+        depends on the forces added by the previous pair.
+        """
+        n_elem = 4
+
+        def straight_rod(y, external_force):
+            node_position = np.zeros((3, n_elem + 1))
+            node_position[0] = np.linspace(0.0, 1.0, n_elem + 1)
+            node_position[1] = y
+            external_forces = np.zeros((3, n_elem + 1))
+            external_forces[1] = external_force
+            return (
+                node_position,
+                np.full(n_elem, 0.1),
+                np.full(n_elem, 0.25),
+                np.repeat(np.array([[1.0], [0.0], [0.0]]), n_elem, axis=1),
+                np.zeros((3, n_elem + 1)),
+                np.zeros((3, n_elem + 1)),
+                external_forces,
+            )
+
+        rod_one = straight_rod(0.0, 1.0)
+        rod_two = straight_rod(0.15, -1.0)
+        candidates = (np.arange(n_elem + 1), np.arange(n_elem))
+
+        expected = self.rod_rod_contact_forces(
+            "reference", rod_one, rod_two, *candidates
+        )
+        forces = self.rod_rod_contact_forces("numpy", rod_one, rod_two, *candidates)
+        # The equilibrium force of a pair changes with the forces of the
+        # previous pairs, unlike with each pair on its own
+        independent_force_one = sum(
+            self.rod_rod_contact_forces(
+                "reference",
+                rod_one,
+                rod_two,
+                np.repeat([0, 1], [i + 1, n_elem - i]),
+                np.array([i]),
+            )[0]
+            for i in range(n_elem)
+        )
+        assert np.all(expected[0][1] < 0.0)
+        assert not np.allclose(expected[0], independent_force_one)
+        for force, expected_force in zip(forces, expected):
+            assert_allclose(force, expected_force, rtol=1e-12, atol=1e-12)
+
+    @pytest.mark.parametrize("skin", [0.0, 0.3])
+    def test_self_rod(self, skin):
+        """
+        Candidates found with a skin include extra pairs, which the
+        narrowphase must discard.
+        """
+        rng = np.random.default_rng(2)
+        (position, radius, lengths, tangents, velocity, _, external) = self.random_rod(
+            100, rng
+        )
+        candidate_offsets, candidate_indices = _find_self_contact_candidates(
+            position[..., :-1], radius, lengths, skin
+        )
+
+        expected = external.copy()
+        get_kernels("elastica._contact_functions", "reference")[
+            "_calculate_contact_forces_self_rod"
+        ](
+            position[..., :-1],
+            radius,
+            lengths,
+            tangents,
+            velocity,
+            expected,
+            1e2,
+            1e-1,
+        )
+        assert not np.allclose(expected, external)
+
+        for backend in ["reference", "numpy"]:
+            kernel = get_kernels("elastica._contact_functions", backend)[
+                "_calculate_contact_forces_self_rod_candidates"
+            ]
+            external_forces = external.copy()
+            kernel(
+                position[..., :-1],
+                radius,
+                lengths,
+                tangents,
+                velocity,
+                external_forces,
+                candidate_offsets,
+                candidate_indices,
+                1e2,
+                1e-1,
+            )
+            assert_allclose(external_forces, expected, rtol=1e-12, atol=1e-12)
+
+    @staticmethod
+    def rod_on_plane(n_elem, rng):
+        position = np.zeros((3, n_elem + 1))
+        position[0] = np.linspace(0.0, 1.0, n_elem + 1)
+        position[1] = rng.uniform(-0.02, 0.02, n_elem + 1)
+        position[2] = 0.05 * rng.standard_normal(n_elem + 1)
+        tangents = np.diff(position, axis=1)
+        tangents /= np.linalg.norm(tangents, axis=0)
+        directors = np.zeros((3, 3, n_elem))
+        directors[2] = tangents
+        directors[0] = np.cross(tangents, np.array([0.0, 1.0, 0.0]), axis=0)
+        directors[0] /= np.linalg.norm(directors[0], axis=0)
+        directors[1] = np.cross(directors[2], directors[0], axis=0)
+        return {
+            "radius": np.full(n_elem, 0.01),
+            "mass": 1.0 + rng.random(n_elem + 1),
+            "tangents": tangents,
+            "position_collection": position,
+            "director_collection": directors,
+            "velocity_collection": rng.standard_normal((3, n_elem + 1)),
+            "omega_collection": rng.standard_normal((3, n_elem)),
+            "internal_forces": rng.standard_normal((3, n_elem + 1)),
+            "external_forces": rng.standard_normal((3, n_elem + 1)),
+            "internal_torques": rng.standard_normal((3, n_elem)),
+            "external_torques": rng.standard_normal((3, n_elem)),
+        }
+
+    def test_rod_plane(self):
+        rod = self.rod_on_plane(50, np.random.default_rng(3))
+        results = []
+        for backend in ["reference", "numpy"]:
+            external_forces = rod["external_forces"].copy()
+            results.append(
+                (
+                    *get_kernels("elastica._contact_functions", backend)[
+                        "_calculate_contact_forces_rod_plane"
+                    ](
+                        np.zeros((3, 1)),
+                        np.array([0.0, 1.0, 0.0]),
+                        1e-4,
+                        1e2,
+                        1e-1,
+                        rod["radius"],
+                        rod["mass"],
+                        rod["position_collection"],
+                        rod["velocity_collection"],
+                        rod["internal_forces"],
+                        external_forces,
+                    ),
+                    external_forces,
+                )
+            )
+        (expected_mag, expected_idx, expected), (mag, idx, forces) = results
+        assert 0 < expected_idx.size < 50
+        assert_allclose(mag, expected_mag, rtol=1e-12, atol=1e-12)
+        assert_array_equal(idx, expected_idx)
+        assert_allclose(forces, expected, rtol=1e-12, atol=1e-12)
+
+    def test_rod_plane_with_anisotropic_friction(self):
+        rod = self.rod_on_plane(50, np.random.default_rng(4))
+        results = []
+        for backend in ["reference", "numpy"]:
+            external_forces = rod["external_forces"].copy()
+            external_torques = rod["external_torques"].copy()
+            get_kernels("elastica._contact_functions", backend)[
+                "_calculate_contact_forces_rod_plane_with_anisotropic_friction"
+            ](
+                np.zeros((3, 1)),
+                np.array([0.0, 1.0, 0.0]),
+                1e-4,
+                1e-1,
+                1e2,
+                1e-1,
+                1.0,
+                1.5,
+                2.0,
+                1.1,
+                1.6,
+                2.1,
+                rod["radius"],
+                rod["mass"],
+                rod["tangents"],
+                rod["position_collection"],
+                rod["director_collection"],
+                rod["velocity_collection"],
+                rod["omega_collection"],
+                rod["internal_forces"],
+                external_forces,
+                rod["internal_torques"],
+                external_torques,
+            )
+            results.append((external_forces, external_torques))
+        assert not np.allclose(results[0][0], rod["external_forces"])
+        assert_allclose(results[1][0], results[0][0], rtol=1e-12, atol=1e-12)
+        assert_allclose(results[1][1], results[0][1], rtol=1e-12, atol=1e-12)
+
+    @staticmethod
+    def terrain(n_cells, rng):
+        "Triangulated height field y = h(x, z) over [0, 1] x [0, 1]"
+        grid = np.linspace(0.0, 1.0, n_cells + 1)
+        x, z = np.meshgrid(grid, grid, indexing="ij")
+        vertices = np.stack((x, 0.02 * rng.standard_normal(x.shape), z))
+        a = vertices[:, :-1, :-1].reshape(3, -1)
+        b = vertices[:, 1:, :-1].reshape(3, -1)
+        c = vertices[:, 1:, 1:].reshape(3, -1)
+        d = vertices[:, :-1, 1:].reshape(3, -1)
+        faces = np.concatenate(
+            (np.stack((a, c, b), axis=1), np.stack((a, d, c), axis=1)), axis=-1
+        )
+        face_normals = np.cross(
+            faces[:, 1] - faces[:, 0], faces[:, 2] - faces[:, 0], axis=0
+        )
+        return faces, face_normals / np.linalg.norm(face_normals, axis=0)
+
+    def test_rod_mesh_surface(self):
+        rng = np.random.default_rng(5)
+        faces, face_normals = self.terrain(10, rng)
+        rod = self.rod_on_plane(50, rng)
+        rod["position_collection"][2] += 0.5
+        n_faces = faces.shape[-1]
+        # All the triangles are candidates of all the elements
+        candidate_offsets = np.arange(51) * n_faces
+        candidate_indices = np.tile(np.arange(n_faces), 50)
+
+        results = []
+        for backend in ["reference", "numpy"]:
+            external_forces = rod["external_forces"].copy()
+            get_kernels("elastica._contact_functions", backend)[
+                "_calculate_contact_forces_rod_mesh_surface"
+            ](
+                faces,
+                face_normals,
+                candidate_offsets,
+                candidate_indices,
+                1e-4,
+                1e2,
+                1e-1,
+                rod["radius"],
+                rod["mass"],
+                rod["position_collection"],
+                rod["velocity_collection"],
+                rod["internal_forces"],
+                external_forces,
+            )
+            results.append(external_forces)
+        assert not np.allclose(results[0], rod["external_forces"])
+        assert_allclose(results[1], results[0], rtol=1e-12, atol=1e-12)
+
+    def test_rod_rigid_bodies(self):
+        """
+        Bodies are capsules around the rod, some of them too far to be in
+        contact. Without rotation, the contact with each body is the rod-cylinder
+        contact.
+        """
+        rng = np.random.default_rng(6)
+        (position, radius, lengths, tangents, velocity, internal, external) = (
+            self.random_rod(40, rng)
+        )
+        n_bodies = 30
+        center = position[:, rng.integers(0, 41, n_bodies)]
+        center += 0.1 * rng.standard_normal((3, n_bodies))
+        center[:, :5] += 10.0
+        body_radius = 0.05 + 0.05 * rng.random(n_bodies)
+        body_length = 0.1 + 0.2 * rng.random(n_bodies)
+        body_velocity = rng.standard_normal((3, n_bodies))
+
+        def contact_forces(backend, director):
+            axis = director[2]
+            forces = external.copy()
+            body_forces = np.zeros((3, n_bodies))
+            body_torques = np.zeros((3, n_bodies))
+            get_kernels("elastica._contact_functions", backend)[
+                "_calculate_contact_forces_rod_rigid_bodies"
+            ](
+                position,
+                radius,
+                lengths,
+                tangents,
+                internal,
+                forces,
+                velocity,
+                center,
+                center - 0.5 * body_length * axis,
+                body_length * axis,
+                np.abs(
+                    np.einsum(
+                        "jib,jb->ib",
+                        director,
+                        np.stack((body_radius, body_radius, 0.5 * body_length)),
+                    )
+                ),
+                body_radius,
+                body_length,
+                body_forces,
+                body_torques,
+                director,
+                body_velocity,
+                1e2,
+                1e-1,
+                1e-1,
+                0.5,
+            )
+            return forces, body_forces, body_torques
+
+        identity = np.repeat(np.eye(3)[..., np.newaxis], n_bodies, axis=2)
+        expected_forces = external.copy()
+        expected_body_forces = np.zeros((3, n_bodies))
+        expected_body_torques = np.zeros((3, n_bodies))
+        for b in range(n_bodies):
+            get_kernels("elastica._contact_functions", "reference")[
+                "_calculate_contact_forces_rod_cylinder"
+            ](
+                0.5 * (position[:, 1:] + position[:, :-1]),
+                lengths * tangents,
+                center[:, b],
+                center[:, b] - 0.5 * body_length[b] * identity[2, :, b],
+                body_length[b] * identity[2, :, b],
+                radius + body_radius[b],
+                lengths + body_length[b],
+                internal,
+                expected_forces,
+                expected_body_forces[:, b : b + 1],
+                expected_body_torques[:, b : b + 1],
+                identity[..., b],
+                velocity,
+                body_velocity[:, b : b + 1],
+                1e2,
+                1e-1,
+                1e-1,
+                0.5,
+            )
+        assert np.any(expected_body_forces[:, 5:] != 0.0)
+        assert np.all(expected_body_forces[:, :5] == 0.0)
+        for backend in ["reference", "numpy"]:
+            for result, expected in zip(
+                contact_forces(backend, identity),
+                (expected_forces, expected_body_forces, expected_body_torques),
+            ):
+                assert_allclose(result, expected, rtol=1e-12, atol=1e-12)
+
+        director = np.stack(
+            [np.linalg.qr(rng.standard_normal((3, 3)))[0] for _ in range(n_bodies)],
+            axis=2,
+        )
+        for reference, vectorized in zip(
+            contact_forces("reference", director), contact_forces("numpy", director)
+        ):
+            assert_allclose(vectorized, reference, rtol=1e-12, atol=1e-12)
+
+
+class TestContactRecordsInKernels:
+    "Class to test the records of the pairs in contact filled by the kernels"
+
+    random_rod = staticmethod(TestVectorizedContactKernels.random_rod)
+    rod_on_plane = staticmethod(TestVectorizedContactKernels.rod_on_plane)
+    terrain = staticmethod(TestVectorizedContactKernels.terrain)
+
+    @staticmethod
+    def records(capacity=10000):
+        records = ContactRecords(capacity)
+        records.systems[:] = (3, 7)
+        return records
+
+    @staticmethod
+    def assert_same_records(records, expected_records):
+        assert records.n_records == expected_records.n_records
+        assert_array_equal(records.indices, expected_records.indices)
+        assert_allclose(records.values, expected_records.values, rtol=1e-12, atol=1e-12)
+
+    def test_rod_cylinder(self):
+        rng = np.random.default_rng(0)
+        (position, radius, lengths, tangents, velocity, internal, external) = (
+            self.random_rod(50, rng)
+        )
+        cylinder_center = np.mean(position, axis=1)
+        edge_cylinder = np.array([0.0, 0.0, 1.0])
+
+        def contact_forces(backend, records):
+            external_forces = external.copy()
+            get_kernels("elastica._contact_functions", backend)[
+                "_calculate_contact_forces_rod_cylinder"
+            ](
+                position[..., :-1],
+                lengths * tangents,
+                cylinder_center,
+                cylinder_center - 0.5 * edge_cylinder,
+                edge_cylinder,
+                radius + 0.3,
+                lengths + 1.0,
+                internal,
+                external_forces,
+                np.zeros((3, 1)),
+                np.zeros((3, 1)),
+                np.eye(3),
+                velocity,
+                np.zeros((3, 1)),
+                1e2,
+                1e-1,
+                1e-1,
+                0.5,
+                records,
+            )
+            return external_forces
+
+        all_records = []
+        for backend in ["reference", "numpy"]:
+            records = self.records()
+            # Recording does not change the contact forces
+            assert_array_equal(
+                contact_forces(backend, records.buffers),
+                contact_forces(backend, None),
+            )
+            all_records.append(records)
+        records, expected_records = all_records
+        self.assert_same_records(records, expected_records)
+
+        n_records = records.n_records
+        assert n_records > 0
+        assert_array_equal(records.indices[0, :n_records], 3)
+        assert_array_equal(records.indices[2, :n_records], 7)
+        assert_array_equal(records.indices[3, :n_records], 0)
+        assert np.all(records.values[1, :n_records] > 0.0)
+
+    def test_rod_rod(self):
+        "Pairs in contact, their penetration and force do not depend on the backend"
+        rng = np.random.default_rng(1)
+        rod_one = self.random_rod(40, rng)
+        rod_two = self.random_rod(30, rng, offset=0.05)
+        all_records = []
+        for backend in ["reference", "numpy"]:
+            records = self.records()
+            get_kernels("elastica._contact_functions", backend)[
+                "_calculate_contact_forces_rod_rod_candidates"
+            ](
+                rod_one[0][..., :-1],
+                *rod_one[1:5],
+                rod_one[5],
+                rod_one[6].copy(),
+                rod_two[0][..., :-1],
+                *rod_two[1:5],
+                rod_two[5],
+                rod_two[6].copy(),
+                np.arange(41) * 30,
+                np.arange(40 * 30) % 30,
+                1e2,
+                1e-1,
+                records.buffers,
+            )
+            all_records.append(records)
+        records, expected_records = all_records
+        assert records.n_records > 0
+        self.assert_same_records(records, expected_records)
+
+    @pytest.mark.parametrize("backend", ["reference", "numpy"])
+    def test_self_rod(self, backend):
+        rng = np.random.default_rng(2)
+        (position, radius, lengths, tangents, velocity, _, external) = self.random_rod(
+            100, rng
+        )
+        candidate_offsets, candidate_indices = _find_self_contact_candidates(
+            position[..., :-1], radius, lengths, 0.0
+        )
+        expected_records = self.records()
+        get_kernels("elastica._contact_functions", "reference")[
+            "_calculate_contact_forces_self_rod_candidates"
+        ](
+            position[..., :-1],
+            radius,
+            lengths,
+            tangents,
+            velocity,
+            external.copy(),
+            candidate_offsets,
+            candidate_indices,
+            1e2,
+            1e-1,
+            expected_records.buffers,
+        )
+        records = self.records()
+        get_kernels("elastica._contact_functions", backend)[
+            "_calculate_contact_forces_self_rod_candidates"
+        ](
+            position[..., :-1],
+            radius,
+            lengths,
+            tangents,
+            velocity,
+            external.copy(),
+            candidate_offsets,
+            candidate_indices,
+            1e2,
+            1e-1,
+            records.buffers,
+        )
+        assert records.n_records > 0
+        self.assert_same_records(records, expected_records)
+        # Element i is always after element j
+        assert np.all(
+            records.indices[1, : records.n_records]
+            > records.indices[3, : records.n_records]
+        )
+
+    def test_rod_plane(self):
+        rod = self.rod_on_plane(50, np.random.default_rng(3))
+        all_records = []
+        for backend in ["reference", "numpy"]:
+            records = self.records()
+            _, no_contact_point_idx = get_kernels(
+                "elastica._contact_functions", backend
+            )["_calculate_contact_forces_rod_plane"](
+                np.zeros((3, 1)),
+                np.array([0.0, 1.0, 0.0]),
+                1e-4,
+                1e2,
+                1e-1,
+                rod["radius"],
+                rod["mass"],
+                rod["position_collection"],
+                rod["velocity_collection"],
+                rod["internal_forces"],
+                rod["external_forces"].copy(),
+                records.buffers,
+            )
+            all_records.append(records)
+        records, expected_records = all_records
+        self.assert_same_records(records, expected_records)
+
+        # Elements in contact, with their penetration below the plane
+        element = records.indices[1, : records.n_records]
+        assert_array_equal(
+            np.sort(np.concatenate((element, no_contact_point_idx))), np.arange(50)
+        )
+        element_position = 0.5 * (
+            rod["position_collection"][:, 1:] + rod["position_collection"][:, :-1]
+        )
+        assert_allclose(
+            records.values[0, : records.n_records],
+            rod["radius"][element] - element_position[1, element],
+            rtol=1e-12,
+            atol=1e-12,
+        )
+
+    def test_rod_plane_with_anisotropic_friction(self):
+        "Friction is not recorded, records are the ones of the plane contact"
+        rod = self.rod_on_plane(50, np.random.default_rng(4))
+        expected_records = self.records()
+        get_kernels("elastica._contact_functions", "reference")[
+            "_calculate_contact_forces_rod_plane"
+        ](
+            np.zeros((3, 1)),
+            np.array([0.0, 1.0, 0.0]),
+            1e-4,
+            1e2,
+            1e-1,
+            rod["radius"],
+            rod["mass"],
+            rod["position_collection"],
+            rod["velocity_collection"],
+            rod["internal_forces"],
+            rod["external_forces"].copy(),
+            expected_records.buffers,
+        )
+        for backend in ["reference", "numpy"]:
+            records = self.records()
+            get_kernels("elastica._contact_functions", backend)[
+                "_calculate_contact_forces_rod_plane_with_anisotropic_friction"
+            ](
+                np.zeros((3, 1)),
+                np.array([0.0, 1.0, 0.0]),
+                1e-4,
+                1e-1,
+                1e2,
+                1e-1,
+                1.0,
+                1.5,
+                2.0,
+                1.1,
+                1.6,
+                2.1,
+                rod["radius"],
+                rod["mass"],
+                rod["tangents"],
+                rod["position_collection"],
+                rod["director_collection"],
+                rod["velocity_collection"],
+                rod["omega_collection"],
+                rod["internal_forces"],
+                rod["external_forces"].copy(),
+                rod["internal_torques"],
+                rod["external_torques"].copy(),
+                records.buffers,
+            )
+            assert records.n_records > 0
+            self.assert_same_records(records, expected_records)
+
+    def test_rod_mesh_surface(self):
+        rng = np.random.default_rng(5)
+        faces, face_normals = self.terrain(10, rng)
+        rod = self.rod_on_plane(50, rng)
+        rod["position_collection"][2] += 0.5
+        n_faces = faces.shape[-1]
+
+        all_records = []
+        for backend in ["reference", "numpy"]:
+            records = self.records()
+            get_kernels("elastica._contact_functions", backend)[
+                "_calculate_contact_forces_rod_mesh_surface"
+            ](
+                faces,
+                face_normals,
+                np.arange(51) * n_faces,
+                np.tile(np.arange(n_faces), 50),
+                1e-4,
+                1e2,
+                1e-1,
+                rod["radius"],
+                rod["mass"],
+                rod["position_collection"],
+                rod["velocity_collection"],
+                rod["internal_forces"],
+                rod["external_forces"].copy(),
+                records.buffers,
+            )
+            all_records.append(records)
+        records, expected_records = all_records
+        assert records.n_records > 0
+        self.assert_same_records(records, expected_records)
+        assert np.all(records.indices[3, : records.n_records] < n_faces)
@@ -0,0 +1,49 @@
+__doc__ = """ Test the records of the element pairs in contact """
+
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+from elastica.contact_records import ContactRecords
+from elastica.contact_utils import _record_contact
+
+
+@pytest.mark.parametrize("capacity", [0, -1])
+def test_contact_records_invalid_capacity(capacity):
+    with pytest.raises(ValueError) as excinfo:
+        ContactRecords(capacity)
+    assert "Capacity of contact records must be positive" in str(excinfo.value)
+
+
+def test_contact_records_drain():
+    records = ContactRecords(capacity=2)
+    records.systems[:] = (0, 1)
+    _record_contact(records.buffers, 5, 7, 0.01, 2.0)
+    records.systems[:] = (1, 3)
+    _record_contact(records.buffers, 6, 0, 0.02, 3.0)
+    _record_contact(records.buffers, 8, 0, 0.03, 4.0)
+    assert records.n_records == 2
+    assert records.n_dropped == 1
+
+    drained = records.drain()
+    assert_array_equal(drained["first_system"], [0, 1])
+    assert_array_equal(drained["first_element"], [5, 6])
+    assert_array_equal(drained["second_system"], [1, 3])
+    assert_array_equal(drained["second_element"], [7, 0])
+    assert_allclose(drained["gamma"], [0.01, 0.02])
+    assert_allclose(drained["force"], [2.0, 3.0])
+    assert drained["n_dropped"] == 1
+
+    # Draining clears the records, drained arrays are copies
+    assert records.n_records == 0
+    assert records.n_dropped == 0
+    _record_contact(records.buffers, 9, 0, 0.04, 5.0)
+    assert_array_equal(drained["first_element"], [5, 6])
+    assert records.drain()["first_element"].tolist() == [9]
+
+
+def test_contact_records_clear():
+    records = ContactRecords(capacity=3)
+    for _ in range(4):
+        _record_contact(records.buffers, 0, 0, 0.0, 0.0)
+    records.clear()
+    assert records.n_records == 0
+    assert all(array.size == 0 for array in list(records.drain().values())[:-1])
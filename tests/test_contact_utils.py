@@ -2,16 +2,19 @@ __doc__ = """ Test helper functions in elastica/contact_util.py used for contact
 
 import pytest
 import numpy as np
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_array_equal
 from elastica.utils import Tolerance
 from elastica.typing import RodBase
 from elastica.rigidbody import Cylinder, Sphere
+from elastica._backends import get_kernels
+from elastica.contact_records import ContactRecords
 from elastica.contact_utils import (
     _dot_product,
     _norm,
     _clip,
     _out_of_bounds,
     _find_min_dist,
+    _find_closest_point_on_triangle,
     _aabbs_not_intersecting,
     _prune_using_aabbs_rod_cylinder,
     _prune_using_aabbs_rod_rod,
@@ -21,6 +24,7 @@ from elastica.contact_utils import (
     _elements_to_nodes_inplace,
     _node_to_element_position,
     _node_to_element_velocity,
+    _node_to_element_mass_or_force_in_block,
 )
 
 
@@ -208,6 +212,102 @@ def test_find_min_dist():
     assert_allclose(contact_point_of_system1, [0, 0, 0])
 
 
+@pytest.mark.parametrize("backend", ["reference", "numpy"])
+def test_find_min_dist_batch(backend):
+    "Function to test the batched _find_min_dist against the scalar version"
+
+    """
+    Pairs of random segments, with parallel and intersecting segments and
+    segments closest at their end points, must give the same distance vector
+    as _find_min_dist for each pair.
+    """
+    _find_min_dist_batch = get_kernels("elastica.contact_utils", backend)[
+        "_find_min_dist_batch"
+    ]
+    rng = np.random.default_rng(0)
+    n_pairs = 50
+    x1 = rng.standard_normal((3, n_pairs))
+    e1 = rng.standard_normal((3, n_pairs))
+    x2 = rng.standard_normal((3, n_pairs))
+    e2 = rng.standard_normal((3, n_pairs))
+    # parallel segments
+    e2[..., :5] = 2.0 * e1[..., :5]
+    e2[..., 5:10] = -e1[..., 5:10]
+    # intersecting lines
+    x2[..., 10] = np.array([0, 1, 0])
+    x1[..., 10], e1[..., 10], e2[..., 10] = 0.0, 1.0, np.array([1, 0, 1])
+    # far apart along the first segment
+    x2[..., 11:15] = x1[..., 11:15] + 10.0 * e1[..., 11:15]
+
+    distance_vector, s, t = _find_min_dist_batch(x1, e1, x2, e2)
+
+    for pair in range(n_pairs):
+        expected, contact_point_of_system2, _ = _find_min_dist(
+            x1[..., pair], e1[..., pair], x2[..., pair], e2[..., pair]
+        )
+        assert_allclose(distance_vector[..., pair], expected, atol=Tolerance.atol())
+        assert_allclose(
+            x2[..., pair] + s[pair] * e2[..., pair],
+            contact_point_of_system2,
+            atol=Tolerance.atol(),
+        )
+        assert 0.0 <= s[pair] <= 1.0 and 0.0 <= t[pair] <= 1.0
+
+
+def test_find_closest_point_on_triangle():
+    "Function to test the closest point on a triangle in each Voronoi region"
+
+    a = np.array([0.0, 0.0, 0.0])
+    b = np.array([1.0, 0.0, 0.0])
+    c = np.array([0.0, 1.0, 0.0])
+    for point, expected in [
+        ([0.2, 0.2, 1.0], [0.2, 0.2, 0.0]),  # face
+        ([-1.0, -1.0, 0.5], [0.0, 0.0, 0.0]),  # vertex a
+        ([2.0, -0.5, 0.0], [1.0, 0.0, 0.0]),  # vertex b
+        ([-0.5, 2.0, 0.0], [0.0, 1.0, 0.0]),  # vertex c
+        ([0.5, -1.0, 0.0], [0.5, 0.0, 0.0]),  # edge ab
+        ([-1.0, 0.5, 0.0], [0.0, 0.5, 0.0]),  # edge ac
+        ([1.0, 1.0, -2.0], [0.5, 0.5, 0.0]),  # edge bc
+    ]:
+        assert_allclose(
+            _find_closest_point_on_triangle(np.array(point), a, b, c),
+            expected,
+            atol=Tolerance.atol(),
+        )
+
+
+@pytest.mark.parametrize("backend", ["reference", "numpy"])
+def test_find_closest_point_on_triangle_batch(backend):
+    "Function to test the batched closest point on triangles against the scalar version"
+
+    _find_closest_point_on_triangle_batch = get_kernels(
+        "elastica.contact_utils", backend
+    )["_find_closest_point_on_triangle_batch"]
+    rng = np.random.default_rng(0)
+    n_pairs = 200
+    points, a, b, c = (rng.standard_normal((3, n_pairs)) for _ in range(4))
+    # degenerate triangles
+    b[..., :5] = a[..., :5]
+    c[..., 5:10] = 0.5 * (a[..., 5:10] + b[..., 5:10])
+    c[..., 10:15] = a[..., 10:15]
+    c[..., 15:20] = b[..., 15:20]
+    b[..., 20:25] = a[..., 20:25]
+    c[..., 20:25] = a[..., 20:25]
+
+    closest_points = _find_closest_point_on_triangle_batch(points, a, b, c)
+    assert np.all(np.isfinite(closest_points))
+
+    for pair in range(n_pairs):
+        assert_allclose(
+            closest_points[..., pair],
+            _find_closest_point_on_triangle(
+                points[..., pair], a[..., pair], b[..., pair], c[..., pair]
+            ),
+            rtol=1e-12,
+            atol=1e-12,
+        )
+
+
 def test_aabbs_not_intersecting():
     "Function to test the _aabb_intersecting function"
 
@@ -441,6 +541,80 @@ def test_prune_using_aabbs_rod_sphere():
     )
 
 
+@pytest.mark.parametrize("backend", ["reference", "numpy"])
+@pytest.mark.parametrize("n_elem", [1, 2, 10, 100])
+@pytest.mark.parametrize("skin", [0.0, 0.1])
+def test_find_self_contact_candidates(backend, n_elem, skin):
+    "Function to test the self contact broadphase against all pairs of elements"
+
+    """
+    Elements of a helix are in contact with the elements of the turns above and
+    below them. Candidates must be the elements the brute-force loop over all
+    pairs keeps, in the same order.
+    """
+    _find_self_contact_candidates = get_kernels("elastica.contact_utils", backend)[
+        "_find_self_contact_candidates"
+    ]
+    rng = np.random.default_rng(0)
+    angle = np.linspace(0.0, 0.2 * np.pi * n_elem, n_elem + 1)
+    node_position = np.vstack((np.cos(angle), np.sin(angle), 0.02 * angle))
+    node_position += 0.01 * rng.standard_normal(node_position.shape)
+    position = node_position[..., :-1]
+    lengths = np.linalg.norm(np.diff(node_position, axis=1), axis=0)
+    radius = 0.05 + 0.01 * rng.random(n_elem)
+
+    candidate_offsets, candidate_indices = _find_self_contact_candidates(
+        position, radius, lengths, skin
+    )
+
+    assert candidate_offsets.shape == (n_elem + 1,)
+    for i in range(n_elem):
+        skip = int(1 + np.ceil(0.8 * np.pi * radius[i] / lengths[i]))
+        expected = [
+            j
+            for j in range(i - skip, -1, -1)
+            if np.linalg.norm(position[..., i] - position[..., j])
+            < (radius[i] + radius[j]) + (lengths[i] + lengths[j]) + skin
+        ]
+        assert (
+            list(candidate_indices[candidate_offsets[i] : candidate_offsets[i + 1]])
+            == expected
+        )
+
+
+@pytest.mark.parametrize("backend", ["reference", "numpy"])
+def test_record_contacts(backend):
+    "Pairs beyond the capacity of the records are counted, but not stored"
+    _record_contacts = get_kernels("elastica.contact_utils", backend)[
+        "_record_contacts"
+    ]
+    records = ContactRecords(capacity=5)
+    records.systems[:] = (2, 4)
+    first_elements = np.array([3, 1, 4])
+    second_elements = np.array([0, 5, 9])
+    gamma = np.array([0.1, 0.2, 0.3])
+    force = np.array([1.0, 2.0, 3.0])
+
+    _record_contacts(records.buffers, first_elements, second_elements, gamma, force)
+    assert records.n_records == 3
+    _record_contacts(
+        records.buffers, first_elements + 10, second_elements, gamma, force
+    )
+    assert records.n_records == 5
+    assert records.n_dropped == 1
+
+    assert_array_equal(
+        records.indices,
+        [[2] * 5, [3, 1, 4, 13, 11], [4] * 5, [0, 5, 9, 0, 5]],
+    )
+    assert_allclose(records.values, [[0.1, 0.2, 0.3, 0.1, 0.2], [1, 2, 3, 1, 2]])
+
+    # Records full, pairs are only counted
+    _record_contacts(records.buffers, first_elements, second_elements, gamma, force)
+    assert records.n_dropped == 4
+    assert_array_equal(records.indices[1], [3, 1, 4, 13, 11])
+
+
 class TestRodPlaneAuxiliaryFunctions:
     @pytest.mark.parametrize("n_elem", [2, 3, 5, 10, 20])
     def test_linear_interpolation_slip(self, n_elem):
@@ -501,6 +675,49 @@ class TestRodPlaneAuxiliaryFunctions:
         assert_allclose(correct_output, output, atol=Tolerance.atol())
         assert_allclose(np.sum(input), np.sum(output), atol=Tolerance.atol())
 
+    def test_node_to_element_mass_or_force_in_block(self):
+        """
+        Two rods stored one after the other with ghosts in between, as in a
+        memory block, must give the elements of each rod.
+        """
+        rng = np.random.default_rng(0)
+        rod_one = rng.standard_normal((3, 6))
+        rod_two = rng.standard_normal((3, 4))
+        block = np.hstack((rod_one, rng.standard_normal((3, 1)), rod_two))
+
+        output = _node_to_element_mass_or_force_in_block(
+            block, np.array([0, 7]), np.array([4, 9])
+        )
+        assert_allclose(output[..., :5], _node_to_element_mass_or_force(rod_one))
+        assert_allclose(output[..., 7:], _node_to_element_mass_or_force(rod_two))
+
+    @pytest.mark.parametrize(
+        "kernel_name",
+        [
+            "_node_to_element_mass_or_force",
+            "_node_to_element_position",
+            "_node_to_element_velocity",
+            "_elements_to_nodes_inplace",
+        ],
+    )
+    def test_numpy_kernels(self, kernel_name):
+        rng = np.random.default_rng(0)
+        n_elem = 10
+        node_vector = rng.standard_normal((3, n_elem + 1))
+        mass = 1.0 + rng.random(n_elem + 1)
+        outputs = []
+        for backend in ["reference", "numpy"]:
+            kernel = get_kernels("elastica.contact_utils", backend)[kernel_name]
+            if kernel_name == "_node_to_element_velocity":
+                outputs.append(kernel(mass, node_vector))
+            elif kernel_name == "_elements_to_nodes_inplace":
+                output = node_vector.copy()
+                kernel(node_vector[..., :-1], output)
+                outputs.append(output)
+            else:
+                outputs.append(kernel(node_vector))
+        assert_allclose(outputs[0], outputs[1], rtol=1e-14, atol=1e-14)
+
     # These functions are used in the case if Numba is available
     class TestGeneralAuxiliaryFunctions:
         @pytest.mark.parametrize("n_elem", [2, 3, 5, 10, 20])
@@ -0,0 +1,145 @@
+__doc__ = """ Ensemble tests """
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from elastica.ensemble import Ensemble
+from elastica.modules import BaseSystemCollection, Constraints, Forcing
+from elastica.rod.cosserat_rod import CosseratRod
+from elastica.rigidbody import Sphere
+from elastica.boundary_conditions import OneEndFixedBC
+from elastica.external_forces import GravityForces
+from elastica.timestepper.symplectic_steppers import PositionVerlet
+from elastica.timestepper import integrate
+
+
+class SimulatorForTesting(BaseSystemCollection, Constraints, Forcing):
+    pass
+
+
+YOUNGS_MODULI = np.array([1e5, 2e5, 5e5, 1e6])
+
+
+def build_member(simulator, member_idx):
+    rod = CosseratRod.straight_rod(
+        n_elements=10,
+        start=np.zeros(3),
+        direction=np.array([1.0, 0.0, 0.0]),
+        normal=np.array([0.0, 0.0, 1.0]),
+        base_length=1.0,
+        base_radius=0.05,
+        density=1000.0,
+        youngs_modulus=YOUNGS_MODULI[member_idx],
+        shear_modulus=YOUNGS_MODULI[member_idx] / 3.0,
+    )
+    sphere = Sphere(center=np.array([0.0, 0.0, 1.0]), base_radius=0.1, density=1000.0)
+    simulator.append(rod)
+    simulator.append(sphere)
+    simulator.constrain(rod).using(
+        OneEndFixedBC, constrained_position_idx=(0,), constrained_director_idx=(0,)
+    )
+    simulator.add_forcing_to(rod).using(GravityForces)
+    simulator.add_forcing_to(sphere).using(GravityForces)
+    return rod, sphere
+
+
+class TestEnsemble:
+    @pytest.mark.parametrize("n_members", [1, 2, 4])
+    def test_ensemble_reproduces_members_run_alone(self, n_members):
+        ensemble = Ensemble(SimulatorForTesting(), n_members, build_member)
+        ensemble.finalize()
+        integrate(PositionVerlet(), ensemble.simulator, 0.05, 500, progress_bar=False)
+
+        for member_idx in range(n_members):
+            simulator = SimulatorForTesting()
+            rod, sphere = build_member(simulator, member_idx)
+            simulator.finalize()
+            integrate(PositionVerlet(), simulator, 0.05, 500, progress_bar=False)
+
+            ensemble_rod, ensemble_sphere = ensemble.members[member_idx]
+            assert_allclose(
+                ensemble_rod.position_collection,
+                rod.position_collection,
+                rtol=1e-12,
+                atol=1e-12,
+            )
+            assert_allclose(
+                ensemble_sphere.position_collection,
+                sphere.position_collection,
+                rtol=1e-12,
+                atol=1e-12,
+            )
+
+        # Members with different stiffness bend differently
+        if n_members > 1:
+            tips = ensemble.stack("position_collection")[:, 1, -1]
+            assert np.all(np.diff(tips) > 0.0)
+
+    def test_systems_of_members(self):
+        ensemble = Ensemble(SimulatorForTesting(), 3, build_member)
+
+        assert ensemble.n_members == 3
+        for member_idx in range(3):
+            assert ensemble.systems(member_idx) == list(ensemble.members[member_idx])
+
+    @pytest.mark.parametrize("finalize", [False, True])
+    @pytest.mark.parametrize(
+        "attribute", ["position_collection", "director_collection"]
+    )
+    @pytest.mark.parametrize("system_idx", [0, 1])
+    def test_stack(self, finalize, attribute, system_idx):
+        ensemble = Ensemble(SimulatorForTesting(), 4, build_member)
+        if finalize:
+            ensemble.finalize()
+
+        stacked = ensemble.stack(attribute, system_idx)
+
+        expected = np.stack(
+            [getattr(member[system_idx], attribute) for member in ensemble.members]
+        )
+        assert_array_equal(stacked, expected)
+        assert not stacked.flags.writeable
+        # After finalize, the stacked variable is a view of the memory block
+        assert (
+            np.shares_memory(
+                stacked, getattr(ensemble.simulator[-2 + system_idx], attribute)
+            )
+            == finalize
+        )
+
+    def test_stack_follows_simulation(self):
+        ensemble = Ensemble(SimulatorForTesting(), 2, build_member)
+        ensemble.finalize()
+        stacked = ensemble.stack("position_collection")
+
+        integrate(PositionVerlet(), ensemble.simulator, 0.01, 10, progress_bar=False)
+
+        for member_idx, (rod, _) in enumerate(ensemble.members):
+            assert_array_equal(stacked[member_idx], rod.position_collection)
+
+    def test_different_members_throw(self):
+        def build_different_member(simulator, member_idx):
+            rod, sphere = build_member(simulator, 0)
+            if member_idx == 1:
+                simulator.append(
+                    Sphere(center=np.zeros(3), base_radius=0.1, density=1000.0)
+                )
+            return rod, sphere
+
+        with pytest.raises(ValueError) as excinfo:
+            Ensemble(SimulatorForTesting(), 2, build_different_member)
+        assert "member 1 differs from member 0" in str(excinfo.value)
+
+    @pytest.mark.parametrize("n_members", [0, -1])
+    def test_invalid_number_of_members_throws(self, n_members):
+        with pytest.raises(ValueError):
+            Ensemble(SimulatorForTesting(), n_members, build_member)
+
+    def test_build_after_finalize_throws(self):
+        simulator = SimulatorForTesting()
+        build_member(simulator, 0)
+        simulator.finalize()
+
+        with pytest.raises(AssertionError):
+            Ensemble(simulator, 2, build_member)
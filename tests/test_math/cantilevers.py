@@ -0,0 +1,61 @@
+__doc__ = """Cantilevers under gravity, shared by the time-stepper tests"""
+
+import numpy as np
+
+from elastica.modules import (
+    BaseSystemCollection,
+    Constraints,
+    Forcing,
+    CallBacks,
+    Contact,
+)
+
+
+class Simulator(BaseSystemCollection, Constraints, Forcing, CallBacks, Contact):
+    pass
+
+
+def make_cantilevers(*rods_parameters, finalize=True):
+    """
+    Simulator of rods along x, clamped at their start and under gravity.
+
+    Parameters
+    ----------
+    rods_parameters : dict
+        Parameters of each rod: n_elem (10), start (origin), base_length (1.0),
+        base_radius (0.01) and youngs_modulus (1e6).
+    finalize : bool
+        Whether to finalize the simulator, e.g. not to add other features.
+
+    Returns
+    -------
+    simulator, rods
+    """
+    from elastica.rod.cosserat_rod import CosseratRod
+    from elastica.boundary_conditions import OneEndFixedBC
+    from elastica.external_forces import GravityForces
+
+    simulator = Simulator()
+    rods = []
+    for parameters in rods_parameters:
+        rod = CosseratRod.straight_rod(
+            parameters.get("n_elem", 10),
+            parameters.get("start", np.zeros(3)),
+            np.array([1.0, 0.0, 0.0]),
+            np.array([0.0, 0.0, 1.0]),
+            parameters.get("base_length", 1.0),
+            parameters.get("base_radius", 0.01),
+            1e3,
+            youngs_modulus=parameters.get("youngs_modulus", 1e6),
+        )
+        simulator.append(rod)
+        simulator.constrain(rod).using(
+            OneEndFixedBC, constrained_position_idx=(0,), constrained_director_idx=(0,)
+        )
+        simulator.add_forcing_to(rod).using(
+            GravityForces, acc_gravity=np.array([0.0, 0.0, -9.81])
+        )
+        rods.append(rod)
+    if finalize:
+        simulator.finalize()
+    return simulator, rods
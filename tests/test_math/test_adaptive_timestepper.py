@@ -0,0 +1,168 @@
+__doc__ = """Testing adaptive time stepping of symplectic steppers"""
+from collections import defaultdict
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from elastica.timestepper import integrate, integrate_adaptive
+from elastica.timestepper.adaptive import _AdaptiveStepController
+from elastica.timestepper.explicit_steppers import RungeKutta4
+from elastica.timestepper.symplectic_steppers import PositionVerlet, PEFRL
+
+from tests.test_math.cantilevers import Simulator, make_cantilevers
+
+
+def make_cantilever():
+    "A soft cantilever swinging down under gravity"
+    from elastica.callback_functions import MyCallBack
+
+    simulator, (rod,) = make_cantilevers(
+        dict(base_length=0.5, youngs_modulus=1e5), finalize=False
+    )
+    callback_params = defaultdict(list)
+    simulator.collect_diagnostics(rod).using(
+        MyCallBack, step_skip=1, callback_params=callback_params
+    )
+    simulator.finalize()
+    return simulator, rod, callback_params
+
+
+def make_falling_rod():
+    "A rod falling flat on a stiff plane"
+    from elastica.rod.cosserat_rod import CosseratRod
+    from elastica.external_forces import GravityForces
+    from elastica.contact_forces import RodPlaneContact
+    from elastica.surface import Plane
+
+    simulator = Simulator()
+    rod = CosseratRod.straight_rod(
+        10,
+        np.array([0.0, 0.0, 0.02]),
+        np.array([1.0, 0.0, 0.0]),
+        np.array([0.0, 0.0, 1.0]),
+        0.5,
+        0.01,
+        1e3,
+        youngs_modulus=1e6,
+    )
+    plane = Plane(np.zeros(3), np.array([0.0, 0.0, 1.0]))
+    simulator.append(rod)
+    simulator.append(plane)
+    simulator.add_forcing_to(rod).using(
+        GravityForces, acc_gravity=np.array([0.0, 0.0, -9.81])
+    )
+    simulator.detect_contact_between(rod, plane).using(RodPlaneContact, k=1e4, nu=1.0)
+    simulator.finalize()
+    return simulator, rod
+
+
+@pytest.mark.parametrize("stepper", [PositionVerlet, PEFRL])
+def test_adaptive_steps_match_small_fixed_steps(stepper):
+    simulator, rod, _ = make_cantilever()
+    integrate(stepper(), simulator, 0.1, 4000, progress_bar=False)
+    expected_position = rod.position_collection.copy()
+
+    simulator, rod, _ = make_cantilever()
+    time = integrate_adaptive(
+        stepper(),
+        simulator,
+        final_time=0.1,
+        output_interval=0.01,
+        dt_min=1e-7,
+        dt_max=1e-2,
+        tolerance=1e-7,
+        director_tolerance=1e-4,
+        progress_bar=False,
+    )
+
+    assert time == 0.1
+    # The rod swung down
+    assert rod.position_collection[2, -1] < -0.02
+    assert_allclose(rod.position_collection, expected_position, atol=1e-3)
+
+
+def test_callbacks_are_called_at_output_times():
+    simulator, rod, callback_params = make_cantilever()
+    integrate_adaptive(
+        PositionVerlet(),
+        simulator,
+        final_time=0.05,
+        output_interval=0.01,
+        dt_min=1e-7,
+        dt_max=3e-3,
+        tolerance=1e-6,
+        progress_bar=False,
+    )
+
+    # Including the call of the callbacks when the simulator is finalized
+    assert callback_params["step"] == [0, 1, 2, 3, 4, 5]
+    assert callback_params["time"] == [0.0, 0.01, 0.02, 0.03, 0.04, 0.05]
+
+
+def test_time_step_grows_in_flight_and_shrinks_at_impact():
+    simulator, rod = make_falling_rod()
+    controller = _AdaptiveStepController(
+        PositionVerlet(), simulator, 1e-7, 1e-3, 1e-6, 1e-4
+    )
+    time = 0.0
+    impact_step = None
+    while time < 0.1:
+        time = controller.step(time, 0.1)
+        if impact_step is None and rod.position_collection[2].min() < rod.radius[0]:
+            impact_step = controller.statistics()["largest_step"]
+
+    statistics = controller.statistics()
+    # Uniform acceleration is integrated exactly, the steps of the free fall
+    # reach the largest time step
+    assert impact_step == 1e-3
+    assert statistics["smallest_step"] < 1e-4
+    assert statistics["rejected_steps"] > 0
+    # The rod rests on the plane
+    assert np.all(rod.position_collection[2] > 0.0)
+    assert np.all(rod.position_collection[2] < 2.0 * rod.radius[0])
+
+
+def test_rejected_steps_restore_the_state():
+    simulator, rod, _ = make_cantilever()
+    position = rod.position_collection.copy()
+    # No step is accurate enough, but the smallest one
+    controller = _AdaptiveStepController(
+        PositionVerlet(), simulator, 1e-6, 1e-3, 1e-30, 1e-30
+    )
+    controller.dt = 1e-3
+    time = controller.step(0.0, 1.0)
+
+    assert time == pytest.approx(1e-6)
+    assert controller.statistics()["rejected_steps"] > 0
+    # The state reached is the one of two half steps of the smallest step
+    simulator, expected_rod, _ = make_cantilever()
+    integrate(PositionVerlet(), simulator, 1e-6, 2, progress_bar=False)
+    assert_allclose(
+        rod.position_collection, expected_rod.position_collection, rtol=1e-12
+    )
+    assert not np.all(rod.position_collection == position)
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        (dict(dt_min=1e-3, dt_max=1e-4), "dt_min <= dt_max"),
+        (dict(dt_min=0.0), "dt_min <= dt_max"),
+        (dict(tolerance=0.0), "Tolerances must be positive"),
+    ],
+)
+def test_adaptive_time_stepping_with_illegal_settings_throws(kwargs, message):
+    simulator, _, _ = make_cantilever()
+    settings = dict(dt_min=1e-6, dt_max=1e-3, tolerance=1e-6, director_tolerance=1e-6)
+    settings.update(kwargs)
+    with pytest.raises(ValueError) as excinfo:
+        _AdaptiveStepController(PositionVerlet(), simulator, **settings)
+    assert message in str(excinfo.value)
+
+
+def test_adaptive_time_stepping_with_explicit_stepper_throws():
+    simulator, _, _ = make_cantilever()
+    with pytest.raises(NotImplementedError) as excinfo:
+        _AdaptiveStepController(RungeKutta4(), simulator, 1e-6, 1e-3, 1e-6, 1e-6)
+    assert "only supported for symplectic steppers" in str(excinfo.value)
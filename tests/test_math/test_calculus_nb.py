@@ -5,6 +5,7 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 from elastica.utils import Tolerance
+from elastica._backends import available_backends, get_kernels
 from elastica._calculus import (
     _trapezoidal,
     _two_point_difference,
@@ -13,6 +14,10 @@ from elastica._calculus import (
     _trapezoidal_for_block_structure,
     _two_point_difference_for_block_structure,
 )
+from elastica.memory_block.memory_block_rod_base import (
+    make_block_memory_metadata,
+    make_block_memory_ghost_mask,
+)
 
 
 class Trapezoidal:
@@ -190,6 +195,73 @@ def test_two_point_difference_for_block_structure_correctness():
     assert_allclose(test_vector, correct_vector, atol=Tolerance.atol())
 
 
+@pytest.mark.parametrize("backend", available_backends("elastica._calculus"))
+@pytest.mark.parametrize(
+    "kernel_name",
+    ["_trapezoidal_for_block_structure", "_two_point_difference_for_block_structure"],
+)
+def test_masked_block_structure_kernels_match_ghost_index_kernels(backend, kernel_name):
+    """
+    Block-structure kernels driven by a ghost mask give the same result as the ones
+    driven by ghost indices, for both the output and the reset input.
+
+    Returns
+    -------
+
+    """
+    kernels = get_kernels("elastica._calculus", backend)
+    n_elems, _, ghost_elems_idx, _ = make_block_memory_metadata(
+        np.array([5, 10, 3, 8], dtype=np.int64)
+    )
+    ghost_mask = make_block_memory_ghost_mask(n_elems, ghost_elems_idx)
+    input_vector = np.random.randn(3, n_elems)
+    correct_input_vector = input_vector.copy()
+
+    correct_vector = get_kernels("elastica._calculus", "reference")[kernel_name](
+        correct_input_vector, ghost_elems_idx
+    )
+    test_vector = np.empty((3, n_elems + 1))
+    kernels["_masked" + kernel_name](input_vector, ghost_mask, out=test_vector)
+
+    assert_allclose(test_vector, correct_vector, atol=Tolerance.atol())
+    assert_allclose(input_vector, correct_input_vector, atol=Tolerance.atol())
+
+
+@pytest.mark.parametrize("backend", available_backends("elastica._calculus"))
+def test_calculus_kernels_match_reference(backend):
+    reference = get_kernels("elastica._calculus", "reference")
+    kernels = get_kernels("elastica._calculus", backend)
+    blocksize = 32
+    ghost_idx = np.array([14, 15])
+    input_vector = np.random.randn(3, blocksize)
+
+    for kernel_name in ["_trapezoidal", "_two_point_difference", "_difference"]:
+        assert_allclose(
+            kernels[kernel_name](input_vector),
+            reference[kernel_name](input_vector),
+            atol=Tolerance.atol(),
+        )
+    for kernel_name in [
+        "_trapezoidal_for_block_structure",
+        "_two_point_difference_for_block_structure",
+    ]:
+        assert_allclose(
+            kernels[kernel_name](input_vector.copy(), ghost_idx),
+            reference[kernel_name](input_vector.copy(), ghost_idx),
+            atol=Tolerance.atol(),
+        )
+    assert_allclose(
+        kernels["_average"](input_vector[0]),
+        reference["_average"](input_vector[0]),
+        atol=Tolerance.atol(),
+    )
+    assert_allclose(
+        kernels["_clip_array"](input_vector[0].copy(), -0.5, 0.5),
+        reference["_clip_array"](input_vector[0].copy(), -0.5, 0.5),
+        atol=Tolerance.atol(),
+    )
+
+
 def test_clip_array():
     """
     Test _clip array function.
@@ -1,10 +1,15 @@
 __doc__ = """Test Cosserat rod governing equations for Numba implementation"""
 
 # System imports
+from copy import deepcopy
+
 import numpy as np
 from numpy.testing import assert_allclose
 from elastica.utils import Tolerance, MaxDimension
+from elastica._backends import available_backends, get_kernels
 from elastica._linalg import _batch_matvec
+from elastica._rotations import _rotate
+from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
 from elastica.rod.cosserat_rod import (
     CosseratRod,
     _compute_geometry_from_state,
@@ -50,6 +55,8 @@ def constructor(n_elem):
     # Ghost needed for Cosserat rod functions adapted for block structure.
     rod.ghost_elems_idx = np.empty((0), dtype=int)
     rod.ghost_voronoi_idx = np.empty((0), dtype=int)
+    rod.elems_mask = np.ones(rod.n_elems)
+    rod.voronoi_mask = np.ones(rod.n_elems - 1)
 
     return cls, rod
 
@@ -1205,3 +1212,132 @@ def test_get_z_vector_function():
     """
     correct_z_vector = np.array([0.0, 0.0, 1.0]).reshape(3, 1)
     assert_allclose(correct_z_vector, _get_z_vector(), atol=Tolerance.atol())
+
+
+def _perturbed_memory_block(n_elems_list):
+    rods = []
+    for n_elem in n_elems_list:
+        _, rod = constructor(n_elem)
+        rods.append(rod)
+    memory_block = MemoryBlockCosseratRod(rods, list(range(len(rods))))
+
+    memory_block.position_collection[:] += 1e-2 * np.random.randn(
+        3, memory_block.n_nodes
+    )
+    memory_block.velocity_collection[:] = np.random.randn(3, memory_block.n_nodes)
+    memory_block.omega_collection[:] = np.random.randn(3, memory_block.n_elems)
+    memory_block.director_collection[:] = _rotate(
+        memory_block.director_collection,
+        1.0,
+        1e-1 * np.random.randn(3, memory_block.n_elems),
+    )
+    return memory_block
+
+
+def _internal_forces_and_torques_from_separate_kernels(memory_block):
+    _compute_internal_forces(
+        memory_block.position_collection,
+        memory_block.volume,
+        memory_block.lengths,
+        memory_block.tangents,
+        memory_block.radius,
+        memory_block.rest_lengths,
+        memory_block.rest_voronoi_lengths,
+        memory_block.dilatation,
+        memory_block.voronoi_dilatation,
+        memory_block.director_collection,
+        memory_block.sigma,
+        memory_block.rest_sigma,
+        memory_block.shear_matrix,
+        memory_block.internal_stress,
+        memory_block.internal_forces,
+        memory_block.ghost_elems_idx,
+    )
+    _compute_internal_torques(
+        memory_block.position_collection,
+        memory_block.velocity_collection,
+        memory_block.tangents,
+        memory_block.lengths,
+        memory_block.rest_lengths,
+        memory_block.director_collection,
+        memory_block.rest_voronoi_lengths,
+        memory_block.bend_matrix,
+        memory_block.rest_kappa,
+        memory_block.kappa,
+        memory_block.voronoi_dilatation,
+        memory_block.mass_second_moment_of_inertia,
+        memory_block.omega_collection,
+        memory_block.internal_stress,
+        memory_block.internal_couple,
+        memory_block.dilatation,
+        memory_block.dilatation_rate,
+        memory_block.internal_torques,
+        memory_block.ghost_voronoi_idx,
+    )
+
+
+@pytest.mark.parametrize("backend", available_backends("elastica.rod.cosserat_rod"))
+@pytest.mark.parametrize("n_elems_list", [[5], [2, 7], [10, 3, 6]])
+def test_fused_internal_forces_and_torques_match_separate_kernels(
+    backend, n_elems_list
+):
+    test_block = _perturbed_memory_block(n_elems_list)
+    correct_block = deepcopy(test_block)
+    _internal_forces_and_torques_from_separate_kernels(correct_block)
+
+    # Outputs are overwritten, not accumulated
+    test_block.internal_forces[:] = np.nan
+    test_block.internal_torques[:] = np.nan
+    fused_kernel = get_kernels("elastica.rod.cosserat_rod", backend)[
+        "_compute_internal_forces_and_torques"
+    ]
+    fused_kernel(
+        test_block.position_collection,
+        test_block.velocity_collection,
+        test_block.volume,
+        test_block.lengths,
+        test_block.tangents,
+        test_block.radius,
+        test_block.rest_lengths,
+        test_block.rest_voronoi_lengths,
+        test_block.dilatation,
+        test_block.voronoi_dilatation,
+        test_block.director_collection,
+        test_block.sigma,
+        test_block.rest_sigma,
+        test_block.shear_matrix,
+        test_block.internal_stress,
+        test_block.bend_matrix,
+        test_block.rest_kappa,
+        test_block.kappa,
+        test_block.internal_couple,
+        test_block.mass_second_moment_of_inertia,
+        test_block.omega_collection,
+        test_block.dilatation_rate,
+        test_block.internal_forces,
+        test_block.internal_torques,
+        test_block.elems_mask,
+        test_block.voronoi_mask,
+    )
+
+    for name in [
+        "lengths",
+        "tangents",
+        "radius",
+        "dilatation",
+        "voronoi_dilatation",
+        "sigma",
+        "internal_stress",
+        "kappa",
+        "internal_couple",
+        "dilatation_rate",
+        "internal_forces",
+        "internal_torques",
+    ]:
+        assert_allclose(
+            getattr(test_block, name),
+            getattr(correct_block, name),
+            rtol=Tolerance.rtol(),
+            atol=Tolerance.atol(),
+            err_msg=name,
+        )
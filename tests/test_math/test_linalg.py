@@ -6,6 +6,8 @@ __doc__ = (
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
+from elastica.utils import Tolerance
+from elastica._backends import available_backends, get_kernels
 from elastica._linalg import (
     _batch_matvec,
     _batch_matmul,
@@ -195,3 +197,81 @@ def test_batch_matrix_transpose(blocksize):
     correct_matrix_collection = np.einsum("ijk->jik", input_matrix_collection)
 
     assert_allclose(test_matrix_collection, correct_matrix_collection)
+
+
+def _linalg_kernel_arguments(blocksize):
+    matrix_collection = np.random.randn(3, 3, blocksize)
+    second_matrix_collection = np.random.randn(3, 3, blocksize)
+    vector_collection = np.random.randn(3, blocksize)
+    second_vector_collection = np.random.randn(3, blocksize)
+    vector = np.random.randn(3)
+    scalar_collection = np.random.randn(blocksize)
+
+    # kernel name : (inputs, shape of the output)
+    return {
+        "_batch_matvec": (
+            (matrix_collection, vector_collection),
+            (3, blocksize),
+        ),
+        "_batch_matmul": (
+            (matrix_collection, second_matrix_collection),
+            (3, 3, blocksize),
+        ),
+        "_batch_cross": (
+            (vector_collection, second_vector_collection),
+            (3, blocksize),
+        ),
+        "_batch_vec_oneD_vec_cross": ((vector_collection, vector), (3, blocksize)),
+        "_batch_dot": (
+            (vector_collection, second_vector_collection),
+            (blocksize,),
+        ),
+        "_batch_norm": ((vector_collection,), (blocksize,)),
+        "_batch_product_i_k_to_ik": ((vector, scalar_collection), (3, blocksize)),
+        "_batch_product_i_ik_to_k": ((vector, vector_collection), (blocksize,)),
+        "_batch_product_k_ik_to_ik": (
+            (scalar_collection, vector_collection),
+            (3, blocksize),
+        ),
+        "_batch_vector_sum": (
+            (vector_collection, second_vector_collection),
+            (3, blocksize),
+        ),
+        "_batch_matrix_transpose": ((matrix_collection,), (3, 3, blocksize)),
+    }
+
+
+@pytest.mark.parametrize("backend", available_backends("elastica._linalg"))
+@pytest.mark.parametrize("kernel_name", list(_linalg_kernel_arguments(1).keys()))
+@pytest.mark.parametrize("blocksize", [1, 8, 32])
+def test_linalg_backends_match_reference(backend, kernel_name, blocksize):
+    inputs, _ = _linalg_kernel_arguments(blocksize)[kernel_name]
+
+    test_output = get_kernels("elastica._linalg", backend)[kernel_name](*inputs)
+    correct_output = get_kernels("elastica._linalg", "reference")[kernel_name](*inputs)
+
+    assert test_output.shape == correct_output.shape
+    assert_allclose(test_output, correct_output, atol=Tolerance.atol())
+
+
+@pytest.mark.parametrize("backend", available_backends("elastica._linalg"))
+@pytest.mark.parametrize("kernel_name", list(_linalg_kernel_arguments(1).keys()))
+def test_linalg_kernels_write_into_out_buffer(backend, kernel_name):
+    blocksize = 16
+    inputs, output_shape = _linalg_kernel_arguments(blocksize)[kernel_name]
+    kernel = get_kernels("elastica._linalg", backend)[kernel_name]
+
+    # Fill with garbage, kernels must overwrite everything
+    out = np.full(output_shape, np.nan)
+    test_output = kernel(*inputs, out=out)
+
+    assert test_output is out
+    assert_allclose(out, kernel(*inputs), atol=Tolerance.atol())
+
+
+def test_linalg_backend_registry():
+    assert "numpy" in available_backends("elastica._linalg")
+    assert "reference" in available_backends("elastica._linalg")
+
+    with pytest.raises(ValueError):
+        get_kernels("elastica._linalg", "not_a_backend")
@@ -178,6 +178,53 @@ def test_block_structure_kinematic_update(n_rods):
     )
 
 
+@pytest.mark.parametrize("with_scratch", [True, False])
+def test_kinematic_update_with_position_residual_in_single_precision(with_scratch):
+    """
+    Increments below the rounding error of single precision positions are lost
+    by a plain update, and carried over to the next updates with a residual.
+    """
+    n_nodes = 4
+    prefac = 1.0
+    velocity = np.full((3, n_nodes), 1e-8, dtype=np.float32)
+    omega = np.zeros((3, n_nodes - 1), dtype=np.float32)
+    scratch = (
+        (
+            np.zeros((1, 3, n_nodes), dtype=np.float32),
+            np.zeros((1, 3, n_nodes - 1), dtype=np.float32),
+            np.zeros((1, 3, 3, n_nodes - 1), dtype=np.float32),
+        )
+        if with_scratch
+        else (None, None, None)
+    )
+
+    def update(n_updates, position_residual):
+        position = np.ones((3, n_nodes), dtype=np.float32)
+        directors = np.repeat(
+            np.identity(3, dtype=np.float32)[..., np.newaxis], n_nodes - 1, axis=2
+        )
+        for _ in range(n_updates):
+            overload_operator_kinematic_numba(
+                n_nodes,
+                prefac,
+                position,
+                directors,
+                velocity,
+                omega,
+                *scratch,
+                position_residual,
+            )
+        return position
+
+    n_updates = 100
+    assert_allclose(update(n_updates, None), 1.0, rtol=0.0, atol=0.0)
+    assert_allclose(
+        update(n_updates, np.zeros((3, n_nodes), dtype=np.float32)),
+        1.0 + n_updates * prefac * 1e-8,
+        rtol=1e-7,
+    )
+
+
 @pytest.mark.parametrize("n_rods", [1, 2, 5, 6])
 def test_block_structure_dynamic_state_references(n_rods):
     """
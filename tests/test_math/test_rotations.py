@@ -5,9 +5,11 @@ import pytest
 from numpy.testing import assert_allclose
 import sys
 
+from elastica._backends import available_backends, get_kernels
 from elastica._rotations import (
     _get_rotation_matrix,
     _rotate,
+    _rotate_in_place,
     _inv_rotate,
 )
 
@@ -374,6 +376,71 @@ def test_inv_rotate_correctness_on_circle_in_two_dimensions_with_different_direc
     assert_allclose(test_scaling, 0.0 * test_scaling + dtheta_di, atol=Tolerance.atol())
 
 
+def _axis_collection_with_small_angles(blocksize):
+    axis_collection = np.random.randn(3, blocksize)
+    axis_collection /= np.linalg.norm(axis_collection, axis=0)
+    # Angles across the small angle branch, including the identity
+    angles = np.logspace(-14, 0, blocksize)
+    angles[0] = 0.0
+    return axis_collection * angles
+
+
+@pytest.mark.parametrize("angle", [1e-12, 1e-6, 0.999e-3, 1.001e-3, 0.5])
+def test_inv_rotate_recovers_rotation_vector_at_small_angles(angle):
+    axis = np.random.randn(3, 1)
+    rotation_vector = angle * axis / np.linalg.norm(axis)
+    director_collection = np.dstack(
+        (np.eye(3).reshape(3, 3, 1), _get_rotation_matrix(1.0, rotation_vector))
+    )
+
+    assert_allclose(
+        _inv_rotate(director_collection), rotation_vector, rtol=1e-10, atol=0.0
+    )
+
+
+def test_rotate_in_place_matches_rotate():
+    blocksize = 64
+    director_collection = _get_rotation_matrix(1.0, np.random.randn(3, blocksize))
+    axis_collection = _axis_collection_with_small_angles(blocksize)
+
+    correct_director_collection = _rotate(director_collection, 0.3, axis_collection)
+    _rotate_in_place(director_collection, 0.3, axis_collection)
+
+    assert_allclose(
+        director_collection, correct_director_collection, atol=Tolerance.atol()
+    )
+
+
+@pytest.mark.parametrize("backend", available_backends("elastica._rotations"))
+def test_rotation_kernels_match_reference(backend):
+    blocksize = 64
+    reference = get_kernels("elastica._rotations", "reference")
+    kernels = get_kernels("elastica._rotations", backend)
+    axis_collection = _axis_collection_with_small_angles(blocksize)
+    director_collection = reference["_get_rotation_matrix"](
+        1.0, np.random.randn(3, blocksize)
+    )
+
+    for scale in [1.0, -0.3, 0.0]:
+        assert_allclose(
+            kernels["_get_rotation_matrix"](scale, axis_collection),
+            reference["_get_rotation_matrix"](scale, axis_collection),
+            atol=Tolerance.atol(),
+        )
+    assert_allclose(
+        kernels["_inv_rotate"](director_collection),
+        reference["_inv_rotate"](director_collection),
+        atol=Tolerance.atol(),
+    )
+
+    test_director_collection = director_collection.copy()
+    kernels["_rotate_in_place"](test_director_collection, 1.0, axis_collection)
+    reference["_rotate_in_place"](director_collection, 1.0, axis_collection)
+    assert_allclose(
+        test_director_collection, director_collection, atol=Tolerance.atol()
+    )
+
+
 ###############################################################################
 ##################### Implementation tests finis ##############################
 ###############################################################################
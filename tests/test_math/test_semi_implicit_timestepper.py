@@ -0,0 +1,195 @@
+__doc__ = """Testing the implicit-explicit position Verlet stepper"""
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from elastica.timestepper import integrate
+from elastica.timestepper.symplectic_steppers import (
+    PositionVerlet,
+    SemiImplicitPositionVerlet,
+)
+
+from tests.test_math.cantilevers import (
+    Simulator,
+    make_cantilevers as make_cantilever_simulator,
+)
+
+
+def make_cantilevers():
+    """
+    Two slender cantilevers under gravity, whose time step is limited by their
+    shear and stretch stiffness
+    """
+    simulator, rods = make_cantilever_simulator(
+        *(
+            dict(n_elem=20, start=np.array([0.0, 1.0 * i_rod, 0.0]), base_radius=0.005)
+            for i_rod in range(2)
+        )
+    )
+    return simulator, rods
+
+
+@pytest.fixture(scope="module")
+def reference_cantilevers():
+    simulator, rods = make_cantilevers()
+    integrate(PositionVerlet(), simulator, 0.05, 5000, progress_bar=False)
+    return rods
+
+
+def test_constrained_nodes_and_elements_are_marked_in_memory_blocks():
+    simulator, rods = make_cantilevers()
+    memory_block = simulator._memory_blocks[0]
+
+    # The fixed ends of both rods, after the ghost node and elements
+    assert_array_equal(memory_block.constrained_nodes_idx, [0, 22])
+    assert_array_equal(memory_block.constrained_elems_idx, [0, 22])
+    # OneEndFixedBC constrains all the components of their rates
+    assert memory_block.constrained_nodes_selector.all()
+    assert memory_block.constrained_elems_selector.all()
+
+
+def test_semi_implicit_steps_beyond_the_explicit_time_step_limit(
+    reference_cantilevers,
+):
+    # Explicit steps are unstable above 3e-4
+    simulator, rods = make_cantilevers()
+    integrate(PositionVerlet(), simulator, 0.05, 100, progress_bar=False)
+    assert not np.allclose(
+        rods[0].position_collection,
+        reference_cantilevers[0].position_collection,
+        atol=1e-2,
+    )
+
+    simulator, rods = make_cantilevers()
+    integrate(SemiImplicitPositionVerlet(), simulator, 0.05, 25, progress_bar=False)
+
+    for rod, reference_rod in zip(rods, reference_cantilevers):
+        # The rods bend, clamped at their fixed end
+        assert rod.position_collection[2, -1] < -1e-2
+        assert_array_equal(
+            rod.position_collection[:, 0], reference_rod.position_collection[:, 0]
+        )
+        assert_allclose(
+            rod.position_collection, reference_rod.position_collection, atol=1e-4
+        )
+
+
+def test_semi_implicit_steps_are_second_order(reference_cantilevers):
+    errors = []
+    for n_steps in [250, 500]:
+        simulator, rods = make_cantilevers()
+        integrate(
+            SemiImplicitPositionVerlet(), simulator, 0.05, n_steps, progress_bar=False
+        )
+        errors.append(
+            np.abs(
+                rods[0].position_collection
+                - reference_cantilevers[0].position_collection
+            ).max()
+        )
+
+    assert errors[0] < 1e-6
+    assert errors[0] / errors[1] > 3.5
+
+
+@pytest.mark.parametrize(
+    "constraint_kwargs, acc_gravity",
+    [
+        # Node free to fall along x, held along z
+        (
+            dict(
+                constrained_position_idx=(0,),
+                translational_constraint_selector=np.array([False, False, True]),
+            ),
+            np.array([-9.81, 0.0, 0.0]),
+        ),
+        # Element free to rotate around z, bending under gravity along y
+        (
+            dict(
+                constrained_position_idx=(0,),
+                constrained_director_idx=(0,),
+                rotational_constraint_selector=np.array([True, True, False]),
+            ),
+            np.array([0.0, -9.81, 0.0]),
+        ),
+    ],
+)
+def test_semi_implicit_steps_of_partially_constrained_rods(
+    constraint_kwargs, acc_gravity
+):
+    from elastica.rod.cosserat_rod import CosseratRod
+    from elastica.boundary_conditions import GeneralConstraint
+    from elastica.external_forces import GravityForces
+
+    rods = []
+    for stepper in [PositionVerlet, SemiImplicitPositionVerlet]:
+        simulator = Simulator()
+        rod = CosseratRod.straight_rod(
+            10,
+            np.zeros(3),
+            np.array([1.0, 0.0, 0.0]),
+            np.array([0.0, 0.0, 1.0]),
+            1.0,
+            0.01,
+            1e3,
+            youngs_modulus=1e6,
+        )
+        simulator.append(rod)
+        simulator.constrain(rod).using(GeneralConstraint, **constraint_kwargs)
+        simulator.add_forcing_to(rod).using(GravityForces, acc_gravity=acc_gravity)
+        simulator.finalize()
+        integrate(stepper(), simulator, 0.05, 500, progress_bar=False)
+        rods.append(rod)
+
+    # Only the constrained components of the rates of the first node and
+    # element are held, the others move as with explicit steps
+    assert_allclose(rods[1].position_collection, rods[0].position_collection, atol=1e-5)
+    assert_allclose(
+        rods[1].velocity_collection[:, 0], rods[0].velocity_collection[:, 0], rtol=1e-3
+    )
+    assert_allclose(
+        rods[1].omega_collection[:, 0], rods[0].omega_collection[:, 0], rtol=1e-2
+    )
+
+
+def test_semi_implicit_steps_of_rigid_bodies_are_position_verlet():
+    from elastica.rigidbody import Sphere
+    from elastica.external_forces import GravityForces
+
+    spheres = []
+    for stepper in [PositionVerlet, SemiImplicitPositionVerlet]:
+        simulator = Simulator()
+        sphere = Sphere(np.zeros(3), 0.1, 1e3)
+        sphere.velocity_collection[0] = 1.0
+        sphere.omega_collection[2] = 1.0
+        simulator.append(sphere)
+        simulator.add_forcing_to(sphere).using(
+            GravityForces, acc_gravity=np.array([0.0, 0.0, -9.81])
+        )
+        simulator.finalize()
+        integrate(stepper(), simulator, 0.1, 100, progress_bar=False)
+        spheres.append(sphere)
+
+    assert_array_equal(spheres[1].position_collection, spheres[0].position_collection)
+    assert_array_equal(spheres[1].director_collection, spheres[0].director_collection)
+
+
+def test_semi_implicit_steps_of_ring_rods_throws():
+    from elastica.rod.cosserat_rod import CosseratRod
+
+    simulator = Simulator()
+    ring_rod = CosseratRod.ring_rod(
+        20,
+        np.zeros(3),
+        np.array([0.0, 0.0, 1.0]),
+        np.array([1.0, 0.0, 0.0]),
+        1.0,
+        0.01,
+        1e3,
+        youngs_modulus=1e6,
+    )
+    simulator.append(ring_rod)
+    simulator.finalize()
+    with pytest.raises(NotImplementedError) as excinfo:
+        integrate(SemiImplicitPositionVerlet(), simulator, 0.01, 10, progress_bar=False)
+    assert "Ring rods are not supported" in str(excinfo.value)
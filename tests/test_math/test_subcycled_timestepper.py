@@ -0,0 +1,192 @@
+__doc__ = """Testing rods subcycled within the time step of the simulation"""
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from elastica.timestepper import (
+    integrate,
+    extend_stepper_interface,
+    compile_step_plan,
+)
+from elastica.timestepper.explicit_steppers import RungeKutta4
+from elastica.timestepper.symplectic_steppers import PositionVerlet, PEFRL
+
+from tests.test_math.cantilevers import (
+    Simulator,
+    make_cantilevers as make_cantilever_simulator,
+)
+
+
+def make_cantilevers(n_substeps=None):
+    "A soft and a stiff cantilever under gravity, the stiff one subcycled"
+    simulator, (soft_rod, stiff_rod) = make_cantilever_simulator(
+        dict(base_radius=0.02, youngs_modulus=1e5),
+        dict(start=np.array([0.0, 1.0, 0.0]), base_length=0.2, youngs_modulus=1e7),
+        finalize=False,
+    )
+    if n_substeps is not None:
+        simulator.subcycle([stiff_rod], n_substeps)
+    simulator.finalize()
+    return simulator, soft_rod, stiff_rod
+
+
+@pytest.fixture(scope="module")
+def reference_cantilevers():
+    simulator, soft_rod, stiff_rod = make_cantilevers()
+    integrate(PositionVerlet(), simulator, 0.02, 4000, progress_bar=False)
+    return soft_rod, stiff_rod
+
+
+def test_subcycled_rods_are_in_their_own_memory_block():
+    simulator, soft_rod, stiff_rod = make_cantilevers(n_substeps=10)
+
+    assert len(simulator._memory_blocks) == 2
+    block, subcycled_block = simulator._memory_blocks
+    assert block.n_substeps == 1
+    assert_array_equal(block.system_idx_list, [0])
+    assert subcycled_block.n_substeps == 10
+    assert_array_equal(subcycled_block.system_idx_list, [1])
+    assert np.shares_memory(
+        stiff_rod.position_collection, subcycled_block.position_collection
+    )
+
+
+def test_single_substep_reproduces_the_simulation():
+    simulator, soft_rod, stiff_rod = make_cantilevers()
+    integrate(PositionVerlet(), simulator, 0.01, 100, progress_bar=False)
+
+    subcycled_simulator, subcycled_soft_rod, subcycled_stiff_rod = make_cantilevers(
+        n_substeps=1
+    )
+    assert len(subcycled_simulator._memory_blocks) == 1
+    integrate(PositionVerlet(), subcycled_simulator, 0.01, 100, progress_bar=False)
+
+    assert_array_equal(
+        subcycled_stiff_rod.position_collection, stiff_rod.position_collection
+    )
+    assert_array_equal(
+        subcycled_soft_rod.position_collection, soft_rod.position_collection
+    )
+
+
+@pytest.mark.parametrize("stepper", [PositionVerlet, PEFRL])
+def test_subcycled_stiff_rod_is_stable_beyond_the_time_step_limit(
+    stepper, reference_cantilevers
+):
+    reference_soft_rod, reference_stiff_rod = reference_cantilevers
+
+    # The stiff rod limits the time step below 2e-4
+    simulator, soft_rod, stiff_rod = make_cantilevers()
+    integrate(PositionVerlet(), simulator, 0.02, 100, progress_bar=False)
+    assert not np.allclose(
+        stiff_rod.position_collection,
+        reference_stiff_rod.position_collection,
+        atol=1e-3,
+    )
+
+    simulator, soft_rod, stiff_rod = make_cantilevers(n_substeps=10)
+    integrate(stepper(), simulator, 0.02, 20, progress_bar=False)
+
+    # The stiff rod bends, clamped at its fixed end
+    assert_array_equal(stiff_rod.position_collection[:, 0], [0.0, 1.0, 0.0])
+    assert stiff_rod.position_collection[2, -1] < -2e-3
+    assert_allclose(
+        stiff_rod.position_collection,
+        reference_stiff_rod.position_collection,
+        atol=1e-6,
+    )
+    if stepper is PositionVerlet:
+        assert_allclose(
+            soft_rod.position_collection,
+            reference_soft_rod.position_collection,
+            atol=1e-6,
+        )
+
+
+@pytest.mark.parametrize("stepper", [PositionVerlet, PEFRL])
+def test_step_plan_reproduces_do_step_with_subcycled_rods(stepper):
+    dt = np.float64(1e-3)
+    positions = []
+    for use_plan in [True, False]:
+        simulator, soft_rod, stiff_rod = make_cantilevers(n_substeps=10)
+        do_step, stages_and_updates = extend_stepper_interface(stepper(), simulator)
+        if use_plan:
+            step = compile_step_plan(
+                do_step, stepper(), stages_and_updates, simulator, dt
+            )
+        else:
+
+            def step(time):
+                return do_step(stepper(), stages_and_updates, simulator, time, dt)
+
+        time = np.float64(0.0)
+        for _ in range(10):
+            time = step(time)
+        positions.append(
+            (soft_rod.position_collection.copy(), stiff_rod.position_collection.copy())
+        )
+
+    assert_array_equal(positions[0][0], positions[1][0])
+    assert_array_equal(positions[0][1], positions[1][1])
+
+
+@pytest.mark.parametrize("n_substeps", [0, -2, 1.5])
+def test_subcycle_with_illegal_number_of_substeps_throws(n_substeps):
+    from elastica.rod.cosserat_rod import CosseratRod
+
+    simulator = Simulator()
+    rod = CosseratRod.straight_rod(
+        10,
+        np.zeros(3),
+        np.array([1.0, 0.0, 0.0]),
+        np.array([0.0, 0.0, 1.0]),
+        1.0,
+        0.01,
+        1e3,
+        youngs_modulus=1e6,
+    )
+    simulator.append(rod)
+    with pytest.raises(ValueError) as excinfo:
+        simulator.subcycle([rod], n_substeps)
+    assert "positive integer" in str(excinfo.value)
+
+
+def test_subcycle_rigid_body_throws():
+    from elastica.rigidbody import Sphere
+
+    simulator = Simulator()
+    sphere = Sphere(np.zeros(3), 0.1, 1e3)
+    simulator.append(sphere)
+    with pytest.raises(TypeError) as excinfo:
+        simulator.subcycle([sphere], 10)
+    assert "Only rods can be subcycled" in str(excinfo.value)
+
+
+def test_subcycle_with_thread_pool_throws():
+    from elastica.rod.cosserat_rod import CosseratRod
+
+    simulator = Simulator()
+    rod = CosseratRod.straight_rod(
+        10,
+        np.zeros(3),
+        np.array([1.0, 0.0, 0.0]),
+        np.array([0.0, 0.0, 1.0]),
+        1.0,
+        0.01,
+        1e3,
+        youngs_modulus=1e6,
+    )
+    simulator.append(rod)
+    simulator.subcycle([rod], 10)
+    simulator.use_thread_pool(2)
+    with pytest.raises(NotImplementedError) as excinfo:
+        simulator.finalize()
+    assert "thread pool" in str(excinfo.value)
+    simulator._thread_pool.shutdown()
+
+
+def test_subcycled_rods_with_explicit_stepper_throws():
+    simulator, _, _ = make_cantilevers(n_substeps=10)
+    with pytest.raises(NotImplementedError) as excinfo:
+        extend_stepper_interface(RungeKutta4(), simulator)
+    assert "only supported by symplectic steppers" in str(excinfo.value)
@@ -1,4 +1,6 @@
 __doc__ = """Testing timesteppers in Elastica Numba implementation """
+from collections import defaultdict
+
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
@@ -13,7 +15,11 @@ from elastica.systems.analytical import (
     SymplecticUndampedHarmonicOscillatorCollectiveSystem,
     ScalarExponentialDampedHarmonicOscillatorCollectiveSystem,
 )
-from elastica.timestepper import integrate, extend_stepper_interface
+from elastica.timestepper import (
+    integrate,
+    extend_stepper_interface,
+    compile_step_plan,
+)
 from elastica.timestepper._stepper_interface import _TimeStepper
 
 from elastica.timestepper.explicit_steppers import (
@@ -29,6 +35,7 @@ from elastica.timestepper.explicit_steppers import (
 from elastica.timestepper.symplectic_steppers import (
     PositionVerlet,
     PEFRL,
+    SemiImplicitPositionVerlet,
     SymplecticStepperTag,
 )
 
@@ -156,7 +163,7 @@ def test_integrate_throws_an_assert_for_negative_total_steps():
 # SymplecticSteppers = SymplecticStepper.__subclasses__()
 # StatefulExplicitSteppers = [StatefulRungeKutta4, StatefulEulerForward]
 ExplicitSteppers = [EulerForward, RungeKutta4]
-SymplecticSteppers = [PositionVerlet, PEFRL]
+SymplecticSteppers = [PositionVerlet, PEFRL, SemiImplicitPositionVerlet]
 
 
 class TestStepperInterface:
@@ -363,6 +370,242 @@ class TestSteppersAgainstCollectiveSystems:
     # def test_symplectic_against_collective_system(self, symplectic_stepper):
 
 
+class TestExplicitStepperMemory:
+    """Stage buffers of explicit steppers are allocated once and updated in place."""
+
+    class RigidlyMovingRodLikeSystem:
+        "Nodes translating and elements rotating at constant rates"
+
+        def __init__(self, n_elems=4):
+            from elastica.rod.data_structures import _bootstrap_from_data
+
+            n_nodes = n_elems + 1
+            self.vector_states = np.zeros((3, 3 * n_nodes + 2 * n_elems))
+            self.matrix_states, _ = np.linalg.qr(np.random.randn(3, 3))
+            self.matrix_states = np.repeat(
+                self.matrix_states[..., np.newaxis], n_elems, axis=2
+            )
+            (
+                self.state,
+                self.derivative_state,
+                self.position_collection,
+                self.director_collection,
+                self.velocity_collection,
+                self.omega_collection,
+                _,
+                _,
+            ) = _bootstrap_from_data(
+                "explicit", n_elems, self.vector_states, self.matrix_states
+            )
+            self.position_collection[...] = np.random.randn(3, n_nodes)
+            self.velocity_collection[...] = np.random.randn(3, n_nodes)
+            self.omega_collection[...] = np.random.randn(3, n_elems)
+            self.initial_position_collection = self.position_collection.copy()
+            self.initial_director_collection = self.director_collection.copy()
+
+        def __call__(self, time, *args, **kwargs):
+            return self.derivative_state
+
+    @pytest.mark.parametrize("explicit_stepper", ExplicitSteppers)
+    def test_stage_buffers_are_reused(self, explicit_stepper):
+        from elastica.systems import make_memory_for_explicit_stepper
+
+        collective_system = ScalarExponentialDampedHarmonicOscillatorCollectiveSystem()
+        stepper = explicit_stepper()
+        memory_collection = make_memory_for_explicit_stepper(stepper, collective_system)
+        do_step, stages_and_updates = extend_stepper_interface(
+            stepper, collective_system
+        )
+        dt = np.float64(1e-3)
+        time = do_step(
+            stepper, stages_and_updates, collective_system, memory_collection, 0.0, dt
+        )
+        # The state of the oscillator is an array
+        array_memory = memory_collection[-1]
+        buffers = {name: id(buffer) for name, buffer in vars(array_memory).items()}
+        state = collective_system[-1].state
+
+        for _ in range(10):
+            time = do_step(
+                stepper,
+                stages_and_updates,
+                collective_system,
+                memory_collection,
+                time,
+                dt,
+            )
+
+        assert buffers == {
+            name: id(buffer) for name, buffer in vars(array_memory).items()
+        }
+        assert collective_system[-1].state is state
+
+    @pytest.mark.parametrize("explicit_stepper", ExplicitSteppers)
+    def test_rod_like_state_is_updated_in_place(self, explicit_stepper):
+        from elastica._rotations import _rotate
+        from elastica.systems import make_memory_for_explicit_stepper
+        from elastica.timestepper.explicit_steppers import _SystemInstanceStepper
+
+        system = self.RigidlyMovingRodLikeSystem()
+        stepper = explicit_stepper()
+        memory = make_memory_for_explicit_stepper(stepper, system)
+        stages_and_updates = extend_stepper_interface(stepper, system)[1]
+        final_time = 1.0
+        n_steps = 100
+        dt = np.float64(final_time / n_steps)
+        time = np.float64(0.0)
+        for _ in range(n_steps):
+            time = _SystemInstanceStepper.do_step(
+                stepper, stages_and_updates, system, memory, time, dt
+            )
+
+        # The state still shares memory with the system data
+        assert np.shares_memory(system.state.position_collection, system.vector_states)
+        assert system.state.director_collection is system.director_collection
+        assert_allclose(
+            system.position_collection,
+            system.initial_position_collection
+            + final_time * system.velocity_collection,
+            atol=Tolerance.atol(),
+        )
+        assert_allclose(
+            system.director_collection,
+            _rotate(
+                system.initial_director_collection,
+                final_time,
+                system.omega_collection,
+            ),
+            atol=1e-12,
+        )
+
+
+class TestSystemCollectionStepPlan:
+    """Step plans compiled by `integrate` for collections of memory blocks."""
+
+    @staticmethod
+    def make_simulator():
+        "Two cantilevers under gravity, damped, with a callback"
+        from elastica.modules import (
+            BaseSystemCollection,
+            Constraints,
+            Forcing,
+            Damping,
+            CallBacks,
+        )
+        from elastica.rod.cosserat_rod import CosseratRod
+        from elastica.boundary_conditions import OneEndFixedBC
+        from elastica.external_forces import GravityForces
+        from elastica.dissipation import AnalyticalLinearDamper
+        from elastica.callback_functions import MyCallBack
+
+        class Simulator(BaseSystemCollection, Constraints, Forcing, Damping, CallBacks):
+            pass
+
+        simulator = Simulator()
+        rods = [
+            CosseratRod.straight_rod(
+                10,
+                np.array([0.0, 0.0, 0.1 * i_rod]),
+                np.array([1.0, 0.0, 0.0]),
+                np.array([0.0, 0.0, 1.0]),
+                1.0,
+                0.01,
+                1e3,
+                youngs_modulus=1e6,
+            )
+            for i_rod in range(2)
+        ]
+        callback_params = defaultdict(list)
+        for rod in rods:
+            simulator.append(rod)
+            simulator.constrain(rod).using(
+                OneEndFixedBC,
+                constrained_position_idx=(0,),
+                constrained_director_idx=(0,),
+            )
+            simulator.add_forcing_to(rod).using(
+                GravityForces, acc_gravity=np.array([0.0, 0.0, -9.81])
+            )
+            simulator.dampen(rod).using(
+                AnalyticalLinearDamper, damping_constant=0.1, time_step=1e-4
+            )
+        simulator.collect_diagnostics(rods[0]).using(
+            MyCallBack, step_skip=10, callback_params=callback_params
+        )
+        simulator.finalize()
+        return simulator, rods, callback_params
+
+    @pytest.mark.parametrize("symplectic_stepper", SymplecticSteppers)
+    def test_step_plan_reproduces_do_step(self, symplectic_stepper):
+        from elastica.timestepper.symplectic_steppers import (
+            _SystemCollectionStepPlan,
+        )
+
+        dt = np.float64(1e-4)
+        results = []
+        for use_plan in [True, False]:
+            simulator, rods, callback_params = self.make_simulator()
+            stepper = symplectic_stepper()
+            do_step, stages_and_updates = extend_stepper_interface(stepper, simulator)
+            if use_plan:
+                step = compile_step_plan(
+                    do_step, stepper, stages_and_updates, simulator, dt
+                )
+                assert isinstance(step, _SystemCollectionStepPlan)
+            else:
+
+                def step(time):
+                    return do_step(stepper, stages_and_updates, simulator, time, dt)
+
+            time = np.float64(0.0)
+            for _ in range(100):
+                time = step(time)
+            results.append(
+                (
+                    time,
+                    [rod.position_collection.copy() for rod in rods],
+                    [rod.director_collection.copy() for rod in rods],
+                    [rod.velocity_collection.copy() for rod in rods],
+                    callback_params["step"],
+                )
+            )
+
+        planned, expected = results
+        # The rods sagged
+        assert np.all(planned[1][0][2, 1:] < 0.0)
+        assert planned[0] == expected[0]
+        assert planned[4] == expected[4] == list(range(0, 101, 10))
+        for planned_arrays, expected_arrays in zip(planned[1:4], expected[1:4]):
+            for planned_array, expected_array in zip(planned_arrays, expected_arrays):
+                np.testing.assert_array_equal(planned_array, expected_array)
+
+    def test_step_plan_drifts_through_collection(self):
+        simulator, rods, _ = self.make_simulator()
+        durations = []
+
+        def drift(kinematic_update, time, duration):
+            durations.append(duration)
+            kinematic_update()
+
+        simulator._feature_group_drift.append(drift)
+        stepper = PositionVerlet()
+        do_step, stages_and_updates = extend_stepper_interface(stepper, simulator)
+        step = compile_step_plan(do_step, stepper, stages_and_updates, simulator, 0.1)
+        assert step(0.0) == pytest.approx(0.1)
+        assert durations == [0.05, 0.05]
+
+    def test_step_plan_is_not_compiled_for_simple_systems(self):
+        system = SymplecticUndampedSimpleHarmonicOscillatorSystem()
+        stepper = PositionVerlet()
+        do_step, stages_and_updates = extend_stepper_interface(stepper, system)
+        step = compile_step_plan(do_step, stepper, stages_and_updates, system, 0.1)
+        expected_system = SymplecticUndampedSimpleHarmonicOscillatorSystem()
+        expected_time = do_step(stepper, stages_and_updates, expected_system, 0.0, 0.1)
+
+        assert step(0.0) == expected_time
+        assert_allclose(system._state, expected_system._state, rtol=0.0, atol=0.0)
+
+
 class TestSteppersAgainstRodLikeSystems:
     """The rods compose specific data-structures that
     act as an interface to timesteppers (see `rod/data_structures.py`)
@@ -1,6 +1,7 @@
 import numpy as np
 from numpy.testing import assert_allclose
 
+from elastica._backends import selected_backend
 from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
 import pytest
 from elastica.utils import Tolerance
@@ -1045,3 +1046,113 @@ def test_periodic_boundary_one_ring_one_straight_rod():
         block_structure.end_idx_in_rod_voronoi,
         atol=Tolerance.atol(),
     )
+
+
+@pytest.mark.parametrize("n_rods", [1, 2, 5])
+def test_block_structure_workspace_shapes(n_rods):
+    """
+    Scratch buffers of the block are allocated on the block domains, including
+    the ghosts.
+    """
+    world_rods = [MockRod(np.random.randint(10, 30 + 1)) for _ in range(n_rods)]
+    block_structure = MemoryBlockCosseratRod(world_rods, list(range(n_rods)))
+    workspace = block_structure.workspace
+
+    assert workspace.vectors_in_nodes.shape[1:] == (3, block_structure.n_nodes)
+    assert workspace.vectors_in_elements.shape[1:] == (3, block_structure.n_elems)
+    assert workspace.vectors_in_voronoi.shape[1:] == (3, block_structure.n_voronoi)
+    assert workspace.scalars_in_elements.shape[1:] == (block_structure.n_elems,)
+    assert workspace.scalars_in_voronoi.shape[1:] == (block_structure.n_voronoi,)
+    assert workspace.matrices_in_elements.shape[1:] == (
+        3,
+        3,
+        block_structure.n_elems,
+    )
+    assert (
+        workspace.scaled_dvdt_dwdt_collection.shape
+        == block_structure.dvdt_dwdt_collection.shape
+    )
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_block_structure_dtype(dtype):
+    """
+    Block variables, ghost masks and scratch buffers are allocated with the floating
+    point type of the block, and rods see their variables in that type.
+    """
+    world_rods = [MockRod(np.random.randint(10, 30 + 1)) for _ in range(3)]
+    block_structure = MemoryBlockCosseratRod(world_rods, list(range(3)), dtype=dtype)
+    workspace = block_structure.workspace
+
+    for block_variable in (
+        block_structure.scalar_dofs_in_rod_nodes,
+        block_structure.vector_dofs_in_rod_nodes,
+        block_structure.scalar_dofs_in_rod_elems,
+        block_structure.vector_dofs_in_rod_elems,
+        block_structure.matrix_dofs_in_rod_elems,
+        block_structure.scalar_dofs_in_rod_voronois,
+        block_structure.vector_dofs_in_rod_voronois,
+        block_structure.matrix_dofs_in_rod_voronois,
+        block_structure.rate_collection,
+        block_structure.elems_mask,
+        block_structure.voronoi_mask,
+        workspace.vectors_in_nodes,
+        workspace.vectors_in_elements,
+        workspace.vectors_in_voronoi,
+        workspace.scalars_in_elements,
+        workspace.scalars_in_voronoi,
+        workspace.matrices_in_elements,
+        workspace.scaled_dvdt_dwdt_collection,
+    ):
+        assert block_variable.dtype == dtype
+    for rod in world_rods:
+        assert rod.position_collection.dtype == dtype
+        assert rod.director_collection.dtype == dtype
+        assert rod.kappa.dtype == dtype
+
+
+@pytest.mark.skipif(
+    selected_backend() != "numpy", reason="allocations are measured for numpy kernels"
+)
+def test_block_structure_steady_state_step_does_not_allocate():
+    """
+    Once the stepper is warmed up, a time step does not allocate any array of
+    the size of the block. NumPy may still use its own bounded iteration buffers,
+    so the peak traced memory is compared with the size of a scalar array.
+    """
+    import tracemalloc
+
+    import elastica as ea
+    from elastica.timestepper import extend_stepper_interface
+
+    class Simulator(ea.BaseSystemCollection):
+        pass
+
+    n_elems = 50000
+    simulator = Simulator()
+    simulator.append(
+        ea.CosseratRod.straight_rod(
+            n_elems,
+            np.zeros(3),
+            np.array([0.0, 0.0, 1.0]),
+            np.array([1.0, 0.0, 0.0]),
+            1.0,
+            0.01,
+            1000.0,
+            youngs_modulus=1e6,
+        )
+    )
+    simulator.append(ea.Sphere(np.zeros(3), 0.1, 1000.0))
+    simulator.finalize()
+
+    stepper = ea.PositionVerlet()
+    do_step, stages_and_updates = extend_stepper_interface(stepper, simulator)
+    for _ in range(2):
+        do_step(stepper, stages_and_updates, simulator, np.float64(0.0), 1e-8)
+
+    tracemalloc.start()
+    do_step(stepper, stages_and_updates, simulator, np.float64(0.0), 1e-8)
+    _, peak_allocated_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak_allocated_bytes < n_elems * np.dtype(np.float64).itemsize
@@ -9,6 +9,7 @@ from elastica.modules import (
     Forcing,
     Connections,
     CallBacks,
+    Contact,
 )
 
 
@@ -214,3 +215,277 @@ class TestBaseSystemWithFeaturesUsingCosseratRod:
 
         # TODO: this is a dummy test for apply_callbacks find a better way to test them
         simulator_class.apply_callbacks(time=0, current_step=0)
+
+    def test_drift(self, load_collection):
+        simulator_class, rod = load_collection
+        calls = []
+
+        def feature(name):
+            def drift(kinematic_update, time, duration):
+                calls.append((name, time, duration))
+                kinematic_update()
+
+            return drift
+
+        simulator_class._feature_group_drift.extend([feature("a"), feature("b")])
+        simulator_class.drift(lambda: calls.append("update"), 1.0, 0.5)
+        # Features wrap the kinematic update, which is applied once
+        assert calls == [("b", 1.0, 0.5), ("a", 1.0, 0.5), "update"]
+
+    def test_finalize_with_unsupported_dtype_throws(self, load_collection):
+        simulator_class, rod = load_collection
+        with pytest.raises(ValueError) as excinfo:
+            simulator_class.finalize(dtype=np.int64)
+        assert "float32 or float64" in str(excinfo.value)
+
+    @staticmethod
+    def simulate_cantilever(dtype):
+        from elastica.rod.cosserat_rod import CosseratRod
+        from elastica.boundary_conditions import OneEndFixedBC
+        from elastica.external_forces import GravityForces
+        from elastica.timestepper.symplectic_steppers import PositionVerlet
+        from elastica.timestepper import integrate
+
+        simulator_class = GenericSimulatorClass()
+        rod = CosseratRod.straight_rod(
+            n_elements=20,
+            start=np.zeros((3)),
+            direction=np.array([1.0, 0.0, 0.0]),
+            normal=np.array([0.0, 0.0, 1.0]),
+            base_length=1.0,
+            base_radius=0.05,
+            density=1000.0,
+            youngs_modulus=1e6,
+            shear_modulus=1e6 / 3.0,
+        )
+        simulator_class.append(rod)
+        simulator_class.constrain(rod).using(
+            OneEndFixedBC, constrained_position_idx=(0,), constrained_director_idx=(0,)
+        )
+        simulator_class.add_forcing_to(rod).using(
+            GravityForces, acc_gravity=np.array([0.0, 0.0, -9.81])
+        )
+        simulator_class.finalize(dtype=dtype)
+        integrate(PositionVerlet(), simulator_class, 0.1, 1000, progress_bar=False)
+        return rod
+
+    def test_finalize_in_single_precision(self):
+        """
+        With float32 memory blocks, rods are simulated in single precision and stay
+        close to the double precision solution.
+        """
+        single_precision_rod = self.simulate_cantilever(np.float32)
+        double_precision_rod = self.simulate_cantilever(np.float64)
+
+        assert single_precision_rod.position_collection.dtype == np.float32
+        assert single_precision_rod.director_collection.dtype == np.float32
+        assert np.all(np.isfinite(single_precision_rod.position_collection))
+        # The tip sags under gravity
+        assert double_precision_rod.position_collection[2, -1] < -1e-2
+        np.testing.assert_allclose(
+            single_precision_rod.position_collection,
+            double_precision_rod.position_collection,
+            atol=1e-5,
+        )
+        np.testing.assert_allclose(
+            single_precision_rod.kappa, double_precision_rod.kappa, atol=1e-3
+        )
+
+
+class GenericSimulatorWithContactClass(GenericSimulatorClass, Contact):
+    pass
+
+
+class TestBaseSystemWithThreadPool:
+    @staticmethod
+    def simulate(n_threads):
+        from elastica.rod.cosserat_rod import CosseratRod
+        from elastica.rigidbody import Sphere
+        from elastica.boundary_conditions import OneEndFixedBC
+        from elastica.external_forces import GravityForces, EndpointForces
+        from elastica.joint import FreeJoint
+        from elastica.contact_forces import RodSphereContact
+        from elastica.timestepper.symplectic_steppers import PositionVerlet
+        from elastica.timestepper import integrate
+
+        simulator_class = GenericSimulatorWithContactClass()
+        if n_threads is not None:
+            simulator_class.use_thread_pool(n_threads)
+        rods = [
+            CosseratRod.straight_rod(
+                n_elements=10,
+                start=np.array([0.0, 0.2 * i, 0.0]),
+                direction=np.array([1.0, 0.0, 0.0]),
+                normal=np.array([0.0, 0.0, 1.0]),
+                base_length=1.0,
+                base_radius=0.05,
+                density=1000.0,
+                youngs_modulus=1e6,
+                shear_modulus=1e6 / 3.0,
+            )
+            for i in range(3)
+        ]
+        sphere = Sphere(
+            center=np.array([0.5, 0.4, -0.1]), base_radius=0.06, density=1000.0
+        )
+        for rod in rods:
+            simulator_class.append(rod)
+        simulator_class.append(sphere)
+
+        simulator_class.constrain(rods[0]).using(
+            OneEndFixedBC, constrained_position_idx=(0,), constrained_director_idx=(0,)
+        )
+        for rod in rods:
+            simulator_class.add_forcing_to(rod).using(
+                GravityForces, acc_gravity=np.array([0.0, 0.0, -9.81])
+            )
+        simulator_class.add_forcing_to(rods[2]).using(
+            EndpointForces,
+            start_force=np.zeros(3),
+            end_force=np.array([0.0, 0.1, 0.0]),
+            ramp_up_time=1e-3,
+        )
+        simulator_class.connect(rods[0], rods[1], -1, 0).using(FreeJoint, k=1e3, nu=0)
+        simulator_class.detect_contact_between(rods[2], sphere).using(
+            RodSphereContact, k=1e3, nu=1.0
+        )
+        simulator_class.finalize()
+        integrate(PositionVerlet(), simulator_class, 0.01, 100, progress_bar=False)
+        return rods, sphere
+
+    @pytest.mark.parametrize("n_threads", [1, 2, 4])
+    def test_thread_pool_reproduces_serial_simulation(self, n_threads):
+        serial_rods, serial_sphere = self.simulate(None)
+        rods, sphere = self.simulate(n_threads)
+
+        for serial_rod, rod in zip(serial_rods, rods):
+            np.testing.assert_array_equal(
+                rod.position_collection, serial_rod.position_collection
+            )
+            np.testing.assert_array_equal(
+                rod.director_collection, serial_rod.director_collection
+            )
+        np.testing.assert_array_equal(
+            sphere.position_collection, serial_sphere.position_collection
+        )
+        # The rods moved
+        assert not np.allclose(serial_rods[2].position_collection[2], 0.0)
+
+    @staticmethod
+    def simulate_chunks(n_threads):
+        from elastica.rod.cosserat_rod import CosseratRod
+        from elastica.memory_block import BlockChunkPolicy
+        from elastica.boundary_conditions import OneEndFixedBC
+        from elastica.external_forces import GravityForces
+        from elastica.timestepper.symplectic_steppers import PositionVerlet
+        from elastica.timestepper import integrate
+
+        simulator_class = GenericSimulatorClass()
+        if n_threads is not None:
+            simulator_class.use_thread_pool(
+                n_threads, BlockChunkPolicy(min_elems_per_chunk=1)
+            )
+        rods = [
+            CosseratRod.straight_rod(
+                n_elements=10 + i,
+                start=np.array([0.0, 0.2 * i, 0.0]),
+                direction=np.array([1.0, 0.0, 0.0]),
+                normal=np.array([0.0, 0.0, 1.0]),
+                base_length=1.0,
+                base_radius=0.05,
+                density=1000.0,
+                youngs_modulus=1e6,
+                shear_modulus=1e6 / 3.0,
+            )
+            for i in range(4)
+        ]
+        rods.append(
+            CosseratRod.ring_rod(
+                n_elements=20,
+                ring_center_position=np.zeros(3),
+                direction=np.array([0.0, 0.0, 1.0]),
+                normal=np.array([1.0, 0.0, 0.0]),
+                base_length=0.5,
+                base_radius=0.05,
+                density=1000.0,
+                youngs_modulus=1e6,
+                shear_modulus=1e6 / 3.0,
+            )
+        )
+        for rod in rods:
+            simulator_class.append(rod)
+            simulator_class.add_forcing_to(rod).using(
+                GravityForces, acc_gravity=np.array([0.0, 0.0, -9.81])
+            )
+        simulator_class.constrain(rods[0]).using(
+            OneEndFixedBC, constrained_position_idx=(0,), constrained_director_idx=(0,)
+        )
+        simulator_class.finalize()
+        integrate(PositionVerlet(), simulator_class, 0.01, 100, progress_bar=False)
+        return simulator_class, rods
+
+    @pytest.mark.parametrize("n_threads", [2, 3])
+    def test_chunked_memory_block_reproduces_serial_simulation(self, n_threads):
+        _, serial_rods = self.simulate_chunks(None)
+        simulator_class, rods = self.simulate_chunks(n_threads)
+
+        assert len(simulator_class._memory_block_chunks) == n_threads
+        # Kernels of the numpy backend may round differently on chunks, as their
+        # vectorized loops depend on the alignment of the arrays.
+        for serial_rod, rod in zip(serial_rods, rods):
+            np.testing.assert_allclose(
+                rod.position_collection,
+                serial_rod.position_collection,
+                rtol=1e-12,
+                atol=1e-12,
+            )
+            np.testing.assert_allclose(
+                rod.director_collection,
+                serial_rod.director_collection,
+                rtol=1e-12,
+                atol=1e-12,
+            )
+        # The rods moved
+        assert not np.allclose(serial_rods[1].position_collection[2], 0.0)
+
+    def test_synchronize_schedule(self):
+        from elastica.rod.cosserat_rod import CosseratRod
+        from elastica.external_forces import GravityForces
+        from elastica.joint import FreeJoint
+
+        simulator_class = GenericSimulatorClass()
+        simulator_class.use_thread_pool(2)
+        rods = [
+            CosseratRod.straight_rod(
+                n_elements=2,
+                start=np.zeros(3),
+                direction=np.array([1.0, 0.0, 0.0]),
+                normal=np.array([0.0, 0.0, 1.0]),
+                base_length=1.0,
+                base_radius=0.05,
+                density=1000.0,
+                youngs_modulus=1e6,
+            )
+            for i in range(3)
+        ]
+        for rod in rods:
+            simulator_class.append(rod)
+            simulator_class.add_forcing_to(rod).using(GravityForces)
+        simulator_class.connect(rods[0], rods[1]).using(FreeJoint, k=1.0, nu=0.0)
+        simulator_class.connect(rods[1], rods[2]).using(FreeJoint, k=1.0, nu=0.0)
+        simulator_class.finalize()
+
+        # Joints (synchronized first) sharing the second rod run one after the
+        # other, the forcing of each rod runs after the joints of the rod.
+        assert [len(level) for level in simulator_class._synchronize_levels] == [
+            1,
+            2,
+            2,
+        ]
+
+    def test_use_thread_pool_after_finalize_throws(self):
+        simulator_class = GenericSimulatorClass()
+        simulator_class.finalize()
+        with pytest.raises(AssertionError) as excinfo:
+            simulator_class.use_thread_pool(2)
+        assert "before calling finalize" in str(excinfo.value)
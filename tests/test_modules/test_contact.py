@@ -387,3 +387,784 @@ class TestContactMixin:
                 external_forces_system_two,
                 atol=Tolerance.atol(),
             )
+
+
+class TestContactGroup:
+    from elastica.modules import BaseSystemCollection
+
+    class SystemCollectionWithContactMixin(BaseSystemCollection, Contact):
+        pass
+
+    @staticmethod
+    def make_systems(seed):
+        "Rods crossing each other, a cylinder and a sphere touching some of them"
+        from elastica.rod.cosserat_rod import CosseratRod
+        from elastica.rigidbody import Cylinder, Sphere
+
+        rng = np.random.default_rng(seed)
+        systems = []
+        for i_rod in range(6):
+            direction = np.array([1.0, 0.0, 0.0] if i_rod % 2 else [0.0, 1.0, 0.0])
+            normal = np.array([0.0, 0.0, 1.0])
+            start = np.array([0.3 * i_rod, 0.3 * i_rod, 0.015 * (i_rod % 3)])
+            start -= 0.5 * direction
+            rod = CosseratRod.straight_rod(
+                20, start, direction, normal, 1.0, 0.01, 1e3, youngs_modulus=1e6
+            )
+            rod.position_collection += 0.002 * rng.standard_normal(
+                rod.position_collection.shape
+            )
+            rod.velocity_collection[...] = rng.standard_normal(
+                rod.velocity_collection.shape
+            )
+            systems.append(rod)
+        systems.append(
+            Cylinder(
+                np.array([0.0, 0.0, -0.1]),
+                np.array([0.0, 0.0, 1.0]),
+                np.array([1.0, 0.0, 0.0]),
+                0.2,
+                0.02,
+                1e3,
+            )
+        )
+        systems.append(Sphere(np.array([0.6, 0.5, 0.02]), 0.02, 1e3))
+        return systems
+
+    def test_contact_group_without_contact_class_throws(self):
+        simulator = self.SystemCollectionWithContactMixin()
+        systems = self.make_systems(0)
+        for system in systems:
+            simulator.append(system)
+        simulator.detect_contact_among(systems)
+
+        with pytest.raises(RuntimeError) as excinfo:
+            simulator._finalize_contact()
+        assert "Did you forget to call the `using` method?" in str(excinfo.value)
+
+    def test_contact_group_with_unsupported_system_throws(self):
+        from elastica.contact_forces import RodRodContact
+        from elastica.surface import Plane
+
+        simulator = self.SystemCollectionWithContactMixin()
+        systems = self.make_systems(0)
+        systems.append(Plane(np.zeros(3), np.array([0.0, 0.0, 1.0])))
+        for system in systems:
+            simulator.append(system)
+        simulator.detect_contact_among(systems).using(RodRodContact, k=1.0, nu=1.0)
+
+        with pytest.raises(TypeError) as excinfo:
+            simulator._finalize_contact()
+        assert "must be rods, cylinders or spheres" in str(excinfo.value)
+
+    def test_contact_group_matches_contact_between_all_pairs(self):
+        from elastica.contact_forces import (
+            RodRodContact,
+            RodCylinderContact,
+            RodSphereContact,
+        )
+        from elastica.rod import RodBase
+        from elastica.rigidbody import Cylinder
+
+        contact_kwargs = dict(k=1e3, nu=1.0)
+
+        group_simulator = self.SystemCollectionWithContactMixin()
+        group_systems = self.make_systems(0)
+        for system in group_systems:
+            group_simulator.append(system)
+        group_simulator.detect_contact_among(group_systems).using(
+            RodRodContact, **contact_kwargs
+        ).using(RodCylinderContact, **contact_kwargs).using(
+            RodSphereContact, **contact_kwargs
+        )
+
+        pair_simulator = self.SystemCollectionWithContactMixin()
+        pair_systems = self.make_systems(0)
+        for system in pair_systems:
+            pair_simulator.append(system)
+        rods = [system for system in pair_systems if isinstance(system, RodBase)]
+        for i_rod, rod in enumerate(rods):
+            for other_rod in rods[i_rod + 1 :]:
+                pair_simulator.detect_contact_between(rod, other_rod).using(
+                    RodRodContact, **contact_kwargs
+                )
+        for rod in rods:
+            for system in pair_systems[len(rods) :]:
+                pair_simulator.detect_contact_between(rod, system).using(
+                    RodCylinderContact
+                    if isinstance(system, Cylinder)
+                    else RodSphereContact,
+                    **contact_kwargs,
+                )
+
+        group_simulator.finalize()
+        pair_simulator.finalize()
+        group_simulator._call_contacts(time=0.0)
+        pair_simulator._call_contacts(time=0.0)
+
+        # Some of the systems are in contact
+        assert np.any(group_systems[-1].external_forces != 0.0)
+        assert np.any(group_systems[0].external_forces != 0.0)
+        for group_system, pair_system in zip(group_systems, pair_systems):
+            assert_allclose(
+                group_system.external_forces,
+                pair_system.external_forces,
+                atol=Tolerance.atol(),
+            )
+            if not isinstance(group_system, RodBase):
+                assert_allclose(
+                    group_system.external_torques,
+                    pair_system.external_torques,
+                    atol=Tolerance.atol(),
+                )
+
+    def test_contact_group_with_skin_matches_contact_group_without_skin(self):
+        from elastica.contact_forces import RodRodContact, RodSphereContact
+        from elastica.rod import RodBase
+
+        simulators, all_systems = [], []
+        for skin in [0.0, 0.05]:
+            simulator = self.SystemCollectionWithContactMixin()
+            systems = self.make_systems(0)
+            for system in systems:
+                simulator.append(system)
+            simulator.detect_contact_among(systems, skin=skin).using(
+                RodRodContact, k=1e3, nu=1.0
+            ).using(RodSphereContact, k=1e3, nu=1.0)
+            simulator.finalize()
+            simulators.append(simulator)
+            all_systems.append(systems)
+
+        rng = np.random.default_rng(1)
+        for _ in range(5):
+            displacement = [
+                0.002 * rng.standard_normal(system.position_collection.shape)
+                for system in all_systems[0]
+            ]
+            for simulator, systems in zip(simulators, all_systems):
+                for system, system_displacement in zip(systems, displacement):
+                    system.position_collection += system_displacement
+                    system.external_forces[...] = 0.0
+                simulator._call_contacts(time=0.0)
+            for system, cached_system in zip(*all_systems):
+                assert_allclose(
+                    cached_system.external_forces, system.external_forces, atol=0.0
+                )
+
+        assert any(
+            np.any(system.external_forces != 0.0)
+            for system in all_systems[0]
+            if isinstance(system, RodBase)
+        )
+        group_id = tuple(range(len(all_systems[0])))
+        assert simulators[0].contact_candidate_statistics()[group_id]["n_rebuilds"] == 5
+        statistics = simulators[1].contact_candidate_statistics()[group_id]
+        assert statistics["n_updates"] == 5
+        assert statistics["n_rebuilds"] == 1
+
+
+class TestContactInMemoryBlock:
+    from elastica.modules import BaseSystemCollection, Forcing
+
+    class SystemCollectionWithContactMixin(BaseSystemCollection, Contact, Forcing):
+        pass
+
+    friction_kwargs = dict(
+        k=1.0,
+        nu=1e-6,
+        slip_velocity_tol=1e-8,
+        static_mu_array=np.array([0.1, 0.15, 0.2]),
+        kinetic_mu_array=np.array([0.1, 0.15, 0.2]),
+    )
+
+    def make_simulator(self, n_rods=4):
+        "Rods lying on a plane, twisted by muscle torques"
+        from elastica.rod.cosserat_rod import CosseratRod
+        from elastica.surface import Plane
+        from elastica.external_forces import GravityForces, MuscleTorques
+
+        simulator = self.SystemCollectionWithContactMixin()
+        plane = Plane(np.zeros(3), np.array([0.0, 1.0, 0.0]))
+        simulator.append(plane)
+        rods = []
+        for i_rod in range(n_rods):
+            rod = CosseratRod.straight_rod(
+                20 + i_rod,
+                np.array([0.0, 0.009, 0.2 * i_rod]),
+                np.array([1.0, 0.0, 0.0]),
+                np.array([0.0, 1.0, 0.0]),
+                1.0,
+                0.01,
+                1e3,
+                youngs_modulus=1e5,
+            )
+            simulator.append(rod)
+            simulator.add_forcing_to(rod).using(
+                GravityForces, acc_gravity=np.array([0.0, -9.81, 0.0])
+            )
+            simulator.add_forcing_to(rod).using(
+                MuscleTorques,
+                base_length=1.0,
+                b_coeff=0.01 * np.arange(1.0, 7.0),
+                period=1.0,
+                wave_number=6.0,
+                phase_shift=0.0,
+                rest_lengths=rod.rest_lengths,
+                ramp_up_time=0.1,
+                direction=np.array([0.0, 1.0, 0.0]),
+                with_spline=True,
+            )
+            rods.append(rod)
+        return simulator, plane, rods
+
+    def test_plane_contacts_are_batched(self):
+        from elastica.contact_forces import (
+            RodPlaneContactWithAnisotropicFriction,
+            RodRodContact,
+        )
+        from elastica.modules.contact import _ContactInMemoryBlock
+
+        simulator, plane, rods = self.make_simulator()
+        for i_rod, rod in enumerate(rods):
+            simulator.detect_contact_between(rod, plane).using(
+                RodPlaneContactWithAnisotropicFriction, **self.friction_kwargs
+            )
+            if i_rod == 1:
+                # Rod 1 is in another contact before the last plane contact
+                simulator.detect_contact_between(rods[1], rods[2]).using(
+                    RodRodContact, k=1.0, nu=0.0
+                )
+        simulator.finalize()
+
+        contacts = simulator._contacts
+        assert len(contacts) == 4
+        assert isinstance(contacts[3][2], _ContactInMemoryBlock)
+        assert contacts[3][2].system_indices == (3, 4)
+        assert contacts[3][2].rods.n_elems == 22 + 23 + 2
+        assert not any(
+            isinstance(contact, _ContactInMemoryBlock) for _, _, contact in contacts[:3]
+        )
+
+    def test_plane_contacts_with_records_are_not_batched(self):
+        from elastica.contact_forces import RodPlaneContact
+        from elastica.contact_records import ContactRecords
+
+        simulator, plane, rods = self.make_simulator()
+        records = ContactRecords(1000)
+        for i_rod, rod in enumerate(rods):
+            simulator.detect_contact_between(rod, plane).using(
+                RodPlaneContact,
+                k=1.0,
+                nu=1e-3,
+                records=records if i_rod == 1 else None,
+            )
+        simulator.finalize()
+
+        # Records index the elements of each rod, rod 1 splits the batches
+        assert len(simulator._contacts) == 3
+        simulator._call_contacts(time=0.0)
+        assert records.n_records == rods[1].n_elems
+        assert np.all(records.indices[0, : records.n_records] == 2)
+        assert np.all(records.indices[2, : records.n_records] == 0)
+
+    @pytest.mark.parametrize("with_friction", [False, True])
+    def test_batched_plane_contacts_match_contacts_of_each_rod(
+        self, monkeypatch, with_friction
+    ):
+        import elastica.modules.contact
+        from elastica.contact_forces import (
+            RodPlaneContact,
+            RodPlaneContactWithAnisotropicFriction,
+        )
+        from elastica.timestepper import integrate
+        from elastica.timestepper.symplectic_steppers import PositionVerlet
+
+        positions = []
+        for batched in [True, False]:
+            if not batched:
+                monkeypatch.setattr(
+                    elastica.modules.contact,
+                    "find_rod_batches_in_memory_blocks",
+                    lambda memory_blocks, entries: [],
+                )
+            simulator, plane, rods = self.make_simulator()
+            for rod in rods:
+                if with_friction:
+                    simulator.detect_contact_between(rod, plane).using(
+                        RodPlaneContactWithAnisotropicFriction, **self.friction_kwargs
+                    )
+                else:
+                    simulator.detect_contact_between(rod, plane).using(
+                        RodPlaneContact, k=1.0, nu=1e-3
+                    )
+            simulator.finalize()
+            assert len(simulator._contacts) == (1 if batched else len(rods))
+            integrate(PositionVerlet(), simulator, 0.01, 50, progress_bar=False)
+            positions.append(np.hstack([rod.position_collection for rod in rods]))
+
+        assert np.all(np.isfinite(positions[0]))
+        assert_allclose(positions[0], positions[1], rtol=1e-12, atol=1e-12)
+
+
+class TestContactRecords:
+    from elastica.modules import BaseSystemCollection
+
+    class SystemCollectionWithContactMixin(BaseSystemCollection, Contact):
+        pass
+
+    make_systems = staticmethod(TestContactGroup.make_systems)
+
+    def test_contact_records_are_tagged_with_system_indices(self):
+        from elastica.contact_forces import RodRodContact, RodSphereContact
+        from elastica.contact_records import ContactRecords
+
+        simulator = self.SystemCollectionWithContactMixin()
+        systems = self.make_systems(0)
+        for system in systems:
+            simulator.append(system)
+        rod_rod_records = ContactRecords(1000)
+        rod_sphere_records = ContactRecords(1000)
+        simulator.detect_contact_between(systems[0], systems[1]).using(
+            RodRodContact, k=1e3, nu=1.0, records=rod_rod_records
+        )
+        simulator.detect_contact_between(systems[2], systems[7]).using(
+            RodSphereContact, k=1e3, nu=1.0, records=rod_sphere_records
+        )
+        simulator.finalize()
+
+        for _ in range(2):
+            # Records are cleared before each contact step
+            simulator._call_contacts(time=0.0)
+            assert rod_rod_records.n_records > 0
+            assert rod_sphere_records.n_records > 0
+            n_records = rod_rod_records.n_records
+            assert np.all(rod_rod_records.indices[0, :n_records] == 0)
+            assert np.all(rod_rod_records.indices[2, :n_records] == 1)
+            n_records = rod_sphere_records.n_records
+            assert np.all(rod_sphere_records.indices[0, :n_records] == 2)
+            assert np.all(rod_sphere_records.indices[2, :n_records] == 7)
+
+    def test_contact_records_shared_between_contacts_throws(self):
+        from elastica.contact_forces import RodRodContact
+        from elastica.contact_records import ContactRecords
+
+        simulator = self.SystemCollectionWithContactMixin()
+        systems = self.make_systems(0)
+        for system in systems:
+            simulator.append(system)
+        records = ContactRecords(1000)
+        simulator.detect_contact_between(systems[0], systems[1]).using(
+            RodRodContact, k=1e3, nu=1.0, records=records
+        )
+        simulator.detect_contact_among(systems[2:6]).using(
+            RodRodContact, k=1e3, nu=1.0, records=records
+        )
+
+        with pytest.raises(ValueError) as excinfo:
+            simulator._finalize_contact()
+        assert "Contact records can only be filled by one contact" in str(excinfo.value)
+
+    def test_contact_group_records_match_contact_between_all_pairs(self):
+        from elastica.contact_forces import RodRodContact, RodSphereContact
+        from elastica.contact_records import ContactRecords
+        from elastica.rod import RodBase
+
+        group_simulator = self.SystemCollectionWithContactMixin()
+        group_systems = self.make_systems(0)
+        for system in group_systems:
+            group_simulator.append(system)
+        # Contact classes of a group share their records
+        group_records = ContactRecords(1000)
+        group_simulator.detect_contact_among(group_systems).using(
+            RodRodContact, k=1e3, nu=1.0, records=group_records
+        ).using(RodSphereContact, k=1e3, nu=1.0, records=group_records)
+
+        pair_simulator = self.SystemCollectionWithContactMixin()
+        pair_systems = self.make_systems(0)
+        for system in pair_systems:
+            pair_simulator.append(system)
+        rods = [system for system in pair_systems if isinstance(system, RodBase)]
+        pair_records = []
+        for i_rod, rod in enumerate(rods):
+            for other in rods[i_rod + 1 :] + [pair_systems[-1]]:
+                pair_records.append(ContactRecords(1000))
+                pair_simulator.detect_contact_between(rod, other).using(
+                    RodRodContact if isinstance(other, RodBase) else RodSphereContact,
+                    k=1e3,
+                    nu=1.0,
+                    records=pair_records[-1],
+                )
+
+        group_simulator.finalize()
+        pair_simulator.finalize()
+        group_simulator._call_contacts(time=0.0)
+        pair_simulator._call_contacts(time=0.0)
+
+        def sorted_pairs(all_records):
+            drained = [records.drain() for records in all_records]
+            pairs = np.hstack(
+                [
+                    np.vstack(
+                        [
+                            records[key]
+                            for key in [
+                                "first_system",
+                                "first_element",
+                                "second_system",
+                                "second_element",
+                            ]
+                        ]
+                    )
+                    for records in drained
+                ]
+            )
+            gamma = np.hstack([records["gamma"] for records in drained])
+            order = np.lexsort(pairs[::-1])
+            return pairs[:, order], gamma[order]
+
+        pairs, gamma = sorted_pairs([group_records])
+        expected_pairs, expected_gamma = sorted_pairs(pair_records)
+        assert np.any(pairs[2] == len(pair_systems) - 1)
+        assert np.any(pairs[2] < len(rods))
+        np.testing.assert_array_equal(pairs, expected_pairs)
+        assert_allclose(gamma, expected_gamma, atol=Tolerance.atol())
+
+
+class TestContactWithBodiesInMemoryBlock:
+    from elastica.modules import BaseSystemCollection
+
+    class SystemCollectionWithContactMixin(BaseSystemCollection, Contact):
+        pass
+
+    contact_kwargs = dict(
+        k=1e3, nu=1.0, velocity_damping_coefficient=0.1, friction_coefficient=0.5
+    )
+
+    def make_simulator(self, seed=0):
+        "A rod among spheres and cylinders, some of them touching it"
+        from elastica.rod.cosserat_rod import CosseratRod
+        from elastica.rigidbody import Cylinder, Sphere
+
+        rng = np.random.default_rng(seed)
+        simulator = self.SystemCollectionWithContactMixin()
+        rod = CosseratRod.straight_rod(
+            50,
+            np.zeros(3),
+            np.array([1.0, 0.0, 0.0]),
+            np.array([0.0, 1.0, 0.0]),
+            1.0,
+            0.01,
+            1e3,
+            youngs_modulus=1e6,
+        )
+        rod.velocity_collection[...] = rng.standard_normal(
+            rod.velocity_collection.shape
+        )
+        simulator.append(rod)
+        bodies = []
+        for i_body in range(20):
+            center = np.array(
+                [
+                    rng.uniform(-0.2, 1.2),
+                    rng.uniform(-0.03, 0.03),
+                    rng.uniform(-0.03, 0.03),
+                ]
+            )
+            if i_body < 12:
+                body = Sphere(center, 0.02, 1e3)
+            else:
+                body = Cylinder(
+                    center,
+                    np.array([0.0, 0.0, 1.0]),
+                    np.array([1.0, 0.0, 0.0]),
+                    0.05,
+                    0.01,
+                    1e3,
+                )
+            body.velocity_collection[...] = rng.standard_normal((3, 1))
+            simulator.append(body)
+            bodies.append(body)
+        return simulator, rod, bodies
+
+    def detect_contacts(self, simulator, rod, bodies):
+        from elastica.contact_forces import RodCylinderContact, RodSphereContact
+        from elastica.rigidbody import Sphere
+
+        for body in bodies:
+            simulator.detect_contact_between(rod, body).using(
+                RodSphereContact if isinstance(body, Sphere) else RodCylinderContact,
+                **self.contact_kwargs,
+            )
+
+    def test_contacts_with_consecutive_bodies_are_batched(self):
+        from elastica.modules.contact import _ContactWithBodiesInMemoryBlock
+
+        simulator, rod, bodies = self.make_simulator()
+        self.detect_contacts(simulator, rod, bodies)
+        simulator.finalize()
+
+        # One batch of spheres, one batch of cylinders
+        contacts = simulator._contacts
+        assert len(contacts) == 2
+        assert all(
+            isinstance(contact, _ContactWithBodiesInMemoryBlock)
+            for _, _, contact in contacts
+        )
+        assert contacts[0][2].system_indices == tuple(range(1, 13))
+        assert contacts[1][2].system_indices == tuple(range(13, 21))
+        assert [indices for indices, _ in simulator._contacts_tasks()] == [
+            (0, *range(1, 13)),
+            (0, *range(13, 21)),
+        ]
+
+    def test_contacts_are_not_moved_past_other_contacts_of_their_systems(self):
+        from elastica.contact_forces import RodRodContact, RodSphereContact
+        from elastica.rod.cosserat_rod import CosseratRod
+
+        simulator, rod, bodies = self.make_simulator()
+        other_rod = CosseratRod.straight_rod(
+            10,
+            np.zeros(3),
+            np.array([0.0, 1.0, 0.0]),
+            np.array([1.0, 0.0, 0.0]),
+            0.5,
+            0.01,
+            1e3,
+            youngs_modulus=1e6,
+        )
+        simulator.append(other_rod)
+        for i_body in range(4):
+            simulator.detect_contact_between(rod, bodies[i_body]).using(
+                RodSphereContact, **self.contact_kwargs
+            )
+            if i_body == 1:
+                simulator.detect_contact_between(rod, other_rod).using(
+                    RodRodContact, k=1.0, nu=0.0
+                )
+        simulator.finalize()
+
+        # Only the contacts after the rod-rod contact are batched
+        contacts = simulator._contacts
+        assert len(contacts) == 4
+        assert contacts[-1][2].system_indices == (3, 4)
+
+    def test_contacts_with_records_are_not_batched(self):
+        from elastica.contact_forces import RodSphereContact
+        from elastica.contact_records import ContactRecords
+
+        simulator, rod, bodies = self.make_simulator()
+        for i_body in range(4):
+            simulator.detect_contact_between(rod, bodies[i_body]).using(
+                RodSphereContact,
+                **self.contact_kwargs,
+                records=ContactRecords(100) if i_body == 3 else None,
+            )
+        simulator.finalize()
+        contacts = simulator._contacts
+        assert len(contacts) == 2
+        assert contacts[0][2].system_indices == (1, 2, 3)
+        assert contacts[1][2].records is not None
+
+    def test_batched_contacts_match_contacts_of_each_body(self, monkeypatch):
+        import elastica.modules.contact
+
+        results = []
+        for batched in [True, False]:
+            if not batched:
+                monkeypatch.setattr(
+                    elastica.modules.contact,
+                    "find_body_batches_in_memory_blocks",
+                    lambda memory_blocks, entries: [],
+                )
+            simulator, rod, bodies = self.make_simulator()
+            self.detect_contacts(simulator, rod, bodies)
+            simulator.finalize()
+            assert len(simulator._contacts) == (2 if batched else len(bodies))
+            simulator._call_contacts(time=0.0)
+            results.append(
+                (
+                    rod.external_forces.copy(),
+                    np.hstack([body.external_forces for body in bodies]),
+                    np.hstack([body.external_torques for body in bodies]),
+                )
+            )
+
+        assert np.any(results[0][1] != 0.0)
+        assert np.any(results[0][1] == 0.0)
+        for batched, expected in zip(*results):
+            assert_allclose(batched, expected, rtol=1e-12, atol=1e-12)
+
+
+class TestContactSubsteps:
+    from elastica.modules import BaseSystemCollection, Forcing
+
+    class SystemCollectionWithContactMixin(BaseSystemCollection, Contact, Forcing):
+        pass
+
+    @staticmethod
+    def make_rods():
+        "A rod falling on another rod"
+        from elastica.rod.cosserat_rod import CosseratRod
+
+        rods = [
+            CosseratRod.straight_rod(
+                10,
+                start,
+                direction,
+                np.array([0.0, 0.0, 1.0]),
+                1.0,
+                0.02,
+                1e3,
+                youngs_modulus=1e6,
+            )
+            for start, direction in [
+                (np.zeros(3), np.array([1.0, 0.0, 0.0])),
+                (np.array([0.5, -0.5, 0.041]), np.array([0.0, 1.0, 0.0])),
+            ]
+        ]
+        rods[1].velocity_collection[2] = -1.0
+        return rods
+
+    def make_simulator(self, substeps=True, acc_gravity=None, **kwargs):
+        from elastica.contact_forces import RodRodContact, RodPlaneContact
+        from elastica.external_forces import GravityForces
+        from elastica.surface import Plane
+
+        simulator = self.SystemCollectionWithContactMixin()
+        rods = self.make_rods()
+        plane = Plane(np.array([0.0, 0.0, -1.0]), np.array([0.0, 0.0, 1.0]))
+        for system in [*rods, plane]:
+            simulator.append(system)
+        if acc_gravity is not None:
+            for rod in rods:
+                simulator.add_forcing_to(rod).using(
+                    GravityForces, acc_gravity=np.array([0.0, 0.0, acc_gravity])
+                )
+        simulator.detect_contact_between(*rods).using(RodRodContact, k=1e7, nu=1.0)
+        simulator.detect_contact_between(rods[0], plane).using(
+            RodPlaneContact, k=1.0, nu=0.0
+        )
+        if substeps:
+            simulator.substep_contacts(**kwargs)
+        simulator.finalize()
+        return simulator, rods
+
+    @pytest.mark.parametrize("kwargs", [dict(max_substeps=0), dict(safety_factor=0.0)])
+    def test_substep_contacts_with_illegal_settings_throws(self, kwargs):
+        simulator = self.SystemCollectionWithContactMixin()
+        with pytest.raises(ValueError) as excinfo:
+            simulator.substep_contacts(**kwargs)
+        assert "must be positive" in str(excinfo.value)
+
+    def test_rod_rod_contacts_are_substepped(self):
+        from elastica.contact_forces import RodPlaneContact, RodRodContact
+
+        simulator, rods = self.make_simulator()
+
+        # The rod-rod contact is moved to the substeps
+        substepper = simulator._contact_substepper
+        assert [type(contact) for _, _, contact in simulator._contacts] == [
+            RodPlaneContact
+        ]
+        assert [type(contact) for _, _, contact in substepper.contacts] == [
+            RodRodContact
+        ]
+        assert substepper.system_indices == (0, 1)
+        assert simulator._feature_group_drift == [substepper.drift]
+        assert [indices for indices, _ in simulator._contacts_tasks()][-1] == (0, 1)
+        assert substepper.max_substep == pytest.approx(
+            0.1 * 2.0 / (np.sqrt(1e7 / rods[0].mass[0]) + 1.0 / rods[0].mass[0])
+        )
+
+    def test_contacts_are_applied_without_drift(self):
+        # Explicit steppers do not drift the systems, contacts are then applied
+        # with the other contacts
+        results = []
+        for substeps in [True, False]:
+            simulator, rods = self.make_simulator(substeps)
+            rods[1].position_collection[2] -= 0.005
+            simulator._call_contacts(time=0.0)
+            results.append([rod.external_forces.copy() for rod in rods])
+
+        assert np.any(results[0][0] != 0.0)
+        for substepped, expected in zip(*results):
+            assert_allclose(substepped, expected, rtol=1e-12, atol=1e-12)
+
+    def test_substepped_contact_forces_see_external_forces(self):
+        # The rod-rod normal force depends on the external forces, e.g. the
+        # weight of the upper rod
+        results = []
+        for substeps in [True, False]:
+            simulator, rods = self.make_simulator(substeps)
+            rods[1].position_collection[2] -= 0.005
+            rods[1].external_forces[2] = -50.0
+            external_forces = [rod.external_forces.copy() for rod in rods]
+            if substeps:
+                substepper = simulator._contact_substepper
+                assert substepper._compute_contact_forces()
+                for rod, forces in zip(rods, external_forces):
+                    assert_allclose(rod.external_forces, forces, rtol=0.0, atol=0.0)
+                results.append(substepper._contact_forces)
+            else:
+                simulator._call_contacts(time=0.0)
+                results.append(
+                    [
+                        rod.external_forces - forces
+                        for rod, forces in zip(rods, external_forces)
+                    ]
+                )
+
+        substepped, expected = results
+        for substepped_forces, expected_forces in zip(substepped, expected):
+            assert_allclose(substepped_forces, expected_forces, rtol=1e-12, atol=1e-9)
+
+    def test_drift_out_of_contact_is_not_split(self):
+        simulator, rods = self.make_simulator()
+        expected = [
+            rod.position_collection + 1e-4 * rod.velocity_collection for rod in rods
+        ]
+
+        def kinematic_update():
+            for rod in rods:
+                rod.position_collection += 1e-4 * rod.velocity_collection
+
+        simulator.drift(kinematic_update, 0.0, 1e-4)
+        # Contacts are no longer applied with the other contacts
+        simulator._call_contacts(time=0.0)
+
+        for rod, position in zip(rods, expected):
+            assert_allclose(rod.position_collection, position, rtol=1e-12)
+        assert np.all(rods[1].external_forces == 0.0)
+        assert simulator.contact_substep_statistics() == {
+            "drifts": 1,
+            "drifts_in_contact": 0,
+            "substeps": 0,
+            "max_substep": simulator._contact_substepper.max_substep,
+        }
+
+    @pytest.mark.parametrize("acc_gravity", [None, -500.0])
+    def test_substeps_match_simulation_with_small_time_step(self, acc_gravity):
+        from elastica.timestepper import integrate
+        from elastica.timestepper.symplectic_steppers import PositionVerlet
+
+        final_time = 4e-3
+        results = []
+        for substeps, n_steps in [(True, 40), (False, 40), (False, 800)]:
+            simulator, rods = self.make_simulator(substeps, acc_gravity)
+            integrate(
+                PositionVerlet(), simulator, final_time, n_steps, progress_bar=False
+            )
+            # Velocity given to the lower rod by the contact
+            free_fall_velocity = (acc_gravity or 0.0) * final_time
+            results.append(rods[0].velocity_collection[2].mean() - free_fall_velocity)
+            if substeps:
+                statistics = simulator.contact_substep_statistics()
+
+        # Only the steps in contact are split
+        assert statistics["drifts"] == 2 * 40
+        assert 0 < statistics["drifts_in_contact"] < 10
+        assert statistics["substeps"] > statistics["drifts_in_contact"]
+        substepped, coarse, fine = results
+        assert fine < -0.1
+        assert abs(substepped - fine) < 0.01 * abs(fine)
+        assert abs(coarse - fine) > 0.1 * abs(fine)
@@ -224,3 +224,79 @@ class TestForcingMixin:
     def test_constrain_call_on_systems(self):
         # TODO Finish after the architecture is complete
         pass
+
+
+class TestForcingInMemoryBlock:
+    from elastica.modules import BaseSystemCollection
+
+    class SystemCollectionWithForcingMixin(BaseSystemCollection, Forcing):
+        pass
+
+    def make_simulator(self):
+        "Rods lying on a frictional plane, with gravity"
+        from elastica.rod.cosserat_rod import CosseratRod
+        from elastica.external_forces import GravityForces
+        from elastica.interaction import AnisotropicFrictionalPlane
+
+        simulator = self.SystemCollectionWithForcingMixin()
+        rods = []
+        for i_rod in range(4):
+            rod = CosseratRod.straight_rod(
+                20,
+                np.array([0.0, 0.009, 0.2 * i_rod]),
+                np.array([1.0, 0.0, 0.0]),
+                np.array([0.0, 1.0, 0.0]),
+                1.0,
+                0.01,
+                1e3,
+                youngs_modulus=1e5,
+            )
+            rod.velocity_collection[0] = 0.1 * i_rod
+            simulator.append(rod)
+            simulator.add_forcing_to(rod).using(
+                AnisotropicFrictionalPlane,
+                k=1.0,
+                nu=1e-6,
+                plane_origin=np.zeros((3,)),
+                plane_normal=np.array([0.0, 1.0, 0.0]),
+                slip_velocity_tol=1e-8,
+                static_mu_array=np.array([0.1, 0.15, 0.2]),
+                kinetic_mu_array=np.array([0.1, 0.15, 0.2]),
+            )
+            simulator.add_forcing_to(rod).using(
+                GravityForces, acc_gravity=np.array([0.0, -9.81, 0.0])
+            )
+            rods.append(rod)
+        return simulator, rods
+
+    def test_batched_friction_planes_match_friction_plane_of_each_rod(
+        self, monkeypatch
+    ):
+        import elastica.modules.forcing
+        from elastica.modules.forcing import _ForcingInMemoryBlock
+        from elastica.timestepper import integrate
+        from elastica.timestepper.symplectic_steppers import PositionVerlet
+
+        positions = []
+        for batched in [True, False]:
+            if not batched:
+                monkeypatch.setattr(
+                    elastica.modules.forcing,
+                    "find_rod_batches_in_memory_blocks",
+                    lambda memory_blocks, entries: [],
+                )
+            simulator, rods = self.make_simulator()
+            simulator.finalize()
+            friction_planes = simulator._ext_forces_torques[4:]
+            if batched:
+                # Friction planes are moved after the gravity of all the rods
+                assert len(friction_planes) == 1
+                assert isinstance(friction_planes[0][1], _ForcingInMemoryBlock)
+                assert friction_planes[0][1].system_indices == (0, 1, 2, 3)
+            else:
+                assert len(friction_planes) == 4
+            integrate(PositionVerlet(), simulator, 0.01, 50, progress_bar=False)
+            positions.append(np.hstack([rod.position_collection for rod in rods]))
+
+        assert np.all(np.isfinite(positions[0]))
+        np.testing.assert_allclose(positions[0], positions[1], rtol=1e-12, atol=1e-12)
@@ -4,6 +4,7 @@ import pytest
 import numpy as np
 from numpy.testing import assert_array_equal
 from elastica.memory_block.memory_block_rod_base import (
+    BlockChunkPolicy,
     make_block_memory_metadata,
     make_block_memory_periodic_boundary_metadata,
 )
@@ -117,3 +118,45 @@ def test_make_block_memory_periodic_boundary_metadata(n_elems_in_ring_rods):
     assert_array_equal(periodic_boundary_node_idx, expected_node_idx)
     assert_array_equal(periodic_boundary_elems_idx, expected_element_idx)
     assert_array_equal(periodic_boundary_voronoi_idx, expected_voronoi_idx)
+
+
+class TestBlockChunkPolicy:
+    @pytest.mark.parametrize("n_threads", [1, 2, 3, 4, 8])
+    def test_split_balances_elements(self, n_threads):
+        n_elems_in_rods = np.full(16, 100, dtype=np.int64)
+        policy = BlockChunkPolicy(min_elems_per_chunk=1)
+
+        rod_bounds = policy.split(n_elems_in_rods, n_threads)
+
+        assert rod_bounds[0] == 0
+        assert rod_bounds[-1] == 16
+        assert rod_bounds.shape[0] == n_threads + 1
+        # Chunks differ by at most one rod
+        n_rods_in_chunks = np.diff(rod_bounds)
+        assert n_rods_in_chunks.max() - n_rods_in_chunks.min() <= 1
+
+    def test_split_respects_minimum_chunk_size(self):
+        n_elems_in_rods = np.full(16, 100, dtype=np.int64)
+        policy = BlockChunkPolicy(min_elems_per_chunk=500)
+
+        rod_bounds = policy.split(n_elems_in_rods, 8)
+
+        assert_array_equal(rod_bounds, [0, 5, 11, 16])
+
+    def test_split_number_of_chunks(self):
+        n_elems_in_rods = np.array([10, 200, 10, 10, 10, 200], dtype=np.int64)
+        policy = BlockChunkPolicy(n_chunks=2, min_elems_per_chunk=1)
+
+        # The number of chunks of the policy overrides the number of threads
+        rod_bounds = policy.split(n_elems_in_rods, 8)
+
+        assert_array_equal(rod_bounds, [0, 3, 6])
+
+    @pytest.mark.parametrize("n_elems_in_rods", [[10], [4000, 4000], [10, 10]])
+    def test_small_blocks_are_not_split(self, n_elems_in_rods):
+        n_elems_in_rods = np.array(n_elems_in_rods, dtype=np.int64)
+        policy = BlockChunkPolicy()
+
+        rod_bounds = policy.split(n_elems_in_rods, 8)
+
+        assert_array_equal(rod_bounds, [0, n_elems_in_rods.shape[0]])
@@ -8,6 +8,8 @@ from numpy.testing import assert_array_equal
 from elastica.rod import RodBase
 from elastica.modules.memory_block import construct_memory_block_structures
 from elastica.memory_block.memory_block_rod import MemoryBlockCosseratRod
+from elastica.memory_block.memory_block_rod_base import BlockChunkPolicy
+from elastica._thread_pool import ThreadPool
 
 
 class BaseRodForTesting(RodBase):
@@ -222,3 +224,61 @@ def test_memory_block_rod(n_straight_rods, n_ring_rods):
                 memory_block.__dict__[attr_x],
                 memory_block.__dict__[attr_y],
             )
+
+
+@pytest.mark.parametrize("n_straight_rods", [1, 2, 5])
+@pytest.mark.parametrize("n_ring_rods", [0, 1, 2])
+@pytest.mark.parametrize("n_threads", [2, 3])
+def test_memory_block_rod_split_into_chunks(n_straight_rods, n_ring_rods, n_threads):
+    n_rods = n_straight_rods + n_ring_rods
+    n_elems = np.random.randint(low=10, high=31, size=(n_rods,))
+    systems = [
+        BaseRodForTesting(n_elems=n_elems[k], ring_rod_flag=False)
+        for k in range(n_straight_rods)
+    ] + [
+        BaseRodForTesting(n_elems=n_elems[k + n_straight_rods], ring_rod_flag=True)
+        for k in range(n_ring_rods)
+    ]
+    random.shuffle(systems)
+    memory_block = MemoryBlockCosseratRod(
+        systems=systems, system_idx_list=np.arange(0, n_rods)
+    )
+    thread_pool = ThreadPool(n_threads)
+
+    chunks = memory_block.split_into_chunks(
+        BlockChunkPolicy(min_elems_per_chunk=1), thread_pool
+    )
+    thread_pool.shutdown()
+
+    if n_rods == 1:
+        # A single rod is never split
+        assert chunks == []
+        return
+    assert 2 <= len(chunks) <= min(n_threads, n_rods)
+    assert memory_block.chunks is chunks
+
+    # Chunks cover the rods, and only miss the ghosts between chunks
+    n_nodes_in_chunks = sum(chunk.n_nodes for chunk in chunks)
+    assert n_nodes_in_chunks == memory_block.n_nodes - (len(chunks) - 1)
+    start_node = 0
+    for chunk in chunks:
+        end_node = start_node + chunk.n_nodes
+        assert np.shares_memory(
+            chunk.position_collection, memory_block.position_collection
+        )
+        assert_array_equal(
+            chunk.position_collection,
+            memory_block.position_collection[:, start_node:end_node],
+        )
+        assert_array_equal(
+            chunk.director_collection,
+            memory_block.director_collection[..., start_node : end_node - 1],
+        )
+        assert_array_equal(
+            chunk.kappa, memory_block.kappa[:, start_node : end_node - 2]
+        )
+        # Chunk ends are rod ends, not ghosts
+        assert chunk.elems_mask[0] == 1.0 and chunk.elems_mask[-1] == 1.0
+        assert chunk.voronoi_mask[0] == 1.0 and chunk.voronoi_mask[-1] == 1.0
+        # Skip the ghost node between the chunks
+        start_node = end_node + 1
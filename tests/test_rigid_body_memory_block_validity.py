@@ -321,3 +321,28 @@ if __name__ == "__main__":
     from pytest import main
 
     main([__file__])
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_block_structure_dtype(dtype):
+    """
+    Block variables and scratch buffers are allocated with the floating point type
+    of the block, and bodies see their variables in that type.
+    """
+    world_bodies = [MockRigidBody() for _ in range(3)]
+    block_structure = MemoryBlockRigidBody(
+        world_bodies, [i for i in range(len(world_bodies))], dtype=dtype
+    )
+
+    for block_variable in (
+        block_structure.scalar_dofs_in_rigid_bodies,
+        block_structure.vector_dofs_in_rigid_bodies,
+        block_structure.matrix_dofs_in_rigid_bodies,
+        block_structure.rate_collection,
+        block_structure.workspace.vectors_in_elements,
+        block_structure.workspace.scaled_dvdt_dwdt_collection,
+    ):
+        assert block_variable.dtype == dtype
+    for body in world_bodies:
+        assert body.position_collection.dtype == dtype
+        assert body.director_collection.dtype == dtype
@@ -0,0 +1,53 @@
+__doc__ = """Tests for mesh surface class"""
+from types import SimpleNamespace
+
+import numpy as np
+from numpy.testing import assert_allclose
+from elastica.surface import MeshSurface
+import pytest
+
+
+def two_triangles():
+    faces = np.zeros((3, 3, 2))
+    faces[..., 0] = np.array([[0.0, 1.0, 1.0], [0.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+    faces[..., 1] = np.array([[0.0, 1.0, 0.0], [0.0, 0.0, 0.0], [0.0, 1.0, 1.0]])
+    face_normals = np.array([[0.0, 0.0], [-2.0, -3.0], [0.0, 0.0]])
+    return SimpleNamespace(faces=faces, face_normals=face_normals)
+
+
+def test_mesh_surface_initialization():
+    mesh = two_triangles()
+    surface = MeshSurface(mesh)
+
+    assert surface.n_faces == 2
+    assert_allclose(surface.faces, mesh.faces)
+    assert_allclose(surface.face_normals, [[0.0, 0.0], [-1.0, -1.0], [0.0, 0.0]])
+    assert_allclose(surface.face_centers, np.mean(mesh.faces, axis=1))
+
+
+def test_mesh_surface_with_quads_throws():
+    mesh = SimpleNamespace(faces=np.zeros((3, 4, 2)), face_normals=np.ones((3, 2)))
+    with pytest.raises(ValueError) as excinfo:
+        MeshSurface(mesh)
+    assert "made of triangles" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("n_faces", [1, 7, 200])
+def test_mesh_surface_aabb_hierarchy_bounds_its_faces(n_faces):
+    rng = np.random.default_rng(n_faces)
+    faces = rng.standard_normal((3, 3, n_faces))
+    surface = MeshSurface(
+        SimpleNamespace(faces=faces, face_normals=rng.standard_normal((3, n_faces)))
+    )
+
+    hierarchy, face_order = surface.aabb_hierarchy(faces_per_aabb=4)
+
+    assert sorted(face_order) == list(range(n_faces))
+    # Built once
+    assert surface.aabb_hierarchy(faces_per_aabb=4)[0] is hierarchy
+    leaves = hierarchy.aabb[-1]
+    for leaf in range(leaves.shape[-1]):
+        for dof in range(hierarchy.dof_offsets[leaf], hierarchy.dof_offsets[leaf + 1]):
+            vertices = faces[..., face_order[dof]]
+            assert np.all(leaves[:, 0, leaf, None] <= vertices + 1e-12)
+            assert np.all(leaves[:, 1, leaf, None] >= vertices - 1e-12)
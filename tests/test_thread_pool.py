@@ -0,0 +1,114 @@
+__doc__ = """ Thread pool and task scheduling tests """
+
+import threading
+
+import numpy as np
+import pytest
+
+from elastica._thread_pool import ThreadPool, schedule_tasks
+
+
+class TestThreadPool:
+    @pytest.mark.parametrize("n_threads", [1, 2, 4])
+    @pytest.mark.parametrize("n_items", [0, 1, 3, 10])
+    def test_map_calls_function_on_all_items(self, n_threads, n_items):
+        thread_pool = ThreadPool(n_threads)
+        out = np.zeros(n_items)
+
+        def function(item):
+            out[item] += item + 1
+
+        thread_pool.map(function, list(range(n_items)))
+        thread_pool.shutdown()
+
+        np.testing.assert_array_equal(out, np.arange(n_items) + 1)
+
+    def test_map_uses_calling_and_worker_threads(self):
+        thread_pool = ThreadPool(2)
+        barrier = threading.Barrier(2, timeout=10)
+        thread_names = set()
+
+        def function(item):
+            # Both items must be processed at the same time to pass the barrier
+            barrier.wait()
+            thread_names.add(threading.current_thread().name)
+
+        thread_pool.map(function, [0, 1])
+        thread_pool.shutdown()
+
+        assert threading.current_thread().name in thread_names
+        assert len(thread_names) == 2
+
+    def test_nested_map_runs_on_worker(self):
+        thread_pool = ThreadPool(2)
+        out = np.zeros((2, 3))
+
+        def inner_function(item):
+            out[item] = threading.current_thread().name.startswith("elastica")
+
+        def function(row):
+            # Would wait forever for the busy worker, if not run on the worker
+            thread_pool.map(lambda column: inner_function((row, column)), [0, 1, 2])
+
+        thread_pool.map(function, [0, 1])
+        thread_pool.shutdown()
+
+        # The second row is mapped by the worker, and run on the worker
+        np.testing.assert_array_equal(out[1], [1, 1, 1])
+
+    def test_map_raises_worker_exceptions(self):
+        thread_pool = ThreadPool(2)
+
+        def function(item):
+            if item == 1:
+                raise RuntimeError("task {0} failed".format(item))
+
+        with pytest.raises(RuntimeError) as excinfo:
+            thread_pool.map(function, [0, 1])
+        thread_pool.shutdown()
+        assert "task 1 failed" in str(excinfo.value)
+
+    @pytest.mark.parametrize("n_threads", [0, -2])
+    def test_invalid_number_of_threads_throws(self, n_threads):
+        with pytest.raises(ValueError) as excinfo:
+            ThreadPool(n_threads)
+        assert "must be positive" in str(excinfo.value)
+
+
+class TestScheduleTasks:
+    def test_independent_tasks_share_a_level(self):
+        levels = schedule_tasks([((0,), "a"), ((1,), "b"), ((2,), "c")])
+        assert levels == [["a", "b", "c"]]
+
+    def test_tasks_writing_the_same_system_keep_their_order(self):
+        levels = schedule_tasks(
+            [((0,), "a"), ((1,), "b"), ((0, 1), "c"), ((1,), "d"), ((2,), "e")]
+        )
+        assert levels == [["a", "b", "e"], ["c"], ["d"]]
+
+    def test_tasks_without_keys_run_alone(self):
+        levels = schedule_tasks(
+            [((0,), "a"), ((1,), "b"), (None, "c"), ((0,), "d"), ((2,), "e")]
+        )
+        assert levels == [["a", "b"], ["c"], ["d", "e"]]
+
+    def test_scheduled_levels_reproduce_serial_order(self):
+        rng = np.random.default_rng(0)
+        tasks = []
+        for i in range(50):
+            keys = tuple(rng.choice(8, size=rng.integers(1, 3), replace=False))
+            tasks.append((keys, (i, keys)))
+
+        levels = schedule_tasks(tasks)
+
+        # Every task is scheduled once, tasks of a level write to different keys
+        # and, for each key, tasks are in their serial order.
+        assert sorted(i for level in levels for i, _ in level) == list(range(50))
+        order_of_key = {}
+        for level in levels:
+            keys_of_level = [key for _, keys in level for key in keys]
+            assert len(keys_of_level) == len(set(keys_of_level))
+            for i, keys in level:
+                for key in keys:
+                    assert order_of_key.get(key, -1) < i
+                    order_of_key[key] = i